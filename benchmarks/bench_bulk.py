@@ -0,0 +1,87 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import timeit
+import numpy
+import pero
+from pero.backends.svg import SVGCanvas
+
+# init repeats
+REPEATS = 5
+NUMBER = 10
+SIZE = 10000
+
+# init data
+RNG = numpy.random.default_rng(0)
+XS = RNG.random(SIZE) * 500
+YS = RNG.random(SIZE) * 500
+SIZES = RNG.random(SIZE) * 10
+COLORS = [pero.Color.create(c) for c in ("#f00", "#0f0", "#00f", "#000")]
+ITEM_COLORS = [COLORS[i % len(COLORS)] for i in range(SIZE)]
+
+
+def run(name, bulk, single):
+    """Measures bulk drawing against drawing items one by one."""
+    
+    def draw_bulk():
+        canvas = SVGCanvas(width=500, height=500)
+        bulk(canvas)
+    
+    def draw_single():
+        canvas = SVGCanvas(width=500, height=500)
+        single(canvas)
+    
+    legacy = min(timeit.repeat(draw_single, repeat=REPEATS, number=NUMBER))
+    current = min(timeit.repeat(draw_bulk, repeat=REPEATS, number=NUMBER))
+    
+    print("%-20s single: %8.2f ms  bulk: %8.2f ms  speedup: %.2fx" % (
+        name,
+        1e3 * legacy / NUMBER,
+        1e3 * current / NUMBER,
+        legacy / current))
+
+
+def circles_single(canvas):
+    for x, y, r in zip(XS, YS, SIZES):
+        canvas.draw_circle(x, y, r)
+
+
+def circles_bulk(canvas):
+    canvas.draw_circles(XS, YS, SIZES)
+
+
+def colored_single(canvas):
+    for x, y, r, c in zip(XS, YS, SIZES, ITEM_COLORS):
+        canvas.fill_color = c
+        canvas.draw_circle(x, y, r)
+
+
+def colored_bulk(canvas):
+    canvas.draw_circles(XS, YS, SIZES, fill_colors=ITEM_COLORS)
+
+
+def rects_single(canvas):
+    for x, y, s in zip(XS, YS, SIZES):
+        canvas.draw_rect(x, y, s, s)
+
+
+def rects_bulk(canvas):
+    canvas.draw_rects(XS, YS, SIZES, SIZES)
+
+
+def segments_single(canvas):
+    for x, y, s in zip(XS, YS, SIZES):
+        canvas.draw_line(x, y, x+s, y+s)
+
+
+def segments_bulk(canvas):
+    canvas.draw_segments(XS, YS, XS+SIZES, YS+SIZES)
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run("circles", circles_bulk, circles_single)
+    run("colored circles", colored_bulk, colored_single)
+    run("rects", rects_bulk, rects_single)
+    run("segments", segments_bulk, segments_single)
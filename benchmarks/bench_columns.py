@@ -0,0 +1,47 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import time
+import numpy
+import pero
+
+# init count
+COUNT = 100000
+
+# init data
+X_DATA = numpy.random.uniform(0, 800, COUNT)
+Y_DATA = numpy.random.uniform(0, 600, COUNT)
+SIZES = numpy.random.uniform(2, 10, COUNT)
+
+# init sources
+ROWS = [{'size': s} for s in SIZES]
+COLUMNS = {'size': SIZES}
+
+
+def run(label, data, size):
+    """Measures time needed to draw profile points."""
+    
+    profile = pero.Profile(
+        x = X_DATA,
+        y = Y_DATA,
+        data = data,
+        show_line = False,
+        show_points = True,
+        clip = pero.Frame(0, 0, 400, 300),
+        marker_size = size)
+    
+    canvas = pero.json.JsonCanvas()
+    
+    start = time.perf_counter()
+    profile.draw(canvas)
+    duration = time.perf_counter() - start
+    
+    print("%-12s %d points: %8.1f ms" % (label, COUNT, 1e3 * duration))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run("rows", ROWS, lambda d: d['size'])
+    run("columns", COLUMNS, lambda d: d['size'])
+    run("vectorized", COLUMNS, pero.vectorized(lambda d: d['size']))
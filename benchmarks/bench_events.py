@@ -0,0 +1,80 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import timeit
+import pero
+
+# init repeats
+REPEATS = 5
+NUMBER = 100000
+
+
+class Listener(pero.EvtHandler):
+    """Testing listener."""
+    
+    
+    def on_evt(self, evt):
+        """Called when event is fired."""
+        
+        pass
+
+
+def legacy_fire(self, evt, **kwargs):
+    """Fires event by copying callbacks and params on every call."""
+    
+    if self._callbacks is None:
+        return
+    
+    callbacks = self._callbacks.get(evt.TYPE, None)
+    if not callbacks:
+        return
+    
+    for callback, params in reversed(callbacks[:]):
+        params = dict(params, **kwargs)
+        callback.callback(evt, **params)
+        if evt.is_canceled():
+            return
+
+
+def run(count, own=False):
+    """Measures firing of property changed event with given listeners."""
+    
+    handler = Listener()
+    listeners = [handler if own else Listener() for i in range(count)]
+    
+    for listener in listeners:
+        handler.bind(pero.EVT_PROPERTY_CHANGED, listener.on_evt)
+    
+    evt = pero.PropertyChangedEvt(name="width", old_value=1, new_value=2)
+    
+    def fire():
+        handler.fire(evt)
+    
+    # measure current
+    current = min(timeit.repeat(fire, repeat=REPEATS, number=NUMBER))
+    
+    # measure legacy
+    original = pero.EvtHandler.fire
+    pero.EvtHandler.fire = legacy_fire
+    
+    try:
+        legacy = min(timeit.repeat(fire, repeat=REPEATS, number=NUMBER))
+    finally:
+        pero.EvtHandler.fire = original
+    
+    print("%d %-8s legacy: %8.3f us  dispatch: %8.3f us  speedup: %.2fx" % (
+        count,
+        "own" if own else "external",
+        1e6 * legacy / NUMBER,
+        1e6 * current / NUMBER,
+        legacy / current))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run(0)
+    run(1)
+    run(5)
+    run(1, own=True)
+    run(5, own=True)
@@ -0,0 +1,96 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import tempfile
+import timeit
+import numpy
+import pero
+
+# init repeats
+REPEATS = 3
+NUMBER = 1
+
+# init jobs
+JOBS = 200
+WORKERS = os.cpu_count()
+CHUNKSIZE = 8
+
+
+class Chart(pero.Graphics):
+    """Testing chart."""
+    
+    def __init__(self, seed, **overrides):
+        super().__init__(**overrides)
+        
+        rng = numpy.random.default_rng(seed)
+        self.points = numpy.column_stack((numpy.linspace(20, 480, 200), 50 + rng.random(200) * 200))
+    
+    
+    def draw(self, canvas, **overrides):
+        
+        canvas.line_color = "#00f"
+        canvas.draw_lines(self.points)
+        
+        canvas.fill_color = "#f00"
+        canvas.draw_circles(self.points[::5, 0], self.points[::5, 1], 3)
+        
+        for x in range(20, 500, 50):
+            canvas.draw_text("Label %d" % x, x, 280)
+
+
+def export_serial(jobs):
+    """Exports all jobs one after another."""
+    
+    for graphics, path in jobs:
+        pero.export(graphics, path, 500, 300)
+
+
+def export_parallel(jobs, pool=None):
+    """Exports all jobs using worker processes."""
+    
+    jobs = [(g, p, 500, 300) for g, p in jobs]
+    
+    if pool is None:
+        results = pero.export_many(jobs, workers=WORKERS, chunksize=CHUNKSIZE)
+    else:
+        results = pool.export_many(jobs, chunksize=CHUNKSIZE)
+    
+    assert all(r.ok for r in results)
+
+
+def run():
+    """Compares serial export loop with pero.export_many."""
+    
+    charts = [Chart(i) for i in range(JOBS)]
+    
+    with tempfile.TemporaryDirectory() as temp:
+        jobs = [(c, os.path.join(temp, "chart%d.svg" % i)) for i, c in enumerate(charts)]
+        
+        # measure serial loop
+        serial = min(timeit.repeat(lambda: export_serial(jobs), repeat=REPEATS, number=NUMBER))
+        
+        # measure including pool start
+        cold = min(timeit.repeat(lambda: export_parallel(jobs), repeat=REPEATS, number=NUMBER))
+        
+        # measure using warm pool
+        with pero.ExportPool(WORKERS) as pool:
+            warm = min(timeit.repeat(lambda: export_parallel(jobs, pool), repeat=REPEATS, number=NUMBER))
+    
+    print("jobs: %d  workers: %d  chunksize: %d" % (JOBS, WORKERS, CHUNKSIZE))
+    
+    print("time     serial: %8.1f ms  new pool: %8.1f ms  speedup: %.2fx" % (
+        1e3 * serial / NUMBER,
+        1e3 * cold / NUMBER,
+        serial / cold))
+    
+    print("time     serial: %8.1f ms  warm pool: %8.1f ms  speedup: %.2fx" % (
+        1e3 * serial / NUMBER,
+        1e3 * warm / NUMBER,
+        serial / warm))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
@@ -0,0 +1,57 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import sys
+import subprocess
+import tempfile
+import timeit
+
+# init repeats
+REPEATS = 5
+NUMBER = 1
+
+# init startup script
+SCRIPT = "import pero; pero.FONTS.get_font('')"
+
+
+def run():
+    """Measures startup time with cold and warm fonts index."""
+    
+    with tempfile.TemporaryDirectory() as temp:
+        
+        env = dict(os.environ, PERO_CACHE_DIR=temp)
+        index = os.path.join(temp, "fonts.json")
+        
+        def start():
+            subprocess.run([sys.executable, "-c", SCRIPT], env=env, check=True)
+        
+        def start_cold():
+            if os.path.exists(index):
+                os.remove(index)
+            start()
+        
+        # measure
+        cold = min(timeit.repeat(start_cold, repeat=REPEATS, number=NUMBER))
+        warm = min(timeit.repeat(start, repeat=REPEATS, number=NUMBER))
+        
+        # measure loading only
+        setup = "import pero; from pero.drawing.fonts import FontManager; FontManager(cache=%r).load()" % index
+        load_cold = min(timeit.repeat("FontManager(cache=None).load()", setup, repeat=REPEATS, number=NUMBER))
+        load_warm = min(timeit.repeat("FontManager(cache=%r).load()" % index, setup, repeat=REPEATS, number=NUMBER))
+    
+    print("import   cold: %8.1f ms  warm: %8.1f ms  speedup: %.2fx" % (
+        1e3 * cold / NUMBER,
+        1e3 * warm / NUMBER,
+        cold / warm))
+    
+    print("load     cold: %8.1f ms  warm: %8.1f ms  speedup: %.2fx" % (
+        1e3 * load_cold / NUMBER,
+        1e3 * load_warm / NUMBER,
+        load_cold / load_warm))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
@@ -0,0 +1,96 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import timeit
+import numpy
+import pero
+
+# init repeats
+REPEATS = 5
+NUMBER = 200
+
+
+def make_axis():
+    """Creates testing axis."""
+    
+    ticks = tuple(range(0, 500, 25))
+    
+    return pero.StraitAxis(
+        x = 50,
+        y = 250,
+        length = 500,
+        title = "Axis title",
+        major_ticks = ticks,
+        minor_ticks = tuple(range(0, 500, 5)),
+        labels = tuple(str(x) for x in ticks))
+
+
+def make_legend():
+    """Creates testing legend."""
+    
+    items = []
+    for i, marker in enumerate("osxd+tp"):
+        items.append(pero.MarkerLegend(
+            text = "Legend item %d" % i,
+            marker = marker,
+            show_line = True))
+    
+    return pero.LegendBox(items=tuple(items), x=20, y=20)
+
+
+def make_layout():
+    """Creates testing layout."""
+    
+    layout = pero.Layout()
+    
+    for i in range(3):
+        for j in range(4):
+            layout.add(pero.Profile(
+                x = numpy.arange(50.),
+                y = numpy.random.uniform(0, 100, 50),
+                show_points = True), i, j)
+    
+    return layout
+
+
+def run(label, graphics):
+    """Measures drawing of original and frozen graphics."""
+    
+    frozen = graphics.freeze()
+    
+    def draw_original():
+        canvas = pero.Image(width=600, height=300)
+        graphics.draw(canvas)
+    
+    def draw_frozen():
+        canvas = pero.Image(width=600, height=300)
+        frozen.draw(canvas)
+    
+    # check output
+    original_canvas = pero.Image(width=600, height=300)
+    graphics.draw(original_canvas)
+    
+    frozen_canvas = pero.Image(width=600, height=300)
+    frozen.draw(frozen_canvas)
+    frozen_canvas = pero.Image(width=600, height=300)
+    frozen.draw(frozen_canvas)
+    
+    assert original_canvas.get_json() == frozen_canvas.get_json()
+    
+    # measure
+    original = min(timeit.repeat(draw_original, repeat=REPEATS, number=NUMBER))
+    compiled = min(timeit.repeat(draw_frozen, repeat=REPEATS, number=NUMBER))
+    
+    print("%-8s original: %8.3f ms  frozen: %8.3f ms  speedup: %.2fx" % (
+        label,
+        1e3 * original / NUMBER,
+        1e3 * compiled / NUMBER,
+        original / compiled))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run("axis", make_axis())
+    run("legend", make_legend())
+    run("layout", make_layout())
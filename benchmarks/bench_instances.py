@@ -0,0 +1,44 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import gc
+import time
+import tracemalloc
+import pero
+
+# init count
+COUNT = 100000
+
+
+def run(label, factory):
+    """Measures time and memory needed to create glyph instances."""
+    
+    # measure time
+    gc.collect()
+    start = time.perf_counter()
+    items = [factory(i) for i in range(COUNT)]
+    duration = time.perf_counter() - start
+    
+    # measure memory
+    del items
+    gc.collect()
+    tracemalloc.start()
+    items = [factory(i) for i in range(COUNT)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print("%-12s %d instances: %7.1f ms  %6.1f MB  %5d B/instance" % (
+        label,
+        len(items),
+        1e3 * duration,
+        current / 1024**2,
+        current / COUNT))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run("Circle", lambda i: pero.Circle())
+    run("Circle(x,y)", lambda i: pero.Circle(x=i, y=i))
+    run("TextLabel", lambda i: pero.TextLabel())
+    run("TextLabel(t)", lambda i: pero.TextLabel(x=i, y=i, text=str(i)))
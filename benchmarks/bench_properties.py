@@ -0,0 +1,147 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import timeit
+import pero
+from pero.properties.propset import PROP_SPLITTER
+
+# init repeats
+REPEATS = 5
+NUMBER = 200
+
+
+def legacy_get_property_path(self, name, raise_error=False):
+    """Resolves property path by splitting the name on every call."""
+    
+    path = [self]
+    
+    if name in self._properties:
+        return path + [self._properties[name]]
+    
+    idx = name.find(PROP_SPLITTER)
+    while idx > 0:
+        
+        parent = name[:idx]
+        if parent in self._properties:
+            parent_prop = getattr(self, parent)
+            if isinstance(parent_prop, pero.PropertySet):
+                child_prop = legacy_get_property_path(parent_prop, name[idx+1:])
+                if child_prop:
+                    return path + child_prop
+        
+        idx = name.find(PROP_SPLITTER, idx+1)
+    
+    if raise_error:
+        raise AttributeError(name)
+
+
+def legacy_get_property(self, name, source=pero.UNDEF, overrides=None, native=False):
+    """Gets property value without using the resolution plans."""
+    
+    parent, prop = legacy_get_property_path(self, name, True)[-2:]
+    
+    if overrides and name in overrides:
+        value = prop.parse(overrides[name])
+    else:
+        value = getattr(parent, prop.name)
+    
+    if native:
+        return value
+    
+    if isinstance(value, prop.types):
+        return value
+    
+    if callable(value):
+        value = value(source)
+    
+    return prop.parse(value)
+
+
+def make_axis():
+    """Creates testing axis."""
+    
+    ticks = tuple(range(0, 500, 25))
+    
+    return pero.StraitAxis(
+        x = 50,
+        y = 250,
+        length = 500,
+        title = "Axis title",
+        major_ticks = ticks,
+        minor_ticks = tuple(range(0, 500, 5)),
+        labels = tuple(str(x) for x in ticks))
+
+
+def make_legend():
+    """Creates testing legend."""
+    
+    items = []
+    for i, marker in enumerate("osxd+tp"):
+        items.append(pero.MarkerLegend(
+            text = "Legend item %d" % i,
+            marker = marker,
+            show_line = True))
+    
+    return pero.LegendBox(items=tuple(items), x=20, y=20)
+
+
+class Composite(pero.PropertySet):
+    """Property set with nested child property set."""
+    
+    child = pero.Property(pero.UNDEF, types=(pero.Marker,), nullable=True)
+    child_label_text = pero.Include(pero.TextProperties, prefix="child_label_")
+
+
+def run_lookup(label, prop_set, names):
+    """Measures plain property lookups with current and legacy resolution."""
+    
+    def lookup():
+        for name in names:
+            prop_set.get_property(name)
+    
+    measure(label, lookup, NUMBER * 10)
+
+
+def run_draw(label, glyph):
+    """Measures drawing with current and legacy property resolution."""
+    
+    canvas = pero.Image(width=600, height=300)
+    
+    def draw():
+        canvas._commands = []
+        glyph.draw(canvas)
+    
+    measure(label, draw, NUMBER)
+
+
+def measure(label, func, number):
+    """Measures given function with current and legacy property resolution."""
+    
+    # measure current
+    current = min(timeit.repeat(func, repeat=REPEATS, number=number))
+    
+    # measure legacy
+    original = pero.PropertySet.get_property
+    pero.PropertySet.get_property = legacy_get_property
+    
+    try:
+        legacy = min(timeit.repeat(func, repeat=REPEATS, number=number))
+    finally:
+        pero.PropertySet.get_property = original
+    
+    print("%-8s legacy: %8.3f ms  plans: %8.3f ms  speedup: %.2fx" % (
+        label,
+        1e3 * legacy / number,
+        1e3 * current / number,
+        legacy / current))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    axis = make_axis()
+    run_lookup("lookup", axis, ('label_font_size', 'major_tick_line_width', 'title_text_align', 'x', 'y'))
+    run_lookup("nested", Composite(child=pero.Circle()), ('child_size', 'child_line_color', 'child_label_font_size'))
+    
+    run_draw("axis", axis)
+    run_draw("legend", make_legend())
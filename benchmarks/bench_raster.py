@@ -0,0 +1,73 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import timeit
+import numpy
+import cairo
+import PIL.Image
+import pero
+from pero.backends.cairo import CairoCanvas, RasterPool
+
+# init repeats
+REPEATS = 5
+NUMBER = 200
+
+# init size
+WIDTH = 150
+HEIGHT = 100
+
+# init data
+RNG = numpy.random.default_rng(0)
+XS = RNG.random(20) * WIDTH
+YS = RNG.random(20) * HEIGHT
+
+
+class Thumbnail(pero.Graphics):
+    """Testing thumbnail."""
+    
+    def draw(self, canvas, **overrides):
+        canvas.line_color = "#000"
+        canvas.fill_color = "#f00a"
+        canvas.draw_rect(5, 5, WIDTH-10, HEIGHT-10)
+        canvas.draw_circles(XS, YS, numpy.full(XS.shape, 5.))
+        canvas.draw_text("Thumbnail", 10, 10)
+
+
+def export_original(graphics):
+    """Draws image using new surface and channel swapping copy."""
+    
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, WIDTH, HEIGHT)
+    dc = cairo.Context(surface)
+    dc.set_fill_rule(cairo.FILL_RULE_EVEN_ODD)
+    
+    canvas = CairoCanvas(dc, width=WIDTH, height=HEIGHT)
+    graphics.draw(canvas)
+    
+    data = numpy.frombuffer(surface.get_data(), numpy.uint8)
+    data.shape = (HEIGHT, WIDTH, 4)
+    tmp = numpy.copy(data[:, :, 0])
+    data[:, :, 0] = data[:, :, 2]
+    data[:, :, 2] = tmp
+    
+    return PIL.Image.frombuffer("RGBA", (WIDTH, HEIGHT), data, 'raw', "RGBA", 0, 1)
+
+
+def run():
+    """Compares original raster export with pooled zero-copy export."""
+    
+    graphics = Thumbnail()
+    pool = RasterPool()
+    
+    original = min(timeit.repeat(lambda: export_original(graphics), repeat=REPEATS, number=NUMBER))
+    pooled = min(timeit.repeat(lambda: pool.draw(graphics, WIDTH, HEIGHT), repeat=REPEATS, number=NUMBER))
+    
+    print("per image original: %8.3f ms  pooled: %8.3f ms  speedup: %.2fx" % (
+        1e3 * original / NUMBER,
+        1e3 * pooled / NUMBER,
+        original / pooled))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
@@ -0,0 +1,128 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import tempfile
+import timeit
+import tracemalloc
+import numpy
+import pero
+from pero.backends.json import JsonCanvas, Image
+from pero.backends.recording import RecordingCanvas
+from pero.backends.svg import SVGCanvas
+
+# init repeats
+REPEATS = 5
+NUMBER = 3
+
+# init data
+RNG = numpy.random.default_rng(0)
+LINES = [numpy.column_stack((numpy.arange(1000.), RNG.random(1000) * 500)) for i in range(100)]
+XS = RNG.random(5000) * 500
+YS = RNG.random(5000) * 500
+MARKER = pero.Path().circle(0, 0, 0.5)
+COLORS = ("#f00", "#0f0", "#00f", "#000")
+
+
+def draw(canvas):
+    """Draws testing scene."""
+    
+    # draw lines
+    for i, points in enumerate(LINES):
+        canvas.line_color = COLORS[i % len(COLORS)]
+        canvas.draw_lines(points)
+    
+    # draw markers
+    for x, y in zip(XS, YS):
+        canvas.fill_color = COLORS[int(x) % len(COLORS)]
+        canvas.draw_path(MARKER.transformed(pero.Matrix().scale(5, 5).translate(x, y)))
+    
+    # draw labels
+    for i, (x, y) in enumerate(zip(XS, YS)):
+        canvas.draw_text("Label %d" % (i % 10), x, y)
+
+
+def measure_memory(canvas_class):
+    """Measures memory retained by recorded canvas."""
+    
+    tracemalloc.start()
+    canvas = canvas_class(width=500, height=500)
+    draw(canvas)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return size, canvas
+
+
+def replay_json(canvas):
+    """Replays JSON canvas into SVG canvas the way pero.Image used to."""
+    
+    target = SVGCanvas(width=500, height=500)
+    target.draw_json(canvas.get_json())
+
+
+def replay_recording(canvas):
+    """Replays recording canvas into SVG canvas."""
+    
+    target = SVGCanvas(width=500, height=500)
+    canvas.replay(target)
+
+
+def run():
+    """Measures memory, recording and replay time."""
+    
+    # measure memory
+    json_size, json_canvas = measure_memory(JsonCanvas)
+    rec_size, rec_canvas = measure_memory(RecordingCanvas)
+    
+    print("memory   json: %8.2f MB  recording: %8.2f MB  ratio: %.2fx" % (
+        json_size / 1e6,
+        rec_size / 1e6,
+        json_size / rec_size))
+    
+    # measure recording
+    json_time = min(timeit.repeat(lambda: draw(JsonCanvas()), repeat=REPEATS, number=NUMBER))
+    rec_time = min(timeit.repeat(lambda: draw(RecordingCanvas()), repeat=REPEATS, number=NUMBER))
+    
+    print("record   json: %8.2f ms  recording: %8.2f ms  speedup: %.2fx" % (
+        1e3 * json_time / NUMBER,
+        1e3 * rec_time / NUMBER,
+        json_time / rec_time))
+    
+    # measure replay
+    json_time = min(timeit.repeat(lambda: replay_json(json_canvas), repeat=REPEATS, number=NUMBER))
+    rec_time = min(timeit.repeat(lambda: replay_recording(rec_canvas), repeat=REPEATS, number=NUMBER))
+    
+    print("replay   json: %8.2f ms  recording: %8.2f ms  speedup: %.2fx" % (
+        1e3 * json_time / NUMBER,
+        1e3 * rec_time / NUMBER,
+        json_time / rec_time))
+    
+    # measure loading
+    with tempfile.TemporaryDirectory() as temp:
+        
+        json_path = os.path.join(temp, "image.json")
+        rec_path = os.path.join(temp, "image.pero")
+        
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(json_canvas.get_json())
+        
+        rec_canvas.save(rec_path)
+        
+        json_time = min(timeit.repeat(lambda: Image.load_json(json_path), repeat=REPEATS, number=NUMBER))
+        rec_time = min(timeit.repeat(lambda: Image.load(rec_path), repeat=REPEATS, number=NUMBER))
+        
+        print("load     json: %8.2f ms  binary:    %8.2f ms  speedup: %.2fx" % (
+            1e3 * json_time / NUMBER,
+            1e3 * rec_time / NUMBER,
+            json_time / rec_time))
+        
+        print("size     json: %8.2f MB  binary:    %8.2f MB" % (
+            os.path.getsize(json_path) / 1e6,
+            os.path.getsize(rec_path) / 1e6))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
@@ -0,0 +1,101 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import tempfile
+import timeit
+import tracemalloc
+import numpy
+import pero
+from pero.backends.svg import SVGCanvas
+
+# init repeats
+REPEATS = 5
+NUMBER = 1
+
+# init data
+RNG = numpy.random.default_rng(0)
+LINES = [numpy.column_stack((numpy.arange(10000.), RNG.random(10000) * 500)) for i in range(50)]
+XS = RNG.random(5000) * 500
+YS = RNG.random(5000) * 500
+MARKER = pero.Path().circle(0, 0, 0.5)
+COLORS = ("#f00", "#0f0", "#00f", "#000")
+
+
+def draw(canvas):
+    """Draws testing scene."""
+    
+    # draw lines
+    for i, points in enumerate(LINES):
+        canvas.line_color = COLORS[i % len(COLORS)]
+        canvas.draw_lines(points)
+        canvas.draw_polygon(points[::10])
+    
+    # draw paths
+    for x, y in zip(XS, YS):
+        canvas.fill_color = COLORS[int(x) % len(COLORS)]
+        canvas.draw_path(MARKER.transformed(pero.Matrix().scale(5, 5).translate(x, y)))
+
+
+def export_buffered(path):
+    """Exports scene by buffering whole document."""
+    
+    canvas = SVGCanvas(width=500, height=500)
+    draw(canvas)
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(canvas.get_xml())
+
+
+def export_streamed(path):
+    """Exports scene by streaming into file."""
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        canvas = SVGCanvas(f, width=500, height=500)
+        draw(canvas)
+        canvas.finish()
+
+
+def measure_peak(func, path):
+    """Measures peak memory of given export."""
+    
+    tracemalloc.start()
+    func(path)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return peak
+
+
+def run():
+    """Compares buffered and streamed SVG export."""
+    
+    with tempfile.TemporaryDirectory() as temp:
+        path = os.path.join(temp, "image.svg")
+        
+        # measure time
+        buffered = min(timeit.repeat(lambda: export_buffered(path), repeat=REPEATS, number=NUMBER))
+        streamed = min(timeit.repeat(lambda: export_streamed(path), repeat=REPEATS, number=NUMBER))
+        
+        # measure memory
+        buffered_peak = measure_peak(export_buffered, path)
+        streamed_peak = measure_peak(export_streamed, path)
+        file_size = os.path.getsize(path)
+    
+    print("file size:        %8.1f MB" % (file_size / 1e6))
+    
+    print("time     buffered: %8.1f ms  streamed: %8.1f ms  speedup: %.2fx" % (
+        1e3 * buffered / NUMBER,
+        1e3 * streamed / NUMBER,
+        buffered / streamed))
+    
+    print("peak     buffered: %8.1f MB  streamed: %8.1f MB  reduction: %.2fx" % (
+        buffered_peak / 1e6,
+        streamed_peak / 1e6,
+        buffered_peak / streamed_peak))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
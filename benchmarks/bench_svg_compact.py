@@ -0,0 +1,114 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import glob
+import runpy
+import timeit
+import numpy
+import pero
+from pero.backends.svg import SVGCanvas
+
+# init repeats
+REPEATS = 3
+NUMBER = 1
+
+# init examples
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples", "drawing", "draw_*.py")
+
+# init data
+RNG = numpy.random.default_rng(0)
+XS = RNG.random(4000) * 700 + 50
+YS = RNG.random(4000) * 500 + 50
+SYMBOLS = (pero.MARKER_HEXAGON, pero.MARKER_PENTAGON, pero.MARKER_TRIANGLE, pero.MARKER_DIAMOND)
+
+
+class Markers(pero.Graphics):
+    """Marker-heavy testing scene."""
+    
+    
+    def draw(self, canvas, *args, **kwargs):
+        """Draws the scene."""
+        
+        canvas.fill(pero.colors.White)
+        
+        for i, symbol in enumerate(SYMBOLS):
+            
+            marker = pero.Marker.create(symbol,
+                size = 8,
+                line_color = pero.colors.Black,
+                fill_color = pero.colors.Blue.lighter(0.2*i))
+            
+            for x, y in zip(XS[i::len(SYMBOLS)], YS[i::len(SYMBOLS)]):
+                marker.draw(canvas, x=x, y=y)
+
+
+def get_scenes():
+    """Loads drawing examples."""
+    
+    scenes = []
+    
+    for path in sorted(glob.glob(EXAMPLES)):
+        
+        try:
+            test = runpy.run_path(path, run_name="bench").get('DrawTest')
+        except Exception:
+            continue
+        
+        if test is not None:
+            scenes.append((os.path.basename(path), test()))
+    
+    return scenes
+
+
+def export(graphics, compact):
+    """Draws graphics into SVG and returns its size."""
+    
+    canvas = SVGCanvas(width=800, height=600, compact=compact)
+    graphics.draw(canvas)
+    
+    return len(canvas.get_xml())
+
+
+def run():
+    """Compares normal and compact SVG output."""
+    
+    # measure examples
+    total_normal = 0
+    total_compact = 0
+    
+    for name, graphics in get_scenes():
+        
+        try:
+            normal = export(graphics, False)
+            compact = export(graphics, True)
+        except Exception:
+            continue
+        
+        total_normal += normal
+        total_compact += compact
+        
+        print("%-30s %10d B  %10d B  %6.2fx" % (name, normal, compact, normal / compact))
+    
+    print("%-30s %10d B  %10d B  %6.2fx" % ("examples total", total_normal, total_compact, total_normal / total_compact))
+    
+    # measure markers
+    graphics = Markers()
+    normal = export(graphics, False)
+    compact = export(graphics, True)
+    
+    print("%-30s %10d B  %10d B  %6.2fx" % ("markers", normal, compact, normal / compact))
+    
+    # measure time
+    normal = min(timeit.repeat(lambda: export(graphics, False), repeat=REPEATS, number=NUMBER))
+    compact = min(timeit.repeat(lambda: export(graphics, True), repeat=REPEATS, number=NUMBER))
+    
+    print("markers time   normal: %8.1f ms  compact: %8.1f ms" % (
+        1e3 * normal / NUMBER,
+        1e3 * compact / NUMBER))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
@@ -0,0 +1,67 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import tempfile
+import timeit
+import numpy
+import pero
+from pero.backends.cairo import export_raster
+
+# init repeats
+REPEATS = 3
+NUMBER = 1
+
+# init size
+WIDTH = 6000
+HEIGHT = 8000
+WORKERS = os.cpu_count()
+
+# init data
+RNG = numpy.random.default_rng(0)
+XS = RNG.random(100000) * WIDTH
+YS = RNG.random(100000) * HEIGHT
+
+
+class Poster(pero.Graphics):
+    """Testing poster."""
+    
+    def draw(self, canvas, **overrides):
+        
+        canvas.fill_color = "#fff"
+        canvas.fill()
+        
+        canvas.line_color = "#00f"
+        canvas.draw_lines(numpy.column_stack((XS[:5000], YS[:5000])))
+        
+        canvas.fill_color = "#f008"
+        canvas.draw_circles(XS, YS, numpy.full(XS.shape, 4.))
+
+
+def run():
+    """Compares single surface raster export with tiled export."""
+    
+    graphics = Poster()
+    
+    with tempfile.TemporaryDirectory() as temp:
+        path = os.path.join(temp, "poster.png")
+        
+        single = min(timeit.repeat(lambda: export_raster(graphics, path, WIDTH, HEIGHT), repeat=REPEATS, number=NUMBER))
+        tiled = min(timeit.repeat(lambda: export_raster(graphics, path, WIDTH, HEIGHT, tiles=4*WORKERS, workers=WORKERS), repeat=REPEATS, number=NUMBER))
+    
+    print("size: %dx%d  workers: %d" % (WIDTH, HEIGHT, WORKERS))
+    
+    print("time     single: %8.1f ms  tiled: %8.1f ms  speedup: %.2fx" % (
+        1e3 * single / NUMBER,
+        1e3 * tiled / NUMBER,
+        single / tiled))
+    
+    print("pixels   single: %8.1f MB  tiled: %8.1f MB per worker" % (
+        WIDTH * HEIGHT * 4 / 1e6,
+        WIDTH * HEIGHT * 4 / (4 * WORKERS) / 1e6))
+
+
+# run benchmark
+if __name__ == '__main__':
+    
+    run()
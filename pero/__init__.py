@@ -16,8 +16,83 @@ from . tickers import *
 from . geometry import *
 from . drawing import *
 from . glyphs import *
-from . backends import *
 
 # import modules
-from . import backends
 from . import colors
+
+# remove submodules leaked by star imports shadowing lazy backends
+globals().pop('backends', None)
+globals().pop('view', None)
+
+# define lazy objects
+_BACKENDS = (
+    'Control', 'ToolControl', 'Sizer', 'Tool', 'View', 'Image',
+    'show', 'export', 'export_bytes', 'export_many', 'debug',
+    'ExportPool', 'ExportResult',
+    'control', 'sizer', 'tool', 'view', 'json', 'recording', 'svg')
+
+_TOOLKITS = ('cairo', 'mupdf', 'qt', 'wx', 'pythonista')
+
+
+def __getattr__(name):
+    """Imports backends and lazy glyphs on first access."""
+    
+    from importlib import import_module
+    
+    # get all names for star import
+    if name == '__all__':
+        return _get_all()
+    
+    # import backends
+    if name == 'backends':
+        return import_module(".backends", __name__)
+    
+    # get lazy glyph
+    if name in glyphs._LAZY or name in glyphs._LAZY_NAMES:
+        value = getattr(glyphs, name)
+    
+    # get backends object
+    elif name in _BACKENDS or name in _TOOLKITS:
+        value = getattr(import_module(".backends", __name__), name, None)
+    
+    else:
+        value = None
+    
+    # check value
+    if value is None:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    
+    # store value
+    globals()[name] = value
+    
+    return value
+
+
+def __dir__():
+    """Gets all available names including lazy ones."""
+    
+    names = set(globals()) | set(glyphs._LAZY) | set(glyphs._LAZY_NAMES)
+    names |= set(_BACKENDS) | {'backends'}
+    
+    return sorted(names)
+
+
+def _get_all():
+    """Gets all public names including available lazy ones."""
+    
+    names = []
+    
+    for name in __dir__() + list(_TOOLKITS):
+        
+        if name.startswith('_'):
+            continue
+        
+        try:
+            if name not in globals():
+                __getattr__(name)
+            names.append(name)
+        
+        except AttributeError:
+            pass
+    
+    return names
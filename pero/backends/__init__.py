@@ -6,25 +6,38 @@ from . control import Control, ToolControl
 from . sizer import Sizer
 from . tool import Tool
 from . view import View
-from . export import show, export, debug
+from . export import show, export, export_bytes, debug
+from . batch import ExportPool, ExportResult, export_many
 from . json import Image
 
 # import main backends
 from . import json
-from . import svg
+from . import recording
 
-# try import backends
-try: from . import cairo
-except ImportError: pass
+# define lazy backends
+_LAZY = ('svg', 'cairo', 'mupdf', 'qt', 'wx', 'pythonista')
+_MISSING = set()
 
-try: from . import mupdf
-except ImportError: pass
 
-try: from . import qt
-except ImportError: pass
+def __getattr__(name):
+    """Imports lazy backends on first access."""
+    
+    # check backend
+    if name not in _LAZY or name in _MISSING:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    
+    # try import backend
+    try:
+        from importlib import import_module
+        return import_module("." + name, __name__)
+    
+    # remember missing library
+    except ImportError:
+        _MISSING.add(name)
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
 
-try: from . import wx
-except ImportError: pass
 
-try: from . import pythonista
-except ImportError: pass
+def __dir__():
+    """Gets all available names including lazy backends."""
+    
+    return sorted(set(globals()) | (set(_LAZY) - _MISSING))
@@ -0,0 +1,495 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import os
+import io
+import time
+import pickle
+import traceback
+import importlib
+import multiprocessing
+import concurrent.futures
+from .. enums import *
+from .. drawing import FONTS
+from . export import is_path, get_extension
+from . json import JsonCanvas
+
+# define constants
+_PRELOAD = (BACKEND_JSON, BACKEND_SVG, BACKEND_CAIRO, BACKEND_MUPDF)
+_PENDING = 4
+_FONT_SIZES = (10, 11)
+
+
+class ExportResult(object):
+    """Holds the outcome of a single export job."""
+    
+    
+    def __init__(self, index, path, duration, error=None, trace=None, data=None):
+        """Initializes a new instance of ExportResult."""
+        
+        self._index = index
+        self._path = path
+        self._duration = duration
+        self._error = error
+        self._trace = trace
+        self._data = data
+    
+    
+    def __repr__(self):
+        """Gets debug string representation."""
+        
+        status = self._error or "OK"
+        return "%s(%d, %.1f ms, %s)" % (self.__class__.__name__, self._index, 1e3 * self._duration, status)
+    
+    
+    @property
+    def index(self):
+        """
+        Gets index of the job within the batch.
+        
+        Returns:
+            int
+                Job index.
+        """
+        
+        return self._index
+    
+    
+    @property
+    def path(self):
+        """
+        Gets export target of the job.
+        
+        Returns:
+            str or file
+                File path or file object.
+        """
+        
+        return self._path
+    
+    
+    @property
+    def duration(self):
+        """
+        Gets time spent by rendering the job within the worker.
+        
+        Returns:
+            float
+                Rendering time in seconds.
+        """
+        
+        return self._duration
+    
+    
+    @property
+    def error(self):
+        """
+        Gets error message if the job failed.
+        
+        Returns:
+            str or None
+                Error message.
+        """
+        
+        return self._error
+    
+    
+    @property
+    def trace(self):
+        """
+        Gets formatted traceback if the job failed.
+        
+        Returns:
+            str or None
+                Error traceback.
+        """
+        
+        return self._trace
+    
+    
+    @property
+    def data(self):
+        """
+        Gets image data rendered for file object target.
+        
+        Returns:
+            bytes or None
+                Image data.
+        """
+        
+        return self._data
+    
+    
+    @property
+    def ok(self):
+        """
+        Checks whether the job succeeded.
+        
+        Returns:
+            bool
+                True if no error occurred.
+        """
+        
+        return self._error is None
+
+
+class ExportPool(object):
+    """
+    Renders export jobs in a pool of warm worker processes. Every worker
+    imports the export backends and receives the fonts of the main process
+    when started, so that neither the imports nor the font scan are repeated
+    for individual jobs. The pool should be closed when not needed anymore,
+    preferably by using it as context manager.
+    
+    Each job graphics is pickled only once within the main process, even if
+    used by several jobs. Jobs writing into file objects are rendered into
+    bytes by the workers and written into the file objects by the main process.
+    Failed jobs are reported by their results without aborting the batch.
+    """
+    
+    
+    def __init__(self, workers=None, preload=_PRELOAD, context=None):
+        """
+        Initializes a new instance of ExportPool.
+        
+        Args:
+            workers: int or None
+                Number of worker processes. If set to None, number of CPUs is
+                used. If set to 0, jobs are rendered within current process.
+            
+            preload: (pero.BACKEND,)
+                Backends to be imported by workers. Missing libraries are
+                ignored.
+            
+            context: str, multiprocessing.context.BaseContext or None
+                Multiprocessing context or start method name to be used.
+        """
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if isinstance(context, str):
+            context = multiprocessing.get_context(context)
+        
+        self._workers = workers
+        self._executor = None
+        
+        # init workers
+        if workers > 0:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers = workers,
+                mp_context = context,
+                initializer = _init_worker,
+                initargs = (FONTS.export_fonts(), tuple(preload)))
+            
+            # start all workers
+            futures = [self._executor.submit(os.getpid) for i in range(workers)]
+            concurrent.futures.wait(futures)
+    
+    
+    def __enter__(self):
+        """Enters context manager."""
+        
+        return self
+    
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Closes the pool."""
+        
+        self.close()
+    
+    
+    @property
+    def workers(self):
+        """
+        Gets number of worker processes.
+        
+        Returns:
+            int
+                Number of workers.
+        """
+        
+        return self._workers
+    
+    
+    def submit(self, graphics, path=None, width=None, height=None, **options):
+        """
+        Submits single export job into the pool.
+        
+        Args:
+            graphics: pero.Graphics or bytes
+                Graphics to be drawn or its pickled data.
+            
+            path: str or None
+                Full path of a file to save the image into. If set to None,
+                the image data are returned by the result, in which case the
+                'format' option must be specified.
+            
+            width: float or None
+                Image width in device units.
+            
+            height: float or None
+                Image height in device units.
+            
+            options: str:any pairs
+                Additional parameters for pero.export.
+        
+        Returns:
+            concurrent.futures.Future
+                Future of the job result. The result is provided as a tuple
+                of (duration, error, trace, data).
+        """
+        
+        # render directly
+        if self._executor is None:
+            future = concurrent.futures.Future()
+            future.set_result(_render(graphics, path, width, height, options))
+            return future
+        
+        # pickle graphics
+        if not isinstance(graphics, bytes):
+            graphics = pickle.dumps(graphics, pickle.HIGHEST_PROTOCOL)
+        
+        # submit job
+        return self._executor.submit(_render, graphics, path, width, height, options)
+    
+    
+    def export_many(self, jobs, callback=None, chunksize=1, **options):
+        """
+        Renders all given jobs using the pool workers.
+        
+        Args:
+            jobs: ((pero.Graphics, str or file, ...),)
+                Jobs to be rendered. Each job is defined as a tuple of
+                graphics and its target path or binary file object,
+                optionally followed by image width, image height and a
+                dictionary of specific export options.
+            
+            callback: callable or None
+                Function to be called with every finished pero.ExportResult.
+            
+            chunksize: int
+                Number of jobs sent to a worker at once. Higher values reduce
+                the communication overhead for many small images.
+            
+            options: str:any pairs
+                Common export options used for all jobs.
+        
+        Returns:
+            (pero.ExportResult,)
+                Results of all jobs in the same order as jobs.
+        """
+        
+        results = []
+        pending = {}
+        payloads = {}
+        chunk = []
+        limit = max(1, _PENDING * self._workers)
+        
+        for index, job in enumerate(jobs):
+            
+            # get job
+            graphics, path, width, height, job_options = _parse_job(job, options)
+            results.append(None)
+            
+            # pickle graphics once
+            payload = graphics
+            if self._executor is not None:
+                
+                key = id(graphics)
+                if key not in payloads:
+                    payloads[key] = (graphics, pickle.dumps(graphics, pickle.HIGHEST_PROTOCOL))
+                
+                payload = payloads[key][1]
+            
+            # render file objects into bytes
+            target = path
+            if not is_path(path):
+                job_options['format'] = get_extension(path, job_options.get('format', None))
+                target = None
+            
+            # add to chunk
+            chunk.append((index, path, (payload, target, width, height, job_options)))
+            if len(chunk) < chunksize:
+                continue
+            
+            # submit chunk
+            pending[self._submit_chunk(chunk)] = chunk
+            chunk = []
+            
+            # wait for free worker
+            if len(pending) >= limit:
+                self._collect(pending, results, callback, concurrent.futures.FIRST_COMPLETED)
+        
+        # submit last chunk
+        if chunk:
+            pending[self._submit_chunk(chunk)] = chunk
+        
+        # wait for all
+        self._collect(pending, results, callback, concurrent.futures.ALL_COMPLETED)
+        
+        return tuple(results)
+    
+    
+    def close(self):
+        """Shuts down all worker processes."""
+        
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    
+    def _submit_chunk(self, chunk):
+        """Submits jobs chunk into the pool."""
+        
+        items = [c[2] for c in chunk]
+        
+        # render directly
+        if self._executor is None:
+            future = concurrent.futures.Future()
+            future.set_result(_render_many(items))
+            return future
+        
+        # submit chunk
+        return self._executor.submit(_render_many, items)
+    
+    
+    def _collect(self, pending, results, callback, when):
+        """Collects finished jobs."""
+        
+        done, not_done = concurrent.futures.wait(pending, return_when=when)
+        
+        for future in done:
+            chunk = pending.pop(future)
+            
+            # get results
+            try:
+                outputs = future.result()
+            
+            # worker crashed
+            except Exception as exc:
+                outputs = [(0., _get_message(exc), traceback.format_exc(), None)] * len(chunk)
+            
+            for (index, path, item), (duration, error, trace, data) in zip(chunk, outputs):
+                
+                # write into file object
+                if data is not None and not is_path(path):
+                    path.write(data)
+                
+                # store result
+                result = ExportResult(index, path, duration, error, trace, data)
+                results[index] = result
+                
+                # call callback
+                if callback is not None:
+                    callback(result)
+
+
+def export_many(jobs, workers=None, callback=None, chunksize=1, **options):
+    """
+    Draws given graphics into specified files or file objects using a pool of
+    worker processes. Any failed job is reported by its result while the rest
+    of the batch continues.
+    
+    Args:
+        jobs: ((pero.Graphics, str or file, ...),)
+            Jobs to be rendered. Each job is defined as a tuple of graphics
+            and its target path or binary file object, optionally followed by
+            image width, image height and a dictionary of specific export
+            options.
+        
+        workers: int or None
+            Number of worker processes. If set to None, number of CPUs is used.
+            If set to 0, jobs are rendered within current process.
+        
+        callback: callable or None
+            Function to be called with every finished pero.ExportResult.
+        
+        chunksize: int
+            Number of jobs sent to a worker at once. Higher values reduce the
+            communication overhead for many small images.
+        
+        options: str:any pairs
+            Common export options used for all jobs.
+    
+    Returns:
+        (pero.ExportResult,)
+            Results of all jobs in the same order as jobs.
+    """
+    
+    with ExportPool(workers) as pool:
+        return pool.export_many(jobs, callback, chunksize, **options)
+
+
+def _parse_job(job, options):
+    """Gets job items with default values."""
+    
+    graphics, path = job[0], job[1]
+    width = job[2] if len(job) > 2 else None
+    height = job[3] if len(job) > 3 else None
+    
+    job_options = dict(options)
+    if len(job) > 4 and job[4]:
+        job_options.update(job[4])
+    
+    return graphics, path, width, height, job_options
+
+
+def _render(payload, path, width, height, options):
+    """Renders single job within a worker."""
+    
+    start = time.perf_counter()
+    
+    try:
+        graphics = pickle.loads(payload) if isinstance(payload, bytes) else payload
+        
+        # export into file
+        if path is not None:
+            graphics.export(path, width, height, **options)
+            data = None
+        
+        # export into bytes
+        else:
+            buff = io.BytesIO()
+            graphics.export(buff, width, height, **options)
+            data = buff.getvalue()
+        
+        return time.perf_counter() - start, None, None, data
+    
+    except Exception as exc:
+        return time.perf_counter() - start, _get_message(exc), traceback.format_exc(), None
+
+
+def _render_many(items):
+    """Renders multiple jobs within a worker."""
+    
+    return [_render(*item) for item in items]
+
+
+def _get_message(exc):
+    """Gets error message from given exception."""
+    
+    return "%s: %s" % (exc.__class__.__name__, exc)
+
+
+def _init_worker(fonts, preload):
+    """Initializes worker process."""
+    
+    # import backends
+    for name in preload:
+        try:
+            importlib.import_module("pero.backends." + name)
+        except ImportError:
+            pass
+    
+    # use fonts of main process
+    FONTS.set_fonts(fonts)
+    
+    # init default font metrics
+    canvas = JsonCanvas()
+    for size in _FONT_SIZES:
+        canvas.font_size = size
+        try:
+            canvas.get_text_size("Ag")
+        except ValueError:
+            pass
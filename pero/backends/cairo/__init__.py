@@ -4,4 +4,6 @@
 # import main objects
 from . enums import *
 from . canvas import CairoCanvas
+from . raster import RasterPool, get_image
 from . export import export, export_raster, export_vector
+from . tiles import export_tiled
@@ -148,6 +148,49 @@ class CairoCanvas(Canvas):
         self._fill_and_stroke()
     
     
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, radii = self._get_bulk_arrays(xs, ys, radii)
+        
+        # apply scaling and offset
+        xs = (self._scale * (xs + self._offset[0])).tolist()
+        ys = (self._scale * (ys + self._offset[1])).tolist()
+        radii = (self._scale * radii).tolist()
+        
+        # get pens and brushes
+        pens, brushes = self._get_bulk_sources(line_colors, fill_colors, len(xs))
+        
+        # draw
+        dc = self._dc
+        angle = 2*numpy.pi
+        
+        for x, y, radius, pen, brush in zip(xs, ys, radii, pens, brushes):
+            dc.new_path()
+            dc.arc(x, y, radius, 0, angle)
+            self._fill_and_stroke(pen, brush)
+    
+    
     def draw_ellipse(self, x, y, width, height):
         """
         Adds an ellipse centered at given position and fitting into the size.
@@ -244,6 +287,9 @@ class CairoCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # init drawing
         self._dc.new_path()
         self._dc.move_to(points[0][0], points[0][1])
@@ -256,6 +302,54 @@ class CairoCanvas(Canvas):
         self._fill_and_stroke()
     
     
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, sizes = self._get_bulk_arrays(xs, ys, sizes)
+        
+        # apply scaling and offset
+        xs = (self._scale * (xs + self._offset[0])).tolist()
+        ys = (self._scale * (ys + self._offset[1])).tolist()
+        sizes = (self._scale * sizes).tolist()
+        
+        # get pens and brushes
+        pens, brushes = self._get_bulk_sources(line_colors, fill_colors, len(xs))
+        
+        # set new fill rule
+        fill_rule = self._dc.get_fill_rule()
+        self._dc.set_fill_rule(CAIRO_FILL_RULE[path.fill_rule])
+        
+        # draw
+        for x, y, size, pen, brush in zip(xs, ys, sizes, pens, brushes):
+            self._make_native_path(path.transformed(Matrix().scale(size, size).translate(x, y)))
+            self._fill_and_stroke(pen, brush)
+        
+        # set back fill rule
+        self._dc.set_fill_rule(fill_rule)
+    
+    
     def draw_path(self, path):
         """
         Draws given path using current pen and brush.
@@ -301,6 +395,9 @@ class CairoCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # init drawing
         self._dc.new_path()
         self._dc.move_to(points[0][0], points[0][1])
@@ -365,6 +462,104 @@ class CairoCanvas(Canvas):
         self._fill_and_stroke()
     
     
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # draw as paths if having round corners
+        if radius:
+            super().draw_rects(xs, ys, widths, heights, radius, line_colors, fill_colors)
+            return
+        
+        # get items
+        xs, ys, widths, heights = self._get_bulk_arrays(xs, ys, widths, heights)
+        
+        # apply scaling and offset
+        xs = (self._scale * (xs + self._offset[0])).tolist()
+        ys = (self._scale * (ys + self._offset[1])).tolist()
+        widths = (self._scale * widths).tolist()
+        heights = (self._scale * heights).tolist()
+        
+        # get pens and brushes
+        pens, brushes = self._get_bulk_sources(line_colors, fill_colors, len(xs))
+        
+        # draw
+        dc = self._dc
+        
+        for x, y, width, height, pen, brush in zip(xs, ys, widths, heights, pens, brushes):
+            dc.new_path()
+            dc.rectangle(x, y, width, height)
+            self._fill_and_stroke(pen, brush)
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+        """
+        
+        # get items
+        x1s, y1s, x2s, y2s = self._get_bulk_arrays(x1s, y1s, x2s, y2s)
+        
+        # apply scaling and offset
+        x1s = (self._scale * (x1s + self._offset[0])).tolist()
+        y1s = (self._scale * (y1s + self._offset[1])).tolist()
+        x2s = (self._scale * (x2s + self._offset[0])).tolist()
+        y2s = (self._scale * (y2s + self._offset[1])).tolist()
+        
+        # get pens
+        pens, brushes = self._get_bulk_sources(line_colors, None, len(x1s))
+        
+        # draw
+        dc = self._dc
+        
+        for x1, y1, x2, y2, pen, brush in zip(x1s, y1s, x2s, y2s, pens, brushes):
+            dc.new_path()
+            dc.move_to(x1, y1)
+            dc.line_to(x2, y2)
+            self._fill_and_stroke(pen, brush)
+    
+    
     def draw_text(self, text, x, y, angle=0):
         """
         Draws a text string anchored at specified point using current text
@@ -545,28 +740,53 @@ class CairoCanvas(Canvas):
                 self._dc.curve_to(*values)
     
     
-    def _fill_and_stroke(self):
-        """Fills and strokes current path."""
+    def _get_bulk_sources(self, line_colors, fill_colors, count):
+        """Gets pen and brush sources for individual items."""
+        
+        # get pens
+        pens = [self._pen] * count
+        if line_colors is not None:
+            colors = self._get_bulk_colors(line_colors, count, "line_")
+            pens = [c.rgba_r if c.alpha else None for c in colors]
+        
+        # get brushes
+        brushes = [self._brush] * count
+        if fill_colors is not None and self.fill_style != FILL_STYLE_TRANS:
+            colors = self._get_bulk_colors(fill_colors, count, "fill_")
+            brushes = [c.rgba_r if c.alpha else None for c in colors]
+        
+        return pens, brushes
+    
+    
+    def _fill_and_stroke(self, pen=UNDEF, brush=UNDEF):
+        """Fills and strokes current path by current or given sources."""
+        
+        # get sources
+        if pen is UNDEF:
+            pen = self._pen
+        
+        if brush is UNDEF:
+            brush = self._brush
         
         # fill and stroke
-        if self._pen and self._brush:
+        if pen and brush:
             
-            self._dc.set_source_rgba(*self._brush)
+            self._dc.set_source_rgba(*brush)
             self._dc.fill_preserve()
             
-            self._dc.set_source_rgba(*self._pen)
+            self._dc.set_source_rgba(*pen)
             self._dc.stroke()
         
         # stroke only
-        elif self._pen:
+        elif pen:
             
-            self._dc.set_source_rgba(*self._pen)
+            self._dc.set_source_rgba(*pen)
             self._dc.stroke()
         
         # fill only
-        elif self._brush:
+        elif brush:
             
-            self._dc.set_source_rgba(*self._brush)
+            self._dc.set_source_rgba(*brush)
             self._dc.fill()
     
     
@@ -1,27 +1,28 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
-import os.path
 import cairo
-import PIL
-import numpy
+from .. export import get_extension
 from . enums import *
 from . canvas import CairoCanvas
+from . raster import RasterPool
+from . tiles import export_tiled
 
 
 def export(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics into specified image file. The image format is
-    determined from the extension of given file path. Supported extensions are
-    .bmp, .jpg, .jpeg, .png, .pcx, .pnm, .tif, .tiff, .xpm, .ico, .cur, .svg,
-    .pdf and .eps.
+    Draws given graphics into specified image file or file object. The image
+    format is determined from the 'format' option or the extension of given
+    file path. Supported extensions are .bmp, .jpg, .jpeg, .png, .pcx, .pnm,
+    .tif, .tiff, .xpm, .ico, .cur, .svg, .pdf and .eps.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -38,6 +39,10 @@ def export(graphics, path, width=None, height=None, **options):
         font_scale: float
             Font scaling factor.
         
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+            This is required if file object without name is provided.
+        
         dpi: int
             Image resolution as dots-per-inch.
         
@@ -46,10 +51,8 @@ def export(graphics, path, width=None, height=None, **options):
             and 100 excellent. This option is only available for JPEG format.
     """
     
-    # get filename and extension
-    dirname, filename = os.path.split(path)
-    basename, extension = os.path.splitext(filename)
-    extension = extension.lower()
+    # get extension
+    extension = get_extension(path, options.get('format', None))
     
     # export as raster image
     if extension in CAIRO_RASTER_TYPES:
@@ -67,16 +70,18 @@ def export(graphics, path, width=None, height=None, **options):
 
 def export_raster(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics as raster image into specified file. The image format
-    is determined from the extension of given file path. Supported extensions
-    are .bmp, .jpg, .jpeg, .png, .pcx, .tif and .tiff.
+    Draws given graphics as raster image into specified file or file object.
+    The image format is determined from the 'format' option or the extension
+    of given file path. Supported extensions are .bmp, .jpg, .jpeg, .png,
+    .pcx, .tif and .tiff.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -93,18 +98,32 @@ def export_raster(graphics, path, width=None, height=None, **options):
         font_scale: float
             Font scaling factor.
         
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+            This is required if file object without name is provided.
+        
         dpi: int
             Image resolution as dots-per-inch.
         
         quality: int
             Image quality in range between 0 and 100 with 0 meaning very poor
             and 100 excellent. This option is only available for JPEG format.
+        
+        pool: pero.cairo.RasterPool or None
+            Pool of reusable surfaces to be used when exporting many images
+            of the same size.
+        
+        tiles: int or None
+            If set, the image is drawn by given number of tiles in parallel
+            (see pero.cairo.export_tiled). This is only available for PNG
+            format.
+        
+        workers: int or None
+            Number of worker processes used to draw the tiles.
     """
     
-    # get filename and extension
-    dirname, filename = os.path.split(path)
-    basename, extension = os.path.splitext(filename)
-    extension = extension.lower()
+    # get extension
+    extension = get_extension(path, options.get('format', None))
     
     # check format
     if extension not in CAIRO_RASTER_TYPES:
@@ -117,34 +136,20 @@ def export_raster(graphics, path, width=None, height=None, **options):
     if not height:
         height = EXPORT_HEIGHT
     
-    # create DC
-    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
-    dc = cairo.Context(surface)
-    dc.set_fill_rule(cairo.FILL_RULE_EVEN_ODD)
-    
-    # init canvas
-    canvas = CairoCanvas(dc, width=width, height=height)
-    
-    if 'draw_scale' in options:
-        canvas.draw_scale = options['draw_scale']
-    
-    if 'line_scale' in options:
-        canvas.line_scale = options['line_scale']
-    
-    if 'font_scale' in options:
-        canvas.font_scale = options['font_scale']
-    
-    # draw graphics
-    graphics.draw(canvas)
+    # draw by tiles
+    if options.get('tiles', None):
+        
+        if CAIRO_RASTER_TYPES[extension] != 'PNG':
+            message = "Tiled export is only available for PNG format! -> %s" % extension
+            raise NotImplementedError(message)
+        
+        export_tiled(graphics, path, width, height, **options)
+        return
     
-    # convert to PIL image (and convert ARGB to RGBA)
-    width, height = surface.get_width(), surface.get_height()
-    data = numpy.frombuffer(surface.get_data(), numpy.uint8)
-    data.shape = (width, height, 4)
-    tmp = numpy.copy(data[:, :, 0])
-    data[:, :, 0] = data[:, :, 2]
-    data[:, :, 2] = tmp
-    image = PIL.Image.frombuffer("RGBA", (width, height), data, 'raw', "RGBA", 0, 1)
+    # draw image
+    pool = options.get('pool', None) or RasterPool(0)
+    alpha = CAIRO_RASTER_TYPES[extension] != 'JPEG'
+    image = pool.draw(graphics, width, height, alpha, **options)
     
     # get image options
     params = {
@@ -157,16 +162,17 @@ def export_raster(graphics, path, width=None, height=None, **options):
 
 def export_vector(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics as vector image into specified file. The image format
-    is determined from the extension of given file path. Supported extensions
-    are .svg, .pdf and .eps.
+    Draws given graphics as vector image into specified file or file object.
+    The image format is determined from the 'format' option or the extension
+    of given file path. Supported extensions are .svg, .pdf and .eps.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -179,12 +185,14 @@ def export_vector(graphics, path, width=None, height=None, **options):
         
         font_scale: float
             Font scaling factor.
+        
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+            This is required if file object without name is provided.
     """
     
-    # get filename and extension
-    dirname, filename = os.path.split(path)
-    basename, extension = os.path.splitext(filename)
-    extension = extension.lower()
+    # get extension
+    extension = get_extension(path, options.get('format', None))
     
     # check format
     if extension not in CAIRO_VECTOR_TYPES:
@@ -233,3 +241,4 @@ def export_vector(graphics, path, width=None, height=None, **options):
     
     # save to file
     dc.show_page()
+    surface.finish()
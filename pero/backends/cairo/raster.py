@@ -0,0 +1,275 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import sys
+import threading
+import cairo
+import numpy
+import PIL.Image
+from . canvas import CairoCanvas
+
+# define constants
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+_CANVAS_OPTIONS = ('draw_scale', 'line_scale', 'font_scale')
+
+
+def get_image(surface, alpha=True):
+    """
+    Converts given cairo image surface into PIL image. On little-endian
+    machines the premultiplied BGRA data are decoded by PIL directly from the
+    surface buffer, considering its stride and un-premultiplying the colors in
+    a single pass, so that no intermediate copy is created.
+    
+    Args:
+        surface: cairo.ImageSurface
+            Image surface of cairo.FORMAT_ARGB32 format.
+        
+        alpha: bool
+            If set to True, RGBA image is created. Otherwise the colors are
+            composited over black and RGB image is created.
+    
+    Returns:
+        PIL.Image.Image
+            Converted image.
+    """
+    
+    # finish drawing
+    surface.flush()
+    
+    # get surface info
+    width = surface.get_width()
+    height = surface.get_height()
+    stride = surface.get_stride()
+    data = surface.get_data()
+    
+    # decode native buffer directly
+    if _LITTLE_ENDIAN:
+        
+        if alpha:
+            return PIL.Image.frombuffer("RGBA", (width, height), data, 'raw', "BGRa", stride, 1)
+        
+        return PIL.Image.frombuffer("RGB", (width, height), data, 'raw', "BGRX", stride, 1)
+    
+    # reorder big-endian ARGB
+    data = numpy.ndarray((height, width, 4), numpy.uint8, data, strides=(stride, 4, 1))
+    
+    if alpha:
+        data = numpy.ascontiguousarray(data[:, :, (1, 2, 3, 0)])
+        return PIL.Image.frombuffer("RGBA", (width, height), data, 'raw', "RGBa", 0, 1)
+    
+    data = numpy.ascontiguousarray(data[:, :, 1:])
+    return PIL.Image.frombuffer("RGB", (width, height), data, 'raw', "RGB", 0, 1)
+
+
+class RasterPool(object):
+    """
+    Provides reusable cairo image surfaces and canvases to render many raster
+    images of the same size without allocating new surface and initializing
+    new canvas every time.
+    
+    Each acquired canvas is used exclusively until it is released back into
+    the pool. Released canvases are reset into initial state, i.e. the surface
+    is cleared and all the canvas properties are restored. The pool is
+    thread-safe.
+    """
+    
+    
+    def __init__(self, capacity=4):
+        """
+        Initializes a new instance of RasterPool.
+        
+        Args:
+            capacity: int
+                Maximum number of idle canvases kept for every image size.
+        """
+        
+        self._capacity = capacity
+        self._idle = {}
+        self._items = {}
+        self._lock = threading.Lock()
+    
+    
+    def acquire(self, width, height):
+        """
+        Gets a clean canvas of specified size.
+        
+        Args:
+            width: int
+                Image width in device units.
+            
+            height: int
+                Image height in device units.
+        
+        Returns:
+            pero.cairo.CairoCanvas
+                Canvas to draw into.
+        """
+        
+        key = (int(width), int(height))
+        
+        # use idle canvas
+        with self._lock:
+            idle = self._idle.get(key, None)
+            if idle:
+                return idle.pop()
+        
+        # create surface
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, key[0], key[1])
+        dc = cairo.Context(surface)
+        dc.set_fill_rule(cairo.FILL_RULE_EVEN_ODD)
+        
+        # init canvas
+        canvas = CairoCanvas(dc, width=key[0], height=key[1])
+        defaults = {p.name: canvas.get_property(p.name) for p in canvas.properties()}
+        
+        # register canvas
+        with self._lock:
+            self._items[id(canvas)] = (key, surface, dc, defaults)
+        
+        return canvas
+    
+    
+    def release(self, canvas):
+        """
+        Resets given canvas and returns it into the pool.
+        
+        Args:
+            canvas: pero.cairo.CairoCanvas
+                Canvas acquired from this pool.
+        """
+        
+        # get item
+        with self._lock:
+            item = self._items.get(id(canvas), None)
+        
+        if item is None:
+            message = "Canvas was not acquired from this pool!"
+            raise ValueError(message)
+        
+        key, surface, dc, defaults = item
+        
+        # discard if full
+        with self._lock:
+            if len(self._idle.get(key, ())) >= self._capacity:
+                del self._items[id(canvas)]
+                return
+        
+        # reset properties
+        changed = {k: v for k, v in defaults.items() if canvas.get_property(k) is not v}
+        if changed:
+            canvas.set_properties(changed)
+        
+        # reset view and context
+        canvas.view()
+        dc.reset_clip()
+        dc.identity_matrix()
+        dc.new_path()
+        
+        # clear surface
+        dc.set_operator(cairo.OPERATOR_CLEAR)
+        dc.paint()
+        dc.set_operator(cairo.OPERATOR_OVER)
+        
+        # store as idle
+        with self._lock:
+            self._idle.setdefault(key, []).append(canvas)
+    
+    
+    def discard(self, canvas):
+        """
+        Removes given canvas from the pool without reusing it, e.g. if the
+        drawing failed and the canvas state is unknown.
+        
+        Args:
+            canvas: pero.cairo.CairoCanvas
+                Canvas acquired from this pool.
+        """
+        
+        with self._lock:
+            self._items.pop(id(canvas), None)
+    
+    
+    def clear(self):
+        """Removes all idle canvases from the pool."""
+        
+        with self._lock:
+            
+            for canvases in self._idle.values():
+                for canvas in canvases:
+                    del self._items[id(canvas)]
+            
+            self._idle = {}
+    
+    
+    def get_surface(self, canvas):
+        """
+        Gets the image surface of given canvas.
+        
+        Args:
+            canvas: pero.cairo.CairoCanvas
+                Canvas acquired from this pool.
+        
+        Returns:
+            cairo.ImageSurface
+                Canvas surface.
+        """
+        
+        return self._items[id(canvas)][1]
+    
+    
+    def draw(self, graphics, width, height, alpha=True, **options):
+        """
+        Draws given graphics using pooled canvas and converts it into PIL image.
+        
+        Args:
+            graphics: pero.Graphics
+                Graphics to be drawn.
+            
+            width: int
+                Image width in device units.
+            
+            height: int
+                Image height in device units.
+            
+            alpha: bool
+                If set to True, RGBA image is created. Otherwise the colors are
+                composited over black and RGB image is created.
+            
+            draw_scale: float
+                Drawing scaling factor.
+            
+            line_scale: float
+                Line scaling factor.
+            
+            font_scale: float
+                Font scaling factor.
+        
+        Returns:
+            PIL.Image.Image
+                Drawn image.
+        """
+        
+        # get canvas
+        canvas = self.acquire(width, height)
+        
+        try:
+            
+            # set options
+            for name in _CANVAS_OPTIONS:
+                if name in options:
+                    canvas.set_property(name, options[name])
+            
+            # draw graphics
+            graphics.draw(canvas)
+            
+            # convert image
+            image = get_image(self.get_surface(canvas), alpha)
+        
+        except:
+            self.discard(canvas)
+            raise
+        
+        # return canvas
+        self.release(canvas)
+        
+        return image
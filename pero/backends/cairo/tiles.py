@@ -0,0 +1,197 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import io
+import os
+import math
+import concurrent.futures
+import cairo
+import numpy
+from .. export import open_file
+from .. png import PNGWriter, compress_rows
+from .. recording import RecordingCanvas
+from . enums import *
+from . canvas import CairoCanvas
+from . raster import get_image
+
+# define constants
+_TILE_HEIGHT = 256
+_PENDING = 2
+
+# init worker scene
+_SCENE = None
+
+
+def export_tiled(graphics, path, width=None, height=None, **options):
+    """
+    Draws given graphics as PNG image into specified file or file object by
+    horizontal tiles. The graphics is recorded first and the recording is
+    replayed into every tile, shifted by the tile offset. The tiles are drawn
+    and compressed in parallel by worker processes and written into the file
+    in order as soon as available, so that the whole image never needs to be
+    kept in memory.
+    
+    Note that the graphics is drawn into pero.RecordingCanvas, therefore any
+    text measuring within the graphics uses the pero.FONTS metrics instead of
+    the cairo ones.
+    
+    Args:
+        graphics: pero.Graphics
+            Graphics to be drawn.
+        
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
+        
+        width: float or None
+            Image width in device units.
+        
+        height: float or None
+            Image height in device units.
+        
+        draw_scale: float
+            Drawing scaling factor.
+        
+        line_scale: float
+            Line scaling factor.
+        
+        font_scale: float
+            Font scaling factor.
+        
+        dpi: int
+            Image resolution as dots-per-inch.
+        
+        tiles: int or None
+            Number of tiles to split the image into. If not set, the tiles
+            are made of 256 rows.
+        
+        workers: int or None
+            Number of worker processes. If set to None, number of CPUs is used.
+            If set to 0, tiles are drawn within current process.
+        
+        level: int
+            Compression level in range from 0 to 9.
+    """
+    
+    # check size
+    if not width:
+        width = EXPORT_WIDTH
+    if not height:
+        height = EXPORT_HEIGHT
+    
+    width = int(width)
+    height = int(height)
+    
+    # get tiles
+    tiles = options.get('tiles', None) or math.ceil(height / _TILE_HEIGHT)
+    tiles = max(1, min(height, int(tiles)))
+    tile_height = math.ceil(height / tiles)
+    tops = range(0, height, tile_height)
+    
+    # get workers
+    workers = options.get('workers', None)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    level = options.get('level', 6)
+    
+    # record graphics
+    scene = _record(graphics, width, height, options)
+    
+    with open_file(path) as f:
+        
+        # init writer
+        writer = PNGWriter(f, width, height, alpha=True, dpi=options.get('dpi', 72))
+        
+        # draw tiles directly
+        if workers == 0:
+            for top in tops:
+                writer.write_compressed(*_draw_tile(scene, width, height, top, tile_height, level))
+        
+        # draw tiles by workers
+        else:
+            dump = io.BytesIO()
+            scene.save(dump)
+            
+            with concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(dump.getvalue(),)) as executor:
+                
+                pending = []
+                for top in tops:
+                    
+                    # submit tile
+                    pending.append(executor.submit(_draw_worker_tile, width, height, top, tile_height, level))
+                    
+                    # write finished tiles in order
+                    while len(pending) > _PENDING * workers or (pending and pending[0].done()):
+                        writer.write_compressed(*pending.pop(0).result())
+                
+                # write remaining tiles
+                for future in pending:
+                    writer.write_compressed(*future.result())
+        
+        # finish image
+        writer.close()
+
+
+def _record(graphics, width, height, options):
+    """Records given graphics."""
+    
+    # use recording directly
+    if isinstance(graphics, RecordingCanvas):
+        return graphics
+    
+    # init canvas
+    canvas = RecordingCanvas(width=width, height=height)
+    
+    if 'draw_scale' in options:
+        canvas.draw_scale = options['draw_scale']
+    
+    if 'line_scale' in options:
+        canvas.line_scale = options['line_scale']
+    
+    if 'font_scale' in options:
+        canvas.font_scale = options['font_scale']
+    
+    # draw graphics
+    graphics.draw(canvas)
+    
+    return canvas
+
+
+def _draw_tile(scene, width, height, top, tile_height, level):
+    """Draws and compresses single tile."""
+    
+    rows = min(tile_height, height - top)
+    
+    # create surface
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, rows)
+    dc = cairo.Context(surface)
+    dc.set_fill_rule(cairo.FILL_RULE_EVEN_ODD)
+    
+    # shift to tile
+    dc.translate(0, -top)
+    
+    # init canvas
+    canvas = CairoCanvas(dc, width=width, height=height)
+    
+    # draw scene
+    scene.replay(canvas)
+    
+    # compress pixels
+    pixels = numpy.asarray(get_image(surface))
+    compressed, checksum, size = compress_rows(pixels, level)
+    
+    return compressed, checksum, size, rows
+
+
+def _init_worker(dump):
+    """Loads recorded scene within worker process."""
+    
+    global _SCENE
+    _SCENE = RecordingCanvas.load(io.BytesIO(dump))
+
+
+def _draw_worker_tile(width, height, top, tile_height, level):
+    """Draws single tile within worker process."""
+    
+    return _draw_tile(_SCENE, width, height, top, tile_height, level)
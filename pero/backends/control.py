@@ -430,22 +430,28 @@ class ToolControl(Control):
     def _on_tool_control_property_changed(self, evt):
         """Called after any property has changed."""
         
-        # main tool changed
-        if evt.name == 'main_tool':
-            self._set_tool(evt.new_value, evt.old_value, left=True, right=True, touch=True)
+        # get changes
+        changes = evt.changes or {evt.name: (evt.old_value, evt.new_value)}
         
-        # cursor tool changed
-        elif evt.name == 'cursor_tool':
-            self._set_tool(evt.new_value, evt.old_value)
-        
-        # left mouse tool changed
-        elif evt.name == 'left_tool':
-            self._set_tool(evt.new_value, evt.old_value, left=True)
-        
-        # right mouse tool changed
-        elif evt.name == 'right_tool':
-            self._set_tool(evt.new_value, evt.old_value, right=True)
-        
-        # touch tool changed
-        elif evt.name == 'touch_tool':
-            self._set_tool(evt.new_value, evt.old_value, touch=True)
+        # check changes
+        for name, (old_value, new_value) in changes.items():
+            
+            # main tool changed
+            if name == 'main_tool':
+                self._set_tool(new_value, old_value, left=True, right=True, touch=True)
+            
+            # cursor tool changed
+            elif name == 'cursor_tool':
+                self._set_tool(new_value, old_value)
+            
+            # left mouse tool changed
+            elif name == 'left_tool':
+                self._set_tool(new_value, old_value, left=True)
+            
+            # right mouse tool changed
+            elif name == 'right_tool':
+                self._set_tool(new_value, old_value, right=True)
+            
+            # touch tool changed
+            elif name == 'touch_tool':
+                self._set_tool(new_value, old_value, touch=True)
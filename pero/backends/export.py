@@ -1,7 +1,10 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
-import os.path
+import os
+import io
+import uuid
+import contextlib
 from .. enums import *
 
 
@@ -79,12 +82,17 @@ def export(graphics, path, width=None, height=None, backend=None, **options):
     automatically from the file extension. This method makes sure appropriate
     backend canvas is created and provided to graphics 'draw' method.
     
+    Instead of the path, a writable binary file object (e.g. io.BytesIO) can
+    be provided. In such case the image format must be specified by the
+    'format' option unless it can be determined from the file name.
+    
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -96,14 +104,16 @@ def export(graphics, path, width=None, height=None, backend=None, **options):
             Specific backend to be used. The value must be an item from the
             pero.BACKEND enum.
         
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+        
         options: str:any pairs
             Additional parameters for specific backend.
     """
     
-    # get filename and extension
-    dirname, filename = os.path.split(path)
-    basename, extension = os.path.splitext(filename)
-    extension = extension.lower()
+    # get extension
+    extension = get_extension(path, options.get('format', None))
+    stream = not is_path(path)
     
     # get backends
     backends = EXPORT_PRIORITY if backend is None else [backend]
@@ -116,6 +126,10 @@ def export(graphics, path, width=None, height=None, backend=None, **options):
         if extension not in EXPORT_FORMATS[module]:
             continue
         
+        # check if file objects are supported by backend
+        if stream and module not in EXPORT_STREAMS:
+            continue
+        
         # try to import backend
         try:
             if module == BACKEND_CAIRO:
@@ -158,6 +172,44 @@ def export(graphics, path, width=None, height=None, backend=None, **options):
     backend.export(graphics, path, width, height, **options)
 
 
+def export_bytes(graphics, format, width=None, height=None, backend=None, **options):
+    """
+    Draws given graphics into in-memory image of specified format. This method
+    makes sure appropriate backend canvas is created and provided to graphics
+    'draw' method. No temporary files are created.
+    
+    Args:
+        graphics: pero.Graphics
+            Graphics to be drawn.
+        
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+        
+        width: float or None
+            Image width in device units.
+        
+        height: float or None
+            Image height in device units.
+        
+        backend: pero.BACKEND
+            Specific backend to be used. The value must be an item from the
+            pero.BACKEND enum.
+        
+        options: str:any pairs
+            Additional parameters for specific backend.
+    
+    Returns:
+        bytes
+            Image data.
+    """
+    
+    # export into buffer
+    buff = io.BytesIO()
+    export(graphics, buff, width, height, backend, format=format, **options)
+    
+    return buff.getvalue()
+
+
 def debug(graphics, canvas='show', title="", width=None, height=None, backend=None, **options):
     """
     Renders given graphics using simple viewer or file format. This method makes
@@ -220,3 +272,109 @@ def debug(graphics, canvas='show', title="", width=None, height=None, backend=No
     else:
         filename = "test.%s" % canvas
         export(graphics, filename, width, height, backend, **options)
+
+
+def is_path(path):
+    """
+    Checks whether given export target is a file path rather than file object.
+    
+    Args:
+        path: str, os.PathLike or file
+            Export target.
+    
+    Returns:
+        bool
+            True if given target is a file path.
+    """
+    
+    return isinstance(path, (str, os.PathLike))
+
+
+def get_extension(path, format=None):
+    """
+    Gets lower-case image file extension from given format or export target.
+    
+    Args:
+        path: str, os.PathLike or file
+            Export target. For file objects the 'name' attribute is used if
+            available.
+        
+        format: str or None
+            Image format specified by file extension (e.g. 'png' or '.png').
+    
+    Returns:
+        str
+            Image file extension including the dot.
+    """
+    
+    # use format
+    if format:
+        format = format.lower()
+        return format if format.startswith('.') else '.' + format
+    
+    # get file name
+    if not is_path(path):
+        path = getattr(path, 'name', None)
+        if not isinstance(path, str):
+            return ""
+    
+    # get extension
+    return os.path.splitext(path)[1].lower()
+
+
+@contextlib.contextmanager
+def open_file(path, binary=True):
+    """
+    Opens given export target for writing. File paths are opened and closed
+    automatically, while file objects are used directly and left open. Binary
+    file objects are wrapped by UTF-8 text layer if text mode is required.
+    
+    Regular files are written into a temporary sibling file, which replaces
+    the target only if the writing succeeds. This avoids leaving truncated
+    images behind if the drawing fails partway.
+    
+    Args:
+        path: str, os.PathLike or file
+            Full path of a file or writable file object.
+        
+        binary: bool
+            Specifies whether binary or text stream is required.
+    
+    Yields:
+        file
+            Writable file object.
+    """
+    
+    # open special file directly
+    if is_path(path) and os.path.exists(path) and not os.path.isfile(path):
+        with open(path, 'wb') if binary else open(path, 'w', encoding='utf-8') as f:
+            yield f
+    
+    # open path via temporary file
+    elif is_path(path):
+        
+        path = os.path.realpath(path)
+        temp = "%s.%s.tmp" % (path, uuid.uuid4().hex[:8])
+        
+        try:
+            with open(temp, 'xb') if binary else open(temp, 'x', encoding='utf-8') as f:
+                yield f
+            
+            os.replace(temp, path)
+        
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+    
+    # use file directly
+    elif binary or isinstance(path, io.TextIOBase):
+        yield path
+    
+    # wrap binary file
+    else:
+        f = io.TextIOWrapper(path, encoding='utf-8')
+        try:
+            yield f
+        finally:
+            f.flush()
+            f.detach()
@@ -96,6 +96,40 @@ class JsonCanvas(Canvas):
             'radius': radius})
     
     
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, radii = self._get_bulk_arrays(xs, ys, radii)
+        
+        # store command
+        self._store_command('draw_circles', {
+            'xs': xs.tolist(),
+            'ys': ys.tolist(),
+            'radii': radii.tolist(),
+            'line_colors': self._get_json_colors(line_colors, len(xs)),
+            'fill_colors': self._get_json_colors(fill_colors, len(xs))})
+    
+    
     def draw_ellipse(self, x, y, width, height):
         """
         Draws an ellipse centered around given coordinates and fitting into the
@@ -165,6 +199,46 @@ class JsonCanvas(Canvas):
         self._store_command('draw_lines', {'points': points})
     
     
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, sizes = self._get_bulk_arrays(xs, ys, sizes)
+        
+        # get path dump
+        path = json.loads(path.json())
+        
+        # store command
+        self._store_command('draw_markers', {
+            'path': path,
+            'xs': xs.tolist(),
+            'ys': ys.tolist(),
+            'sizes': sizes.tolist(),
+            'line_colors': self._get_json_colors(line_colors, len(xs)),
+            'fill_colors': self._get_json_colors(fill_colors, len(xs))})
+    
+    
     def draw_path(self, path):
         """
         Draws given path using current pen and brush.
@@ -229,6 +303,82 @@ class JsonCanvas(Canvas):
             'radius': radius})
     
     
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, widths, heights = self._get_bulk_arrays(xs, ys, widths, heights)
+        
+        # store command
+        self._store_command('draw_rects', {
+            'xs': xs.tolist(),
+            'ys': ys.tolist(),
+            'widths': widths.tolist(),
+            'heights': heights.tolist(),
+            'radius': radius,
+            'line_colors': self._get_json_colors(line_colors, len(xs)),
+            'fill_colors': self._get_json_colors(fill_colors, len(xs))})
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+        """
+        
+        # get items
+        x1s, y1s, x2s, y2s = self._get_bulk_arrays(x1s, y1s, x2s, y2s)
+        
+        # store command
+        self._store_command('draw_segments', {
+            'x1s': x1s.tolist(),
+            'y1s': y1s.tolist(),
+            'x2s': x2s.tolist(),
+            'y2s': y2s.tolist(),
+            'line_colors': self._get_json_colors(line_colors, len(x1s))})
+    
+    
     def draw_text(self, text, x, y, angle=0):
         """
         Draws a text string anchored at specified point using current text
@@ -388,22 +538,37 @@ class JsonCanvas(Canvas):
         self._commands.append((command, args))
     
     
-    def _on_json_canvas_property_changed(self, evt):
-        """Called after any property has changed."""
+    def _get_json_colors(self, colors, count):
+        """Converts per-item colors into list of hex codes."""
         
-        # get value
-        value = evt.new_value
+        # get colors
+        colors = self._get_bulk_colors(colors, count)
+        if colors is None:
+            return None
         
-        # convert UNDEF
-        if value is UNDEF:
-            value = str(UNDEF)
+        # convert colors
+        return [c.hex if c is not None else None for c in colors]
+    
+    
+    def _on_json_canvas_property_changed(self, evt):
+        """Called after any property has changed."""
         
-        # convert color
-        elif isinstance(value, Color):
-            value = value.hex
+        # get changes
+        changes = evt.changes or {evt.name: (evt.old_value, evt.new_value)}
         
-        # store command
-        self._store_command('set_property', {
-            'name': evt.name,
-            'value': value,
-            'raise_error': False})
+        # store changes
+        for name, (old_value, value) in changes.items():
+            
+            # convert UNDEF
+            if value is UNDEF:
+                value = str(UNDEF)
+            
+            # convert color
+            elif isinstance(value, Color):
+                value = value.hex
+            
+            # store command
+            self._store_command('set_property', {
+                'name': name,
+                'value': value,
+                'raise_error': False})
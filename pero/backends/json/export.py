@@ -2,19 +2,21 @@
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
 from ... enums import *
+from .. export import open_file
 from . canvas import JsonCanvas
 
 
 def export(graphics, path, width=None, height=None, **options):
     """
-    Saves given graphics as JSON dump into specified file.
+    Saves given graphics as JSON dump into specified file or file object.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -54,5 +56,5 @@ def export(graphics, path, width=None, height=None, **options):
     graphics.draw(canvas)
     
     # save to file
-    with open(path, 'w', encoding='utf-8') as f:
+    with open_file(path, binary=False) as f:
         f.write(canvas.get_json())
@@ -2,16 +2,18 @@
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
 from ... drawing import Graphics
-from . canvas import JsonCanvas
+from .. recording import RecordingCanvas
 
 
-class Image(JsonCanvas, Graphics):
+class Image(RecordingCanvas, Graphics):
     """
-    Image represents a combination of pero.JsonCanvas and pero.Graphics. This
-    provides access to all the main drawing methods with a possibility to be
-    later drawn into any standard canvas. In addition, two convenient methods
-    are available as shortcuts to 'export' or 'show' the image using available
-    default drawing backend or viewer, depending on requested format.
+    Image represents a combination of pero.RecordingCanvas and pero.Graphics.
+    This provides access to all the main drawing methods with a possibility to
+    be later drawn into any standard canvas. In addition, two convenient
+    methods are available as shortcuts to 'export' or 'show' the image using
+    available default drawing backend or viewer, depending on requested format.
+    The image can still be dumped into JSON using the 'get_json' method and
+    recreated by the 'from_json' method.
     """
     
     
@@ -101,7 +103,7 @@ class Image(JsonCanvas, Graphics):
                 Canvas to be used for rendering.
         """
         
-        canvas.draw_json(self.get_json())
+        self.replay(canvas)
     
     
     @staticmethod
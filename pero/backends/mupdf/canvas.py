@@ -187,6 +187,9 @@ class MuPDFCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # init shape
         shape = self._page.new_shape()
         
@@ -264,6 +267,9 @@ class MuPDFCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # init shape
         shape = self._page.new_shape()
         
@@ -2,20 +2,22 @@
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
 import fitz
+from .. export import is_path
 from . enums import *
 from . canvas import MuPDFCanvas
 
 
 def export(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics as PDF document into specified file.
+    Draws given graphics as PDF document into specified file or file object.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -59,5 +61,11 @@ def export(graphics, path, width=None, height=None, **options):
     graphics.draw(canvas)
     
     # save to file
-    doc.save(path)
+    if is_path(path):
+        doc.save(path)
+    
+    # write into file object
+    else:
+        path.write(doc.tobytes())
+    
     doc.close()
@@ -0,0 +1,190 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import zlib
+import struct
+import numpy
+
+# define constants
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_CHUNK_SIZE = 1 << 30
+
+_ADLER_BASE = 65521
+_ZLIB_HEADER = b'\x78\x9c'
+_DEFLATE_END = b'\x03\x00'
+_COLOR_TYPES = {3: 2, 4: 6}
+_FILTER_SUB = 1
+
+
+def compress_rows(rows, level=6):
+    """
+    Filters and compresses given image rows as a part of PNG data stream. The
+    rows are filtered using the 'Sub' filter, which does not depend on
+    previous rows, and compressed as raw deflate data terminated by sync
+    flush. Independently compressed parts can therefore be simply joined
+    together in order, e.g. when compressed in parallel.
+    
+    Args:
+        rows: numpy.ndarray
+            Image rows as 8-bit array of shape (height, width, channels).
+        
+        level: int
+            Compression level in range from 0 to 9.
+    
+    Returns:
+        (bytes, int, int)
+            Compressed data, Adler-32 checksum and size of uncompressed data.
+    """
+    
+    height, width, channels = rows.shape
+    
+    # apply filter
+    data = numpy.empty((height, 1 + width * channels), dtype=numpy.uint8)
+    data[:, 0] = _FILTER_SUB
+    
+    pixels = rows.reshape(height, width * channels)
+    data[:, 1:channels+1] = pixels[:, :channels]
+    numpy.subtract(pixels[:, channels:], pixels[:, :-channels], out=data[:, channels+1:])
+    
+    # compress data
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    return compressed, zlib.adler32(data), data.size
+
+
+class PNGWriter(object):
+    """
+    Writes PNG image into a file or file object progressively, so that the
+    whole image never needs to be kept in memory. The image rows are provided
+    in order, either directly as pixels or as data compressed in advance by
+    the 'compress_rows' function.
+    """
+    
+    
+    def __init__(self, file, width, height, alpha=True, dpi=None):
+        """
+        Initializes a new instance of PNGWriter and writes the image header.
+        
+        Args:
+            file: file
+                Writable binary file object.
+            
+            width: int
+                Image width in pixels.
+            
+            height: int
+                Image height in pixels.
+            
+            alpha: bool
+                Specifies whether the image is RGBA or RGB.
+            
+            dpi: int or None
+                Image resolution as dots-per-inch.
+        """
+        
+        self._file = file
+        self._width = int(width)
+        self._height = int(height)
+        self._channels = 4 if alpha else 3
+        
+        self._rows = 0
+        self._checksum = 1
+        
+        # write header
+        self._file.write(PNG_SIGNATURE)
+        self._write_chunk(b'IHDR', struct.pack(">IIBBBBB", self._width, self._height, 8, _COLOR_TYPES[self._channels], 0, 0, 0))
+        
+        # write resolution
+        if dpi:
+            ppm = int(dpi / 0.0254 + 0.5)
+            self._write_chunk(b'pHYs', struct.pack(">IIB", ppm, ppm, 1))
+        
+        # start data stream
+        self._write_chunk(b'IDAT', _ZLIB_HEADER)
+    
+    
+    def write_rows(self, rows, level=6):
+        """
+        Compresses and writes given image rows.
+        
+        Args:
+            rows: numpy.ndarray
+                Image rows as 8-bit array of shape (height, width, channels).
+            
+            level: int
+                Compression level in range from 0 to 9.
+        """
+        
+        compressed, checksum, size = compress_rows(rows, level)
+        self.write_compressed(compressed, checksum, size, rows.shape[0])
+    
+    
+    def write_compressed(self, compressed, checksum, size, count):
+        """
+        Writes image rows compressed by the 'compress_rows' function.
+        
+        Args:
+            compressed: bytes
+                Compressed data.
+            
+            checksum: int
+                Adler-32 checksum of uncompressed data.
+            
+            size: int
+                Size of uncompressed data.
+            
+            count: int
+                Number of image rows.
+        """
+        
+        # check size
+        if self._rows + count > self._height:
+            message = "Too many rows written! -> %d" % (self._rows + count)
+            raise ValueError(message)
+        
+        # update checksum
+        self._checksum = _adler32_combine(self._checksum, checksum, size)
+        self._rows += count
+        
+        # write data
+        for i in range(0, len(compressed), PNG_CHUNK_SIZE):
+            self._write_chunk(b'IDAT', compressed[i:i+PNG_CHUNK_SIZE])
+    
+    
+    def close(self):
+        """Finishes the data stream and writes the image end."""
+        
+        # check size
+        if self._rows != self._height:
+            message = "Missing image rows! -> %d of %d" % (self._rows, self._height)
+            raise ValueError(message)
+        
+        # finish data stream
+        self._write_chunk(b'IDAT', _DEFLATE_END + struct.pack(">I", self._checksum))
+        self._write_chunk(b'IEND', b'')
+    
+    
+    def _write_chunk(self, tag, data):
+        """Writes single PNG chunk."""
+        
+        crc = zlib.crc32(data, zlib.crc32(tag))
+        
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(tag)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", crc))
+
+
+def _adler32_combine(adler1, adler2, size2):
+    """Combines Adler-32 checksums of two consecutive data blocks."""
+    
+    rem = size2 % _ADLER_BASE
+    
+    sum1 = adler1 & 0xffff
+    sum2 = (rem * sum1) % _ADLER_BASE
+    
+    sum1 = (sum1 + (adler2 & 0xffff) + _ADLER_BASE - 1) % _ADLER_BASE
+    sum2 = (sum2 + (adler1 >> 16) + (adler2 >> 16) + _ADLER_BASE - rem) % _ADLER_BASE
+    
+    return sum1 | (sum2 << 16)
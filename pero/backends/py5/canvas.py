@@ -181,6 +181,9 @@ class Py5Canvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # create coords
         points = numpy.concatenate((points[:-1], points[1:]), axis=1)
         
@@ -105,6 +105,48 @@ class QtCanvas(Canvas):
         self.draw_ellipse(x, y, 2*radius, 2*radius)
     
     
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, radii = self._get_bulk_arrays(xs, ys, radii)
+        
+        # apply scaling and offset
+        xs = self._scale * (xs + self._offset[0])
+        ys = self._scale * (ys + self._offset[1])
+        sizes = self._scale * 2 * radii
+        
+        # round
+        cxs = numpy.floor(xs - 0.5 * sizes).tolist()
+        cys = numpy.floor(ys - 0.5 * sizes).tolist()
+        sizes = numpy.floor(sizes).tolist()
+        
+        # make rects
+        rects = [(QRectF(x, y, s, s),) for x, y, s in zip(cxs, cys, sizes)]
+        
+        # draw
+        self._draw_bulk_native(self._dc.drawEllipse, rects, line_colors, fill_colors)
+    
+    
     def draw_ellipse(self, x, y, width, height):
         """
         Draws an ellipse centered around given coordinates and fitting into the
@@ -190,6 +232,9 @@ class QtCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # get lines
         lines = (QLineF(*p) for p in numpy.hstack([points[:-1], points[1:]]))
         
@@ -197,6 +242,45 @@ class QtCanvas(Canvas):
         self._dc.drawLines(*lines)
     
     
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, sizes = self._get_bulk_arrays(xs, ys, sizes)
+        
+        # apply scaling and offset
+        xs = (self._scale * (xs + self._offset[0])).tolist()
+        ys = (self._scale * (ys + self._offset[1])).tolist()
+        sizes = (self._scale * sizes).tolist()
+        
+        # make qt paths
+        paths = [(self._make_native_path(path.transformed(Matrix().scale(s, s).translate(x, y))),) for x, y, s in zip(xs, ys, sizes)]
+        
+        # draw
+        self._draw_bulk_native(self._dc.drawPath, paths, line_colors, fill_colors)
+    
+    
     def draw_path(self, path):
         """
         Draws the path using current pen and brush.
@@ -235,6 +319,9 @@ class QtCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # draw
         self._dc.drawPolygon(*(QPointF(p[0], p[1]) for p in points))
     
@@ -295,6 +382,127 @@ class QtCanvas(Canvas):
             self._dc.drawRoundedRect(QRectF(x, y, width, height), radius, radius)
     
     
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get radius
+        if isinstance(radius, (int, float)) and radius != 0:
+            radius = (radius, radius, radius, radius)
+        
+        # draw as paths if different corners
+        if radius and not all(r == radius[0] for r in radius):
+            super().draw_rects(xs, ys, widths, heights, radius, line_colors, fill_colors)
+            return
+        
+        # get items
+        xs, ys, widths, heights = self._get_bulk_arrays(xs, ys, widths, heights)
+        
+        # apply scaling and offset
+        xs = self._scale * (xs + self._offset[0])
+        ys = self._scale * (ys + self._offset[1])
+        widths = self._scale * widths + .5
+        heights = self._scale * heights + .5
+        
+        # round
+        xs = numpy.floor(xs).tolist()
+        ys = numpy.floor(ys).tolist()
+        widths = numpy.floor(widths).tolist()
+        heights = numpy.floor(heights).tolist()
+        
+        # make rects
+        rects = [QRectF(x, y, w, h) for x, y, w, h in zip(xs, ys, widths, heights)]
+        
+        # draw all at once
+        if not radius and line_colors is None and fill_colors is None:
+            self._dc.drawRects(*rects)
+        
+        # no round corners
+        elif not radius:
+            rects = [(r,) for r in rects]
+            self._draw_bulk_native(self._dc.drawRect, rects, line_colors, fill_colors)
+        
+        # same radius for all corners
+        else:
+            radius = self._scale * radius[0]
+            rects = [(r, radius, radius) for r in rects]
+            self._draw_bulk_native(self._dc.drawRoundedRect, rects, line_colors, fill_colors)
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+        """
+        
+        # get items
+        x1s, y1s, x2s, y2s = self._get_bulk_arrays(x1s, y1s, x2s, y2s)
+        
+        # apply scaling and offset
+        x1s = self._scale * (x1s + self._offset[0])
+        y1s = self._scale * (y1s + self._offset[1])
+        x2s = self._scale * (x2s + self._offset[0])
+        y2s = self._scale * (y2s + self._offset[1])
+        
+        # round
+        x1s = numpy.floor(x1s).tolist()
+        y1s = numpy.floor(y1s).tolist()
+        x2s = numpy.floor(x2s).tolist()
+        y2s = numpy.floor(y2s).tolist()
+        
+        # make lines
+        lines = [QLineF(x1, y1, x2, y2) for x1, y1, x2, y2 in zip(x1s, y1s, x2s, y2s)]
+        
+        # draw all at once
+        if line_colors is None:
+            self._dc.drawLines(*lines)
+        
+        # draw one by one
+        else:
+            lines = [(l,) for l in lines]
+            self._draw_bulk_native(self._dc.drawLine, lines, line_colors, None)
+    
+    
     def draw_text(self, text, x, y, angle=0):
         """
         Draws a text string anchored at specified point using current text
@@ -453,6 +661,50 @@ class QtCanvas(Canvas):
         self._update_text()
     
     
+    def _draw_bulk_native(self, method, items, line_colors, fill_colors):
+        """Draws native items one by one using given method and item colors."""
+        
+        # get colors
+        pens = None
+        if line_colors is not None and self._pen.width() != 0:
+            pens = self._get_bulk_colors(line_colors, len(items), "line_")
+        
+        brushes = None
+        if fill_colors is not None:
+            brushes = self._get_bulk_colors(fill_colors, len(items), "fill_")
+        
+        # draw using current colors
+        if pens is None and brushes is None:
+            for item in items:
+                method(*item)
+            return
+        
+        # draw items
+        pen = None
+        brush = None
+        
+        for i, item in enumerate(items):
+            
+            # set pen color
+            if pens is not None and pens[i] is not pen:
+                pen = pens[i]
+                self._pen.setColor(QColor(*pen.rgba))
+                self._dc.setPen(self._pen)
+            
+            # set brush color
+            if brushes is not None and brushes[i] is not brush:
+                brush = brushes[i]
+                self._brush.setColor(QColor(*brush.rgba))
+                self._dc.setBrush(self._brush)
+            
+            # draw
+            method(*item)
+        
+        # set back pen and brush
+        self._update_pen()
+        self._update_brush()
+    
+    
     def _make_native_path(self, path):
         """Converts given path to native path."""
         
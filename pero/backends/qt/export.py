@@ -1,8 +1,9 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
-import os.path
+from .. export import is_path, get_extension
 from . loader import QSizeF, QRectF, QColor, QPageSize, QImage, QPrinter, QPainter, QApplication
+from . loader import QBuffer, QIODevice, QPdfWriter
 from . enums import *
 from . canvas import QtCanvas
 from . viewer import QtViewer
@@ -67,16 +68,17 @@ def show(graphics, title=None, width=None, height=None, icon=None, **options):
 
 def export(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics into specified image file. The image format is
-    determined from the extension of given file path. Supported extensions are
-    .bmp, .gif, .jpg, .jpeg, .pdf and .png.
+    Draws given graphics into specified image file or file object. The image
+    format is determined from the 'format' option or the extension of given
+    file path. Supported extensions are .bmp, .gif, .jpg, .jpeg, .pdf and .png.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -93,15 +95,17 @@ def export(graphics, path, width=None, height=None, **options):
         font_scale: float
             Font scaling factor.
         
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+            This is required if file object without name is provided.
+        
         quality: int
             Image quality in range between 0 and 100 with 0 meaning very poor
             and 100 excellent. This option is only available for JPEG format.
     """
     
-    # get filename and extension
-    dirname, filename = os.path.split(path)
-    basename, extension = os.path.splitext(filename)
-    extension = extension.lower()
+    # get extension
+    extension = get_extension(path, options.get('format', None))
     
     # export as raster image
     if extension in QT_RASTER_TYPES:
@@ -119,16 +123,18 @@ def export(graphics, path, width=None, height=None, **options):
 
 def export_raster(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics as raster image into specified file. The image format
-    is determined from the extension of given file path. Supported extensions
-    are .bmp, .gif, .jpg, .jpeg and .png.
+    Draws given graphics as raster image into specified file or file object.
+    The image format is determined from the 'format' option or the extension
+    of given file path. Supported extensions are .bmp, .gif, .jpg, .jpeg and
+    .png.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -145,6 +151,10 @@ def export_raster(graphics, path, width=None, height=None, **options):
         font_scale: float
             Font scaling factor.
         
+        format: str
+            Image format specified by file extension (e.g. 'png' or '.png').
+            This is required if file object without name is provided.
+        
         quality: int
             Image quality in range between 0 and 100 with 0 meaning very poor
             and 100 excellent.
@@ -197,21 +207,30 @@ def export_raster(graphics, path, width=None, height=None, **options):
     quality = options.get('quality', -1)
     
     # save to file
-    image.save(path, quality=quality)
+    if is_path(path):
+        image.save(path, quality=quality)
+    
+    # save into file object
+    else:
+        extension = get_extension(path, options.get('format', None))
+        buff = QBuffer()
+        buff.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buff, extension[1:].upper(), quality)
+        path.write(bytes(buff.data()))
 
 
 def export_vector(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics as vector image into specified file. The image format
-    is determined from the extension of given file path. Supported extension
-    is .pdf only.
+    Draws given graphics as vector image into specified file or file object.
+    Supported format is PDF only.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -247,11 +266,23 @@ def export_vector(graphics, path, width=None, height=None, **options):
     printer = QPrinter()
     printer.setPageSize(size)
     printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
-    printer.setOutputFileName(path)
+    device = printer
+    
+    # print into file
+    if is_path(path):
+        printer.setOutputFileName(path)
+    
+    # write into buffer
+    else:
+        buff = QBuffer()
+        buff.open(QIODevice.OpenModeFlag.WriteOnly)
+        device = QPdfWriter(buff)
+        device.setPageSize(size)
+        device.setResolution(printer.resolution())
     
     # init painter
     qp = QPainter()
-    qp.begin(printer)
+    qp.begin(device)
     qp.setRenderHint(QPainter.RenderHint.Antialiasing)
     qp.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
     
@@ -272,3 +303,7 @@ def export_vector(graphics, path, width=None, height=None, **options):
     
     # end drawing
     qp.end()
+    
+    # save into file object
+    if not is_path(path):
+        path.write(bytes(buff.data()))
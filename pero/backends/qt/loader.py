@@ -9,8 +9,8 @@ QT_NAME = None
 if QT_VERSION is None:
     
     try:
-        from PyQt5.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent
-        from PyQt5.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize
+        from PyQt5.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent, QBuffer, QIODevice
+        from PyQt5.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize, QPdfWriter
         from PyQt5.QtGui import QPainter, QImage, QPicture, QPixmap, QIcon, QFontMetrics
         from PyQt5.QtGui import QMouseEvent, QWheelEvent, QTouchEvent
         from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout, QDesktopWidget
@@ -26,8 +26,8 @@ if QT_VERSION is None:
 if QT_VERSION is None:
     
     try:
-        from PySide2.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent
-        from PySide2.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize
+        from PySide2.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent, QBuffer, QIODevice
+        from PySide2.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize, QPdfWriter
         from PySide2.QtGui import QPainter, QImage, QPicture, QPixmap, QIcon, QFontMetrics
         from PySide2.QtGui import QMouseEvent, QWheelEvent, QTouchEvent
         from PySide2.QtWidgets import QApplication, QWidget, QHBoxLayout, QDesktopWidget
@@ -43,8 +43,8 @@ if QT_VERSION is None:
 if QT_VERSION is None:
     
     try:
-        from PyQt6.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent
-        from PyQt6.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize
+        from PyQt6.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent, QBuffer, QIODevice
+        from PyQt6.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize, QPdfWriter
         from PyQt6.QtGui import QPainter, QImage, QPicture, QPixmap, QIcon, QFontMetrics
         from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout
         from PyQt6.QtPrintSupport import QPrinter
@@ -59,8 +59,8 @@ if QT_VERSION is None:
 if QT_VERSION is None:
     
     try:
-        from PySide6.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent
-        from PySide6.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize
+        from PySide6.QtCore import Qt, QPointF, QLineF, QRectF, QSizeF, QEvent, QBuffer, QIODevice
+        from PySide6.QtGui import QFont, QColor, QPen, QBrush, QPainterPath, QPageSize, QPdfWriter
         from PySide6.QtGui import QPainter, QImage, QPicture, QPixmap, QIcon, QFontMetrics
         from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout
         from PySide6.QtPrintSupport import QPrinter
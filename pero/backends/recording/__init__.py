@@ -0,0 +1,5 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+# import main objects
+from . canvas import RecordingCanvas
@@ -0,0 +1,1129 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import json
+import array
+import numpy
+from ... enums import *
+from ... colors import Color
+from ... properties import UNDEF
+from ... geometry import Path
+from ... drawing import Canvas, ClipState, GroupState
+from . dump import save_dump, load_dump
+
+# define recorded commands
+_COMMANDS = (
+    'set_property',
+    'draw_arc',
+    'draw_circle',
+    'draw_circles',
+    'draw_ellipse',
+    'draw_line',
+    'draw_lines',
+    'draw_markers',
+    'draw_path',
+    'draw_polygon',
+    'draw_rect',
+    'draw_rects',
+    'draw_segments',
+    'draw_text',
+    'fill',
+    'view',
+    'clip',
+    'unclip',
+    'group',
+    'ungroup')
+
+_OPCODES = {name: i for i, name in enumerate(_COMMANDS)}
+
+# define state commands
+_STATE = {'set_property', 'view', 'clip', 'unclip'}
+
+
+class RecordingCanvas(Canvas):
+    """
+    Wrapper for buffered drawing context, which records all the drawing calls
+    into compact typed buffers so they can be later replayed onto any other
+    canvas.
+    
+    Each recorded command is represented by its opcode and offsets into shared
+    pool of float values (coordinates, sizes, angles) and pool of integer
+    values (flags, counts and indices). All the other values are interned into
+    separate tables, so that repeated strings (e.g. texts, property names or
+    group tags), style values (e.g. colors or enums) and paths (e.g. marker
+    symbols) are stored only once. Paths are stored as their commands and
+    recreated when replayed.
+    
+    The recording can be saved into a binary dump by the 'save' method and
+    loaded back by the 'load' method. Loaded buffers are memory-mapped from the
+    file and commands are decoded lazily while replaying. Any subsequent
+    drawing into loaded canvas makes in-memory copy of the buffers first.
+    """
+    
+    
+    def __init__(self, **overrides):
+        """Initializes a new instance of RecordingCanvas."""
+        
+        # init buffers
+        self._ops = array.array('B')
+        self._float_starts = array.array('q')
+        self._int_starts = array.array('q')
+        self._floats = array.array('d')
+        self._ints = array.array('q')
+        
+        # init tables
+        self._strings = []
+        self._strings_ids = {}
+        self._values = []
+        self._values_ids = {}
+        self._paths = []
+        self._paths_ids = {}
+        
+        self._mapped = False
+        
+        # init base
+        super().__init__()
+        
+        # bind events
+        self.bind(EVT_PROPERTY_CHANGED, self._on_recording_canvas_property_changed)
+        
+        # set overrides
+        self.set_properties(overrides)
+    
+    
+    def __len__(self):
+        """Gets number of recorded commands."""
+        
+        return len(self._ops)
+    
+    
+    @property
+    def groups(self):
+        """
+        Gets ids of all recorded groups.
+        
+        Returns:
+            (str,)
+                Groups ids.
+        """
+        
+        tags = []
+        
+        for i, op in enumerate(self._ops):
+            if op == _OPCODES['group']:
+                tag_id = self._ints[self._int_starts[i]]
+                if tag_id != -1:
+                    tags.append(self._strings[tag_id])
+        
+        return tuple(tags)
+    
+    
+    def get_group(self, id_tag):
+        """
+        Creates new canvas containing the specified group only. The state
+        changes (e.g. properties, viewport or clipping) recorded before the
+        group are included as well, so that the group looks the same when
+        drawn.
+        
+        Args:
+            id_tag: str
+                Unique id of the group.
+        
+        Returns:
+            pero.RecordingCanvas or None
+                Canvas containing the group or None if not found.
+        """
+        
+        # get group range
+        group = self._find_group(id_tag)
+        if group is None:
+            return None
+        
+        start, stop = group
+        
+        # get preceding state
+        indices = []
+        clips = []
+        
+        for i in range(start):
+            
+            name = _COMMANDS[self._ops[i]]
+            if name not in _STATE:
+                continue
+            
+            if name == 'clip':
+                clips.append(len(indices))
+            
+            elif name == 'unclip' and clips:
+                del indices[clips.pop()]
+                continue
+            
+            indices.append(i)
+        
+        # make canvas
+        canvas = self.__class__()
+        self._replay(canvas, indices + list(range(start, stop)))
+        
+        return canvas
+    
+    
+    def get_json(self):
+        """
+        Gets JSON string for current drawings, compatible with pero.JsonCanvas.
+        
+        Returns:
+            str
+                Drawings JSON string.
+        """
+        
+        commands = []
+        
+        for name, args in self._iter_commands(range(len(self._ops))):
+            
+            # convert values
+            for key, value in args.items():
+                
+                if value is UNDEF:
+                    args[key] = str(UNDEF)
+                
+                elif isinstance(value, Color):
+                    args[key] = value.hex
+                
+                elif isinstance(value, numpy.ndarray):
+                    args[key] = value.tolist()
+                
+                elif key == 'path':
+                    args[key] = json.loads(value.json())
+                
+                elif key.endswith('colors') and value is not None:
+                    args[key] = [c.hex if c is not None else None for c in value]
+            
+            commands.append((name, args))
+        
+        return json.dumps({"commands": commands})
+    
+    
+    def replay(self, canvas):
+        """
+        Draws all recorded commands into given canvas.
+        
+        Args:
+            canvas: pero.Canvas
+                Canvas to be used for rendering.
+        """
+        
+        self._replay(canvas, range(len(self._ops)))
+    
+    
+    def save(self, path):
+        """
+        Saves recorded drawings into binary dump.
+        
+        Args:
+            path: str or file
+                Path or file-like object to write into.
+        """
+        
+        buffers = {
+            'ops': self._ops,
+            'float_starts': self._float_starts,
+            'int_starts': self._int_starts,
+            'floats': self._floats,
+            'ints': self._ints}
+        
+        tables = {
+            'strings': self._strings,
+            'values': self._values,
+            'paths': self._paths}
+        
+        save_dump(buffers, tables, path)
+    
+    
+    @classmethod
+    def load(cls, path, mapped=True):
+        """
+        Creates a new canvas from given binary dump. The final values of the
+        recorded canvas properties are applied to the new canvas.
+        
+        Args:
+            path: str or file
+                Path or file-like object to read from.
+            
+            mapped: bool
+                If set to True, the file is memory-mapped if possible.
+        
+        Returns:
+            pero.RecordingCanvas
+                Loaded canvas.
+        """
+        
+        # load dump
+        buffers, tables = load_dump(path, mapped)
+        
+        # init canvas
+        canvas = cls()
+        
+        # get final properties
+        ops = buffers['ops']
+        ints = buffers['ints']
+        starts = buffers['int_starts'][ops == _OPCODES['set_property']]
+        
+        values = {}
+        for name_id, value_id in zip(ints[starts].tolist(), ints[starts+1].tolist()):
+            values[tables['strings'][name_id]] = tables['values'][value_id]
+        
+        # apply properties
+        for name, value in values.items():
+            canvas.set_property(name, value, raise_error=False)
+        
+        # set buffers
+        canvas._ops = ops
+        canvas._float_starts = buffers['float_starts']
+        canvas._int_starts = buffers['int_starts']
+        canvas._floats = buffers['floats']
+        canvas._ints = ints
+        
+        # set tables
+        canvas._strings = tables['strings']
+        canvas._values = tables['values']
+        canvas._paths = tables['paths']
+        canvas._mapped = True
+        
+        return canvas
+    
+    
+    def draw_arc(self, x, y, radius, start_angle, end_angle, clockwise=True):
+        """
+        Draws an arc of specified radius centered around given coordinates.
+        
+        Args:
+            x: int or float
+                X-coordinate of the center.
+            
+            y: int or float
+                Y-coordinate of the center.
+            
+            radius: int or float
+                Radius of the arc.
+            
+            start_angle: int or float
+                Angle of the starting point in radians.
+            
+            end_angle: int or float
+                Angle of the starting point in radians.
+            
+            clockwise: bool
+                Direction of drawing between start and end point.
+        """
+        
+        self._store_command('draw_arc', (x, y, radius, start_angle, end_angle), (int(clockwise),))
+    
+    
+    def draw_circle(self, x, y, radius):
+        """
+        Draws a circle of specified radius centered around given coordinates.
+        
+        Args:
+            x: int or float
+                X-coordinate of the center.
+            
+            y: int or float
+                Y-coordinate of the center.
+            
+            radius: int or float
+                Radius of the circle.
+        """
+        
+        self._store_command('draw_circle', (x, y, radius))
+    
+    
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, radii = self._get_bulk_arrays(xs, ys, radii)
+        
+        # store command
+        ints = self._get_bulk_ints(len(xs), line_colors, fill_colors)
+        self._store_command('draw_circles', (xs, ys, radii), ints)
+    
+    
+    def draw_ellipse(self, x, y, width, height):
+        """
+        Draws an ellipse centered around given coordinates and fitting into the
+        width and height.
+        
+        Args:
+            x: int or float
+                X-coordinate of the center.
+            
+            y: int or float
+                Y-coordinate of the center.
+            
+            width: int or float
+                Full width of the ellipse.
+            
+            height: int or float
+                Full height of the ellipse.
+        """
+        
+        self._store_command('draw_ellipse', (x, y, width, height))
+    
+    
+    def draw_line(self, x1, y1, x2, y2):
+        """
+        Draws a line between two points.
+        
+        Args:
+            x1: int or float
+                X-coordinate of the line start.
+            
+            y1: int or float
+                Y-coordinate of the line start.
+            
+            x2: int or float
+                X-coordinate of the line end.
+            
+            y2: int or float
+                Y-coordinate of the line end.
+        """
+        
+        self._store_command('draw_line', (x1, y1, x2, y2))
+    
+    
+    def draw_lines(self, points):
+        """
+        Draws continuous open line using sequence of points.
+        
+        Args:
+            points: ((float, float),)
+                Sequence of x,y coordinates of the points.
+        """
+        
+        self._store_command('draw_lines', (_get_points(points),))
+    
+    
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, sizes = self._get_bulk_arrays(xs, ys, sizes)
+        
+        # store command
+        ints = self._get_bulk_ints(len(xs), line_colors, fill_colors)
+        self._store_command('draw_markers', (xs, ys, sizes), (self._get_path_id(path),) + ints)
+    
+    
+    def draw_path(self, path):
+        """
+        Draws given path using current pen and brush.
+        
+        Args:
+            path: pero.Path
+                Path to be drawn.
+        """
+        
+        self._store_command('draw_path', (), (self._get_path_id(path),))
+    
+    
+    def draw_polygon(self, points):
+        """
+        Draws a closed polygon using sequence of points.
+        
+        Args:
+            points: ((float, float),)
+                Sequence of x,y coordinates of the points.
+        """
+        
+        self._store_command('draw_polygon', (_get_points(points),))
+    
+    
+    def draw_rect(self, x, y, width, height, radius=None):
+        """
+        Draws a rectangle specified by given top left corner and size and
+        optional round corners specified as a single value or individual value
+        for each corners starting from top-left.
+        
+        Args:
+            x: int or float
+                X-coordinate of the top left corner.
+            
+            y: int or float
+                Y-coordinate of the top left corner.
+            
+            width: int or float
+                Full width of the rectangle.
+            
+            height: int or float
+                Full height of the rectangle.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners.
+        """
+        
+        self._store_command('draw_rect', (x, y, width, height) + _get_radius(radius))
+    
+    
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, widths, heights = self._get_bulk_arrays(xs, ys, widths, heights)
+        
+        # store command
+        ints = self._get_bulk_ints(len(xs), line_colors, fill_colors)
+        self._store_command('draw_rects', (xs, ys, widths, heights) + _get_radius(radius), ints)
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+        """
+        
+        # get items
+        x1s, y1s, x2s, y2s = self._get_bulk_arrays(x1s, y1s, x2s, y2s)
+        
+        # store command
+        ints = self._get_bulk_ints(len(x1s), line_colors, None)
+        self._store_command('draw_segments', (x1s, y1s, x2s, y2s), ints)
+    
+    
+    def draw_text(self, text, x, y, angle=0):
+        """
+        Draws a text string anchored at specified point using current text
+        settings.
+        
+        Args:
+            text: str
+                Text to be drawn.
+            
+            x: int or float
+                X-coordinate of the text anchor.
+            
+            y: int or float
+                Y-coordinate of the text anchor.
+            
+            angle: int or float
+                Text angle in radians.
+        """
+        
+        self._store_command('draw_text', (x, y, angle), (self._get_string_id(text),))
+    
+    
+    def fill(self, color=None):
+        """
+        Fills current drawing region by specified or actual fill color.
+        
+        Args:
+            color: pero.Color, (int,), str, None or UNDEF
+                Specifies the fill color as an RGB or RGBA tuple, hex code, name
+                or pero.Color. If not set, current fill color will be used.
+        """
+        
+        # get color
+        color_id = self._get_value_id(Color.create(color)) if color else -1
+        
+        # store command
+        self._store_command('fill', (), (color_id,))
+    
+    
+    def view(self, x=None, y=None, width=None, height=None, relative=False):
+        """
+        Sets rectangular region currently used for drawing. This provides an
+        easy way to draw complex graphics at specific position of the canvas
+        without adjusting the coordinates of the graphics. It is achieved by
+        changing the origin coordinates and the logical width and height of
+        the canvas.
+        
+        Args:
+            x: int or float
+                X-coordinate of the top-left corner.
+            
+            y: int or float
+                Y-coordinate of the top-left corner.
+            
+            width: int, float or None
+                Full width of the viewport.
+            
+            height: int, float or None
+                Full height of the viewport.
+            
+            relative: bool
+                If set to True the new viewport is applied relative to current
+                one.
+        
+        Returns:
+            pero.ViewState
+                Viewport state context manager.
+        """
+        
+        # set to base
+        state = super().view(x, y, width, height, relative)
+        
+        # store command
+        values = tuple(numpy.nan if v is None else v for v in (x, y, width, height))
+        self._store_command('view', values, (int(relative),))
+        
+        return state
+    
+    
+    def clip(self, path):
+        """
+        Sets clipping path as intersection with current one.
+        
+        Args:
+            path: pero.Path
+                Path to be used for clipping.
+        
+        Returns:
+            pero.ClipState
+                Clipping state context manager.
+        """
+        
+        # store command
+        self._store_command('clip', (), (self._get_path_id(path),))
+        
+        # return state
+        return ClipState(self)
+    
+    
+    def unclip(self):
+        """Removes last clipping path while keeping previous if any."""
+        
+        # store command
+        self._store_command('unclip')
+    
+    
+    def group(self, id_tag=None, class_tag=None):
+        """
+        Opens new drawing group.
+        
+        Args:
+            id_tag: str
+                Unique id of the group.
+            
+            class_tag:
+                Class of the group.
+        
+        Returns:
+            pero.GroupState
+                Grouping state context manager.
+        """
+        
+        # get tags
+        id_id = self._get_string_id(id_tag) if id_tag is not None else -1
+        class_id = self._get_string_id(class_tag) if class_tag is not None else -1
+        
+        # store command
+        self._store_command('group', (), (id_id, class_id))
+        
+        # return state
+        return GroupState(self)
+    
+    
+    def ungroup(self):
+        """Closes the last drawing group."""
+        
+        # store command
+        self._store_command('ungroup')
+    
+    
+    def _store_command(self, command, floats=(), ints=()):
+        """Stores command and its parameters."""
+        
+        # make buffers writable
+        if self._mapped:
+            self._unmap()
+        
+        # store command
+        self._ops.append(_OPCODES[command])
+        self._float_starts.append(len(self._floats))
+        self._int_starts.append(len(self._ints))
+        
+        # store floats
+        for value in floats:
+            if isinstance(value, numpy.ndarray):
+                self._floats.frombytes(numpy.ascontiguousarray(value, dtype=numpy.float64).tobytes())
+            else:
+                self._floats.append(value)
+        
+        # store ints
+        if ints:
+            self._ints.extend(ints)
+    
+    
+    def _unmap(self):
+        """Makes in-memory copy of loaded buffers and tables."""
+        
+        # copy buffers
+        for name, code in (('_ops', 'B'), ('_float_starts', 'q'), ('_int_starts', 'q'), ('_floats', 'd'), ('_ints', 'q')):
+            buff = array.array(code)
+            buff.frombytes(numpy.ascontiguousarray(getattr(self, name), dtype=buff.typecode).tobytes())
+            setattr(self, name, buff)
+        
+        # copy tables
+        self._strings = list(self._strings)
+        self._values = list(self._values)
+        self._paths = list(self._paths)
+        
+        # init ids
+        self._strings_ids = {v: i for i, v in enumerate(self._strings)}
+        self._values_ids = {_get_value_key(v): i for i, v in enumerate(self._values)}
+        self._values_ids.pop(None, None)
+        self._paths_ids = {v: i for i, v in enumerate(self._paths)}
+        
+        self._mapped = False
+    
+    
+    def _get_bulk_ints(self, count, line_colors, fill_colors):
+        """Gets int values for bulk items colors."""
+        
+        line_colors = self._get_bulk_colors(line_colors, count)
+        fill_colors = self._get_bulk_colors(fill_colors, count)
+        
+        ints = [count, int(line_colors is not None), int(fill_colors is not None)]
+        
+        for colors in (line_colors, fill_colors):
+            if colors is not None:
+                ints.extend(self._get_value_id(c) if c is not None else -1 for c in colors)
+        
+        return tuple(ints)
+    
+    
+    def _get_string_id(self, value):
+        """Gets index of given string within strings table."""
+        
+        # make tables writable
+        if self._mapped:
+            self._unmap()
+        
+        idx = self._strings_ids.get(value, None)
+        
+        if idx is None:
+            idx = len(self._strings)
+            self._strings.append(value)
+            self._strings_ids[value] = idx
+        
+        return idx
+    
+    
+    def _get_value_id(self, value):
+        """Gets index of given value within style values table."""
+        
+        # make tables writable
+        if self._mapped:
+            self._unmap()
+        
+        # get key
+        key = _get_value_key(value)
+        
+        # get index
+        idx = self._values_ids.get(key, None) if key is not None else None
+        
+        # add value
+        if idx is None:
+            idx = len(self._values)
+            self._values.append(value)
+            
+            if key is not None:
+                self._values_ids[key] = idx
+        
+        return idx
+    
+    
+    def _get_path_id(self, path):
+        """Gets index of given path within paths table."""
+        
+        # make tables writable
+        if self._mapped:
+            self._unmap()
+        
+        key = (path.fill_rule, path.commands())
+        idx = self._paths_ids.get(key, None)
+        
+        if idx is None:
+            idx = len(self._paths)
+            self._paths.append(key)
+            self._paths_ids[key] = idx
+        
+        return idx
+    
+    
+    def _find_group(self, id_tag):
+        """Gets range of commands for specified group."""
+        
+        group_op = _OPCODES['group']
+        ungroup_op = _OPCODES['ungroup']
+        
+        start = None
+        level = 0
+        
+        for i, op in enumerate(self._ops):
+            
+            # find group start
+            if start is None:
+                if op == group_op:
+                    tag_id = self._ints[self._int_starts[i]]
+                    if tag_id != -1 and self._strings[tag_id] == id_tag:
+                        start = i
+                continue
+            
+            # find group end
+            if op == group_op:
+                level += 1
+            
+            elif op == ungroup_op:
+                if level == 0:
+                    return start, i + 1
+                level -= 1
+        
+        # group not closed
+        if start is not None:
+            return start, len(self._ops)
+        
+        return None
+    
+    
+    def _replay(self, canvas, indices):
+        """Draws specified commands into given canvas."""
+        
+        for name, args in self._iter_commands(indices):
+            getattr(canvas, name)(**args)
+    
+    
+    def _iter_commands(self, indices):
+        """Iterates through specified commands as names and arguments."""
+        
+        # get buffers
+        ops = self._ops
+        float_starts = self._float_starts
+        int_starts = self._int_starts
+        floats = self._floats
+        ints = self._ints
+        
+        # get floats array
+        if isinstance(floats, numpy.ndarray):
+            data = floats
+        else:
+            data = numpy.array(floats, dtype=numpy.float64)
+        
+        # init paths
+        paths = {}
+        
+        def get_path(idx):
+            path = paths.get(idx, None)
+            if path is None:
+                fill_rule, commands = self._paths[idx]
+                path = paths[idx] = Path.from_commands(commands, fill_rule)
+            return path
+        
+        count = len(ops)
+        for i in indices:
+            
+            # get ranges
+            f0 = float_starts[i]
+            i0 = int_starts[i]
+            f1 = float_starts[i+1] if i + 1 < count else len(floats)
+            i1 = int_starts[i+1] if i + 1 < count else len(ints)
+            
+            # get command
+            name = _COMMANDS[ops[i]]
+            
+            # set property
+            if name == 'set_property':
+                args = {
+                    'name': self._strings[ints[i0]],
+                    'value': self._values[ints[i0+1]],
+                    'raise_error': False}
+            
+            # draw arc
+            elif name == 'draw_arc':
+                x, y, radius, start_angle, end_angle = floats[f0:f1]
+                args = {
+                    'x': x,
+                    'y': y,
+                    'radius': radius,
+                    'start_angle': start_angle,
+                    'end_angle': end_angle,
+                    'clockwise': bool(ints[i0])}
+            
+            # draw circle
+            elif name == 'draw_circle':
+                x, y, radius = floats[f0:f1]
+                args = {'x': x, 'y': y, 'radius': radius}
+            
+            # draw ellipse
+            elif name == 'draw_ellipse':
+                x, y, width, height = floats[f0:f1]
+                args = {'x': x, 'y': y, 'width': width, 'height': height}
+            
+            # draw line
+            elif name == 'draw_line':
+                x1, y1, x2, y2 = floats[f0:f1]
+                args = {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2}
+            
+            # draw lines or polygon
+            elif name == 'draw_lines' or name == 'draw_polygon':
+                args = {'points': data[f0:f1].reshape(-1, 2)}
+            
+            # draw path
+            elif name == 'draw_path':
+                args = {'path': get_path(ints[i0])}
+            
+            # draw rect
+            elif name == 'draw_rect':
+                x, y, width, height = floats[f0:f0+4]
+                args = {
+                    'x': x,
+                    'y': y,
+                    'width': width,
+                    'height': height,
+                    'radius': _make_radius(floats[f0+4:f1])}
+            
+            # draw text
+            elif name == 'draw_text':
+                x, y, angle = floats[f0:f1]
+                args = {
+                    'text': self._strings[ints[i0]],
+                    'x': x,
+                    'y': y,
+                    'angle': angle}
+            
+            # draw circles
+            elif name == 'draw_circles':
+                xs, ys, radii, radius, line_colors, fill_colors = self._get_bulk_args(data, f0, f1, ints, i0, 3)
+                args = {
+                    'xs': xs,
+                    'ys': ys,
+                    'radii': radii,
+                    'line_colors': line_colors,
+                    'fill_colors': fill_colors}
+            
+            # draw markers
+            elif name == 'draw_markers':
+                xs, ys, sizes, radius, line_colors, fill_colors = self._get_bulk_args(data, f0, f1, ints, i0+1, 3)
+                args = {
+                    'path': get_path(ints[i0]),
+                    'xs': xs,
+                    'ys': ys,
+                    'sizes': sizes,
+                    'line_colors': line_colors,
+                    'fill_colors': fill_colors}
+            
+            # draw rects
+            elif name == 'draw_rects':
+                xs, ys, widths, heights, radius, line_colors, fill_colors = self._get_bulk_args(data, f0, f1, ints, i0, 4)
+                args = {
+                    'xs': xs,
+                    'ys': ys,
+                    'widths': widths,
+                    'heights': heights,
+                    'radius': radius,
+                    'line_colors': line_colors,
+                    'fill_colors': fill_colors}
+            
+            # draw segments
+            elif name == 'draw_segments':
+                x1s, y1s, x2s, y2s, radius, line_colors, fill_colors = self._get_bulk_args(data, f0, f1, ints, i0, 4)
+                args = {
+                    'x1s': x1s,
+                    'y1s': y1s,
+                    'x2s': x2s,
+                    'y2s': y2s,
+                    'line_colors': line_colors}
+            
+            # fill
+            elif name == 'fill':
+                args = {'color': self._values[ints[i0]] if ints[i0] != -1 else None}
+            
+            # view
+            elif name == 'view':
+                x, y, width, height = (None if v != v else v for v in floats[f0:f1])
+                args = {
+                    'x': x,
+                    'y': y,
+                    'width': width,
+                    'height': height,
+                    'relative': bool(ints[i0])}
+            
+            # clip
+            elif name == 'clip':
+                args = {'path': get_path(ints[i0])}
+            
+            # group
+            elif name == 'group':
+                id_id, class_id = ints[i0:i1]
+                args = {
+                    'id_tag': self._strings[id_id] if id_id != -1 else None,
+                    'class_tag': self._strings[class_id] if class_id != -1 else None}
+            
+            # unclip or ungroup
+            else:
+                args = {}
+            
+            yield name, args
+    
+    
+    def _get_bulk_args(self, data, f0, f1, ints, i0, arrays):
+        """Gets arrays, radius and colors of bulk command."""
+        
+        # get arrays
+        count, has_line, has_fill = ints[i0:i0+3]
+        values = [data[f0+i*count:f0+(i+1)*count] for i in range(arrays)]
+        
+        # get radius
+        values.append(_make_radius(self._floats[f0+arrays*count:f1]))
+        
+        # get colors
+        i0 += 3
+        for has_colors in (has_line, has_fill):
+            
+            if not has_colors:
+                values.append(None)
+                continue
+            
+            values.append([self._values[c] if c != -1 else None for c in ints[i0:i0+count]])
+            i0 += count
+        
+        return values
+    
+    
+    def _on_recording_canvas_property_changed(self, evt):
+        """Called after any property has changed."""
+        
+        # get changes
+        changes = evt.changes or {evt.name: (evt.old_value, evt.new_value)}
+        
+        # store changes
+        for name, (old_value, value) in changes.items():
+            ints = (self._get_string_id(name), self._get_value_id(value))
+            self._store_command('set_property', (), ints)
+
+
+def _get_points(points):
+    """Converts points into 2D array."""
+    
+    return numpy.asarray(points, dtype=numpy.float64).reshape(-1, 2)
+
+
+def _get_radius(radius):
+    """Converts rectangle radius into tuple of floats."""
+    
+    if radius is None:
+        return ()
+    
+    if isinstance(radius, (int, float)):
+        return (radius,)
+    
+    return tuple(radius)
+
+
+def _make_radius(values):
+    """Converts stored floats into rectangle radius."""
+    
+    if len(values) == 0:
+        return None
+    
+    if len(values) == 1:
+        return values[0]
+    
+    return tuple(values)
+
+
+def _get_value_key(value):
+    """Gets hashable key to intern given value or None if not possible."""
+    
+    # colors
+    if isinstance(value, Color):
+        return (Color, value.rgba)
+    
+    # other values
+    try:
+        key = (type(value), value)
+        hash(key)
+        return key
+    
+    except TypeError:
+        return None
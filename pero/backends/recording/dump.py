@@ -0,0 +1,309 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import json
+import mmap
+import struct
+import zipfile
+import numpy
+from ... colors import Color
+from ... properties import UNDEF
+
+# define constants
+DUMP_VERSION = 1
+DUMP_TABLES = "tables.json"
+
+# define arrays
+_ARRAYS = (
+    ('ops', '|u1'),
+    ('float_starts', '<i8'),
+    ('int_starts', '<i8'),
+    ('floats', '<f8'),
+    ('ints', '<i8'),
+    ('path_keys', '|u1'),
+    ('path_key_starts', '<i8'),
+    ('path_floats', '<f8'),
+    ('path_float_starts', '<i8'))
+
+# define path commands size
+_PATH_VALUES = {'M': 2, 'L': 2, 'C': 6, 'Z': 0}
+
+# define zip local header
+_ZIP_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+
+def save_dump(buffers, tables, path):
+    """
+    Saves recorded buffers and tables into binary dump. The dump is a zip
+    archive of uncompressed numpy .npy arrays (i.e. it can be read by
+    numpy.load as well) plus JSON file with the strings, style values and
+    paths fill rules.
+    
+    Args:
+        buffers: {str: array.array or numpy.ndarray}
+            Recorded buffers by name.
+        
+        tables: {str: list}
+            Recorded strings, values and paths.
+        
+        path: str or file
+            Path or file-like object to write into.
+    """
+    
+    # get arrays
+    arrays = dict(buffers)
+    arrays.update(_encode_paths(tables['paths']))
+    
+    # get tables
+    info = {
+        'version': DUMP_VERSION,
+        'strings': list(tables['strings']),
+        'values': [_encode_value(v) for v in tables['values']],
+        'path_rules': [p[0] for p in tables['paths']]}
+    
+    # write archive
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED, allowZip64=True) as archive:
+        
+        archive.writestr(DUMP_TABLES, json.dumps(info))
+        
+        for name, dtype in _ARRAYS:
+            data = numpy.asarray(arrays[name]).astype(dtype, copy=False)
+            with archive.open(name + ".npy", 'w', force_zip64=True) as f:
+                numpy.lib.format.write_array(f, data, allow_pickle=False)
+
+
+def load_dump(path, mapped=True):
+    """
+    Loads recorded buffers and tables from binary dump. If the path is a file
+    name and mapping is enabled, the arrays are memory-mapped from the file
+    without copying so that only the parts actually used are read from disk.
+    
+    Args:
+        path: str or file
+            Path or file-like object to read from.
+        
+        mapped: bool
+            If set to True, the file is memory-mapped if possible.
+    
+    Returns:
+        ({str: numpy.ndarray}, {str: list})
+            Loaded buffers and tables.
+    """
+    
+    with zipfile.ZipFile(path, 'r') as archive:
+        
+        # read tables
+        info = json.loads(archive.read(DUMP_TABLES).decode('utf-8'))
+        if info.get('version') != DUMP_VERSION:
+            message = "Unsupported dump version! -> %s" % info.get('version')
+            raise ValueError(message)
+        
+        # map file
+        data = None
+        if mapped and isinstance(path, str):
+            with open(path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # read arrays
+        arrays = {}
+        for name, dtype in _ARRAYS:
+            
+            member = archive.getinfo(name + ".npy")
+            
+            if data is not None and member.compress_type == zipfile.ZIP_STORED:
+                arrays[name] = _map_array(data, member)
+            else:
+                with archive.open(member) as f:
+                    arrays[name] = numpy.lib.format.read_array(f, allow_pickle=False)
+    
+    # get buffers
+    buffers = {n: arrays[n] for n in ('ops', 'float_starts', 'int_starts', 'floats', 'ints')}
+    
+    # get tables
+    tables = {
+        'strings': info['strings'],
+        'values': [_decode_value(v) for v in info['values']],
+        'paths': PathTable(info['path_rules'], arrays)}
+    
+    return buffers, tables
+
+
+class PathTable(object):
+    """
+    Provides lazy access to paths stored in binary dump. Each path is
+    represented as its fill rule and commands, which are decoded from the
+    arrays when requested.
+    """
+    
+    
+    def __init__(self, rules, arrays):
+        """Initializes a new instance of PathTable."""
+        
+        self._rules = rules
+        self._keys = arrays['path_keys']
+        self._key_starts = arrays['path_key_starts']
+        self._floats = arrays['path_floats']
+        self._float_starts = arrays['path_float_starts']
+    
+    
+    def __len__(self):
+        """Gets number of paths."""
+        
+        return len(self._rules)
+    
+    
+    def __getitem__(self, idx):
+        """Gets fill rule and commands of specified path."""
+        
+        # get ranges
+        count = len(self._rules)
+        k0 = self._key_starts[idx]
+        f0 = self._float_starts[idx]
+        k1 = self._key_starts[idx+1] if idx + 1 < count else len(self._keys)
+        
+        # get data
+        keys = self._keys[k0:k1].tobytes().decode('ascii')
+        values = self._floats[f0:f0+sum(_PATH_VALUES[k] for k in keys)].tolist()
+        
+        # make commands
+        commands = []
+        pos = 0
+        
+        for key in keys:
+            size = _PATH_VALUES[key]
+            commands.append((key, *values[pos:pos+size]))
+            pos += size
+        
+        return self._rules[idx], tuple(commands)
+    
+    
+    def __iter__(self):
+        """Iterates through all paths."""
+        
+        for i in range(len(self)):
+            yield self[i]
+
+
+def _map_array(data, member):
+    """Creates array from memory-mapped zip member."""
+    
+    # get data offset
+    header = _ZIP_HEADER.unpack_from(data, member.header_offset)
+    offset = member.header_offset + _ZIP_HEADER.size + header[-2] + header[-1]
+    
+    # read array header
+    view = memoryview(data)[offset:offset+member.file_size]
+    stream = _BufferReader(view)
+    
+    version = numpy.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran, dtype = numpy.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran, dtype = numpy.lib.format.read_array_header_2_0(stream)
+    
+    # make array
+    count = int(numpy.prod(shape))
+    array = numpy.frombuffer(data, dtype=dtype, count=count, offset=offset+stream.tell())
+    
+    return array.reshape(shape, order='F' if fortran else 'C')
+
+
+def _encode_paths(paths):
+    """Converts paths commands into arrays."""
+    
+    keys = bytearray()
+    key_starts = []
+    floats = []
+    float_starts = []
+    
+    for fill_rule, commands in paths:
+        
+        key_starts.append(len(keys))
+        float_starts.append(len(floats))
+        
+        for command in commands:
+            keys.extend(command[0].encode('ascii'))
+            floats.extend(command[1:])
+    
+    return {
+        'path_keys': numpy.frombuffer(bytes(keys), dtype=numpy.uint8),
+        'path_key_starts': numpy.array(key_starts, dtype=numpy.int64),
+        'path_floats': numpy.array(floats, dtype=numpy.float64),
+        'path_float_starts': numpy.array(float_starts, dtype=numpy.int64)}
+
+
+def _encode_value(value):
+    """Converts style value into JSON-compatible item."""
+    
+    if value is UNDEF:
+        return ['u', None]
+    
+    if isinstance(value, Color):
+        return ['c', list(value.rgba)]
+    
+    if isinstance(value, tuple):
+        return ['t', [_encode_value(v) for v in value]]
+    
+    if isinstance(value, list):
+        return ['l', [_encode_value(v) for v in value]]
+    
+    if isinstance(value, numpy.ndarray):
+        return ['a', value.tolist()]
+    
+    if isinstance(value, numpy.generic):
+        return ['v', value.item()]
+    
+    if value is None or isinstance(value, (str, int, float)):
+        return ['v', value]
+    
+    message = "Unsupported value type! -> %s" % type(value)
+    raise TypeError(message)
+
+
+def _decode_value(item):
+    """Converts JSON-compatible item into style value."""
+    
+    tag, value = item
+    
+    if tag == 'u':
+        return UNDEF
+    
+    if tag == 'c':
+        return Color(*value)
+    
+    if tag == 't':
+        return tuple(_decode_value(v) for v in value)
+    
+    if tag == 'l':
+        return [_decode_value(v) for v in value]
+    
+    if tag == 'a':
+        return numpy.array(value)
+    
+    return value
+
+
+class _BufferReader(object):
+    """Provides minimal file-like reading of a memory view."""
+    
+    
+    def __init__(self, view):
+        """Initializes a new instance of _BufferReader."""
+        
+        self._view = view
+        self._pos = 0
+    
+    
+    def read(self, size):
+        """Reads specified number of bytes."""
+        
+        data = self._view[self._pos:self._pos+size].tobytes()
+        self._pos += len(data)
+        
+        return data
+    
+    
+    def tell(self):
+        """Gets current position."""
+        
+        return self._pos
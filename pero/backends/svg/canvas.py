@@ -3,6 +3,7 @@
 
 import numpy
 import html
+import re
 from ... properties import *
 from ... geometry import Path, Matrix
 from ... drawing import Canvas, ClipState, GroupState
@@ -11,20 +12,80 @@ from . enums import *
 # define constants
 _INDENT = "  "
 _DIGITS = 2
+_SYMBOL_COMMANDS = 64
+_SYMBOL_CACHE = 10000
+_MOVE_RE = re.compile(r"^m[^a-zA-Z]*")
+_ZERO_FRACTION_RE = re.compile(r"\.0(?![0-9])")
+_NEGATIVE_ZERO_RE = re.compile(r"(?<![0-9.])-0(?![0-9.])")
+_LEADING_ZERO_RE = re.compile(r"(?<![0-9])0\.(?=[0-9])")
+_SEPARATOR_RE = re.compile(r" (?=[a-zA-Z-])")
+_XML = '<?xml version="1.0"?>\n<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.0//EN" "http://www.w3.org/TR/2001/REC-SVG-20010904/DTD/svg10.dtd">\n\n'
 
 
 class SVGCanvas(Canvas):
-    """Wrapper for SVG drawing context."""
+    """
+    Wrapper for SVG drawing context.
     
+    By default all the drawings are kept in memory until the final markup is
+    retrieved by the get_xml or get_svg method. If a file-like object is
+    provided as stream, the canvas works in streaming mode instead, writing the
+    XML directly into the stream as drawing proceeds. In such case the header
+    is written with the first drawing command, so the size of the canvas must
+    be set before, and the document must be completed by calling the finish
+    method. The definitions (e.g. clipping paths or filters) are written
+    inline right before they are used for the first time.
     
-    def __init__(self, **overrides):
-        """Initializes a new instance of SVGCanvas."""
+    If compact mode is enabled, the output size is reduced at the cost of
+    readability. Pen and brush attribute sets used repeatedly are defined
+    once as CSS classes, while the first usage of each set is kept inline,
+    so that single-use sets do not add any rule. Path data use relative
+    commands and shortest number format and
+    small paths drawn repeatedly (e.g. markers) are defined once as symbols,
+    which are then placed by <use> elements. Note that the CSS classes are not
+    scoped, so multiple compact images should not be embedded into the same
+    HTML document.
+    """
+    
+    
+    def __init__(self, stream=None, compact=False, precision=_DIGITS, **overrides):
+        """
+        Initializes a new instance of SVGCanvas.
+        
+        Args:
+            stream: file or None
+                Text file-like object to stream the XML into.
+            
+            compact: bool
+                If set to True, compact output is created.
+            
+            precision: int
+                Number of decimal digits used for coordinates.
+            
+            overrides: str:any pairs
+                Value overwrites for specific properties.
+        """
+        
+        # init stream
+        self._stream = stream
+        self._started = False
+        self._defs = []
+        
+        # init compaction
+        self._compact = compact
+        self._digits = precision
         
         # init buffers
         self._commands = []
         self._filters = {}
         self._clips = {}
-        self._indent = _INDENT
+        self._styles = {}
+        self._classes = 0
+        self._rules = []
+        self._shapes = {}
+        self._symbols = {}
+        
+        self._tab = "" if compact else _INDENT
+        self._indent = self._tab
         
         self._pen_attrs = {
             'stroke': None,
@@ -73,12 +134,7 @@ class SVGCanvas(Canvas):
                 Drawings XML.
         """
         
-        # make xml
-        xml = '<?xml version="1.0"?>'
-        xml += '\n<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.0//EN" "http://www.w3.org/TR/2001/REC-SVG-20010904/DTD/svg10.dtd">\n\n'
-        xml += self.get_svg()
-        
-        return xml
+        return _XML + self.get_svg()
     
     
     def get_svg(self):
@@ -91,13 +147,22 @@ class SVGCanvas(Canvas):
                 Drawings SVG markup.
         """
         
+        # check stream
+        if self._stream is not None:
+            message = "Streaming canvas keeps no drawings! Use finish() instead."
+            raise ValueError(message)
+        
         # init xml
-        xml = '<svg xmlns="http://www.w3.org/2000/svg" width="%s" height="%s">\n' % (self.width, self.height)
+        xml = self._get_header()
         
         # add defs
-        if self._filters or self._clips:
+        if self._filters or self._clips or self._rules or self._symbols:
             xml += "  <defs>\n"
             
+            # add styles
+            if self._rules:
+                xml += "    <style>%s</style>\n" % "".join(self._rules)
+            
             # add filters
             if self._filters:
                 xml += "    %s\n" % "\n    ".join(self._filters.values())
@@ -106,6 +171,10 @@ class SVGCanvas(Canvas):
             if self._clips:
                 xml += "    %s\n" % "\n    ".join(self._clips.values())
             
+            # add symbols
+            if self._symbols:
+                xml += "    %s\n" % "\n    ".join(self._symbols.values())
+            
             xml += "  </defs>\n"
         
         # add drawings
@@ -117,6 +186,24 @@ class SVGCanvas(Canvas):
         return xml
     
     
+    def finish(self):
+        """
+        Completes the document written into the stream in streaming mode. The
+        stream itself is neither flushed nor closed.
+        """
+        
+        # check stream
+        if self._stream is None:
+            message = "Canvas is not in streaming mode!"
+            raise ValueError(message)
+        
+        # write pending items
+        self._write_all(())
+        
+        # finish xml
+        self._stream.write('</svg>')
+    
+    
     def draw_circle(self, x, y, radius):
         """
         Draws a circle of specified radius centered around given coordinates.
@@ -138,19 +225,64 @@ class SVGCanvas(Canvas):
         radius = self._scale * radius
         
         # apply rounding
-        x = round(x, _DIGITS)
-        y = round(y, _DIGITS)
-        radius = round(radius, _DIGITS)
+        x = round(x, self._digits)
+        y = round(y, self._digits)
+        radius = round(radius, self._digits)
         
         # get pen and brush
-        pen = self._get_pen_attrs()
-        brush = self._get_brush_attrs()
+        style = self._get_style_attrs()
         
         # make command
-        command = self._indent + '<circle cx="%s" cy="%s" r="%s" %s %s />' % (x, y, radius, pen, brush)
+        command = self._indent + '<circle cx="%s" cy="%s" r="%s" %s />' % (x, y, radius, style)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
+    
+    
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, radii = self._get_bulk_arrays(xs, ys, radii)
+        
+        # apply scaling and offset
+        xs = self._scale * (xs + self._offset[0])
+        ys = self._scale * (ys + self._offset[1])
+        radii = self._scale * radii
+        
+        # apply rounding
+        xs = xs.round(self._digits).tolist()
+        ys = ys.round(self._digits).tolist()
+        radii = radii.round(self._digits).tolist()
+        
+        # get pens and brushes
+        styles = self._get_bulk_style_attrs(line_colors, fill_colors, len(xs))
+        
+        # make commands
+        template = self._indent + '<circle cx="%s" cy="%s" r="%s" %s />'
+        commands = (template % item for item in zip(xs, ys, radii, styles))
+        
+        # add commands
+        self._write_all(commands)
     
     
     def draw_ellipse(self, x, y, width, height):
@@ -183,20 +315,19 @@ class SVGCanvas(Canvas):
         ry = 0.5 * height
         
         # apply rounding
-        x = round(x, _DIGITS)
-        y = round(y, _DIGITS)
-        rx = round(rx, _DIGITS)
-        ry = round(ry, _DIGITS)
+        x = round(x, self._digits)
+        y = round(y, self._digits)
+        rx = round(rx, self._digits)
+        ry = round(ry, self._digits)
         
         # get pen and brush
-        pen = self._get_pen_attrs()
-        brush = self._get_brush_attrs()
+        style = self._get_style_attrs()
         
         # make command
-        command = self._indent + '<ellipse cx="%s" cy="%s" rx="%s" ry="%s" %s %s />' % (x, y, rx, ry, pen, brush)
+        command = self._indent + '<ellipse cx="%s" cy="%s" rx="%s" ry="%s" %s />' % (x, y, rx, ry, style)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
     
     
     def draw_line(self, x1, y1, x2, y2):
@@ -224,19 +355,19 @@ class SVGCanvas(Canvas):
         y2 = self._scale * (y2 + self._offset[1])
         
         # get pen
-        pen = self._get_pen_attrs()
+        style = self._get_style_attrs(brush=False)
         
         # apply rounding
-        x1 = round(x1, _DIGITS)
-        y1 = round(y1, _DIGITS)
-        x2 = round(x2, _DIGITS)
-        y2 = round(y2, _DIGITS)
+        x1 = round(x1, self._digits)
+        y1 = round(y1, self._digits)
+        x2 = round(x2, self._digits)
+        y2 = round(y2, self._digits)
         
         # make command
-        command = self._indent + '<line x1="%s" y1="%s" x2="%s" y2="%s" %s />' % (x1, y1, x2, y2, pen)
+        command = self._indent + '<line x1="%s" y1="%s" x2="%s" y2="%s" %s />' % (x1, y1, x2, y2, style)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
     
     
     def draw_lines(self, points):
@@ -255,21 +386,85 @@ class SVGCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
-        # apply rounding
-        points = [(round(x, _DIGITS), round(y, _DIGITS)) for x, y in points]
+        # decimate points
+        points = self._decimate(points)
         
         # format
-        points = ("%s,%s" % (x, y) for x, y in points)
+        points = _format_points(points, self._digits)
         
         # get pen and brush
-        pen = self._get_pen_attrs()
-        brush = self._get_brush_attrs()
+        style = self._get_style_attrs()
         
         # make command
-        command = self._indent + '<polyline points="%s" %s %s fill-rule="evenodd" />' % (" ".join(points), pen, brush)
+        command = self._indent + '<polyline points="%s" %s fill-rule="evenodd" />' % (points, style)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
+    
+    
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, sizes = self._get_bulk_arrays(xs, ys, sizes)
+        
+        # get pens and brushes
+        styles = self._get_bulk_style_attrs(line_colors, fill_colors, len(xs))
+        fill = SVG_FILL_RULE[path.fill_rule]
+        
+        # init scaling and offset
+        matrix = Matrix()
+        matrix.translate(self._offset[0], self._offset[1])
+        matrix.scale(self._scale, self._scale)
+        
+        # use symbols
+        if self._compact:
+            
+            for x, y, size, style in zip(xs.tolist(), ys.tolist(), sizes.tolist(), styles):
+                
+                # place path
+                item = Matrix().scale(size, size).translate(x, y)
+                item.translate(self._offset[0], self._offset[1])
+                item.scale(self._scale, self._scale)
+                
+                # add command
+                self._write_symbol(path, item, style)
+            
+            return
+        
+        # make commands
+        template = self._indent + '<path %s fill-rule="%s" d="%s" />'
+        indent = self._indent + _INDENT
+        
+        for x, y, size, style in zip(xs.tolist(), ys.tolist(), sizes.tolist(), styles):
+            
+            # place path
+            item = path.transformed(Matrix().scale(size, size).translate(x, y))
+            item = item.transformed(matrix)
+            
+            # add command
+            self._write(template % (style, fill, item.svg(indent, self._digits)))
     
     
     def draw_path(self, path):
@@ -281,25 +476,31 @@ class SVGCanvas(Canvas):
                 Path to be drawn.
         """
         
-        # apply scaling and offset
+        # init scaling and offset
         matrix = Matrix()
         matrix.translate(self._offset[0], self._offset[1])
         matrix.scale(self._scale, self._scale)
-        path = path.transformed(matrix)
-        
-        # get svg
-        svg = path.svg(self._indent+_INDENT, _DIGITS)
         
         # get pen and brush
-        pen = self._get_pen_attrs()
-        brush = self._get_brush_attrs()
+        style = self._get_style_attrs()
         fill = SVG_FILL_RULE[path.fill_rule]
         
+        # use symbols
+        if self._compact:
+            self._write_symbol(path, matrix, style)
+            return
+        
+        # apply scaling and offset
+        path = path.transformed(matrix)
+        
+        # get svg
+        svg = path.svg(self._indent+_INDENT, self._digits)
+        
         # make command
-        command = self._indent + '<path %s %s fill-rule="%s" d="%s" />' % (pen, brush, fill, svg)
+        command = self._indent + '<path %s fill-rule="%s" d="%s" />' % (style, fill, svg)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
     
     
     def draw_polygon(self, points):
@@ -315,24 +516,28 @@ class SVGCanvas(Canvas):
         if len(points) < 3:
             return
         
+        # use symbols for small polygons
+        if self._compact and len(points) < _SYMBOL_COMMANDS:
+            self.draw_path(Path(EVENODD).polygon(points))
+            return
+        
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
-        # apply rounding
-        points = [(round(x, _DIGITS), round(y, _DIGITS)) for x, y in points]
+        # decimate points
+        points = self._decimate(points)
         
         # format
-        points = ("%s,%s" % (x, y) for x, y in points)
+        points = _format_points(points, self._digits)
         
         # get pen and brush
-        pen = self._get_pen_attrs()
-        brush = self._get_brush_attrs()
+        style = self._get_style_attrs()
         
         # make command
-        command = self._indent + '<polygon points="%s" %s %s fill-rule="evenodd" />' % (" ".join(points), pen, brush)
+        command = self._indent + '<polygon points="%s" %s fill-rule="evenodd" />' % (points, style)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
     
     
     def draw_rect(self, x, y, width, height, radius=0):
@@ -382,26 +587,146 @@ class SVGCanvas(Canvas):
         radius = self._scale * radius
         
         # apply rounding
-        x = round(x, _DIGITS)
-        y = round(y, _DIGITS)
-        width = round(width, _DIGITS)
-        height = round(height, _DIGITS)
-        radius = round(radius, _DIGITS)
+        x = round(x, self._digits)
+        y = round(y, self._digits)
+        width = round(width, self._digits)
+        height = round(height, self._digits)
+        radius = round(radius, self._digits)
         
         # get pen and brush
-        pen = self._get_pen_attrs()
-        brush = self._get_brush_attrs()
+        style = self._get_style_attrs()
         
         # no round corners
         if not radius:
-            command = self._indent + '<rect x="%s" y="%s" width="%s" height="%s" %s %s />' % (x, y, width, height, pen, brush)
+            command = self._indent + '<rect x="%s" y="%s" width="%s" height="%s" %s />' % (x, y, width, height, style)
         
         # same radius for all corners
         else:
-            command = self._indent + '<rect x="%s" y="%s" width="%s" height="%s" rx="%s" ry="%s" %s %s />' % (x, y, width, height, radius, radius, pen, brush)
+            command = self._indent + '<rect x="%s" y="%s" width="%s" height="%s" rx="%s" ry="%s" %s />' % (x, y, width, height, radius, radius, style)
         
         # add command
-        self._commands.append(command)
+        self._write(command)
+    
+    
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get radius
+        if isinstance(radius, (int, float)) and radius != 0:
+            radius = (radius, radius, radius, radius)
+        
+        # draw as paths if different corners
+        if radius and not all(r == radius[0] for r in radius):
+            super().draw_rects(xs, ys, widths, heights, radius, line_colors, fill_colors)
+            return
+        
+        # get single radius
+        radius = round(self._scale * radius[0], self._digits) if radius else 0
+        
+        # get items
+        xs, ys, widths, heights = self._get_bulk_arrays(xs, ys, widths, heights)
+        
+        # apply scaling and offset
+        xs = self._scale * (xs + self._offset[0])
+        ys = self._scale * (ys + self._offset[1])
+        widths = self._scale * widths
+        heights = self._scale * heights
+        
+        # apply rounding
+        xs = xs.round(self._digits).tolist()
+        ys = ys.round(self._digits).tolist()
+        widths = widths.round(self._digits).tolist()
+        heights = heights.round(self._digits).tolist()
+        
+        # get pens and brushes
+        styles = self._get_bulk_style_attrs(line_colors, fill_colors, len(xs))
+        
+        # no round corners
+        if not radius:
+            template = self._indent + '<rect x="%s" y="%s" width="%s" height="%s" %s />'
+        
+        # same radius for all corners
+        else:
+            template = self._indent + '<rect x="%%s" y="%%s" width="%%s" height="%%s" rx="%s" ry="%s" %%s />' % (radius, radius)
+        
+        # make commands
+        commands = (template % item for item in zip(xs, ys, widths, heights, styles))
+        
+        # add commands
+        self._write_all(commands)
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+        """
+        
+        # get items
+        x1s, y1s, x2s, y2s = self._get_bulk_arrays(x1s, y1s, x2s, y2s)
+        
+        # apply scaling and offset
+        x1s = self._scale * (x1s + self._offset[0])
+        y1s = self._scale * (y1s + self._offset[1])
+        x2s = self._scale * (x2s + self._offset[0])
+        y2s = self._scale * (y2s + self._offset[1])
+        
+        # apply rounding
+        x1s = x1s.round(self._digits).tolist()
+        y1s = y1s.round(self._digits).tolist()
+        x2s = x2s.round(self._digits).tolist()
+        y2s = y2s.round(self._digits).tolist()
+        
+        # get pens
+        styles = self._get_bulk_style_attrs(line_colors, None, len(x1s), brush=False)
+        
+        # make commands
+        template = self._indent + '<line x1="%s" y1="%s" x2="%s" y2="%s" %s />'
+        commands = (template % item for item in zip(x1s, y1s, x2s, y2s, styles))
+        
+        # add commands
+        self._write_all(commands)
     
     
     def draw_text(self, text, x, y, angle=0):
@@ -436,8 +761,8 @@ class SVGCanvas(Canvas):
         angle = numpy.rad2deg(angle)
         
         # apply rounding
-        trans_x = round(trans_x, _DIGITS)
-        trans_y = round(trans_y, _DIGITS)
+        trans_x = round(trans_x, self._digits)
+        trans_y = round(trans_y, self._digits)
         
         # split lines
         lines = [text]
@@ -481,15 +806,19 @@ class SVGCanvas(Canvas):
             line = html.escape(line)
             
             # apply rounding
-            text_x = round(text_x, _DIGITS)
-            text_y = round(text_y, _DIGITS)
+            text_x = round(text_x, self._digits)
+            text_y = round(text_y, self._digits)
             
             # make command
             transform = 'transform="rotate(%s, %s, %s)"' % (angle, trans_x, trans_y) if angle else ""
-            command = self._indent + '<text x="%s" y="%s" %s %s>%s</text>' % (text_x, text_y, font, transform, line)
+            command = self._indent + '<text x="%s" y="%s" %s %s>' % (text_x, text_y, font, transform)
+            
+            # shorten numbers
+            if self._compact:
+                command = _compact_numbers(command)
             
             # add command
-            self._commands.append(command)
+            self._write(command + line + '</text>', verbatim=True)
     
     
     def clip(self, path):
@@ -512,20 +841,25 @@ class SVGCanvas(Canvas):
         path = path.transformed(matrix)
         
         # get svg
-        svg = path.svg("", _DIGITS)
+        if self._compact:
+            svg = _compact_path(path, self._digits)
+        else:
+            svg = path.svg("", self._digits)
         
         # make clip path
         name = "clip_%03d" % len(self._clips)
         self._clips[name] = '<clipPath id="%s"><path d="%s" /></clipPath>' % (name, svg)
+        if self._stream is not None:
+            self._defs.append(self._clips[name])
         
         # make command
         command = self._indent + '<g clip-path="url(#%s)">' % name
         
         # add command
-        self._commands.append(command)
+        self._write(command)
         
         # increase indentation
-        self._indent += _INDENT
+        self._indent += self._tab
         
         # return state
         return ClipState(self)
@@ -535,10 +869,10 @@ class SVGCanvas(Canvas):
         """Removes last clipping path while keeping previous if any."""
         
         # decrease indentation
-        self._indent = self._indent[:-len(_INDENT)]
+        self._indent = self._indent[:len(self._indent)-len(self._tab)]
         
         # add command
-        self._commands.append(self._indent + '</g>')
+        self._write(self._indent + '</g>')
     
     
     def group(self, id_tag=None, class_tag=None):
@@ -563,10 +897,10 @@ class SVGCanvas(Canvas):
         command = self._indent + '<g%s%s>' % (id_tag, class_tag)
         
         # add command
-        self._commands.append(command)
+        self._write(command, verbatim=True)
         
         # increase indentation
-        self._indent += _INDENT
+        self._indent += self._tab
         
         # return state
         return GroupState(self)
@@ -576,29 +910,277 @@ class SVGCanvas(Canvas):
         """Closes the last drawing group."""
         
         # decrease indentation
-        self._indent = self._indent[:-len(_INDENT)]
+        self._indent = self._indent[:len(self._indent)-len(self._tab)]
         
         # add command
-        self._commands.append(self._indent + '</g>')
+        self._write(self._indent + '</g>')
     
     
-    def _get_pen_attrs(self):
-        """Gets current pen attributes."""
+    def _get_header(self):
+        """Gets main SVG tag."""
         
-        attrs = ('%s="%s"' % attr for attr in self._pen_attrs.items() if attr[1] is not None)
-        return " ".join(attrs)
+        # use xlink for symbols only
+        xlink = ""
+        if self._compact and (self._symbols or self._stream is not None):
+            xlink = ' xmlns:xlink="http://www.w3.org/1999/xlink"'
+        
+        return '<svg xmlns="http://www.w3.org/2000/svg"%s width="%s" height="%s">\n' % (xlink, self.width, self.height)
+    
+    
+    def _write(self, command, verbatim=False):
+        """Adds single command into buffer or stream."""
+        
+        # shorten numbers
+        if self._compact and not verbatim:
+            command = _compact_numbers(command)
+        
+        # add to buffer
+        if self._stream is None:
+            self._commands.append(command)
+            return
+        
+        # write to stream
+        self._write_all((command,), True)
+    
+    
+    def _write_all(self, commands, verbatim=False):
+        """Adds multiple commands into buffer or stream."""
+        
+        # shorten numbers
+        if self._compact and not verbatim:
+            commands = (_compact_numbers(c) for c in commands)
+        
+        # add to buffer
+        if self._stream is None:
+            self._commands.extend(commands)
+            return
+        
+        # write header
+        if not self._started:
+            self._stream.write(_XML + self._get_header())
+            self._started = True
+        
+        # write pending defs
+        if self._defs or self._rules:
+            
+            if self._rules:
+                self._defs.insert(0, "<style>%s</style>" % "".join(self._rules))
+                del self._rules[:]
+            
+            indent = self._indent + self._tab
+            defs = "".join("%s%s\n" % (indent, d) for d in self._defs)
+            self._stream.write("%s<defs>\n%s%s</defs>\n" % (self._indent, defs, self._indent))
+            del self._defs[:]
+        
+        # write commands
+        self._stream.write("".join(c + "\n" for c in commands))
+    
+    
+    def _write_symbol(self, path, matrix, style):
+        """Writes compact path transformed by given matrix."""
+        
+        # get fill rule
+        fill = SVG_FILL_RULE[path.fill_rule]
+        
+        # write complex path directly
+        commands = path.commands()
+        if not commands or len(commands) > _SYMBOL_COMMANDS:
+            svg = _compact_path(path.transformed(matrix), self._digits)
+            self._write(self._indent + '<path %s fill-rule="%s" d="%s" />' % (style, fill, svg))
+            return
+        
+        # get origin
+        x, y = matrix.transform(commands[0][1], commands[0][2])
+        origin = "%s %s" % (round(float(x), self._digits), round(float(y), self._digits))
+        origin = _compact_numbers(origin)
+        
+        # get path relative to origin
+        local = matrix.clone().translate(-x, -y)
+        svg = _compact_path(path.transformed(local), self._digits)
+        key = (fill, svg)
+        
+        # write first occurrence as path
+        if key not in self._shapes:
+            
+            if len(self._shapes) < _SYMBOL_CACHE:
+                self._shapes[key] = None
+            
+            svg = "M" + origin + _MOVE_RE.sub("", svg, 1)
+            self._write(self._indent + '<path %s fill-rule="%s" d="%s" />' % (style, fill, svg))
+            return
+        
+        # make symbol
+        name = self._shapes[key]
+        if name is None:
+            
+            name = "sym_%d" % len(self._symbols)
+            self._shapes[key] = name
+            self._symbols[name] = '<symbol id="%s" overflow="visible"><path fill-rule="%s" d="%s" /></symbol>' % (name, fill, svg)
+            
+            if self._stream is not None:
+                self._defs.append(self._symbols[name])
+        
+        # write usage
+        x, y = origin.split(" ")
+        self._write(self._indent + '<use xlink:href="#%s" x="%s" y="%s" %s />' % (name, x, y, style))
+    
+    
+    def _get_style_attrs(self, pen=True, brush=True):
+        """Gets current pen and brush attributes."""
+        
+        pen = tuple(self._pen_attrs.items()) if pen else None
+        brush = tuple(self._brush_attrs.items()) if brush else None
+        
+        return self._make_style(pen, brush)
+    
+    
+    def _get_bulk_style_attrs(self, line_colors, fill_colors, count, brush=True):
+        """Gets pen and brush attributes for individual items."""
+        
+        # get items
+        pens = self._get_bulk_pen_items(line_colors, count)
+        brushes = self._get_bulk_brush_items(fill_colors, count) if brush else [None] * count
+        
+        # count usages
+        keys = [(id(pen), id(brush)) for pen, brush in zip(pens, brushes)]
+        counts = {}
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+        
+        # make attributes
+        cache = {}
+        styles = []
+        
+        for key, pen, brush in zip(keys, pens, brushes):
+            
+            if key not in cache:
+                cache[key] = self._make_style(pen, brush, counts[key] > 1)
+            
+            styles.append(cache[key])
+        
+        return styles
+    
+    
+    def _get_bulk_pen_items(self, colors, count):
+        """Gets pen attributes items for individual items."""
+        
+        # use current pen
+        if colors is None:
+            return [tuple(self._pen_attrs.items())] * count
+        
+        # get final colors
+        colors = self._get_bulk_colors(colors, count, "line_")
+        
+        # make attributes
+        cache = {}
+        attrs = self._pen_attrs.copy()
+        
+        for color in colors:
+            if color.rgba not in cache:
+                attrs['stroke'] = color.hex[:-2]
+                attrs['stroke-opacity'] = color.alpha/255. if color.alpha != 255 else None
+                cache[color.rgba] = tuple(attrs.items())
+        
+        return [cache[c.rgba] for c in colors]
     
     
-    def _get_brush_attrs(self):
-        """Gets current brush attributes."""
+    def _get_bulk_brush_items(self, colors, count):
+        """Gets brush attributes items for individual items."""
+        
+        # use current brush
+        if colors is None or self.fill_style == FILL_STYLE_TRANS:
+            return [tuple(self._brush_attrs.items())] * count
+        
+        # get final colors
+        colors = self._get_bulk_colors(colors, count, "fill_")
+        
+        # make attributes
+        cache = {}
+        attrs = self._brush_attrs.copy()
+        
+        for color in colors:
+            if color.rgba not in cache:
+                attrs['fill'] = color.hex[:-2]
+                attrs['fill-opacity'] = color.alpha/255. if color.alpha != 255 else None
+                cache[color.rgba] = tuple(attrs.items())
+        
+        return [cache[c.rgba] for c in colors]
+    
+    
+    def _make_style(self, pen, brush, repeated=False):
+        """Makes attributes or class for given pen and brush items."""
+        
+        # make attributes
+        if not self._compact:
+            items = (x for x in (pen, brush) if x is not None)
+            return " ".join(" ".join('%s="%s"' % a for a in x if a[1] is not None) for x in items)
+        
+        # make classes
+        return self._make_classes((("p", pen), ("f", brush)), repeated)
+    
+    
+    def _make_classes(self, groups, repeated=False):
+        """Makes class attribute for repeated attributes items or inline attributes."""
+        
+        names = []
+        attrs = []
+        
+        for prefix, items in groups:
+            
+            # get key
+            key = tuple((a[0], round(a[1], 3) if isinstance(a[1], float) else a[1]) for a in items or () if a[1] is not None)
+            if not key:
+                continue
+            
+            # use class
+            name = self._get_class(prefix, key, repeated)
+            if name is not None:
+                names.append(name)
+            
+            # use attributes
+            else:
+                attrs.extend('%s="%s"' % a for a in key)
+        
+        if names:
+            attrs.insert(0, 'class="%s"' % " ".join(names))
         
-        attrs = ('%s="%s"' % attr for attr in self._brush_attrs.items() if attr[1] is not None)
         return " ".join(attrs)
     
     
+    def _get_class(self, prefix, key, repeated=False):
+        """Gets CSS class name for given attributes key or None if used first time."""
+        
+        style = (prefix, key)
+        
+        # mark first usage
+        if style not in self._styles and not repeated:
+            self._styles[style] = None
+            return None
+        
+        # get existing
+        name = self._styles.get(style, None)
+        if name is not None:
+            return name
+        
+        # make class
+        name = "%s%d" % (prefix, self._classes)
+        self._styles[style] = name
+        self._classes += 1
+        
+        # make rule
+        rule = ";".join("%s:%s" % a for a in key)
+        self._rules.append(_compact_numbers(".%s{%s}" % (name, rule)))
+        
+        return name
+    
+    
     def _get_text_attrs(self):
         """Gets current text attributes."""
         
+        # make class
+        if self._compact:
+            return self._make_classes((("t", self._font_attrs.items()),))
+        
         attrs = ('%s="%s"' % attr for attr in self._font_attrs.items() if attr[1] is not None)
         return " ".join(attrs)
     
@@ -622,6 +1204,8 @@ class SVGCanvas(Canvas):
                 flood += ' flood-opacity="%s"' % (color.alpha/255.)
             
             self._filters[name] = '<filter id="%s" x="0" y="0" width="1" height="1"><feFlood %s /><feComposite in="SourceGraphic" /></filter>' % (name, flood)
+            if self._stream is not None:
+                self._defs.append(self._filters[name])
         
         return name
     
@@ -773,3 +1357,37 @@ class SVGCanvas(Canvas):
             font = self.get_font()
             self._font_attrs['font-family'] = font.name
             self._font_descent = font.get_descent(int(0.5+self._font_attrs['font-size']))
+
+
+def _format_points(points, digits):
+    """Formats points coordinates in bulk."""
+    
+    # apply rounding
+    points = numpy.asarray(points, dtype=float).round(digits)
+    
+    # format
+    template = " ".join(("%s,%s",) * len(points))
+    
+    return template % tuple(points.ravel().tolist())
+
+
+def _compact_numbers(text):
+    """Removes redundant characters from formatted numbers."""
+    
+    text = _ZERO_FRACTION_RE.sub("", text)
+    text = _NEGATIVE_ZERO_RE.sub("0", text)
+    
+    return _LEADING_ZERO_RE.sub(".", text)
+
+
+def _compact_path(path, digits):
+    """Gets compact relative SVG data for given path."""
+    
+    # get relative data
+    svg = " ".join(path.svg("", digits, relative=True).split())
+    
+    # shorten numbers
+    svg = _compact_numbers(svg)
+    
+    # remove separators before commands and negative numbers
+    return _SEPARATOR_RE.sub("", svg)
@@ -1,20 +1,24 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
+from .. export import open_file
 from . enums import *
 from . canvas import SVGCanvas
 
 
 def export(graphics, path, width=None, height=None, **options):
     """
-    Draws given graphics as SVG vector image into specified file.
+    Draws given graphics as SVG vector image into specified file or file
+    object. The XML is streamed into the file as drawing proceeds. If the
+    drawing fails, no truncated file is left at given path.
     
     Args:
         graphics: pero.Graphics
             Graphics to be drawn.
         
-        path: str
-            Full path of a file to save the image into.
+        path: str or file
+            Full path of a file to save the image into or writable binary
+            file object.
         
         width: float or None
             Image width in device units.
@@ -30,6 +34,12 @@ def export(graphics, path, width=None, height=None, **options):
         
         font_scale: float
             Font scaling factor.
+        
+        compact: bool
+            If set to True, compact SVG is created (see pero.svg.SVGCanvas).
+        
+        precision: int
+            Number of decimal digits used for coordinates.
     """
     
     # check size
@@ -38,21 +48,22 @@ def export(graphics, path, width=None, height=None, **options):
     if not height:
         height = EXPORT_HEIGHT
     
-    # init canvas
-    canvas = SVGCanvas(width=width, height=height)
-    
-    if 'draw_scale' in options:
-        canvas.draw_scale = options['draw_scale']
-    
-    if 'line_scale' in options:
-        canvas.line_scale = options['line_scale']
-    
-    if 'font_scale' in options:
-        canvas.font_scale = options['font_scale']
-    
-    # draw graphics
-    graphics.draw(canvas)
-    
     # save to file
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(canvas.get_xml())
+    with open_file(path, binary=False) as f:
+        
+        # init canvas
+        args = {k: options[k] for k in ('compact', 'precision') if k in options}
+        canvas = SVGCanvas(f, width=width, height=height, **args)
+        
+        if 'draw_scale' in options:
+            canvas.draw_scale = options['draw_scale']
+        
+        if 'line_scale' in options:
+            canvas.line_scale = options['line_scale']
+        
+        if 'font_scale' in options:
+            canvas.font_scale = options['font_scale']
+        
+        # draw graphics
+        graphics.draw(canvas)
+        canvas.finish()
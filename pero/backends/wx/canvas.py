@@ -145,6 +145,48 @@ class WXCanvas(Canvas):
         self._dc.DrawCircle(x, y, radius)
     
     
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, radii = self._get_bulk_arrays(xs, ys, radii)
+        
+        # apply scaling and offset
+        xs = self._scale * (xs + self._offset[0])
+        ys = self._scale * (ys + self._offset[1])
+        radii = self._scale * radii
+        
+        # make ellipses
+        ellipses = numpy.column_stack((xs - radii, ys - radii, 2*radii, 2*radii))
+        ellipses = numpy.round(ellipses).astype(int).tolist()
+        
+        # get pens and brushes
+        pens = self._get_bulk_pens(line_colors, len(ellipses))
+        brushes = self._get_bulk_brushes(fill_colors, len(ellipses))
+        
+        # draw
+        self._dc.DrawEllipseList(ellipses, pens, brushes)
+    
+    
     def draw_ellipse(self, x, y, width, height):
         """
         Draws an ellipse centered around given coordinates and fitting into the
@@ -223,10 +265,73 @@ class WXCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # draw
         self._dc.DrawLines(points)
     
     
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # get items
+        xs, ys, sizes = self._get_bulk_arrays(xs, ys, sizes)
+        
+        # apply scaling and offset
+        xs = (self._scale * (xs + self._offset[0])).tolist()
+        ys = (self._scale * (ys + self._offset[1])).tolist()
+        sizes = (self._scale * sizes).tolist()
+        
+        # get pens and brushes
+        pens = self._get_bulk_pens(line_colors, len(xs))
+        brushes = self._get_bulk_brushes(fill_colors, len(xs))
+        
+        # init drawing
+        gc = self._get_gc(self._dc)
+        fill = WX_FILL_RULE[path.fill_rule]
+        
+        # draw
+        for i, (x, y, size) in enumerate(zip(xs, ys, sizes)):
+            
+            if pens is not None:
+                gc.SetPen(pens[i])
+            
+            if brushes is not None:
+                gc.SetBrush(brushes[i])
+            
+            wx_path = self._make_native_path(path.transformed(Matrix().scale(size, size).translate(x, y)), gc)
+            gc.DrawPath(wx_path, fillStyle=fill)
+        
+        # set back pen and brush
+        if pens is not None:
+            gc.SetPen(self._pen)
+        
+        if brushes is not None:
+            gc.SetBrush(self._brush)
+    
+    
     def draw_path(self, path):
         """
         Draws the path using current pen and brush.
@@ -266,6 +371,9 @@ class WXCanvas(Canvas):
         # apply scaling and offset
         points = (numpy.array(points) + self._offset) * numpy.array((self._scale, self._scale))
         
+        # decimate points
+        points = self._decimate(points)
+        
         # draw
         self._dc.DrawPolygon(points)
     
@@ -320,6 +428,102 @@ class WXCanvas(Canvas):
             self._dc.DrawRoundedRectangle(x, y, width, height, radius)
     
     
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items.
+        """
+        
+        # draw one by one if having round corners
+        if radius:
+            super().draw_rects(xs, ys, widths, heights, radius, line_colors, fill_colors)
+            return
+        
+        # get items
+        xs, ys, widths, heights = self._get_bulk_arrays(xs, ys, widths, heights)
+        
+        # apply scaling and offset
+        xs = self._scale * (xs + self._offset[0])
+        ys = self._scale * (ys + self._offset[1])
+        widths = self._scale * widths + 1
+        heights = self._scale * heights + 1
+        
+        # make rects
+        rects = numpy.column_stack((xs, ys, widths, heights))
+        rects = numpy.round(rects).astype(int).tolist()
+        
+        # get pens and brushes
+        pens = self._get_bulk_pens(line_colors, len(rects))
+        brushes = self._get_bulk_brushes(fill_colors, len(rects))
+        
+        # draw
+        self._dc.DrawRectangleList(rects, pens, brushes)
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items.
+        """
+        
+        # get items
+        x1s, y1s, x2s, y2s = self._get_bulk_arrays(x1s, y1s, x2s, y2s)
+        
+        # apply scaling and offset
+        x1s = self._scale * (x1s + self._offset[0])
+        y1s = self._scale * (y1s + self._offset[1])
+        x2s = self._scale * (x2s + self._offset[0])
+        y2s = self._scale * (y2s + self._offset[1])
+        
+        # make lines
+        lines = numpy.column_stack((x1s, y1s, x2s, y2s))
+        lines = numpy.round(lines).astype(int).tolist()
+        
+        # get pens
+        pens = self._get_bulk_pens(line_colors, len(lines))
+        
+        # draw
+        self._dc.DrawLineList(lines, pens)
+    
+    
     def draw_text(self, text, x, y, angle=0):
         """
         Draws a text string anchored at specified point using current text
@@ -492,6 +696,48 @@ class WXCanvas(Canvas):
         return wx_path
     
     
+    def _get_bulk_pens(self, colors, count):
+        """Gets native pens for individual items."""
+        
+        # use current pen
+        if colors is None or self._pen.Width == 0:
+            return None
+        
+        # get final colors
+        colors = self._get_bulk_colors(colors, count, "line_")
+        
+        # make pens
+        cache = {}
+        for color in colors:
+            if color.rgba not in cache:
+                pen = wx.Pen(self._pen)
+                pen.Colour = color.rgba
+                cache[color.rgba] = pen
+        
+        return [cache[c.rgba] for c in colors]
+    
+    
+    def _get_bulk_brushes(self, colors, count):
+        """Gets native brushes for individual items."""
+        
+        # use current brush
+        if colors is None:
+            return None
+        
+        # get final colors
+        colors = self._get_bulk_colors(colors, count, "fill_")
+        
+        # make brushes
+        cache = {}
+        for color in colors:
+            if color.rgba not in cache:
+                brush = wx.Brush(self._brush)
+                brush.Colour = color.rgba
+                cache[color.rgba] = brush
+        
+        return [cache[c.rgba] for c in colors]
+    
+    
     def _update_pen(self, evt=None):
         """Updates pen with current properties."""
         
@@ -2,6 +2,7 @@
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
 import math
+import hashlib
 from . library import Library
 
 # init library
@@ -21,6 +22,10 @@ class ColorMeta(type):
                 Corresponding color.
         """
         
+        # skip special attributes
+        if key.startswith('__'):
+            raise AttributeError(key)
+        
         return COLORS[key]
 
 
@@ -108,6 +113,7 @@ class Color(object, metaclass=ColorMeta):
         self._blue = int(0.5 + blue)
         self._alpha = int(0.5 + alpha)
         self._name = name
+        self._fingerprint = None
         
         # register color by name
         if name is not None:
@@ -356,6 +362,23 @@ class Color(object, metaclass=ColorMeta):
         return 1.055 * math.pow(lum, 1.0/2.4) - 0.055
     
     
+    def fingerprint(self):
+        """
+        Gets content hash of current color, which is stable across runs. The
+        name of the color is not considered.
+        
+        Returns:
+            str
+                Hexadecimal digest.
+        """
+        
+        if self._fingerprint is None:
+            data = ("Color%s" % (self.rgba,)).encode()
+            self._fingerprint = hashlib.blake2b(data, digest_size=16).hexdigest()
+        
+        return self._fingerprint
+    
+    
     def lighter(self, factor=0.2, name=None):
         """
         Creates derived color by making current color lighter. The factor
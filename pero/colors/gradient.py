@@ -1,6 +1,7 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
+import hashlib
 from . library import Library
 from . color import Color
 from . palette import Palette, PALETTES
@@ -22,6 +23,10 @@ class GradientMeta(type):
                 Corresponding gradient.
         """
         
+        # skip special attributes
+        if key.startswith('__'):
+            raise AttributeError(key)
+        
         return GRADIENTS[key]
 
 
@@ -55,6 +60,7 @@ class Gradient(object, metaclass=GradientMeta):
         
         # set name
         self._name = name
+        self._fingerprint = None
         
         # check colors
         if len(colors) == 0:
@@ -146,6 +152,24 @@ class Gradient(object, metaclass=GradientMeta):
         return self._stops
     
     
+    def fingerprint(self):
+        """
+        Gets content hash of current gradient, which is stable across runs. The
+        name of the gradient is not considered.
+        
+        Returns:
+            str
+                Hexadecimal digest.
+        """
+        
+        if self._fingerprint is None:
+            colors = ",".join(c.fingerprint() for c in self._colors)
+            data = ("Gradient%s%s" % (colors, self._stops)).encode()
+            self._fingerprint = hashlib.blake2b(data, digest_size=16).hexdigest()
+        
+        return self._fingerprint
+    
+    
     def color_at(self, position, name=None):
         """
         Creates interpolated color for given position. The new color is
@@ -22,6 +22,10 @@ class PaletteMeta(type):
                 Corresponding palette.
         """
         
+        # skip special attributes
+        if key.startswith('__'):
+            raise AttributeError(key)
+        
         return PALETTES[key]
 
 
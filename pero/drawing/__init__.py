@@ -6,9 +6,12 @@ from . import np
 
 # import main objects
 from . fonts import Font, FontManager, FONTS
+from . fonts import TextCache, TEXT_CACHE
 from . graphics import Graphics
+from . frozen import FrozenGraphics
 from . canvas import Canvas, ClipState, GroupState, ViewState
 from . layout import Layout, Row, Column, Cell
+from . decimation import decimate
 
 # import shapes
 from .shapes import make_arc, make_circle, make_ellipse, make_rect, make_polygon
@@ -6,8 +6,10 @@ import numpy
 from .. enums import *
 from .. events import *
 from .. properties import *
-from .. geometry import Frame, Path
-from . fonts import FONTS
+from .. colors import Color
+from .. geometry import Frame, Path, Matrix
+from . fonts import FONTS, TEXT_CACHE
+from . decimation import decimate
 
 
 class Canvas(PropertySet):
@@ -142,6 +144,12 @@ class Canvas(PropertySet):
             Specifies additional space to be inserted between text lines as
             multiplier of line height.
         
+        decimation: int, float or None
+            Specifies the tolerance in device units used to reduce the number
+            of points of lines and polygons before drawing or None to draw all
+            the points. Value of 0.5 is visually lossless for typical outputs
+            (see pero.drawing.decimate for details).
+        
         viewport: pero.Frame (read-only)
             Specifies current drawing region coordinates in logical units. It
             defines actual drawing origin and logical width and height of the
@@ -154,6 +162,7 @@ class Canvas(PropertySet):
     draw_scale = FloatProperty(1, dynamic=False)
     line_scale = FloatProperty(1, dynamic=False)
     font_scale = FloatProperty(1, dynamic=False)
+    decimation = NumProperty(None, dynamic=False, nullable=True)
     
     pen = Include(LineProperties, dynamic=False,
         line_color = "#000",
@@ -253,9 +262,10 @@ class Canvas(PropertySet):
         """
         
         # extract and set line properties
-        for prop in self._pen_properties:
-            value = prop_set.get_property(prefix+prop, source, overrides)
-            self.set_property(prop, value, True)
+        with self.batch_changes():
+            for prop in self._pen_properties:
+                value = prop_set.get_property(prefix+prop, source, overrides)
+                self.set_property(prop, value, True)
     
     
     def set_brush_by(self, prop_set, prefix="", source=UNDEF, overrides=None):
@@ -277,9 +287,10 @@ class Canvas(PropertySet):
         """
         
         # extract and set fill properties
-        for prop in self._brush_properties:
-            value = prop_set.get_property(prefix+prop, source, overrides)
-            self.set_property(prop, value, True)
+        with self.batch_changes():
+            for prop in self._brush_properties:
+                value = prop_set.get_property(prefix+prop, source, overrides)
+                self.set_property(prop, value, True)
     
     
     def set_text_by(self, prop_set, prefix="", source=UNDEF, overrides=None):
@@ -301,9 +312,10 @@ class Canvas(PropertySet):
         """
         
         # extract and set text properties
-        for prop in self._text_properties:
-            value = prop_set.get_property(prefix+prop, source, overrides)
-            self.set_property(prop, value, True)
+        with self.batch_changes():
+            for prop in self._text_properties:
+                value = prop_set.get_property(prefix+prop, source, overrides)
+                self.set_property(prop, value, True)
     
     
     def get_font(self):
@@ -378,6 +390,12 @@ class Canvas(PropertySet):
         if self.font_size:
             size = int(0.5 + self.font_size * self.font_scale)
         
+        # get cached size
+        key = (font.path, font.index, size, text)
+        cached = TEXT_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
         # get text size
         width, height = font.get_size(text, size)
         
@@ -385,6 +403,9 @@ class Canvas(PropertySet):
         full = font.get_size("j", size)
         height = max(height, full[1])
         
+        # store size
+        TEXT_CACHE.put(key, (width, height))
+        
         return width, height
     
     
@@ -678,6 +699,42 @@ class Canvas(PropertySet):
         self.draw_path(path)
     
     
+    def draw_circles(self, xs, ys, radii, line_colors=None, fill_colors=None):
+        """
+        Draws multiple circles of specified radii centered around given
+        coordinates. All the coordinates and sizes can be provided as single
+        values or numpy arrays, which are broadcast against each other.
+        
+        This method should be overridden by specific backend to provide native
+        implementation other than the default, calling the 'draw_circle' method
+        for each item.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            radii: float or numpy.ndarray
+                Radii of the circles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items. If not set, current line
+                color will be used.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items. If not set, current fill
+                color will be used.
+        """
+        
+        # get items
+        items = self._get_bulk_items(xs, ys, radii)
+        
+        # draw items
+        self._draw_bulk(self.draw_circle, items, line_colors, fill_colors)
+    
+    
     def draw_ellipse(self, x, y, width, height):
         """
         Draws an ellipse centered around given coordinates and fitting into the
@@ -801,6 +858,9 @@ class Canvas(PropertySet):
                 Sequence of x,y coordinates of the points.
         """
         
+        # decimate points
+        points = self._decimate_logical(points)
+        
         # init path
         path = Path()
         path.move_to(points[0][0], points[0][1])
@@ -813,6 +873,50 @@ class Canvas(PropertySet):
         self.draw_path(path)
     
     
+    def draw_markers(self, path, xs, ys, sizes, line_colors=None, fill_colors=None):
+        """
+        Draws given symbol path at multiple positions and sizes. The path must
+        be a 'symbol-path' i.e. centered at 0,0 and scaled to fit into 1x1
+        square (see pero.Symbol marker). All the coordinates and sizes can be
+        provided as single values or numpy arrays, which are broadcast against
+        each other.
+        
+        This method should be overridden by specific backend to provide native
+        implementation other than the default, calling the 'draw_path' method
+        for each item.
+        
+        Args:
+            path: pero.Path
+                Symbol path to be drawn.
+            
+            xs: float or numpy.ndarray
+                X-coordinates of the centers.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the centers.
+            
+            sizes: float or numpy.ndarray
+                Sizes of the markers.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items. If not set, current line
+                color will be used.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items. If not set, current fill
+                color will be used.
+        """
+        
+        # get items
+        items = self._get_bulk_items(xs, ys, sizes)
+        
+        # make paths
+        paths = ((path.transformed(Matrix().scale(s, s).translate(x, y)),) for x, y, s in items)
+        
+        # draw items
+        self._draw_bulk(self.draw_path, paths, line_colors, fill_colors)
+    
+    
     def draw_path(self, path):
         """
         Draws given path using current pen and brush.
@@ -844,6 +948,9 @@ class Canvas(PropertySet):
         if len(points) < 2:
             return
         
+        # decimate points
+        points = self._decimate_logical(points)
+        
         # init path
         path = Path()
         path.move_to(points[0][0], points[0][1])
@@ -930,6 +1037,86 @@ class Canvas(PropertySet):
         self.draw_path(path)
     
     
+    def draw_rects(self, xs, ys, widths, heights, radius=None, line_colors=None, fill_colors=None):
+        """
+        Draws multiple rectangles specified by given top left corners and sizes
+        and optional round corners specified as a single value or individual
+        value for each corners starting from top-left. All the coordinates and
+        sizes can be provided as single values or numpy arrays, which are
+        broadcast against each other.
+        
+        This method should be overridden by specific backend to provide native
+        implementation other than the default, calling the 'draw_rect' method
+        for each item.
+        
+        Args:
+            xs: float or numpy.ndarray
+                X-coordinates of the top left corners.
+            
+            ys: float or numpy.ndarray
+                Y-coordinates of the top left corners.
+            
+            widths: float or numpy.ndarray
+                Full widths of the rectangles.
+            
+            heights: float or numpy.ndarray
+                Full heights of the rectangles.
+            
+            radius: int, float, (int,int,int,int) or (float,float,float,float)
+                Radius of curved corners applied to all the rectangles.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items. If not set, current line
+                color will be used.
+            
+            fill_colors: (pero.Color,), numpy.ndarray or None
+                Fill colors for individual items. If not set, current fill
+                color will be used.
+        """
+        
+        # get items
+        items = self._get_bulk_items(xs, ys, widths, heights)
+        items = ((x, y, w, h, radius) for x, y, w, h in items)
+        
+        # draw items
+        self._draw_bulk(self.draw_rect, items, line_colors, fill_colors)
+    
+    
+    def draw_segments(self, x1s, y1s, x2s, y2s, line_colors=None):
+        """
+        Draws multiple separate lines between given points. All the coordinates
+        can be provided as single values or numpy arrays, which are broadcast
+        against each other.
+        
+        This method should be overridden by specific backend to provide native
+        implementation other than the default, calling the 'draw_line' method
+        for each item.
+        
+        Args:
+            x1s: float or numpy.ndarray
+                X-coordinates of the lines start.
+            
+            y1s: float or numpy.ndarray
+                Y-coordinates of the lines start.
+            
+            x2s: float or numpy.ndarray
+                X-coordinates of the lines end.
+            
+            y2s: float or numpy.ndarray
+                Y-coordinates of the lines end.
+            
+            line_colors: (pero.Color,), numpy.ndarray or None
+                Line colors for individual items. If not set, current line
+                color will be used.
+        """
+        
+        # get items
+        items = self._get_bulk_items(x1s, y1s, x2s, y2s)
+        
+        # draw items
+        self._draw_bulk(self.draw_line, items, line_colors, None)
+    
+    
     def draw_text(self, text, x, y, angle=0):
         """
         Draws a text string anchored at specified point using current text
@@ -1305,31 +1492,181 @@ class Canvas(PropertySet):
         return x, y
     
     
+    def _decimate(self, points):
+        """Reduces given device points if decimation is enabled."""
+        
+        # check decimation
+        tolerance = self.decimation
+        if not tolerance:
+            return points
+        
+        # decimate
+        return decimate(points, tolerance)
+    
+    
+    def _decimate_logical(self, points):
+        """Reduces given logical points if decimation is enabled."""
+        
+        # check decimation
+        if not self.decimation or len(points) < 3:
+            return points
+        
+        # apply scaling and offset
+        scale = numpy.array((self._scale, self._scale))
+        points = (numpy.array(points) + self._offset) * scale
+        
+        # decimate
+        points = self._decimate(points)
+        
+        # revert scaling and offset
+        return points / scale - self._offset
+    
+    
+    def _get_bulk_arrays(self, *values):
+        """Broadcasts given values into flat float arrays of the same size."""
+        
+        # make arrays
+        arrays = [numpy.asarray(v, dtype=float).ravel() for v in values]
+        
+        # broadcast
+        return [numpy.array(a) for a in numpy.broadcast_arrays(*arrays)]
+    
+    
+    def _get_bulk_items(self, *values):
+        """Broadcasts given values and gets them as list of tuples."""
+        
+        # get arrays
+        arrays = self._get_bulk_arrays(*values)
+        
+        # get items
+        return list(zip(*(a.tolist() for a in arrays)))
+    
+    
+    def _get_bulk_colors(self, colors, count, prefix=None):
+        """
+        Converts given per-item colors into list of pero.Color or None. If the
+        prefix is specified the colors are converted into final colors with
+        current alpha applied (see pero.ColorProperties.get_color).
+        """
+        
+        # check colors
+        if colors is None:
+            return None
+        
+        # convert array
+        if isinstance(colors, numpy.ndarray):
+            colors = colors.tolist()
+        
+        # check size
+        if len(colors) != count:
+            message = "Number of colors (%d) must match number of items (%d)!" % (len(colors), count)
+            raise ValueError(message)
+        
+        # get alpha
+        alpha = self.get_property(prefix+'alpha') if prefix else None
+        if alpha is UNDEF:
+            alpha = None
+        
+        # convert colors
+        cache = {}
+        buff = []
+        
+        for value in colors:
+            
+            # get key
+            key = tuple(value) if isinstance(value, list) else value
+            if isinstance(key, Color):
+                key = key.rgba
+            
+            # convert color
+            color = cache.get(key, UNDEF)
+            if color is UNDEF:
+                
+                color = value
+                if value is not None and not isinstance(value, Color):
+                    color = Color.create(value)
+                
+                # make transparent from None
+                if prefix and color is None:
+                    color = Color.Transparent
+                
+                # apply alpha
+                elif alpha is not None and color.alpha != alpha:
+                    color = color.opaque(alpha/255.)
+                
+                cache[key] = color
+            
+            buff.append(color)
+        
+        return buff
+    
+    
+    def _draw_bulk(self, method, items, line_colors, fill_colors):
+        """Draws given items one by one using given method and item colors."""
+        
+        # make list
+        items = list(items)
+        
+        # get colors
+        line_colors = self._get_bulk_colors(line_colors, len(items))
+        fill_colors = self._get_bulk_colors(fill_colors, len(items))
+        
+        # draw using current colors
+        if line_colors is None and fill_colors is None:
+            for item in items:
+                method(*item)
+            return
+        
+        # store current colors
+        line_color = self.line_color
+        fill_color = self.fill_color
+        
+        # draw items
+        try:
+            for i, item in enumerate(items):
+                
+                if line_colors is not None:
+                    self.line_color = line_colors[i]
+                
+                if fill_colors is not None:
+                    self.fill_color = fill_colors[i]
+                
+                method(*item)
+        
+        # restore colors
+        finally:
+            self.line_color = line_color
+            self.fill_color = fill_color
+    
+    
     def _on_canvas_property_changed(self, evt):
         """Called after any property has changed."""
         
+        # get changed names
+        names = evt.names
+        
         # update global scaling
-        if evt.name == 'draw_scale':
+        if 'draw_scale' in names:
             self._scale = self.draw_scale
         
         # update full viewport
-        if evt.name in ('draw_scale', 'width', 'height'):
+        if any(n in ('draw_scale', 'width', 'height') for n in names):
             self._viewport_full = Frame(0, 0, self.width/self.draw_scale, self.height/self.draw_scale)
         
         # update current font
-        if evt.name in ('font_name', 'font_family', 'font_style', 'font_weight'):
+        if any(n in ('font_name', 'font_family', 'font_style', 'font_weight') for n in names):
             self._cfont = None
         
         # update current pen
-        if evt.name in self._pen_properties or evt.name == 'line_scale':
+        if any(n in self._pen_properties or n == 'line_scale' for n in names):
             self.fire(PenChangedEvt.from_evt(evt))
         
         # update current brush
-        if evt.name in self._brush_properties:
+        if any(n in self._brush_properties for n in names):
             self.fire(BrushChangedEvt.from_evt(evt))
         
         # update current text
-        if evt.name in self._text_properties or evt.name == 'font_scale':
+        if any(n in self._text_properties or n == 'font_scale' for n in names):
             self.fire(TextChangedEvt.from_evt(evt))
 
 
@@ -0,0 +1,162 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import numpy
+
+# define constants
+_MIN_POINTS = 16
+_MIN_REDUCTION = 0.5
+
+
+def decimate(points, tolerance=0.5):
+    """
+    Reduces the number of points of a polyline or polygon so that its drawing
+    stays visually the same at the resolution where the tolerance corresponds
+    to a fraction of a pixel. The points are expected to be in device units
+    already (i.e. after the scaling and offset of the canvas).
+    
+    For lines with monotonic x-coordinates (or y-coordinates), typically
+    coming from a signal or profile, the points are split into columns of
+    tolerance width and only the first, last, minimum and maximum point of each
+    column is kept. Lines changing the direction are split into monotonic runs
+    first. If such approach does not lead to sufficient reduction, general
+    simplification is used instead, merging consecutive points falling into the
+    same cell and applying the Douglas-Peucker algorithm, so that the result
+    deviates from original points by about the tolerance at most.
+    
+    Args:
+        points: numpy.ndarray
+            Points as 2D array of x,y coordinates in device units.
+        
+        tolerance: float
+            Max allowed deviation in device units.
+    
+    Returns:
+        numpy.ndarray
+            Decimated points.
+    """
+    
+    # check points
+    count = len(points)
+    if count < _MIN_POINTS or tolerance <= 0:
+        return points
+    
+    # skip undefined values
+    points = numpy.asarray(points, dtype=float)
+    if not numpy.all(numpy.isfinite(points)):
+        return points
+    
+    # decimate by columns or rows
+    keep = _decimate_columns(points, tolerance, 0)
+    if len(keep) > count * _MIN_REDUCTION:
+        rows = _decimate_columns(points, tolerance, 1)
+        keep = rows if len(rows) < len(keep) else keep
+    
+    # use general simplification
+    if len(keep) > count * _MIN_REDUCTION:
+        return _decimate_general(points, tolerance)
+    
+    return points[keep]
+
+
+def _decimate_columns(points, width, axis):
+    """Gets indices of first, last, min and max point in every column."""
+    
+    count = len(points)
+    
+    # get columns and values
+    cols = numpy.floor(points[:, axis] / width)
+    values = points[:, 1 - axis]
+    
+    # get direction of segments
+    signs = numpy.sign(numpy.diff(points[:, axis]))
+    idxs = numpy.where(signs != 0, numpy.arange(len(signs)), 0)
+    signs = signs[numpy.maximum.accumulate(idxs)]
+    
+    # split by columns and direction changes
+    breaks = numpy.zeros(count, dtype=bool)
+    breaks[0] = True
+    breaks[1:] = cols[1:] != cols[:-1]
+    breaks[2:] |= signs[1:] != signs[:-1]
+    
+    # get groups
+    starts = numpy.flatnonzero(breaks)
+    ends = numpy.append(starts[1:], count) - 1
+    groups = numpy.cumsum(breaks) - 1
+    
+    # get min and max
+    mins = _get_group_extremes(values, starts, groups, numpy.minimum)
+    maxs = _get_group_extremes(values, starts, groups, numpy.maximum)
+    
+    # get indices in original order
+    mask = numpy.zeros(count, dtype=bool)
+    mask[starts] = True
+    mask[ends] = True
+    mask[mins] = True
+    mask[maxs] = True
+    
+    return numpy.flatnonzero(mask)
+
+
+def _get_group_extremes(values, starts, groups, func):
+    """Gets index of first extreme value within each group."""
+    
+    # get extremes
+    extremes = func.reduceat(values, starts)
+    
+    # get matching indices
+    idxs = numpy.flatnonzero(values == extremes[groups])
+    
+    # keep first for each group
+    first = numpy.ones(len(idxs), dtype=bool)
+    first[1:] = groups[idxs[1:]] != groups[idxs[:-1]]
+    
+    return idxs[first]
+
+
+def _decimate_general(points, tolerance):
+    """Simplifies points by merging cells and Douglas-Peucker algorithm."""
+    
+    # merge consecutive points within the same cell
+    cells = numpy.floor(points / (0.5 * tolerance))
+    
+    keep = numpy.ones(len(points), dtype=bool)
+    keep[1:-1] = numpy.any(cells[1:-1] != cells[:-2], axis=1)
+    points = points[keep]
+    
+    # init mask
+    count = len(points)
+    mask = numpy.zeros(count, dtype=bool)
+    mask[0] = mask[-1] = True
+    
+    # simplify segments
+    tolerance = 0.5 * tolerance
+    stack = [(0, count - 1)]
+    
+    while stack:
+        
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        
+        # get distances from segment
+        p1 = points[start]
+        diff = points[end] - p1
+        length = numpy.hypot(diff[0], diff[1])
+        inner = points[start+1:end] - p1
+        
+        if length == 0:
+            dists = numpy.hypot(inner[:, 0], inner[:, 1])
+        else:
+            t = numpy.clip((inner[:, 0] * diff[0] + inner[:, 1] * diff[1]) / length**2, 0, 1)
+            dists = numpy.hypot(inner[:, 0] - t * diff[0], inner[:, 1] - t * diff[1])
+        
+        # check max distance
+        idx = numpy.argmax(dists)
+        if dists[idx] > tolerance:
+            idx += start + 1
+            mask[idx] = True
+            stack.append((start, idx))
+            stack.append((idx, end))
+    
+    return points[mask]
@@ -2,9 +2,22 @@
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
 import sys
+import os
 import os.path
+import json
+import collections
+import numpy
 from PIL import ImageFont
 from .. enums import *
+from .. properties import UNDEF
+
+# define constants
+TEXT_CACHE_SIZE = 4096
+METRICS_RANGE = 0x2500
+KERNING_RANGE = 0x80
+FONTS_INDEX_VERSION = 1
+FONTS_INDEX_NAME = "fonts.json"
+FONTS_EXTENSIONS = ('.ttf', '.otf', '.ttc')
 
 
 class FontManager(object):
@@ -13,11 +26,32 @@ class FontManager(object):
     available. This is mainly used to speed up text size calculations and font
     handling for canvas like SVG, where no specific text size calculation is
     available. For now, only the TrueType or OpenType fonts are supported.
+    
+    The system fonts are loaded lazily when any font is requested for the first
+    time. To avoid opening every single font file at each start, basic info
+    about all the system fonts is stored in an index file within the user
+    cache directory. The index is validated by modification times of the
+    scanned directories and by sizes and modification times of the font files,
+    so that any change is detected and only new or modified files are opened
+    again. The index can be rebuilt completely using the 'rebuild' method.
     """
     
-    def __init__(self):
-        """Initializes a new instance of FontManager."""
+    def __init__(self, cache=UNDEF):
+        """
+        Initializes a new instance of FontManager.
+        
+        Args:
+            cache: str, None or UNDEF
+                Path to the fonts index file. If set to None, no index is used.
+                If set to UNDEF, default index file within the user cache
+                directory is used.
+        """
         
+        if cache is UNDEF:
+            cache = _get_cache_path()
+        
+        self._cache = cache
+        self._loaded = False
         self._fonts = {}
     
     
@@ -48,6 +82,7 @@ class FontManager(object):
                 Tuple of font families names.
         """
         
+        self._check_loaded()
         return tuple(sorted(self._fonts.keys()))
     
     
@@ -61,6 +96,8 @@ class FontManager(object):
                 Tuple of fonts
         """
         
+        self._check_loaded()
+        
         fonts = (self._fonts[name] for name in sorted(self._fonts.keys()))
         return tuple(v for f in fonts for v in f)
     
@@ -78,6 +115,7 @@ class FontManager(object):
                 Family fonts.
         """
         
+        self._check_loaded()
         return tuple(self._fonts.get(family, []))
     
     
@@ -106,6 +144,9 @@ class FontManager(object):
                 Requested font or None if not found.
         """
         
+        # load system fonts
+        self._check_loaded()
+        
         # get fonts
         fonts = self._fonts.get(family, None)
         if fonts is None:
@@ -142,6 +183,38 @@ class FontManager(object):
         return fonts[0] if loose else None
     
     
+    def export_fonts(self):
+        """
+        Gets basic definitions of all available fonts. These can be used to
+        initialize another font manager (e.g. within a worker process) by the
+        'set_fonts' method without scanning the system again.
+        
+        Returns:
+            ((str, int, str, str, str),)
+                Font definitions as (path, index, name, family, type).
+        """
+        
+        return tuple((f.path, f.index, f.name, f.family, f.type) for f in self.fonts)
+    
+    
+    def set_fonts(self, fonts):
+        """
+        Removes all currently loaded fonts and uses given font definitions
+        instead. System fonts are not loaded afterwards.
+        
+        Args:
+            fonts: ((str, int, str, str, str),)
+                Font definitions as (path, index, name, family, type), e.g.
+                as retrieved by the 'export_fonts' method.
+        """
+        
+        self._fonts = {}
+        self._loaded = True
+        
+        for path, index, name, family, font_type in fonts:
+            self._add_font(Font(path, index, name, family, font_type))
+    
+    
     def load_fonts(self, path):
         """
         Loads all supported fonts from specified folder.
@@ -169,75 +242,116 @@ class FontManager(object):
                 provided.
         """
         
-        # get filename and extension
-        dir_name, file_name = os.path.split(path)
-        base_name, extension = os.path.splitext(file_name)
+        # load system fonts first
+        self._check_loaded()
         
-        # check font type
-        if extension.lower() not in ('.ttf', '.otf', '.ttc'):
-            return
+        # add to library
+        for font in _read_fonts(path, name):
+            self._add_font(font)
+    
+    
+    def load(self):
+        """
+        Loads all supported fonts from known system locations. The fonts index
+        is used if available and valid, otherwise it is updated.
+        """
         
-        # init index
-        index = 0
+        self._loaded = True
         
-        # load all variants from file
-        while True:
-            
-            # get font
-            font = Font.from_ttf(path, name, index)
-            if font is None:
-                return
-            
-            # add to library
-            if font.family not in self._fonts:
-                self._fonts[font.family] = [font]
-            else:
-                self._fonts[font.family].append(font)
-            
-            # increase index
-            index += 1
+        # get paths
+        paths = _get_system_paths()
+        
+        # read index
+        index = self._read_index()
+        
+        # check index
+        if not _check_index(index, paths):
+            index = _make_index(paths, index)
+            self._write_index(index)
+        
+        # add fonts
+        self._add_index(index)
     
     
-    def load(self):
-        """Loads all supported fonts from known system locations."""
+    def rebuild(self):
+        """
+        Removes all currently loaded fonts, scans all known system locations
+        to load available fonts and updates the fonts index.
+        """
         
-        # init paths
-        paths = []
+        self._fonts = {}
+        self._loaded = True
         
-        # load MSWin fonts
-        if sys.platform == 'win32':
-            paths = [
-                r"c:\Windows\Fonts"]
+        # make index
+        paths = _get_system_paths()
+        index = _make_index(paths)
+        self._write_index(index)
         
-        # load MacOS fonts
-        elif sys.platform == 'darwin':
-            
-            paths = [
-                r"/Library/Fonts/",
-                r"/Network/Library/Fonts/",
-                r"/System/Library/Fonts/"]
+        # add fonts
+        self._add_index(index)
+    
+    
+    def _check_loaded(self):
+        """Loads system fonts if not loaded yet."""
+        
+        if not self._loaded:
+            self.load()
+    
+    
+    def _add_font(self, font):
+        """Adds given font into library."""
+        
+        if font.family not in self._fonts:
+            self._fonts[font.family] = [font]
+        else:
+            self._fonts[font.family].append(font)
+    
+    
+    def _add_index(self, index):
+        """Adds all fonts from given index into library."""
+        
+        for path, (size, mtime, items) in index['files'].items():
+            for idx, font_family, font_type in items:
+                self._add_font(Font(path, idx, font_family, font_family, font_type))
+    
+    
+    def _read_index(self):
+        """Reads fonts index file."""
+        
+        if not self._cache:
+            return None
+        
+        try:
+            with open(self._cache, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(index, dict) or index.get('version') != FONTS_INDEX_VERSION:
+            return None
+        
+        return index
+    
+    
+    def _write_index(self, index):
+        """Writes fonts index file."""
+        
+        if not self._cache:
+            return
+        
+        temp = "%s.%d.tmp" % (self._cache, os.getpid())
+        
+        try:
+            os.makedirs(os.path.dirname(self._cache) or ".", exist_ok=True)
             
-            home = os.environ.get('HOME')
-            if home is not None:
-                path = os.path.join(home, 'Library', 'Fonts')
-                paths.append(path)
-        
-        # load linux fonts
-        elif sys.platform == 'linux':
-            paths = [
-                r"/usr/share/fonts",
-                r"/usr/local/share/fonts",
-                r"~/.local/share/fonts",
-                r"/usr/share/fonts"]
-        
-        # load iOS fonts
-        elif sys.platform == 'ios':
-            paths = [
-                r"/System/Library/Fonts/"]
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
             
-        for path in paths:
-            if os.path.exists(path):
-                self.load_fonts(path)
+            os.replace(temp, self._cache)
+        
+        except OSError:
+            pass
 
 
 class Font(object):
@@ -248,6 +362,7 @@ class Font(object):
         """Initializes a new instance of Font."""
         
         self._cache = {}
+        self._metrics = {}
         
         self._path = path
         self._index = index
@@ -399,25 +514,72 @@ class Font(object):
         return self._cache[size]
     
     
-    def get_size(self, text, size):
+    def get_size(self, text, size, exact=False):
         """
         Gets text size for given text.
         
+        By default, the size is calculated using the advance-width table of
+        the font (see the 'measure_many' method), while the exact measurement
+        by PIL is used for texts, which cannot be measured this way.
+        
         Args:
             text: str
                 Text for which the size should be calculated.
             
             size: int
                 Font size to be used.
+            
+            exact: bool
+                If set to True, the size is always measured by PIL.
         
         Returns:
             (float, float)
                 Text size as width and height.
         """
         
-        font = self.get_font(size)
+        # get exact size
+        if exact:
+            font = self.get_font(size)
+            return font.getbbox(text)[2:]
+        
+        # get size from table
+        width, height = self.measure_many((text,), size)[0]
         
-        return font.getbbox(text)[2:]
+        return int(width), int(height)
+    
+    
+    def measure_many(self, texts, size):
+        """
+        Gets sizes of multiple texts at once.
+        
+        Sizes are calculated using the table of advance widths, ink extents and
+        kerning pairs, which is built lazily for each font size. This makes the
+        measuring of a text a simple numpy gather-and-sum, while the results
+        correspond to the PIL measurement. Texts containing characters outside
+        the table (e.g. control characters or rare scripts) are measured by PIL
+        directly. The same applies for all texts if PIL is using the complex
+        layout engine (Raqm), where the text shaping cannot be predicted.
+        
+        Args:
+            texts: (str,)
+                Texts for which the size should be calculated.
+            
+            size: int
+                Font size to be used.
+        
+        Returns:
+            numpy.ndarray
+                Sizes as 2D array of widths and heights.
+        """
+        
+        # get metrics
+        metrics = self._metrics.get(size, None)
+        if metrics is None:
+            metrics = _FontMetrics(self.get_font(size))
+            self._metrics[size] = metrics
+        
+        # measure
+        return metrics.measure(texts)
     
     
     def get_metrics(self, size):
@@ -482,6 +644,492 @@ class Font(object):
             return None
 
 
+class _FontMetrics(object):
+    """Holds lazily built advance-width and kerning tables of a font for single size."""
+    
+    
+    def __init__(self, font):
+        """Initializes a new instance of _FontMetrics."""
+        
+        self._font = font
+        self._exact = font.layout_engine != ImageFont.Layout.BASIC
+        
+        self._known = numpy.zeros(METRICS_RANGE, dtype=bool)
+        self._advances = numpy.zeros(METRICS_RANGE)
+        self._rights = numpy.zeros(METRICS_RANGE)
+        self._bottoms = numpy.zeros(METRICS_RANGE)
+        self._kerning = None
+        self._kerned = None
+        
+        # mark control chars as unsupported
+        self._known[:32] = True
+        self._advances[:32] = numpy.nan
+    
+    
+    def measure(self, texts):
+        """Calculates sizes of given texts."""
+        
+        # init sizes
+        count = len(texts)
+        sizes = numpy.zeros((count, 2))
+        if not count:
+            return sizes
+        
+        # use exact measurement
+        if self._exact:
+            for i, text in enumerate(texts):
+                sizes[i] = self._font.getbbox(text)[2:] if text else (0, 0)
+            return sizes
+        
+        # get codes
+        codes = numpy.frombuffer("".join(texts).encode('utf-32-le'), dtype=numpy.uint32)
+        lengths = numpy.fromiter((len(t) for t in texts), dtype=numpy.intp, count=count)
+        
+        # skip empty texts
+        filled = lengths > 0
+        if not codes.size:
+            return sizes
+        
+        # get text indices
+        starts = numpy.cumsum(lengths) - lengths
+        starts = starts[filled]
+        owners = numpy.repeat(numpy.arange(count), lengths)
+        
+        # mark outside chars
+        outside = codes >= METRICS_RANGE
+        codes = numpy.where(outside, 0, codes)
+        
+        # update table
+        self._update(codes)
+        
+        # get char metrics
+        advances = self._advances[codes]
+        rights = self._rights[codes]
+        bottoms = self._bottoms[codes]
+        
+        # mark unsupported chars
+        invalid = numpy.isnan(advances) | outside
+        advances[invalid] = 0
+        
+        # apply kerning
+        kerning = self._get_kerning(codes, owners)
+        if kerning is not None:
+            advances[:-1] += kerning
+        
+        # get pen offsets within each text
+        steps = numpy.cumsum(advances) - advances
+        offsets = steps - steps[starts][numpy.cumsum(filled)[owners] - 1]
+        
+        # get sizes
+        sizes[filled, 0] = numpy.floor(numpy.maximum.reduceat(offsets + rights, starts) + 0.5)
+        sizes[filled, 1] = numpy.maximum.reduceat(bottoms, starts)
+        
+        # use exact measurement for unsupported texts
+        if invalid.any():
+            for i in numpy.unique(owners[invalid]):
+                sizes[i] = self._font.getbbox(texts[i])[2:]
+        
+        return sizes
+    
+    
+    def _update(self, codes):
+        """Measures chars missing in the table."""
+        
+        # get missing chars
+        missing = numpy.unique(codes[~self._known[codes]])
+        
+        # measure chars
+        for code in missing.tolist():
+            
+            char = chr(code)
+            bbox = self._font.getbbox(char)
+            
+            self._advances[code] = self._font.getlength(char)
+            self._rights[code] = bbox[2] if bbox[2] > bbox[0] else -numpy.inf
+            self._bottoms[code] = bbox[3]
+            self._known[code] = True
+    
+    
+    def _get_kerning(self, codes, owners):
+        """Gets kerning between consecutive chars."""
+        
+        # check pairs
+        if len(codes) < 2:
+            return None
+        
+        # get pairs of basic chars within the same text
+        firsts = codes[:-1]
+        seconds = codes[1:]
+        
+        valid = (firsts >= 32) & (firsts < KERNING_RANGE) & (seconds >= 32) & (seconds < KERNING_RANGE)
+        valid &= owners[:-1] == owners[1:]
+        
+        if not valid.any():
+            return None
+        
+        firsts = firsts[valid]
+        seconds = seconds[valid]
+        
+        # update table
+        self._update_kerning(firsts, seconds)
+        
+        # get kerning of known pairs
+        kerning = numpy.zeros(len(codes) - 1)
+        kerning[valid] = self._kerning[firsts, seconds]
+        
+        return kerning
+    
+    
+    def _update_kerning(self, firsts, seconds):
+        """Measures kerning of pairs missing in the table."""
+        
+        # init table
+        if self._kerning is None:
+            self._kerning = numpy.zeros((KERNING_RANGE, KERNING_RANGE))
+            self._kerned = numpy.zeros((KERNING_RANGE, KERNING_RANGE), dtype=bool)
+        
+        # get missing pairs
+        missing = ~self._kerned[firsts, seconds]
+        if not missing.any():
+            return
+        
+        pairs = numpy.unique(firsts[missing] * KERNING_RANGE + seconds[missing])
+        
+        # measure pairs
+        for pair in pairs.tolist():
+            
+            first, second = divmod(pair, KERNING_RANGE)
+            length = self._font.getlength(chr(first) + chr(second))
+            
+            self._kerning[first, second] = length - self._advances[first] - self._advances[second]
+            self._kerned[first, second] = True
+
+
+class TextCache(object):
+    """
+    Bounded LRU cache of text measurements. A single instance (pero.TEXT_CACHE)
+    is shared across all canvases to avoid repeated measuring of the same texts
+    (e.g. axis labels or legend items) across redraws. The items are typically
+    keyed by the font path, font index, pixel size and the text itself.
+    
+    The cache keeps track of hits and misses to allow checking its efficiency.
+    Its maximum size can be changed anytime, using the 'size' property, while
+    size of 0 disables the caching completely.
+    """
+    
+    
+    def __init__(self, size=TEXT_CACHE_SIZE):
+        """
+        Initializes a new instance of TextCache.
+        
+        Args:
+            size: int
+                Maximum number of items to keep.
+        """
+        
+        self._size = int(size)
+        self._items = collections.OrderedDict()
+        
+        self._hits = 0
+        self._misses = 0
+    
+    
+    def __len__(self):
+        """Gets current number of items."""
+        
+        return len(self._items)
+    
+    
+    @property
+    def size(self):
+        """
+        Gets maximum number of items.
+        
+        Returns:
+            int
+                Maximum number of items.
+        """
+        
+        return self._size
+    
+    
+    @size.setter
+    def size(self, value):
+        """
+        Sets maximum number of items. Least recently used items are removed if
+        necessary.
+        
+        Args:
+            value: int
+                Maximum number of items.
+        """
+        
+        self._size = max(0, int(value))
+        
+        while len(self._items) > self._size:
+            self._items.popitem(last=False)
+    
+    
+    @property
+    def hits(self):
+        """
+        Gets number of successful lookups.
+        
+        Returns:
+            int
+                Number of hits.
+        """
+        
+        return self._hits
+    
+    
+    @property
+    def misses(self):
+        """
+        Gets number of unsuccessful lookups.
+        
+        Returns:
+            int
+                Number of misses.
+        """
+        
+        return self._misses
+    
+    
+    def get(self, key):
+        """
+        Gets cached value for given key and marks it as recently used.
+        
+        Args:
+            key: any hashable
+                Item key.
+        
+        Returns:
+            any or None
+                Cached value or None if not available.
+        """
+        
+        value = self._items.get(key, None)
+        
+        if value is None:
+            self._misses += 1
+            return None
+        
+        self._hits += 1
+        self._items.move_to_end(key)
+        
+        return value
+    
+    
+    def put(self, key, value):
+        """
+        Stores given value. Least recently used item is removed if the maximum
+        size is reached.
+        
+        Args:
+            key: any hashable
+                Item key.
+            
+            value: any
+                Value to store.
+        """
+        
+        # check size
+        if not self._size:
+            return
+        
+        # store value
+        self._items[key] = value
+        self._items.move_to_end(key)
+        
+        # remove oldest
+        if len(self._items) > self._size:
+            self._items.popitem(last=False)
+    
+    
+    def clear(self):
+        """Removes all items and resets counters."""
+        
+        self._items.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+def _get_cache_path():
+    """Gets default path of the fonts index file."""
+    
+    # use custom directory
+    path = os.environ.get('PERO_CACHE_DIR')
+    if path:
+        return os.path.join(path, FONTS_INDEX_NAME)
+    
+    # get MSWin directory
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(r"~\AppData\Local")
+        path = os.path.join(base, 'pero', 'Cache')
+    
+    # get MacOS directory
+    elif sys.platform == 'darwin':
+        path = os.path.expanduser(r"~/Library/Caches/pero")
+    
+    # get other directory
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(r"~/.cache")
+        path = os.path.join(base, 'pero')
+    
+    return os.path.join(path, FONTS_INDEX_NAME)
+
+
+def _get_system_paths():
+    """Gets known system fonts locations."""
+    
+    # init paths
+    paths = []
+    
+    # MSWin fonts
+    if sys.platform == 'win32':
+        paths = [
+            r"c:\Windows\Fonts"]
+    
+    # MacOS fonts
+    elif sys.platform == 'darwin':
+        paths = [
+            r"/Library/Fonts/",
+            r"/Network/Library/Fonts/",
+            r"/System/Library/Fonts/",
+            r"~/Library/Fonts"]
+    
+    # linux fonts
+    elif sys.platform == 'linux':
+        paths = [
+            r"/usr/share/fonts",
+            r"/usr/local/share/fonts",
+            r"~/.local/share/fonts"]
+    
+    # iOS fonts
+    elif sys.platform == 'ios':
+        paths = [
+            r"/System/Library/Fonts/"]
+    
+    # expand paths
+    paths = (os.path.expanduser(p) for p in paths)
+    
+    return list(dict.fromkeys(paths))
+
+
+def _get_mtime(path):
+    """Gets modification time of given directory or None if not available."""
+    
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _check_index(index, paths):
+    """Checks whether fonts index is up to date."""
+    
+    # check index
+    if index is None or index.get('paths') != paths:
+        return False
+    
+    # check directories
+    for path, mtime in index['dirs'].items():
+        if _get_mtime(path) != mtime:
+            return False
+    
+    # check files
+    for path, (size, mtime, items) in index['files'].items():
+        
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        
+        if stat.st_size != size or stat.st_mtime_ns != mtime:
+            return False
+    
+    return True
+
+
+def _make_index(paths, previous=None):
+    """Scans given folders and creates fonts index."""
+    
+    # get previous files
+    previous = previous['files'] if previous else {}
+    
+    # init index
+    dirs = {}
+    files = {}
+    
+    # scan folders
+    for path in paths:
+        
+        # check folder
+        dirs[path] = _get_mtime(path)
+        if dirs[path] is None:
+            continue
+        
+        for root, dir_names, file_names in os.walk(path):
+            
+            dirs[root] = _get_mtime(root)
+            
+            for file_name in file_names:
+                
+                # check font type
+                if os.path.splitext(file_name)[1].lower() not in FONTS_EXTENSIONS:
+                    continue
+                
+                # check duplicates
+                file_path = os.path.join(root, file_name)
+                if file_path in files:
+                    continue
+                
+                # get file info
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                
+                # reuse unchanged file
+                item = previous.get(file_path, None)
+                if item and item[0] == stat.st_size and item[1] == stat.st_mtime_ns:
+                    files[file_path] = item
+                    continue
+                
+                # read fonts
+                fonts = _read_fonts(file_path)
+                items = [[f.index, f.family, f.type] for f in fonts]
+                files[file_path] = [stat.st_size, stat.st_mtime_ns, items]
+    
+    return {
+        'version': FONTS_INDEX_VERSION,
+        'paths': paths,
+        'dirs': dirs,
+        'files': files}
+
+
+def _read_fonts(path, name=None):
+    """Reads all supported fonts from given file."""
+    
+    fonts = []
+    
+    # check font type
+    if os.path.splitext(path)[1].lower() not in FONTS_EXTENSIONS:
+        return fonts
+    
+    # load all variants from file
+    while True:
+        
+        font = Font.from_ttf(path, name, len(fonts))
+        if font is None:
+            return fonts
+        
+        fonts.append(font)
+
+
 # initializes available fonts
 FONTS = FontManager()
-FONTS.load()
+
+# initializes shared text cache
+TEXT_CACHE = TextCache()
@@ -0,0 +1,512 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import weakref
+import threading
+import numpy
+from .. properties import *
+from .. geometry import Frame, Path, Matrix
+from . canvas import CanvasState
+from . graphics import Graphics
+
+# define recorded canvas methods
+_RECORDED = {'fill', 'view', 'clip', 'unclip', 'group', 'ungroup'}
+_SETTERS = {'set_pen_by', 'set_brush_by', 'set_text_by', 'set_property', 'set_properties'}
+
+# init slots registry
+_SLOTS_LOCK = threading.Lock()
+_SLOTS_COUNT = {}
+
+
+class FrozenGraphics(object):
+    """
+    Represents a cached recording of a graphics, which can be drawn repeatedly
+    with minimum overhead. Instances of this class are not supposed to be
+    created directly but by calling the 'freeze' method of the graphics.
+    
+    When drawn for the first time, all the static properties of the graphics
+    and its children are resolved and all the calls to the canvas are
+    recorded into a flat instruction list. Any subsequent drawing into a
+    canvas of the same type, properties (e.g. size, scaling, pen and brush)
+    and viewport just replays the instructions without evaluating the
+    graphics again, therefore giving the same output much faster.
+    
+    Child graphics containing dynamic (callable) properties are not recorded.
+    Instead, a late-bound slot is stored in the instructions, which draws the
+    child as usual using the same source and overrides as provided by its
+    parent. The rest of the graphics stays recorded. If dynamic values are
+    used by a parent graphics without drawing the child itself (e.g. some
+    property sets are just read), the parent becomes late-bound on next
+    drawing instead. If a data source or overrides are provided for the
+    drawing, the whole graphics is drawn as usual.
+    
+    The recordings are not a standalone copy of the graphics, they keep the
+    reference to the original graphics. Any property change of the graphics
+    or its children is detected using the revision mechanism (see
+    pero.PropertySet) and the recorded instructions are discarded
+    automatically. Changes which cannot be detected this way (e.g. in-place
+    changes of paths or arrays) require the 'touch' method of the graphics to
+    be called.
+    """
+    
+    
+    def __init__(self, graphics):
+        """
+        Initializes a new instance of FrozenGraphics.
+        
+        Args:
+            graphics: pero.Graphics
+                Graphics to be recorded.
+        """
+        
+        self._graphics = graphics
+        self._token = None
+        self._parents = {}
+        self._late = {}
+        self._programs = {}
+        self._last = None
+    
+    
+    @property
+    def graphics(self):
+        """
+        Gets original graphics.
+        
+        Returns:
+            pero.Graphics
+                Original graphics.
+        """
+        
+        return self._graphics
+    
+    
+    @property
+    def dynamic(self):
+        """
+        Checks whether the graphics itself is late-bound and therefore it is
+        always drawn as usual.
+        
+        Returns:
+            bool
+                True if the graphics is dynamic, False otherwise.
+        """
+        
+        self._check_revision()
+        return id(self._graphics) in self._late
+    
+    
+    def draw(self, canvas, source=UNDEF, **overrides):
+        """
+        Uses given canvas to draw the graphics.
+        
+        Args:
+            canvas: pero.Canvas
+                Canvas to be used for rendering.
+            
+            source: any
+                Data source to be used for calculating callable properties.
+            
+            overrides: str:any pairs
+                Specific properties to be overwritten.
+        """
+        
+        # check changes
+        self._check_revision()
+        
+        # draw late-bound
+        if id(self._graphics) in self._late or overrides or (source is not UNDEF and source is not None):
+            self._graphics.draw(canvas, source, **overrides)
+            self._token = self._graphics.revision
+            self._last = None
+            return
+        
+        # get recorded instructions
+        key = self._get_key(canvas)
+        program = self._programs.get(key, None)
+        
+        # replay instructions
+        if program is not None:
+            
+            instructions, end_key = program
+            for func, args, kwargs in instructions:
+                func(canvas, *args, **kwargs)
+            
+            self._set_last(canvas, end_key)
+            return
+        
+        # record instructions
+        recorder = _Recorder(canvas, [], self._late)
+        self._record(recorder)
+        self._token = self._graphics.revision
+        
+        # check unused late-bound graphics
+        missed = [x for x in self._late if x not in recorder._slotted and not self._is_nested(x)]
+        
+        # make parents late-bound
+        if missed:
+            for item_key in missed:
+                self._add_late(item_key, True)
+            self._last = None
+            return
+        
+        # get final canvas state
+        end_key = None
+        if not recorder._slotted:
+            end_key = _get_key(canvas)
+        
+        # store instructions
+        self._programs[key] = (tuple(recorder._program), end_key)
+        self._set_last(canvas, end_key)
+    
+    
+    def _record(self, recorder):
+        """Draws graphics by given recorder using slots for late-bound graphics."""
+        
+        # install slots
+        slots = [g for g in self._late.values() if isinstance(g, Graphics)]
+        with _SLOTS_LOCK:
+            for graphics in slots:
+                _install_slot(graphics)
+        
+        # draw graphics
+        try:
+            self._graphics.draw(recorder)
+        
+        # remove slots
+        finally:
+            with _SLOTS_LOCK:
+                for graphics in slots:
+                    _remove_slot(graphics)
+    
+    
+    def _get_key(self, canvas):
+        """Gets canvas key reusing the final state of previous drawing."""
+        
+        # check previous drawing
+        if self._last is not None:
+            
+            ref, revision, rect, key = self._last
+            if ref() is canvas and canvas.revision == revision and canvas.viewport.rect == rect:
+                return key
+        
+        return _get_key(canvas)
+    
+    
+    def _set_last(self, canvas, key):
+        """Remembers final canvas state to skip its fingerprint next time."""
+        
+        self._last = None
+        if key is not None:
+            self._last = (weakref.ref(canvas), canvas.revision, canvas.viewport.rect, key)
+    
+    
+    def _check_revision(self):
+        """Discards recorded instructions if the graphics has changed."""
+        
+        if not self._graphics.is_dirty(self._token):
+            return
+        
+        self._last = None
+        self._programs = {}
+        self._parents = {}
+        self._late = {}
+        
+        # get late-bound graphics
+        for key in _walk(self._graphics, self._parents):
+            self._add_late(key)
+        
+        self._token = self._graphics.revision
+    
+    
+    def _add_late(self, key, escalate=False):
+        """Marks specified item or its parent graphics as late-bound."""
+        
+        # get nodes
+        nodes = [key]
+        if escalate:
+            self._late.pop(key, None)
+            nodes = [id(p) for p in self._parents[key][1]]
+        
+        # mark nodes
+        while nodes:
+            
+            key = nodes.pop()
+            item, parents = self._parents[key]
+            
+            # mark graphics
+            if isinstance(item, Graphics):
+                self._late[key] = item
+            
+            # use parents instead
+            else:
+                nodes.extend(id(p) for p in parents)
+        
+        # reset recordings
+        self._programs = {}
+        self._last = None
+    
+    
+    def _is_nested(self, key):
+        """Checks whether given item is part of any late-bound graphics."""
+        
+        visited = set()
+        nodes = [key]
+        
+        while nodes:
+            
+            key = nodes.pop()
+            visited.add(key)
+            
+            for parent in self._parents[key][1]:
+                
+                parent_key = id(parent)
+                if parent_key in self._late:
+                    return True
+                
+                if parent_key not in visited:
+                    nodes.append(parent_key)
+        
+        return False
+
+
+class _Recorder(object):
+    """
+    Wraps a canvas to record all the calls changing its state or drawing
+    anything, while forwarding all the calls to the canvas itself.
+    """
+    
+    
+    def __init__(self, canvas, program, slots):
+        """Initializes a new instance of _Recorder."""
+        
+        object.__setattr__(self, '_canvas', canvas)
+        object.__setattr__(self, '_program', program)
+        object.__setattr__(self, '_slots', slots)
+        object.__setattr__(self, '_slotted', set())
+    
+    
+    def __getattr__(self, name):
+        """Gets canvas attribute wrapped to record the calls if needed."""
+        
+        attr = getattr(self._canvas, name)
+        
+        # draw graphics by recorder
+        if name == 'draw_graphics':
+            return self._draw_graphics
+        
+        # record properties
+        if name in _SETTERS:
+            return self._make_setter(name, attr)
+        
+        # record drawing
+        if name in _RECORDED or name.startswith('draw_'):
+            return self._make_recorder(name, attr)
+        
+        return attr
+    
+    
+    def __setattr__(self, name, value):
+        """Sets canvas attribute and records property change."""
+        
+        setattr(self._canvas, name, value)
+        
+        if name in self._canvas._properties:
+            self._program.append((_set_values, ({name: getattr(self._canvas, name)},), {}))
+    
+    
+    def _draw_graphics(self, graphics, source=UNDEF, **overrides):
+        """Draws given graphics using current recorder."""
+        
+        graphics.draw(self, source=source, **overrides)
+    
+    
+    def _draw_slot(self, graphics, draw, source, overrides):
+        """Draws late-bound graphics directly and stores its slot."""
+        
+        # draw as usual if not late-bound
+        key = id(graphics)
+        if self._slots.get(key, None) is not graphics:
+            draw(graphics, self, source, **overrides)
+            return
+        
+        # store slot
+        self._slotted.add(key)
+        self._program.append((_draw_late, (graphics, source, overrides), {}))
+        
+        # draw graphics
+        draw(graphics, self._canvas, source, **overrides)
+    
+    
+    def _make_setter(self, name, method):
+        """Wraps property setter to record final values of affected properties."""
+        
+        def setter(*args, **kwargs):
+            
+            # set properties
+            method(*args, **kwargs)
+            
+            # get affected properties
+            canvas = self._canvas
+            if name == 'set_pen_by':
+                names = canvas._pen_properties
+            elif name == 'set_brush_by':
+                names = canvas._brush_properties
+            elif name == 'set_text_by':
+                names = canvas._text_properties
+            elif name == 'set_property':
+                names = (kwargs.get('name', args[0] if args else None),)
+            else:
+                names = kwargs.get('properties', args[0] if args else {})
+            
+            # record final values
+            names = [n for n in names if n in canvas._properties]
+            if names:
+                values = {n: getattr(canvas, n) for n in names}
+                self._program.append((_set_values, (values,), {}))
+        
+        return setter
+    
+    
+    def _make_recorder(self, name, method):
+        """Wraps canvas method to record the call."""
+        
+        def recorder(*args, **kwargs):
+            
+            # record call
+            func = getattr(self._canvas.__class__, name)
+            frozen_args = tuple(_freeze_arg(a) for a in args)
+            frozen_kwargs = {k: _freeze_arg(v) for k, v in kwargs.items()}
+            self._program.append((func, frozen_args, frozen_kwargs))
+            
+            # call method
+            result = method(*args, **kwargs)
+            
+            # redirect state to recorder
+            if isinstance(result, CanvasState):
+                result._canvas = self
+            
+            return result
+        
+        return recorder
+
+
+class _Slot(object):
+    """
+    Replaces the 'draw' method of late-bound graphics while recording. The
+    call is passed to the recorder if used as the canvas, so that concurrent
+    drawing of the same graphics into other canvases is not affected.
+    """
+    
+    
+    def __init__(self, graphics):
+        """Initializes a new instance of _Slot."""
+        
+        self._graphics = graphics
+    
+    
+    def __call__(self, canvas, source=UNDEF, **overrides):
+        """Draws the graphics or passes it to the recorder."""
+        
+        graphics = self._graphics
+        draw = graphics.__class__.draw
+        
+        # draw by recorder
+        if isinstance(canvas, _Recorder):
+            canvas._draw_slot(graphics, draw, source, overrides)
+        
+        # draw as usual
+        else:
+            draw(graphics, canvas, source, **overrides)
+
+
+def _install_slot(graphics):
+    """Installs slot into given graphics unless already installed."""
+    
+    key = id(graphics)
+    count = _SLOTS_COUNT.get(key, 0)
+    
+    if not count:
+        graphics.__dict__['draw'] = _Slot(graphics)
+    
+    _SLOTS_COUNT[key] = count + 1
+
+
+def _remove_slot(graphics):
+    """Removes slot from given graphics if not used by other recording."""
+    
+    key = id(graphics)
+    count = _SLOTS_COUNT.pop(key, 1) - 1
+    
+    if count:
+        _SLOTS_COUNT[key] = count
+    else:
+        graphics.__dict__.pop('draw', None)
+
+
+def _freeze_arg(value):
+    """Makes a copy of mutable values to keep recorded call intact."""
+    
+    if isinstance(value, numpy.ndarray):
+        return value.copy()
+    
+    if isinstance(value, (Path, Matrix, Frame)):
+        return value.clone()
+    
+    if isinstance(value, list):
+        return [_freeze_arg(v) for v in value]
+    
+    if type(value) is tuple:
+        return tuple(_freeze_arg(v) for v in value)
+    
+    if isinstance(value, dict):
+        return {k: _freeze_arg(v) for k, v in value.items()}
+    
+    return value
+
+
+def _set_values(canvas, values):
+    """Sets recorded property values in the original order."""
+    
+    with canvas.batch_changes():
+        for name, value in values.items():
+            canvas.set_property(name, value, True)
+
+
+def _draw_late(canvas, graphics, source, overrides):
+    """Draws late-bound graphics."""
+    
+    graphics.draw(canvas, source, **overrides)
+
+
+def _get_key(canvas):
+    """Gets canvas parameters and state affecting the output of the graphics."""
+    
+    return (
+        canvas.__class__,
+        canvas.fingerprint(),
+        canvas.viewport.rect)
+
+
+def _walk(prop_set, parents, parent=None):
+    """Collects parents of all property sets and yields the dynamic ones."""
+    
+    key = id(prop_set)
+    
+    # add parent
+    if key in parents:
+        if parent is not None:
+            parents[key][1].append(parent)
+        return
+    
+    parents[key] = (prop_set, [parent] if parent is not None else [])
+    
+    # check own properties
+    for name in prop_set._properties:
+        value = getattr(prop_set, name)
+        if callable(value) and not isinstance(value, PropertySet):
+            yield key
+            break
+    
+    # check children
+    for child in prop_set._get_children():
+        yield from _walk(child, parents, prop_set)
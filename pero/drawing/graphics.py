@@ -40,6 +40,7 @@ class Graphics(PropertySet):
         # init default tag
         if self.tag is UNDEF:
             self.tag = "tag_%s" % str(id(self))
+            self._generated = {'tag': self.tag}
     
     
     def show(self, title=None, width=None, height=None, backend=None, **options):
@@ -115,6 +116,23 @@ class Graphics(PropertySet):
         backends.export(self, path, width, height, backend, **options)
     
     
+    def freeze(self):
+        """
+        Creates cached recording of current graphics, which can be drawn
+        repeatedly with minimum overhead. All static properties are resolved
+        and canvas calls recorded into flat instruction list on the first
+        drawing, while child graphics using dynamic (callable) properties are
+        kept as late-bound slots. See pero.FrozenGraphics for details.
+        
+        Returns:
+            pero.FrozenGraphics
+                Recorded graphics.
+        """
+        
+        from . frozen import FrozenGraphics
+        return FrozenGraphics(self)
+    
+    
     def draw(self, canvas, source=UNDEF, **overrides):
         """
         Uses given canvas to draw the graphics.
@@ -139,13 +157,18 @@ class Graphics(PropertySet):
         In fact this is just a convenient shortcut to call the 'draw' method in
         a loop.
         
+        If the source is columnar (i.e. numpy record array or dict of numpy
+        arrays), all dynamic properties are evaluated for all the items in
+        advance and provided to the 'draw' method as overrides. Vectorized
+        properties or functions (see pero.vectorized) are called just once.
+        
         Args:
             canvas: pero.Canvas
                 Canvas to be used for rendering.
             
-            source: (any,)
-                Collection of data source items to be used for calculating
-                callable properties.
+            source: (any,), numpy.ndarray or {str: numpy.ndarray}
+                Collection of data source items or columnar data source to be
+                used for calculating callable properties.
             
             overrides: str:any pairs
                 Specific properties to be overwritten.
@@ -155,6 +178,24 @@ class Graphics(PropertySet):
         if source is None or source is UNDEF:
             return
         
+        # draw columns
+        if is_columnar(source):
+            
+            # evaluate dynamic properties
+            columns = self.get_columns(source, overrides)
+            names = tuple(columns.keys())
+            values = tuple(columns[name].tolist() for name in names)
+            
+            # draw items
+            for i in range(columnar_size(source)):
+                
+                item_overrides = dict(overrides)
+                item_overrides.update(zip(names, (v[i] for v in values)))
+                
+                self.draw(canvas, columnar_item(source, i), **item_overrides)
+            
+            return
+        
         # draw items
         for item in source:
             self.draw(canvas, item, **overrides)
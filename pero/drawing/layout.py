@@ -1,6 +1,7 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
+import itertools
 from .. enums import *
 from .. properties import *
 from .. geometry import Path, Frame
@@ -209,11 +210,7 @@ class Layout(Graphics):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
+        tag, x, y, width, height = self.get_properties(('tag', 'x', 'y', 'width', 'height'), source, overrides)
         
         # get size from canvas
         if width is UNDEF:
@@ -246,12 +243,8 @@ class Layout(Graphics):
         """Calculates and sets cells frames."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
-        padding = self.get_property('padding', source, overrides)
-        spacing = self.get_property('spacing', source, overrides)
+        x, y, width, height, padding, spacing = self.get_properties(
+            ('x', 'y', 'width', 'height', 'padding', 'spacing'), source, overrides)
         
         # get size from canvas
         if width is UNDEF:
@@ -276,12 +269,16 @@ class Layout(Graphics):
             r, rs = cell.row, cell.row_span
             c, cs = cell.col, cell.col_span
             
-            cell.frame = Frame(
+            frame = Frame(
                 x = x + sum(widths[0:c]) + spacing * c,
                 y = y + sum(heights[0:r]) + spacing * r,
                 width = sum(widths[c:c+cs]) + spacing * (cs-1),
                 height = sum(heights[r:r+rs]) + spacing * (rs-1))
             
+            # keep unchanged frame to keep revision
+            if not cell.frame or cell.frame.rect != frame.rect:
+                cell.frame = frame
+            
             cell.arrange(canvas)
     
     
@@ -377,6 +374,7 @@ class Layout(Graphics):
         
         # register cell
         self._cells.append(cell)
+        self.touch()
         
         # add cell to grid
         for r in rows:
@@ -405,6 +403,7 @@ class Layout(Graphics):
         
         # add row
         self._rows.append(row)
+        self.touch()
         
         # update grid
         self._grid.append([None for c in range(len(self._cols))])
@@ -432,12 +431,22 @@ class Layout(Graphics):
         
         # add column
         self._cols.append(col)
+        self.touch()
         
         # update grid
         for row in self._grid:
             row.append(None)
     
     
+    def _get_children(self):
+        """Gets all child property sets including rows, columns and cells."""
+        
+        children = super()._get_children()
+        children.extend(itertools.chain(self._rows, self._cols, self._cells))
+        
+        return children
+    
+    
     def _arrange_rows(self, available, spacing):
         """Calculates final size of each row."""
         
@@ -743,11 +752,8 @@ class Cell(Graphics):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        graphics = self.get_property('graphics', source, overrides)
-        frame = self.get_property('frame', source, overrides)
-        content = self.get_property('content', source, overrides)
-        clip = self.get_property('clip', source, overrides)
+        tag, graphics, frame, content, clip = self.get_properties(
+            ('tag', 'graphics', 'frame', 'content', 'clip'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -780,15 +786,10 @@ class Cell(Graphics):
         """Calculates and sets content frame."""
         
         # get properties
-        frame = self.get_property('frame', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
-        padding = self.get_property('padding', source, overrides)
-        h_expand = self.get_property('h_expand', source, overrides)
-        v_expand = self.get_property('v_expand', source, overrides)
-        h_align = self.get_property('h_align', source, overrides)
-        v_align = self.get_property('v_align', source, overrides)
-        clip = self.get_property('clip', source, overrides)
+        frame, width, height, padding, h_expand, v_expand, h_align, v_align, clip = self.get_properties(
+            ('frame', 'width', 'height', 'padding', 'h_expand',
+             'v_expand', 'h_align', 'v_align', 'clip'),
+            source, overrides)
         
         # calculate available area inside padding
         inner_x = frame.x + padding[3]
@@ -826,7 +827,10 @@ class Cell(Graphics):
         else:
             y = inner_y
         
-        self.content = Frame(x, y, max(0, width), max(0, height))
+        # keep unchanged frame to keep revision
+        content = Frame(x, y, max(0, width), max(0, height))
+        if not self.content or self.content.rect != content.rect:
+            self.content = content
     
     
     def to_content(self, x, y):
@@ -11,4 +11,5 @@ from . text import *
 from . backends import *
 from . views import *
 from . events import *
+from . props import *
 from . keys import *
@@ -97,6 +97,14 @@ EXPORT_FORMATS = {
     BACKEND_PY5: EXPORT_PY5,
     BACKEND_PYTHONISTA: EXPORT_PYTHONISTA}
 
+# define backends supporting export into file objects
+EXPORT_STREAMS = {
+    BACKEND_JSON,
+    BACKEND_SVG,
+    BACKEND_QT,
+    BACKEND_CAIRO,
+    BACKEND_MUPDF}
+
 # define export backend priorities
 EXPORT_PRIORITY = [
     BACKEND_JSON,
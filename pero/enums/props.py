@@ -0,0 +1,17 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+from . values import *
+from . enum import Enum
+
+# define property change detection
+PROP_COMPARE_EXACT = EXACT
+PROP_COMPARE_IDENTITY = IDENTITY
+PROP_COMPARE_VERSION = VERSION
+PROP_COMPARE_SAMPLED = SAMPLED
+
+PROP_COMPARE = Enum(
+    EXACT = PROP_COMPARE_EXACT,
+    IDENTITY = PROP_COMPARE_IDENTITY,
+    VERSION = PROP_COMPARE_VERSION,
+    SAMPLED = PROP_COMPARE_SAMPLED)
@@ -93,3 +93,8 @@ NSECONDS = 'ns'
 CEIL = 'ceil'
 FLOOR = 'floor'
 HALFUP = 'halfup'
+
+EXACT = 'exact'
+IDENTITY = 'identity'
+VERSION = 'version'
+SAMPLED = 'sampled'
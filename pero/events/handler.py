@@ -1,6 +1,7 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
+import weakref
 from . proxy import Proxy
 from . event import Event
 
@@ -13,13 +14,22 @@ class EvtHandler(object):
     order, so the last added callback will be called first. Calling of
     registered callbacks continues until all are called or until one of them
     cancels the event by calling the 'cancel' method.
+    
+    The callbacks registry is created only when the first callback is bound,
+    so handlers without any listeners stay lightweight. For each event type a
+    dispatch table of already resolved callbacks is created on the first
+    firing and it is reused until the bindings change. Callbacks of garbage
+    collected objects are removed automatically.
     """
     
+    _callbacks = None
+    _dispatch = None
+    
     
     def __init__(self):
         """Initializes a new instance of EvtHandler."""
         
-        self._callbacks = {}
+        pass
     
     
     def bind(self, evt_type, callback, **kwargs):
@@ -43,15 +53,21 @@ class EvtHandler(object):
         # get event type
         evt_type = self._get_evt_type(evt_type)
         
+        # init registry
+        if self._callbacks is None:
+            self._callbacks = {}
+            self._dispatch = {}
+        
         # register event
         if evt_type not in self._callbacks:
             self._callbacks[evt_type] = []
         
         # init proxy
-        proxy = Proxy(callback)
+        proxy = Proxy(callback, self._make_finalizer(evt_type))
         
         # add callback
         self._callbacks[evt_type].append((proxy, kwargs))
+        self._dispatch.pop(evt_type, None)
     
     
     def unbind(self, evt_type, callback, **kwargs):
@@ -81,6 +97,10 @@ class EvtHandler(object):
         # get event type
         evt_type = self._get_evt_type(evt_type)
         
+        # check registry
+        if self._callbacks is None:
+            return removed
+        
         # get callbacks
         callbacks = self._callbacks.get(evt_type, None)
         if not callbacks:
@@ -101,6 +121,10 @@ class EvtHandler(object):
             callbacks.remove(item)
             removed = True
         
+        # reset dispatch table
+        if removed:
+            self._dispatch.pop(evt_type, None)
+        
         return removed
     
     
@@ -120,25 +144,70 @@ class EvtHandler(object):
                 Additional keyword arguments.
         """
         
-        # get callbacks
-        callbacks = self._callbacks.get(evt.TYPE, None)
-        if not callbacks:
+        # check registry
+        if self._callbacks is None:
             return
         
+        # get dispatch table
+        table = self._dispatch.get(evt.TYPE, None)
+        if table is None:
+            table = self._make_dispatch(evt.TYPE)
+        
         # call callbacks
-        for callback, params in reversed(callbacks[:]):
+        for callback, owned, params in table:
             
-            # get params
-            params = dict(params, **kwargs)
+            # get args
+            args = (self, evt) if owned else (evt,)
             
-            # call callback
-            callback(evt, **params)
+            # call without params
+            if not params and not kwargs:
+                callback(*args)
+            
+            # call with params
+            elif not kwargs:
+                callback(*args, **params)
+            
+            else:
+                callback(*args, **dict(params, **kwargs))
             
             # check if canceled
-            if evt.is_canceled():
+            if evt._canceled:
                 return
     
     
+    def _make_dispatch(self, evt_type):
+        """Creates and caches dispatch table for given event type."""
+        
+        callbacks = self._callbacks.get(evt_type, ())
+        table = tuple(proxy.resolve(self) + (params,) for proxy, params in reversed(callbacks))
+        
+        self._dispatch[evt_type] = table
+        return table
+    
+    
+    def _make_finalizer(self, evt_type):
+        """Creates function to remove callbacks of dead objects."""
+        
+        handler = weakref.ref(self)
+        
+        def finalize(ref):
+            
+            # check handler
+            obj = handler()
+            if obj is None or obj._callbacks is None:
+                return
+            
+            # remove dead callbacks
+            callbacks = obj._callbacks.get(evt_type, None)
+            if callbacks:
+                callbacks[:] = [x for x in callbacks if x[0].obj is not ref and x[0].func is not ref]
+            
+            # reset dispatch table
+            obj._dispatch.pop(evt_type, None)
+        
+        return finalize
+    
+    
     def _get_evt_type(self, evt):
         """Gets event type."""
         
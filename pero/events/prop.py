@@ -20,6 +20,11 @@ class PropertyChangedEvt(Event):
         
         new_value: any
             New value.
+        
+        changes: {str: (any, any)} or None
+            All changes made within a batch as {name: (old_value, new_value)}.
+            This is set only if multiple properties have changed at once, in
+            which case the 'name', 'old_value' and 'new_value' are None.
     """
     
     TYPE = EVT_PROPERTY_CHANGED
@@ -31,10 +36,27 @@ class PropertyChangedEvt(Event):
         self.name = None
         self.old_value = None
         self.new_value = None
+        self.changes = None
         
         super().__init__(**kwargs)
     
     
+    @property
+    def names(self):
+        """
+        Gets names of all changed properties.
+        
+        Returns:
+            (str,)
+                Names of changed properties.
+        """
+        
+        if self.changes:
+            return tuple(self.changes.keys())
+        
+        return (self.name,)
+    
+    
     @classmethod
     def from_evt(cls, evt):
         """
@@ -55,4 +77,5 @@ class PropertyChangedEvt(Event):
             
             name = evt.name,
             old_value = evt.old_value,
-            new_value = evt.new_value)
+            new_value = evt.new_value,
+            changes = evt.changes)
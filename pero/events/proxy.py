@@ -11,24 +11,30 @@ class Proxy(object):
     """
     
     
-    def __init__(self, callback):
+    def __init__(self, callback, finalize=None):
         """
         Initializes a new instance of Proxy.
         
         Args:
             callback: callable
                 Callback function or method to be encapsulated.
+            
+            finalize: callable or None
+                Function to be called with the dead weak reference as soon as
+                the callback object or function is garbage collected.
         """
         
         # instance methods
         if hasattr(callback, '__self__'):
-            self.obj = weakref.ref(callback.__self__)
+            self.obj = weakref.ref(callback.__self__, finalize)
             self.func = weakref.ref(callback.__func__)
+            self._func = callback.__func__
         
         # direct function
         else:
             self.obj = None
-            self.func = weakref.ref(callback)
+            self.func = weakref.ref(callback, finalize)
+            self._func = None
     
     
     def __repr__(self):
@@ -38,9 +44,19 @@ class Proxy(object):
     
     
     def __call__(self, *args, **kwargs):
-        """Calls defined callback."""
+        """Calls defined callback if still alive."""
         
-        self.callback(*args, **kwargs)
+        # direct function
+        if self.obj is None:
+            func = self.func()
+            if func is not None:
+                func(*args, **kwargs)
+            return
+        
+        # instance method
+        obj = self.obj()
+        if obj is not None:
+            self._func(obj, *args, **kwargs)
     
     
     def __eq__(self, other):
@@ -49,13 +65,14 @@ class Proxy(object):
         if not isinstance(other, Proxy):
             other = Proxy(other)
         
-        if self.obj is other.obj:
-            return self.func is other.func
-        
+        # direct functions
         if self.obj is None or other.obj is None:
-            return False
+            func = self.func()
+            return self.obj is other.obj and func is not None and func is other.func()
         
-        return self.obj() is other.obj() and self.func() is other.func()
+        # instance methods
+        obj = self.obj()
+        return obj is not None and obj is other.obj() and self.func() is other.func()
     
     
     def __ne__(self, other):
@@ -76,3 +93,29 @@ class Proxy(object):
         obj = self.obj()
         if obj is not None:
             return getattr(obj, self.func().__name__)
+    
+    
+    def resolve(self, owner):
+        """
+        Gets the fastest callable to be stored in the dispatch table of given
+        owner. If the callback is a method of the owner itself, the plain
+        function is returned, which must be called with the owner provided as
+        the first argument. This avoids the proxy overhead without keeping a
+        strong reference to the owner in its own dispatch table. Otherwise the
+        proxy itself is returned to keep the callback weakly referenced.
+        
+        Args:
+            owner: any
+                Object owning the dispatch table.
+        
+        Returns:
+            (callable, bool)
+                Callable to be used for dispatching and a flag specifying
+                whether the owner must be provided as the first argument.
+        """
+        
+        # method of owner
+        if self.obj is not None and self.obj() is owner:
+            return self._func, True
+        
+        return self, False
@@ -244,6 +244,18 @@ class Frame(object):
         return self._reversed
     
     
+    def fingerprint(self):
+        """
+        Gets content hash of current frame, which is stable across runs.
+        
+        Returns:
+            str
+                Hexadecimal digest.
+        """
+        
+        return make_fingerprint("Frame", self.rect, self._reversed)
+    
+    
     def clone(self):
         """
         Creates exact clone of current frame.
@@ -6,6 +6,7 @@ import re
 import json
 
 from .. enums import *
+from .. properties import make_fingerprint
 from . matrix import Matrix
 from . frame import Frame
 from . bezier import Bezier
@@ -47,6 +48,7 @@ class Path(object):
         self._points = None
         self._start_angle = None
         self._end_angle = None
+        self._fingerprint = None
         
         self._fill_rule = fill_rule
     
@@ -81,6 +83,7 @@ class Path(object):
         """
         
         self._fill_rule = value
+        self._fingerprint = None
     
     
     @property
@@ -551,7 +554,23 @@ class Path(object):
             "commands": self.commands()})
     
     
-    def svg(self, indent="", rounding=None):
+    def fingerprint(self):
+        """
+        Gets content hash of current path, which is stable across runs. The value
+        is cached until the path is changed.
+        
+        Returns:
+            str
+                Hexadecimal digest.
+        """
+        
+        if self._fingerprint is None:
+            self._fingerprint = make_fingerprint("Path", self._fill_rule, self.commands())
+        
+        return self._fingerprint
+    
+    
+    def svg(self, indent="", rounding=None, relative=False):
         """
         Gets current path as SVG commands.
         
@@ -561,31 +580,71 @@ class Path(object):
             
             rounding: int or None
                 Rounding applied to all coordinates.
+            
+            relative: bool
+                If set to True, relative commands are used. The coordinates are
+                rounded before the differences are calculated so that rounding
+                errors do not accumulate.
         
         Returns:
             str
                 SVG commands
         """
         
-        full_svg = []
+        # make template and collect values
+        templates = []
+        values = []
+        refs = []
+        
+        cursor = (-1, -1)
+        start = cursor
+        
         for path in self._paths:
             
             path_svg = []
             for commands in path:
                 key = commands[0]
+                size = len(commands) - 1
                 
-                values = commands[1:]
-                if rounding is not None:
-                    values = (round(x, rounding) for x in values)
+                # get references for relative commands
+                if relative:
+                    pos = len(values)
+                    
+                    if key == PATH_CLOSE:
+                        cursor = start
+                    else:
+                        refs.extend(cursor * (size // 2))
+                        cursor = (pos + size - 2, pos + size - 1)
+                    
+                    if key == PATH_MOVE:
+                        start = cursor
+                    
+                    key = key.lower()
                 
-                command = " ".join(str(x) for x in values) if values else ""
-                path_svg.append(key+command)
+                path_svg.append(key + " ".join(("%s",) * size))
+                values.extend(commands[1:])
+            
+            templates.append(" ".join(path_svg))
+        
+        # apply rounding in bulk
+        if (rounding is not None or relative) and values:
+            values = numpy.asarray(values, dtype=float)
+            
+            if rounding is not None:
+                values = values.round(rounding)
+            
+            # make relative
+            if relative:
+                values = values - numpy.append(values, 0.)[refs]
+                if rounding is not None:
+                    values = values.round(rounding)
             
-            full_svg.append(" ".join(path_svg))
+            values = values.tolist()
         
-        indent = "\n" + indent
+        # format values
+        full_svg = ("\n" + indent).join(templates) % tuple(values)
         
-        return indent + indent.join(full_svg)
+        return "\n" + indent + full_svg
     
     
     def beziers(self):
@@ -645,6 +704,7 @@ class Path(object):
         self._points = None
         self._start_angle = None
         self._end_angle = None
+        self._fingerprint = None
     
     
     def close(self):
@@ -9,20 +9,52 @@ from . shapes import Annulus, Arc, Bar, Bow, Ellipse, Line, Polygon, Ray, Rect,
 from . markers import Marker, Asterisk, Circle, Cross, Diamond, Plus, Triangle, Square, Symbol, MarkerProperty
 from . arrows import Arrow, ArcArrow, BowArrow, ConnectorArrow, CurveArrow, LineArrow, PathArrow, RayArrow, ArrowProperty
 from . heads import Head, CircleHead, LineHead, NormalHead, OpenHead, SymbolHead, VeeHead, HeadProperty
-from . grid import Grid, ParallelGrid, RayGrid, RadialGrid
-from . axes import Axis, StraitAxis, RadialAxis
-from . gauge import Gauge, StraitGauge, RadialGauge
-from . colorbar import ColorBar
-from . pather import Pather
-from . framer import Framer
-from . profile import Profile
-from . band import Band
-from . labels import LabelBox, Label, TextLabel
-from . legend import LegendBox, Legend, MarkerLegend
-from . tooltip import Tooltip, TextTooltip
 
 # register properties
 from .. import properties
 properties.MarkerProperty = MarkerProperty
 properties.ArrowProperty = ArrowProperty
 properties.HeadProperty = HeadProperty
+
+# define lazy glyphs
+_LAZY = {
+    'grid': ('Grid', 'ParallelGrid', 'RayGrid', 'RadialGrid'),
+    'axes': ('Axis', 'StraitAxis', 'RadialAxis'),
+    'gauge': ('Gauge', 'StraitGauge', 'RadialGauge'),
+    'colorbar': ('ColorBar',),
+    'pather': ('Pather',),
+    'framer': ('Framer',),
+    'profile': ('Profile',),
+    'band': ('Band',),
+    'labels': ('LabelBox', 'Label', 'TextLabel'),
+    'legend': ('LegendBox', 'Legend', 'MarkerLegend'),
+    'tooltip': ('Tooltip', 'TextTooltip')}
+
+_LAZY_NAMES = {name: module for module, names in _LAZY.items() for name in names}
+
+
+def __getattr__(name):
+    """Imports lazy glyphs and their modules on first access."""
+    
+    # get module name
+    module = name if name in _LAZY else _LAZY_NAMES.get(name, None)
+    if module is None:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    
+    # import module
+    from importlib import import_module
+    module = import_module("." + module, __name__)
+    if name in _LAZY:
+        return module
+    
+    # store value
+    value = getattr(module, name)
+    globals()[name] = value
+    
+    return value
+
+
+def __dir__():
+    """Gets all available names including lazy ones."""
+    
+    return sorted(set(globals()) | set(_LAZY) | set(_LAZY_NAMES))
@@ -51,8 +51,7 @@ class Arrow(Glyph):
         """Draws arrow heads into given canvas."""
         
         # get properties
-        start_head = self.get_property('start_head', source, overrides)
-        end_head = self.get_property('end_head', source, overrides)
+        start_head, end_head = self.get_properties(('start_head', 'end_head'), source, overrides)
         
         # draw start head
         if start_head:
@@ -185,13 +184,10 @@ class ArcArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
+        tag, x, y = self.get_properties(('tag', 'x', 'y'), source, overrides)
         start_angle = AngleProperties.get_angle(self, 'start_', ANGLE_RAD, source, overrides)
         end_angle = AngleProperties.get_angle(self, 'end_', ANGLE_RAD, source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
+        radius, clockwise = self.get_properties(('radius', 'clockwise'), source, overrides)
         
         # make path
         path = Path()
@@ -283,14 +279,8 @@ class BowArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        large = self.get_property('large', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
+        tag, x1, y1, x2, y2, radius, large, clockwise = self.get_properties(
+            ('tag', 'x1', 'y1', 'x2', 'y2', 'radius', 'large', 'clockwise'), source, overrides)
         
         # make path
         path = Path()
@@ -384,14 +374,8 @@ class ConnectorArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
-        orientation = self.get_property('orientation', source, overrides)
-        pivot = self.get_property('pivot', source, overrides)
-        curve = self.get_property('curve', source, overrides)
+        tag, x1, y1, x2, y2, orientation, pivot, curve = self.get_properties(
+            ('tag', 'x1', 'y1', 'x2', 'y2', 'orientation', 'pivot', 'curve'), source, overrides)
         
         # get curvature
         curvature = 2*curve if curve else 1
@@ -519,15 +503,8 @@ class CurveArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
-        cx1 = self.get_property('cx1', source, overrides)
-        cy1 = self.get_property('cy1', source, overrides)
-        cx2 = self.get_property('cx2', source, overrides)
-        cy2 = self.get_property('cy2', source, overrides)
+        tag, x1, y1, x2, y2, cx1, cy1, cx2, cy2 = self.get_properties(
+            ('tag', 'x1', 'y1', 'x2', 'y2', 'cx1', 'cy1', 'cx2', 'cy2'), source, overrides)
         
         # calc absolute coords
         cx1 = x1 + cx1*(x2 - x1)
@@ -606,11 +583,7 @@ class LineArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
+        tag, x1, y1, x2, y2 = self.get_properties(('tag', 'x1', 'y1', 'x2', 'y2'), source, overrides)
         
         # get angle
         angle = math.atan2(y2-y1, x2-x1)
@@ -684,12 +657,7 @@ class PathArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
-        path = self.get_property('path', source, overrides)
+        tag, x1, y1, x2, y2, path = self.get_properties(('tag', 'x1', 'y1', 'x2', 'y2', 'path'), source, overrides)
         
         # check data
         if not path:
@@ -790,10 +758,7 @@ class RayArrow(Arrow):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x1 = self.get_property('x', source, overrides)
-        y1 = self.get_property('y', source, overrides)
-        length = self.get_property('length', source, overrides)
+        tag, x1, y1, length = self.get_properties(('tag', 'x', 'y', 'length'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # calc end point
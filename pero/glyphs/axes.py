@@ -211,12 +211,10 @@ class StraitAxis(Axis):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        show_line = self.get_property('show_line', source, overrides)
-        show_title = self.get_property('show_title', source, overrides)
-        show_labels = self.get_property('show_labels', source, overrides)
-        show_major_ticks = self.get_property('show_major_ticks', source, overrides)
-        show_minor_ticks = self.get_property('show_minor_ticks', source, overrides)
+        tag, show_line, show_title, show_labels, show_major_ticks, show_minor_ticks = self.get_properties(
+            ('tag', 'show_line', 'show_title', 'show_labels',
+             'show_major_ticks', 'show_minor_ticks'),
+            source, overrides)
         
         # start drawing group
         canvas.group(tag, "axis")
@@ -255,10 +253,8 @@ class StraitAxis(Axis):
         """Draws axis major ticks."""
         
         # get properties
-        ticks = self.get_property('major_ticks', source, overrides)
-        size = self.get_property('major_tick_size', source, overrides)
-        offset = self.get_property('major_tick_offset', source, overrides)
-        flip = self.get_property('major_tick_flip', source, overrides)
+        ticks, size, offset, flip = self.get_properties(
+            ('major_ticks', 'major_tick_size', 'major_tick_offset', 'major_tick_flip'), source, overrides)
         
         # set pen
         canvas.set_pen_by(self, prefix='major_tick_', source=source, overrides=overrides)
@@ -271,10 +267,8 @@ class StraitAxis(Axis):
         """Draws axis minor ticks."""
         
         # get properties
-        flip = self.get_property('minor_tick_flip', source, overrides)
-        ticks = self.get_property('minor_ticks', source, overrides)
-        size = self.get_property('minor_tick_size', source, overrides)
-        offset = self.get_property('minor_tick_offset', source, overrides)
+        flip, ticks, size, offset = self.get_properties(
+            ('minor_tick_flip', 'minor_ticks', 'minor_tick_size', 'minor_tick_offset'), source, overrides)
         
         # set pen
         canvas.set_pen_by(self, prefix='minor_tick_', source=source, overrides=overrides)
@@ -291,10 +285,7 @@ class StraitAxis(Axis):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        position = self.get_property('position', source, overrides)
-        relative = self.get_property('relative', source, overrides)
+        x, y, position, relative = self.get_properties(('x', 'y', 'position', 'relative'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # apply position
@@ -334,20 +325,13 @@ class StraitAxis(Axis):
         """Draws axis labels."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        position = self.get_property('position', source, overrides)
-        relative = self.get_property('relative', source, overrides)
+        x, y, position, relative = self.get_properties(('x', 'y', 'position', 'relative'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
-        labels = self.get_property('labels', source, overrides)
-        label_offset = self.get_property('label_offset', source, overrides)
+        labels, label_offset = self.get_properties(('labels', 'label_offset'), source, overrides)
         label_angle = AngleProperties.get_angle(self, 'label_', ANGLE_RAD, source, overrides)
-        label_flip = self.get_property('label_flip', source, overrides)
-        label_overlap = self.get_property('label_overlap', source, overrides)
-        label_text_align = self.get_property('label_text_align', source, overrides)
-        label_text_base = self.get_property('label_text_base', source, overrides)
-        ticks = self.get_property('major_ticks', source, overrides)
+        label_flip, label_overlap, label_text_align, label_text_base, ticks = self.get_properties(
+            ('label_flip', 'label_overlap', 'label_text_align', 'label_text_base', 'major_ticks'), source, overrides)
         
         # check data
         if not labels:
@@ -435,20 +419,15 @@ class StraitAxis(Axis):
         """Draws axis title."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        offset = self.get_property('offset', source, overrides)
-        position = self.get_property('position', source, overrides)
-        length = self.get_property('length', source, overrides)
+        x, y, offset, position, length = self.get_properties(
+            ('x', 'y', 'offset', 'position', 'length'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
-        title = self.get_property('title', source, overrides)
-        title_position = self.get_property('title_position', source, overrides)
-        title_offset = self.get_property('title_offset', source, overrides)
+        title, title_position, title_offset = self.get_properties(
+            ('title', 'title_position', 'title_offset'), source, overrides)
         title_angle = AngleProperties.get_angle(self, 'title_', ANGLE_RAD, source, overrides)
-        title_flip = self.get_property('title_flip', source, overrides)
-        title_text_align = self.get_property('title_text_align', source, overrides)
-        title_text_base = self.get_property('title_text_base', source, overrides)
+        title_flip, title_text_align, title_text_base = self.get_properties(
+            ('title_flip', 'title_text_align', 'title_text_base'), source, overrides)
         
         # check data
         if not title:
@@ -535,11 +514,8 @@ class StraitAxis(Axis):
         """Draws axis line."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        position = self.get_property('position', source, overrides)
-        offset = self.get_property('offset', source, overrides)
-        length = self.get_property('length', source, overrides)
+        x, y, position, offset, length = self.get_properties(
+            ('x', 'y', 'position', 'offset', 'length'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # set pen
@@ -614,11 +590,8 @@ class RadialAxis(Axis):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        show_line = self.get_property('show_line', source, overrides)
-        show_labels = self.get_property('show_labels', source, overrides)
-        show_major_ticks = self.get_property('show_major_ticks', source, overrides)
-        show_minor_ticks = self.get_property('show_minor_ticks', source, overrides)
+        tag, show_line, show_labels, show_major_ticks, show_minor_ticks = self.get_properties(
+            ('tag', 'show_line', 'show_labels', 'show_major_ticks', 'show_minor_ticks'), source, overrides)
         
         # start drawing group
         canvas.group(tag, "axis")
@@ -653,10 +626,8 @@ class RadialAxis(Axis):
         """Draws axis major ticks."""
         
         # get properties
-        ticks = self.get_property('major_ticks', source, overrides)
-        size = self.get_property('major_tick_size', source, overrides)
-        offset = self.get_property('major_tick_offset', source, overrides)
-        flip = self.get_property('major_tick_flip', source, overrides)
+        ticks, size, offset, flip = self.get_properties(
+            ('major_ticks', 'major_tick_size', 'major_tick_offset', 'major_tick_flip'), source, overrides)
         
         # set pen
         canvas.set_pen_by(self, prefix='major_tick_', source=source, overrides=overrides)
@@ -669,10 +640,8 @@ class RadialAxis(Axis):
         """Draws axis minor ticks."""
         
         # get properties
-        ticks = self.get_property('minor_ticks', source, overrides)
-        size = self.get_property('minor_tick_size', source, overrides)
-        offset = self.get_property('minor_tick_offset', source, overrides)
-        flip = self.get_property('minor_tick_flip', source, overrides)
+        ticks, size, offset, flip = self.get_properties(
+            ('minor_ticks', 'minor_tick_size', 'minor_tick_offset', 'minor_tick_flip'), source, overrides)
         
         # set pen
         canvas.set_pen_by(self, prefix='minor_tick_', source=source, overrides=overrides)
@@ -689,10 +658,7 @@ class RadialAxis(Axis):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        units = self.get_property('units', source, overrides)
+        x, y, radius, units = self.get_properties(('x', 'y', 'radius', 'units'), source, overrides)
         
         # convert angles
         if units == ANGLE_DEG:
@@ -724,16 +690,10 @@ class RadialAxis(Axis):
         """Draws axis labels."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        radius = self.get_property('radius', source, overrides)
+        x, y, radius = self.get_properties(('x', 'y', 'radius'), source, overrides)
         
-        flip = self.get_property('label_flip', source, overrides)
-        labels = self.get_property('labels', source, overrides)
-        label_offset = self.get_property('label_offset', source, overrides)
-        label_rotation = self.get_property('label_rotation', source, overrides)
-        ticks = self.get_property('major_ticks', source, overrides)
-        units = self.get_property('units', source, overrides)
+        flip, labels, label_offset, label_rotation, ticks, units = self.get_properties(
+            ('label_flip', 'labels', 'label_offset', 'label_rotation', 'major_ticks', 'units'), source, overrides)
         
         # check data
         if not labels:
@@ -771,10 +731,7 @@ class RadialAxis(Axis):
         """Draws axis line."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
+        x, y, radius, clockwise = self.get_properties(('x', 'y', 'radius', 'clockwise'), source, overrides)
         start_angle = AngleProperties.get_angle(self, 'start_', ANGLE_RAD, source, overrides)
         end_angle = AngleProperties.get_angle(self, 'end_', ANGLE_RAD, source, overrides)
         
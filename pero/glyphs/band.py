@@ -23,7 +23,13 @@ class Band(Glyph):
     
     When individual points are drawn, original 'data' item is provided as the
     'source' together with relevant overrides to the marker glyph so any
-    property of the marker can be dynamic.
+    property of the marker can be dynamic. If the 'data' is columnar (i.e.
+    numpy record array or dict of numpy arrays), dynamic marker properties are
+    evaluated for all the points in advance. Vectorized functions (see
+    pero.vectorized) are then called just once using the whole data. If the
+    marker can be expressed as a symbol path and only its size, colors or
+    visibility are dynamic, all the points are drawn by a single call of the
+    canvas 'draw_markers' method.
     
     If the 'clip' property is defined, drawn data will be clipped to show the
     specified region only. Note that this is applied to points only and not to
@@ -43,9 +49,10 @@ class Band(Glyph):
             Specifies whether the area between the profile lines should be
             displayed.
         
-        data: tuple, callable, None or UNDEF
-            Specifies the sequence of raw data to be provided as the source for
-            drawing individual points.
+        data: tuple, numpy.ndarray, dict, callable, None or UNDEF
+            Specifies the sequence of raw data or columnar data (i.e. numpy
+            record array or dict of numpy arrays) to be provided as the source
+            for drawing individual points.
         
         x: tuple or callable
             Specifies the x-coordinates of the profile lines.
@@ -89,14 +96,14 @@ class Band(Glyph):
     show_points = BoolProperty(UNDEF)
     show_area = BoolProperty(False)
     
-    data = SequenceProperty(UNDEF, nullable=True)
-    x = SequenceProperty(UNDEF, intypes=(int, float))
-    y1 = SequenceProperty(UNDEF, intypes=(int, float))
-    y2 = SequenceProperty(UNDEF, intypes=(int, float))
+    data = Property(UNDEF, types=(list, tuple, numpy.ndarray, dict), nullable=True, compare=PROP_COMPARE_IDENTITY)
+    x = SequenceProperty(UNDEF, intypes=(int, float), compare=PROP_COMPARE_IDENTITY)
+    y1 = SequenceProperty(UNDEF, intypes=(int, float), compare=PROP_COMPARE_IDENTITY)
+    y2 = SequenceProperty(UNDEF, intypes=(int, float), compare=PROP_COMPARE_IDENTITY)
     
     spacing = IntProperty(10)
     clip = FrameProperty(UNDEF)
-
+    
     marker = Property(MARKER_CIRCLE, types=(str, Path, Marker), nullable=True)
     marker_size = NumProperty(4)
     marker_line = Include(LineProperties, prefix='marker_', line_color=UNDEF)
@@ -114,14 +121,8 @@ class Band(Glyph):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        show_line = self.get_property('show_line', source, overrides)
-        show_points = self.get_property('show_points', source, overrides)
-        show_area = self.get_property('show_area', source, overrides)
-        spacing = self.get_property('spacing', source, overrides)
-        x_coords = self.get_property('x', source, overrides)
-        y1_coords = self.get_property('y1', source, overrides)
-        y2_coords = self.get_property('y2', source, overrides)
+        tag, show_line, show_points, show_area, spacing, x_coords, y1_coords, y2_coords = self.get_properties(
+            ('tag', 'show_line', 'show_points', 'show_area', 'spacing', 'x', 'y1', 'y2'), source, overrides)
         
         # enable/disable points display
         if show_points is UNDEF:
@@ -184,8 +185,7 @@ class Band(Glyph):
         """Draws individual points."""
         
         # get properties
-        clip = self.get_property('clip', source, overrides)
-        data = self.get_property('data', source, overrides)
+        clip, data = self.get_properties(('clip', 'data'), source, overrides)
         
         # get marker overrides
         marker_overrides = self.get_child_overrides('marker', overrides)
@@ -195,13 +195,22 @@ class Band(Glyph):
         canvas.set_brush_by(self, source=source, overrides=overrides)
         
         # check raw data
-        has_data = data is not UNDEF and data is not None and len(data) == len(x_coords)
+        has_data = data is not UNDEF and data is not None
+        columnar = has_data and is_columnar(data)
+        has_data = has_data and (columnar_size(data) if columnar else len(data)) == len(x_coords)
+        
+        # draw columns
+        if has_data and columnar and not self._has_dynamic_marker(overrides):
+            self._draw_columns(canvas, overrides, marker_overrides, clip, data, x_coords, y1_coords, y2_coords)
+            return
         
         # draw points
         for i in range(len(x_coords)):
             
             # get point data
-            point_data = data[i] if has_data else None
+            point_data = None
+            if has_data:
+                point_data = columnar_item(data, i) if columnar else data[i]
             
             # get marker
             marker = self.get_property('marker', point_data, overrides)
@@ -230,3 +239,27 @@ class Band(Glyph):
             # draw y2
             if not clip or (clip.y1 < y2+radius and clip.y2 > y2-radius):
                 marker.draw(canvas, point_data, x=x, y=y2, **marker_overrides)
+    
+    
+    def _draw_columns(self, canvas, overrides, marker_overrides, clip, data, x_coords, y1_coords, y2_coords):
+        """Draws individual points using columnar data."""
+        
+        # get marker
+        marker = self.get_property('marker', UNDEF, overrides)
+        if not marker:
+            return
+        
+        # init glyph
+        if not isinstance(marker, Marker):
+            marker = Marker.create(marker)
+            marker.set_properties_from(self, src_prefix='marker_', overrides=overrides, native=True)
+        
+        # draw points
+        marker.draw_columns(canvas, data, x_coords, (y1_coords, y2_coords), clip, marker_overrides)
+    
+    
+    def _has_dynamic_marker(self, overrides):
+        """Checks whether the marker itself is defined as dynamic."""
+        
+        marker = self.get_property('marker', overrides=overrides, native=True)
+        return callable(marker) and not isinstance(marker, (str, Path, Marker))
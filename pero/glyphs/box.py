@@ -98,18 +98,10 @@ class Box(Glyph):
             return
         
         # get properties
-        anchor = self.get_property('anchor', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        padding = self.get_property('padding', source, overrides)
-        margin = self.get_property('margin', source, overrides)
-        graphics = self.get_property('graphics', source, overrides)
-        h_align = self.get_property('h_align', source, overrides)
-        v_align = self.get_property('v_align', source, overrides)
-        clip = self.get_property('clip', source, overrides)
+        anchor, x, y, width, height, radius, padding, margin, graphics, h_align, v_align, clip = self.get_properties(
+            ('anchor', 'x', 'y', 'width', 'height', 'radius', 'padding',
+             'margin', 'graphics', 'h_align', 'v_align', 'clip'),
+            source, overrides)
         
         # init box
         box_x = x
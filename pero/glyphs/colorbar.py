@@ -73,15 +73,8 @@ class ColorBar(Glyph):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        length = self.get_property('length', source, overrides)
-        thickness = self.get_property('thickness', source, overrides)
-        orientation = self.get_property('orientation', source, overrides)
-        reverse = self.get_property('reverse', source, overrides)
-        gradient = self.get_property('gradient', source, overrides)
-        steps = self.get_property('steps', source, overrides)
+        tag, x, y, length, thickness, orientation, reverse, gradient, steps = self.get_properties(
+            ('tag', 'x', 'y', 'length', 'thickness', 'orientation', 'reverse', 'gradient', 'steps'), source, overrides)
         
         # get step size
         step = float(length) / steps
@@ -72,14 +72,8 @@ class Framer(Glyph):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        show_label = self.get_property('show_label', source, overrides)
-        show_size = self.get_property('show_size', source, overrides)
-        label = self.get_property('label', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
+        tag, show_label, show_size, label, x, y, width, height = self.get_properties(
+            ('tag', 'show_label', 'show_size', 'label', 'x', 'y', 'width', 'height'), source, overrides)
         
         # get size from canvas
         if width is UNDEF:
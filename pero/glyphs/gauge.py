@@ -112,17 +112,10 @@ class StraitGauge(Gauge):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        length = self.get_property('length', source, overrides)
-        thickness = self.get_property('thickness', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        limit = self.get_property('limit', source, overrides)
-        orientation = self.get_property('orientation', source, overrides)
-        reverse = self.get_property('reverse', source, overrides)
-        start = self.get_property('start', source, overrides)
-        end = self.get_property('end', source, overrides)
+        tag, x, y, length, thickness, radius, limit, orientation, reverse, start, end = self.get_properties(
+            ('tag', 'x', 'y', 'length', 'thickness', 'radius', 'limit',
+             'orientation', 'reverse', 'start', 'end'),
+            source, overrides)
         
         # check edges
         start = max(0, min(1, start))
@@ -243,20 +236,13 @@ class RadialGauge(Gauge):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
+        tag, x, y = self.get_properties(('tag', 'x', 'y'), source, overrides)
         bgr_start = AngleProperties.get_angle(self, 'start_', ANGLE_RAD, source, overrides)
         bgr_end = AngleProperties.get_angle(self, 'end_', ANGLE_RAD, source, overrides)
-        inner_radius = self.get_property('inner_radius', source, overrides)
-        outer_radius = self.get_property('outer_radius', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
-        corners = self.get_property('corners', source, overrides)
-        caped = self.get_property('caped', source, overrides)
-        limit = self.get_property('limit', source, overrides)
-        reverse = self.get_property('reverse', source, overrides)
-        start = self.get_property('start', source, overrides)
-        end = self.get_property('end', source, overrides)
+        inner_radius, outer_radius, clockwise, corners, caped, limit, reverse, start, end = self.get_properties(
+            ('inner_radius', 'outer_radius', 'clockwise', 'corners',
+             'caped', 'limit', 'reverse', 'start', 'end'),
+            source, overrides)
         
         # check edges
         start = max(0, min(1, start))
@@ -84,13 +84,8 @@ class ParallelGrid(Grid):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        ticks = self.get_property('ticks', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        orientation = self.get_property('orientation', source, overrides)
-        relative = self.get_property('relative', source, overrides)
-        length = self.get_property('length', source, overrides)
+        tag, ticks, x, y, orientation, relative, length = self.get_properties(
+            ('tag', 'ticks', 'x', 'y', 'orientation', 'relative', 'length'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # check ticks
@@ -165,13 +160,8 @@ class RayGrid(Grid):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        ticks = self.get_property('ticks', source, overrides)
-        units = self.get_property('units', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        offset = self.get_property('offset', source, overrides)
-        length = self.get_property('length', source, overrides)
+        tag, ticks, units, x, y, offset, length = self.get_properties(
+            ('tag', 'ticks', 'units', 'x', 'y', 'offset', 'length'), source, overrides)
         
         # check ticks
         if not ticks:
@@ -243,11 +233,7 @@ class RadialGrid(Grid):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        ticks = self.get_property('ticks', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
+        tag, ticks, x, y, clockwise = self.get_properties(('tag', 'ticks', 'x', 'y', 'clockwise'), source, overrides)
         start_angle = AngleProperties.get_angle(self, 'start_', ANGLE_RAD, source, overrides)
         end_angle = AngleProperties.get_angle(self, 'end_', ANGLE_RAD, source, overrides)
         
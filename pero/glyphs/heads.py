@@ -95,9 +95,7 @@ class CircleHead(Head):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -124,9 +122,7 @@ class LineHead(Head):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # get coords
@@ -162,9 +158,7 @@ class NormalHead(Head):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # transform path
@@ -200,9 +194,7 @@ class OpenHead(Head):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # transform path
@@ -243,9 +235,7 @@ class SymbolHead(Head):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         path = self.get_property('path', source, overrides)
         
@@ -286,9 +276,7 @@ class VeeHead(Head):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # transform path
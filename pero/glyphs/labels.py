@@ -88,11 +88,8 @@ class TextLabel(Label):
             return None
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        x_offset = self.get_property('x_offset', source, overrides)
-        y_offset = self.get_property('y_offset', source, overrides)
-        text = self.get_property('text', source, overrides)
+        x, y, x_offset, y_offset, text = self.get_properties(
+            ('x', 'y', 'x_offset', 'y_offset', 'text'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # check text
@@ -118,11 +115,8 @@ class TextLabel(Label):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        x_offset = self.get_property('x_offset', source, overrides)
-        y_offset = self.get_property('y_offset', source, overrides)
-        text = self.get_property('text', source, overrides)
+        x, y, x_offset, y_offset, text = self.get_properties(
+            ('x', 'y', 'x_offset', 'y_offset', 'text'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # check text
@@ -224,11 +218,8 @@ class LabelBox(Glyph):
         """Gets final list of labels to be drawn."""
         
         # get properties
-        items = self.get_property('items', source, overrides)
-        overlap = self.get_property('overlap', source, overrides)
-        spacing = self.get_property('spacing', source, overrides)
-        clip = self.get_property('clip', source, overrides)
-        padding = self.get_property('padding', source, overrides)
+        items, overlap, spacing, clip, padding = self.get_properties(
+            ('items', 'overlap', 'spacing', 'clip', 'padding'), source, overrides)
         
         # check items
         if not items:
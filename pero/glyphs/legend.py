@@ -121,12 +121,8 @@ class MarkerLegend(Legend):
             return None
         
         # get properties
-        marker = self.get_property('marker', source, overrides)
-        marker_size = self.get_property('marker_size', source, overrides)
-        show_marker = self.get_property('show_marker', source, overrides)
-        show_line = self.get_property('show_line', source, overrides)
-        line_size = self.get_property('line_size', source, overrides)
-        line_width = self.get_property('line_width', source, overrides)
+        marker, marker_size, show_marker, show_line, line_size, line_width = self.get_properties(
+            ('marker', 'marker_size', 'show_marker', 'show_line', 'line_size', 'line_width'), source, overrides)
         
         # init size
         width = 0
@@ -158,17 +154,10 @@ class MarkerLegend(Legend):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        text = self.get_property('text', source, overrides)
-        text_x = self.get_property('text_x', source, overrides)
-        text_y = self.get_property('text_y', source, overrides)
-        bull_x = self.get_property('bull_x', source, overrides)
-        bull_y = self.get_property('bull_y', source, overrides)
-        show_marker = self.get_property('show_marker', source, overrides)
-        show_line = self.get_property('show_line', source, overrides)
-        marker = self.get_property('marker', source, overrides)
-        marker_size = self.get_property('marker_size', source, overrides)
-        line_size = self.get_property('line_size', source, overrides)
+        tag, text, text_x, text_y, bull_x, bull_y, show_marker, show_line, marker, marker_size, line_size = self.get_properties(
+            ('tag', 'text', 'text_x', 'text_y', 'bull_x', 'bull_y',
+             'show_marker', 'show_line', 'marker', 'marker_size', 'line_size'),
+            source, overrides)
         
         # start drawing group
         canvas.group(tag, "legend")
@@ -294,9 +283,7 @@ class LegendBox(Glyph):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        padding = self.get_property('padding', source, overrides)
-        radius = self.get_property('radius', source, overrides)
+        tag, padding, radius = self.get_properties(('tag', 'padding', 'radius'), source, overrides)
         
         # get items
         items = self._get_items(canvas, source, overrides)
@@ -332,9 +319,7 @@ class LegendBox(Glyph):
         """Gets initial boxes for all items."""
         
         # get properties
-        items = self.get_property('items', source, overrides)
-        orientation = self.get_property('orientation', source, overrides)
-        spacing = self.get_property('spacing', source, overrides)
+        items, orientation, spacing = self.get_properties(('items', 'orientation', 'spacing'), source, overrides)
         
         # check spacing
         spacing = spacing or 0
@@ -403,10 +388,7 @@ class LegendBox(Glyph):
         """Gets final bbox."""
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        anchor = self.get_property('anchor', source, overrides)
-        padding = self.get_property('padding', source, overrides)
+        x, y, anchor, padding = self.get_properties(('x', 'y', 'anchor', 'padding'), source, overrides)
         
         # init size
         width = 0
@@ -93,6 +93,137 @@ class Marker(Glyph):
             return Symbol(path=symbol, **overrides)
         
         raise ValueError("Unknown marker symbol! -> '%s'" % symbol)
+    
+    
+    def get_symbol(self, source=UNDEF, overrides=None):
+        """
+        Gets the marker shape as a 'symbol-path' i.e. centered at 0,0 and
+        scaled to fit into 1x1 square. Such markers can be drawn at multiple
+        positions at once using the canvas 'draw_markers' method.
+        
+        Args:
+            source: any
+                Data source to be used for retrieving the final value of
+                callable properties.
+            
+            overrides: dict or None
+                Highest priority properties to be used instead of current value.
+        
+        Returns:
+            pero.Path or None
+                Symbol path or None if the marker cannot be drawn as a path.
+        """
+        
+        return None
+    
+    
+    def draw_columns(self, canvas, data, x_coords, y_coords, clip=None, overrides=None):
+        """
+        Uses given canvas to draw the marker at multiple positions using
+        columnar data (i.e. numpy record array or dict of numpy arrays) as the
+        source. Dynamic properties are evaluated for all the items at once. If
+        the marker can be drawn as a symbol-path and only its size, colors or
+        visibility are dynamic, all the points are drawn by a single call of
+        the canvas 'draw_markers' method. Otherwise they are drawn one by one.
+        
+        Args:
+            canvas: pero.Canvas
+                Canvas to be used for rendering.
+            
+            data: numpy.ndarray or dict
+                Columnar data to be used for retrieving the final value of
+                callable properties.
+            
+            x_coords: (float,)
+                X-coordinates of the items.
+            
+            y_coords: ((float,),)
+                One or more sets of y-coordinates of the items. The marker is
+                drawn for each set.
+            
+            clip: pero.Frame or None
+                Points outside this frame are skipped.
+            
+            overrides: dict or None
+                Highest priority properties to be used instead of current value.
+        """
+        
+        if overrides is None:
+            overrides = {}
+        
+        # evaluate dynamic properties
+        columns = self.get_columns(data, overrides, skip=('x', 'y'))
+        
+        # get symbol for bulk drawing
+        symbol = None
+        if all(name in ('size', 'line_color', 'fill_color', 'visible') for name in columns):
+            symbol = self.get_symbol(UNDEF, overrides)
+        
+        # get coords and sizes
+        x_coords = numpy.asarray(x_coords)
+        y_coords = [numpy.asarray(y) for y in y_coords]
+        sizes = columns['size'] if 'size' in columns else self.get_property('size', UNDEF, overrides)
+        radii = 0.5 * sizes
+        
+        # get visible items
+        visible = numpy.ones(len(x_coords), dtype=bool)
+        if symbol is not None and 'visible' in columns:
+            visible &= columns['visible'].astype(bool)
+        
+        if clip:
+            visible &= (clip.x1 <= x_coords + radii) & (clip.x2 >= x_coords - radii)
+        
+        # get visible points for each set
+        idxs = []
+        for y in y_coords:
+            
+            show = visible
+            if clip:
+                show = show & (clip.y1 <= y + radii) & (clip.y2 >= y - radii)
+            
+            idxs.append(numpy.flatnonzero(show))
+        
+        # draw points one by one
+        if symbol is None:
+            
+            names = tuple(columns.keys())
+            values = tuple(columns[name].tolist() for name in names)
+            
+            for y, y_idxs in zip(y_coords, idxs):
+                for i in y_idxs.tolist():
+                    
+                    item_overrides = dict(overrides)
+                    item_overrides.update(zip(names, (v[i] for v in values)))
+                    
+                    self.draw(canvas, columnar_item(data, i), x=x_coords[i], y=y[i], **item_overrides)
+            
+            return
+        
+        # merge points
+        ys = numpy.concatenate([y[i] for y, i in zip(y_coords, idxs)])
+        idxs = numpy.concatenate(idxs)
+        
+        # check visibility
+        if len(idxs) == 0 or ('visible' not in columns and not self.is_visible(UNDEF, overrides)):
+            return
+        
+        # use first item for dynamic pen and brush properties
+        item_overrides = dict(overrides)
+        item_overrides.update((name, column[idxs[0]]) for name, column in columns.items())
+        
+        # set pen and brush
+        canvas.set_pen_by(self, overrides=item_overrides)
+        canvas.set_brush_by(self, overrides=item_overrides)
+        
+        # get per-item values
+        if 'size' in columns:
+            sizes = sizes[idxs]
+        
+        line_colors = columns['line_color'][idxs] if 'line_color' in columns else None
+        fill_colors = columns['fill_color'][idxs] if 'fill_color' in columns else None
+        
+        # draw markers
+        canvas.draw_markers(symbol, x_coords[idxs], ys, sizes, line_colors, fill_colors)
 
 
 class Asterisk(Marker):
@@ -109,9 +240,7 @@ class Asterisk(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # get radii
         radius1 = 0.5*size
@@ -141,9 +270,7 @@ class Circle(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -151,6 +278,12 @@ class Circle(Marker):
         
         # draw
         canvas.draw_circle(x, y, 0.5*size)
+    
+    
+    def get_symbol(self, source=UNDEF, overrides=None):
+        """Gets the marker shape as a 'symbol-path'."""
+        
+        return Path().circle(0, 0, 0.5)
 
 
 class Cross(Marker):
@@ -167,9 +300,7 @@ class Cross(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # get radius
         radius = 0.5*size
@@ -196,9 +327,7 @@ class Diamond(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # get radius
         radius = 0.5*size
@@ -213,6 +342,16 @@ class Diamond(Marker):
             (x+radius, y),
             (x, y+radius),
             (x-radius, y)))
+    
+    
+    def get_symbol(self, source=UNDEF, overrides=None):
+        """Gets the marker shape as a 'symbol-path'."""
+        
+        return Path().polygon((
+            (0, -0.5),
+            (0.5, 0),
+            (0, 0.5),
+            (-0.5, 0)))
 
 
 class Plus(Marker):
@@ -229,9 +368,7 @@ class Plus(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # get radius
         radius = 0.5*size
@@ -258,9 +395,7 @@ class Triangle(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # get factor
         f = (size/2.)/(numpy.sqrt(3)/2.)
@@ -274,6 +409,18 @@ class Triangle(Marker):
             (x, y-f),
             (x+0.5*size, y+f*0.5),
             (x-0.5*size, y+f*0.5)))
+    
+    
+    def get_symbol(self, source=UNDEF, overrides=None):
+        """Gets the marker shape as a 'symbol-path'."""
+        
+        # get factor
+        f = 0.5/numpy.sqrt(3)
+        
+        return Path().polygon((
+            (0, -2*f),
+            (0.5, f),
+            (-0.5, f)))
 
 
 class Square(Marker):
@@ -290,9 +437,7 @@ class Square(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
+        x, y, size = self.get_properties(('x', 'y', 'size'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -300,6 +445,12 @@ class Square(Marker):
         
         # draw
         canvas.draw_rect(x-0.5*size, y-0.5*size, size, size)
+    
+    
+    def get_symbol(self, source=UNDEF, overrides=None):
+        """Gets the marker shape as a 'symbol-path'."""
+        
+        return Path().rect(-0.5, -0.5, 1, 1)
 
 
 class Symbol(Marker):
@@ -325,10 +476,7 @@ class Symbol(Marker):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        size = self.get_property('size', source, overrides)
-        path = self.get_property('path', source, overrides)
+        x, y, size, path = self.get_properties(('x', 'y', 'size', 'path'), source, overrides)
         
         # check data
         if not path:
@@ -344,6 +492,12 @@ class Symbol(Marker):
         
         # draw
         canvas.draw_path(path)
+    
+    
+    def get_symbol(self, source=UNDEF, overrides=None):
+        """Gets the marker shape as a 'symbol-path'."""
+        
+        return self.get_property('path', source, overrides)
 
 
 class MarkerProperty(Property):
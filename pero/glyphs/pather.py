@@ -106,15 +106,10 @@ class Pather(Glyph):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        show_anchors = self.get_property('show_anchors', source, overrides)
-        show_handles = self.get_property('show_handles', source, overrides)
-        show_cursor = self.get_property('show_cursor', source, overrides)
-        path = self.get_property('path', source, overrides)
-        anchor = self.get_property('anchor', source, overrides)
-        control = self.get_property('control', source, overrides)
-        cursor = self.get_property('cursor', source, overrides)
-        handle = self.get_property('handle', source, overrides)
+        tag, show_anchors, show_handles, show_cursor, path, anchor, control, cursor, handle = self.get_properties(
+            ('tag', 'show_anchors', 'show_handles', 'show_cursor',
+             'path', 'anchor', 'control', 'cursor', 'handle'),
+            source, overrides)
         
         # check data
         if not path:
@@ -50,10 +50,8 @@ class Annulus(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        inner_radius = self.get_property('inner_radius', source, overrides)
-        outer_radius = self.get_property('outer_radius', source, overrides)
+        x, y, inner_radius, outer_radius = self.get_properties(
+            ('x', 'y', 'inner_radius', 'outer_radius'), source, overrides)
         
         # make path
         path = make_annulus(x, y, inner_radius, outer_radius)
@@ -117,12 +115,10 @@ class Arc(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
+        x, y = self.get_properties(('x', 'y'), source, overrides)
         start_angle = AngleProperties.get_angle(self, 'start_', ANGLE_RAD, source, overrides)
         end_angle = AngleProperties.get_angle(self, 'end_', ANGLE_RAD, source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
+        radius, clockwise = self.get_properties(('radius', 'clockwise'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -185,13 +181,8 @@ class Bow(Glyph):
             return
         
         # get properties
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        large = self.get_property('large', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
+        x1, y1, x2, y2, radius, large, clockwise = self.get_properties(
+            ('x1', 'y1', 'x2', 'y2', 'radius', 'large', 'clockwise'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -249,11 +240,8 @@ class Bar(Glyph):
             return
         
         # get properties
-        left = self.get_property('left', source, overrides)
-        right = self.get_property('right', source, overrides)
-        top = self.get_property('top', source, overrides)
-        bottom = self.get_property('bottom', source, overrides)
-        radius = self.get_property('radius', source, overrides)
+        left, right, top, bottom, radius = self.get_properties(
+            ('left', 'right', 'top', 'bottom', 'radius'), source, overrides)
         
         # check coords
         if right < left:
@@ -311,10 +299,7 @@ class Ellipse(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
+        x, y, width, height = self.get_properties(('x', 'y', 'width', 'height'), source, overrides)
         
         # set pen and brush
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -362,10 +347,7 @@ class Line(Glyph):
             return
         
         # get properties
-        x1 = self.get_property('x1', source, overrides)
-        y1 = self.get_property('y1', source, overrides)
-        x2 = self.get_property('x2', source, overrides)
-        y2 = self.get_property('y2', source, overrides)
+        x1, y1, x2, y2 = self.get_properties(('x1', 'y1', 'x2', 'y2'), source, overrides)
         
         # set pen
         canvas.set_pen_by(self, source=source, overrides=overrides)
@@ -461,10 +443,7 @@ class Ray(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        length = self.get_property('length', source, overrides)
-        offset = self.get_property('offset', source, overrides)
+        x, y, length, offset = self.get_properties(('x', 'y', 'length', 'offset'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # set pen
@@ -527,12 +506,8 @@ class Rect(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        anchor = self.get_property('anchor', source, overrides)
-        width = self.get_property('width', source, overrides)
-        height = self.get_property('height', source, overrides)
-        radius = self.get_property('radius', source, overrides)
+        x, y, anchor, width, height, radius = self.get_properties(
+            ('x', 'y', 'anchor', 'width', 'height', 'radius'), source, overrides)
         
         # shift anchor
         if anchor is UNDEF or anchor == POS_NW:
@@ -681,16 +656,11 @@ class Wedge(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
+        x, y = self.get_properties(('x', 'y'), source, overrides)
         start_angle = AngleProperties.get_angle(self, 'start_', ANGLE_RAD, source, overrides)
         end_angle = AngleProperties.get_angle(self, 'end_', ANGLE_RAD, source, overrides)
-        inner_radius = self.get_property('inner_radius', source, overrides)
-        outer_radius = self.get_property('outer_radius', source, overrides)
-        clockwise = self.get_property('clockwise', source, overrides)
-        corners = self.get_property('corners', source, overrides)
-        caped = self.get_property('caped', source, overrides)
-        offset = self.get_property('offset', source, overrides)
+        inner_radius, outer_radius, clockwise, corners, caped, offset = self.get_properties(
+            ('inner_radius', 'outer_radius', 'clockwise', 'corners', 'caped', 'offset'), source, overrides)
         
         # apply offset
         if offset:
@@ -46,9 +46,7 @@ class Text(Glyph):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        text = self.get_property('text', source, overrides)
+        x, y, text = self.get_properties(('x', 'y', 'text'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # check data
@@ -105,14 +103,8 @@ class Textbox(Text):
             return
         
         # get properties
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        anchor = self.get_property('anchor', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        padding = self.get_property('padding', source, overrides)
-        text = self.get_property('text', source, overrides)
-        align = self.get_property('text_align', source, overrides)
-        base = self.get_property('text_base', source, overrides)
+        x, y, anchor, radius, padding, text, align, base = self.get_properties(
+            ('x', 'y', 'anchor', 'radius', 'padding', 'text', 'text_align', 'text_base'), source, overrides)
         angle = AngleProperties.get_angle(self, '', ANGLE_RAD, source, overrides)
         
         # check data
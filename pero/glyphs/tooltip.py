@@ -101,20 +101,10 @@ class TextTooltip(Tooltip):
             return
         
         # get properties
-        tag = self.get_property('tag', source, overrides)
-        x = self.get_property('x', source, overrides)
-        y = self.get_property('y', source, overrides)
-        anchor = self.get_property('anchor', source, overrides)
-        x_offset = self.get_property('x_offset', source, overrides)
-        y_offset = self.get_property('y_offset', source, overrides)
-        radius = self.get_property('radius', source, overrides)
-        padding = self.get_property('padding', source, overrides)
-        text = self.get_property('text', source, overrides)
-        align = self.get_property('text_align', source, overrides)
-        base = self.get_property('text_base', source, overrides)
-        clip = self.get_property('clip', source, overrides)
-        v_clip = self.get_property('v_clip', source, overrides)
-        h_clip = self.get_property('h_clip', source, overrides)
+        tag, x, y, anchor, x_offset, y_offset, radius, padding, text, align, base, clip, v_clip, h_clip = self.get_properties(
+            ('tag', 'x', 'y', 'anchor', 'x_offset', 'y_offset', 'radius', 'padding',
+             'text', 'text_align', 'text_base', 'clip', 'v_clip', 'h_clip'),
+            source, overrides)
         
         # check text
         if not text:
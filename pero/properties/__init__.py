@@ -5,6 +5,8 @@
 from . undefined import UNDEF
 from . prop import Property
 from . propset import PropertySet, Include, PROP_SPLITTER
+from . columns import vectorized, is_columnar, columnar_size, columnar_item
+from . fingerprint import make_fingerprint
 
 # import additional properties
 from . typed import FuncProperty, EnumProperty, RangeProperty, BoolProperty
@@ -0,0 +1,190 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import numpy
+
+
+def vectorized(func):
+    """
+    Marks given function as array-capable. When a dynamic property is evaluated
+    over a columnar source, such function is called just once with the whole
+    source and it is expected to return the values for all items at once (e.g.
+    as numpy.ndarray). Non-marked functions are called for each item
+    separately, unless the property itself is declared as vectorized.
+    
+    This can be used as a decorator.
+    
+    Args:
+        func: callable
+            Function to be marked.
+    
+    Returns:
+        callable
+            Given function.
+    """
+    
+    func.vectorized = True
+    return func
+
+
+def is_columnar(source):
+    """
+    Checks whether given data source is columnar, i.e. a numpy record array or
+    a dict of numpy arrays of the same length.
+    
+    Args:
+        source: any
+            Data source to be checked.
+    
+    Returns:
+        bool
+            True if source is columnar, False otherwise.
+    """
+    
+    # check record array
+    if isinstance(source, numpy.ndarray):
+        return source.dtype.names is not None and source.ndim == 1
+    
+    # check dict of arrays
+    if isinstance(source, dict) and source:
+        
+        size = None
+        for column in source.values():
+            
+            if not isinstance(column, numpy.ndarray) or column.ndim != 1:
+                return False
+            
+            if size is None:
+                size = len(column)
+            elif size != len(column):
+                return False
+        
+        return True
+    
+    return False
+
+
+def columnar_size(source):
+    """
+    Gets number of items within given columnar source.
+    
+    Args:
+        source: numpy.ndarray or {str: numpy.ndarray}
+            Columnar data source.
+    
+    Returns:
+        int
+            Number of items.
+    """
+    
+    # get record array size
+    if isinstance(source, numpy.ndarray):
+        return len(source)
+    
+    # get columns size
+    for column in source.values():
+        return len(column)
+    
+    return 0
+
+
+def columnar_item(source, index):
+    """
+    Gets single item of given columnar source. For record array the record
+    itself is returned, while for dict of arrays a new dict is created with the
+    values of all the columns.
+    
+    Args:
+        source: numpy.ndarray or {str: numpy.ndarray}
+            Columnar data source.
+        
+        index: int
+            Index of the item.
+    
+    Returns:
+        numpy.record or {str: any}
+            Source item.
+    """
+    
+    # get record
+    if isinstance(source, numpy.ndarray):
+        return source[index]
+    
+    # make item
+    return {key: column[index] for key, column in source.items()}
+
+
+def make_column(prop, func, source):
+    """
+    Evaluates given dynamic property function over all items of columnar
+    source.
+    
+    If the property or the function is marked as vectorized, the function is
+    called once with the whole source and the result is either broadcast
+    (single value) or used directly (numpy.ndarray or list of values). Numeric
+    arrays provided by vectorized functions are used as they are without
+    additional parsing. Otherwise the function is called for every item and
+    each value is parsed by given property.
+    
+    Args:
+        prop: pero.Property
+            Property to be evaluated.
+        
+        func: callable
+            Property function.
+        
+        source: numpy.ndarray or {str: numpy.ndarray}
+            Columnar data source.
+    
+    Returns:
+        numpy.ndarray
+            Values for all source items. Numeric values are stored as numeric
+            array while any other values as object array.
+    """
+    
+    # get size
+    size = columnar_size(source)
+    
+    # call vectorized
+    if prop.vectorized or getattr(func, 'vectorized', False):
+        values = func(source)
+        
+        # convert numpy scalar
+        if isinstance(values, numpy.generic) or (isinstance(values, numpy.ndarray) and values.ndim == 0):
+            values = values.item()
+        
+        # use numeric array directly
+        if isinstance(values, numpy.ndarray) and values.ndim == 1 and values.dtype.kind in 'biuf':
+            
+            if len(values) != size:
+                message = "Values of the '%s' property must match the source size! -> %d != %d" % (prop.name, len(values), size)
+                raise ValueError(message)
+            
+            return values
+        
+        # broadcast single value
+        if not isinstance(values, (numpy.ndarray, list)):
+            values = [prop.parse(values)] * size
+        
+        # parse values
+        else:
+            if len(values) != size:
+                message = "Values of the '%s' property must match the source size! -> %d != %d" % (prop.name, len(values), size)
+                raise ValueError(message)
+            
+            values = [prop.parse(v) for v in values]
+    
+    # call per item
+    else:
+        values = [prop.parse(func(columnar_item(source, i))) for i in range(size)]
+    
+    # make numeric array
+    if all(isinstance(v, (int, float)) for v in values):
+        return numpy.array(values)
+    
+    # make object array
+    column = numpy.empty(size, dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    
+    return column
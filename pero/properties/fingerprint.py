@@ -0,0 +1,144 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import hashlib
+import numpy
+
+# define constants
+FINGERPRINT_SIZE = 16
+FINGERPRINT_CHUNK = 1 << 20
+
+
+def make_fingerprint(*values):
+    """
+    Calculates content hash of given values, which is stable across runs. The
+    values are hashed recursively according to following rules:
+        
+        - numbers, strings, bytes and None are hashed by their type and value
+        - lists, tuples, sets and dicts are hashed item by item (sets and dicts
+          are ordered by the hash of their items or keys first)
+        - numpy arrays are hashed by their dtype, shape and raw data, which are
+          processed in chunks of FINGERPRINT_CHUNK bytes
+        - any object providing the 'fingerprint' method (e.g. pero.Color,
+          pero.Path or pero.PropertySet) is hashed using it
+        - classes are hashed by their module and qualified name
+        - other callables (e.g. functions, lambdas or methods) are hashed by
+          identity (qualified name and object id), so that different functions
+          never give the same hash, however, such hash is only valid within
+          current process
+        - any other object is hashed by its type and 'repr'
+    
+    Args:
+        values: any
+            Values to be hashed.
+    
+    Returns:
+        str
+            Hexadecimal digest.
+    """
+    
+    hasher = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+    
+    for value in values:
+        _update(hasher, value)
+    
+    return hasher.hexdigest()
+
+
+def _update(hasher, value):
+    """Updates given hasher by given value."""
+    
+    # none
+    if value is None:
+        hasher.update(b'N;')
+    
+    # bool
+    elif isinstance(value, (bool, numpy.bool_)):
+        hasher.update(b'b1;' if value else b'b0;')
+    
+    # numbers
+    elif isinstance(value, (int, numpy.integer)):
+        hasher.update(b'i%d;' % int(value))
+    
+    elif isinstance(value, (float, numpy.floating)):
+        hasher.update(b'f%s;' % repr(float(value)).encode())
+    
+    elif isinstance(value, complex):
+        hasher.update(b'c%s;' % repr(value).encode())
+    
+    # strings
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        hasher.update(b's%d:' % len(data))
+        hasher.update(data)
+    
+    elif isinstance(value, bytes):
+        hasher.update(b'y%d:' % len(value))
+        hasher.update(value)
+    
+    # numpy array
+    elif isinstance(value, numpy.ndarray):
+        _update_array(hasher, value)
+    
+    # sequences
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'l%d:' % len(value) if isinstance(value, list) else b't%d:' % len(value))
+        for item in value:
+            _update(hasher, item)
+    
+    # sets
+    elif isinstance(value, (set, frozenset)):
+        hasher.update(b'e%d:' % len(value))
+        for item in sorted(make_fingerprint(x) for x in value):
+            hasher.update(item.encode())
+    
+    # dicts
+    elif isinstance(value, dict):
+        hasher.update(b'd%d:' % len(value))
+        for key, item in sorted((make_fingerprint(k), v) for k, v in value.items()):
+            hasher.update(key.encode())
+            _update(hasher, item)
+    
+    # objects with fingerprint
+    elif callable(getattr(value, 'fingerprint', None)) and not isinstance(value, type):
+        hasher.update(b'o%s:' % _get_name(type(value)).encode())
+        hasher.update(value.fingerprint().encode())
+    
+    # classes
+    elif isinstance(value, type):
+        hasher.update(b'k%s;' % _get_name(value).encode())
+    
+    # callables
+    elif callable(value):
+        hasher.update(b'x%s@%d;' % (_get_name(value).encode(), id(value)))
+    
+    # other objects
+    else:
+        hasher.update(b'r%s:' % _get_name(type(value)).encode())
+        hasher.update(repr(value).encode('utf-8'))
+
+
+def _update_array(hasher, array):
+    """Updates given hasher by numpy array."""
+    
+    hasher.update(b'a%s%s:' % (array.dtype.str.encode(), str(array.shape).encode()))
+    
+    # hash objects
+    if array.dtype.hasobject:
+        for item in array.flat:
+            _update(hasher, item)
+        return
+    
+    # hash raw data in chunks
+    data = numpy.ascontiguousarray(array).reshape(-1).view(numpy.uint8)
+    for i in range(0, len(data), FINGERPRINT_CHUNK):
+        hasher.update(data[i:i+FINGERPRINT_CHUNK])
+
+
+def _get_name(obj):
+    """Gets qualified name of given class or function."""
+    
+    module = getattr(obj, '__module__', None) or ""
+    name = getattr(obj, '__qualname__', None) or getattr(obj, '__name__', None) or type(obj).__name__
+    
+    return "%s.%s" % (module, name)
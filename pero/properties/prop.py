@@ -2,8 +2,23 @@
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
 import numpy
+import itertools
+from .. enums import *
 from .. events import PropertyChangedEvt
-from . undefined import UNDEF
+from .. colors import Color
+from . undefined import UNDEF, Undefined
+
+# define immutable types safe to be shared as parsed default
+_SHARED_TYPES = (bool, int, float, complex, str, bytes, tuple, frozenset, type(None), Undefined, Color)
+
+# define collection types affected by change detection strategy
+_COLLECTION_TYPES = (numpy.ndarray, list, tuple, dict, set)
+
+# define max number of items compared by sampled strategy
+_SAMPLE_SIZE = 1024
+
+# init global revisions counter
+_REVISIONS = itertools.count(1)
 
 
 class Property(object):
@@ -19,6 +34,20 @@ class Property(object):
     This allows properties to be dynamic and provide specific values based on
     actual data.
     
+    The default value is parsed once when the property is created. If the parsed
+    value is immutable (or not converted at all), it is shared by all the
+    instances and stored into an instance only after a different value is set.
+    
+    The way how new values are compared to decide whether the property has
+    changed can be specified by the 'compare' attribute. This is applied to
+    collections (e.g. numpy.ndarray, list, tuple) only, other values are always
+    compared exactly. Beside the exact comparison, the values can be compared
+    by identity, by shape, type and a regular sample of items (arrays only) or
+    every assignment can be considered as a change, incrementing the property
+    version available by pero.PropertySet.get_property_version. Note that
+    with cheaper strategies the new value is always stored, even if it is not
+    reported as changed.
+    
     Attributes:
         
         name: str, (read-only)
@@ -38,10 +67,19 @@ class Property(object):
         
         nullable: bool (read-only)
             Specifies whether the property value can be set to None.
+        
+        vectorized: bool (read-only)
+            Specifies whether the dynamic value of the property can handle
+            whole columnar source at once and give the values for all its items
+            (e.g. as numpy.ndarray) instead of being called for every item.
+        
+        compare: pero.PROP_COMPARE (read-only)
+            Specifies the change detection strategy as any item from the
+            pero.PROP_COMPARE enum.
     """
     
     
-    def __init__(self, default=UNDEF, types=(), dynamic=True, nullable=False, name=None):
+    def __init__(self, default=UNDEF, types=(), dynamic=True, nullable=False, vectorized=False, compare=PROP_COMPARE_EXACT, name=None):
         """
         Initializes a new instance of Property.
         
@@ -61,6 +99,15 @@ class Property(object):
             nullable: bool
                 Specifies whether the property value can be set to None.
             
+            vectorized: bool
+                Specifies whether the dynamic value of the property can handle
+                whole columnar source at once and give the values for all its
+                items instead of being called for every item.
+            
+            compare: pero.PROP_COMPARE
+                Specifies the change detection strategy as any item from the
+                pero.PROP_COMPARE enum.
+            
             name: str
                 Property name.
         """
@@ -69,6 +116,13 @@ class Property(object):
         self._types = types
         self._dynamic = bool(dynamic)
         self._nullable = bool(nullable)
+        self._vectorized = bool(vectorized)
+        self._compare = compare
+        
+        # check compare
+        if compare not in PROP_COMPARE:
+            message = "Unknown change detection strategy specified! -> %s" % compare
+            raise ValueError(message)
         
         # check types
         if isinstance(types, list):
@@ -77,11 +131,11 @@ class Property(object):
         elif not isinstance(types, tuple):
             self._types = (types,)
         
-        # check default
-        self.parse(default)
-        
         # set default
-        self._default = default
+        self._default = UNDEF
+        self._shared = False
+        self._parsed = UNDEF
+        self._set_default(default)
     
     
     def __str__(self):
@@ -119,14 +173,18 @@ class Property(object):
                 raise RuntimeError('The property name is not set!')
             
             # get known value
-            if name in obj.__dict__:
-                return obj.__dict__[name]
+            values = obj.__dict__
+            if name in values:
+                return values[name]
+            
+            # use shared default
+            if self._shared:
+                return self._parsed
             
             # initialize by default value
-            else:
-                new_value = self.parse(self._default)
-                obj.__dict__[name] = new_value
-                return new_value
+            new_value = self.parse(self._default)
+            values[name] = new_value
+            return new_value
         
         # get property itself
         if objtype is not None:
@@ -144,7 +202,8 @@ class Property(object):
         If the 'obj' is set to an instance of PropertySet, given value is set to
         the instance. If the value is different from the one previously set,
         the pero.EVT_PROPERTY_CHANGED event is fired with current property
-        name and the old and the new values.
+        name and the old and the new values. If the instance is collecting
+        changes in a batch, the change is just stored and fired later.
         
         If the 'obj' is None given value is set as default value of the property
         itself.
@@ -162,37 +221,61 @@ class Property(object):
                 raise RuntimeError('The property name is not set!')
             
             # check lock
-            if obj.is_property_locked(name):
+            if obj._locked and name in obj._locked:
                 message = "The property '%s' is locked and cannot be changed!" % name
                 raise AttributeError(message)
             
             # check undefinable
-            if value is UNDEF and obj.is_property_held(name):
+            if value is UNDEF and obj._held and name in obj._held:
                 return
             
             # get old value
-            if name in obj.__dict__:
-                old_value = obj.__dict__[name]
+            values = obj.__dict__
+            if name in values:
+                old_value = values[name]
+            elif self._shared:
+                old_value = self._parsed
             else:
                 old_value = self.parse(self._default)
-                obj.__dict__[name] = old_value
+                values[name] = old_value
             
             # compare values
-            if type(old_value) != type(new_value):
+            compare = self._compare
+            exact = compare == PROP_COMPARE_EXACT or not isinstance(new_value, _COLLECTION_TYPES)
+            if not exact:
+                replace = self._compare_by(compare, obj, old_value, new_value)
+                values[name] = new_value
+            elif type(old_value) != type(new_value):
                 replace = True
             elif isinstance(old_value, numpy.ndarray):
                 replace = not numpy.array_equal(old_value, new_value)
             else:
                 replace = old_value != new_value
             
-            # set new value and raise changed event
+            # set new value
             if replace:
-                obj.__dict__[name] = new_value
-                obj.fire(PropertyChangedEvt(name=name, old_value=old_value, new_value=new_value))
+                values[name] = new_value
+                
+                # update revision
+                values['_revision'] = next(_REVISIONS)
+                
+                # raise changed event if anybody listens
+                if obj._callbacks:
+                    batch = obj._batch
+                    
+                    # fire event
+                    if batch is None:
+                        obj.fire(PropertyChangedEvt(name=name, old_value=old_value, new_value=new_value))
+                    
+                    # collect batch change
+                    elif name in batch:
+                        batch[name] = (batch[name][0], new_value, batch[name][2] and exact)
+                    else:
+                        batch[name] = (old_value, new_value, exact)
         
         # set class default
         else:
-            self._default = value
+            self._set_default(value)
     
     
     @property
@@ -247,6 +330,33 @@ class Property(object):
         return self._nullable
     
     
+    @property
+    def vectorized(self):
+        """
+        Gets the value indicating whether the dynamic value can handle whole
+        columnar source at once.
+        
+        Returns:
+            bool
+                True if the property is vectorized, False otherwise.
+        """
+        
+        return self._vectorized
+    
+    
+    @property
+    def compare(self):
+        """
+        Gets the change detection strategy.
+        
+        Returns:
+            pero.PROP_COMPARE
+                Change detection strategy.
+        """
+        
+        return self._compare
+    
+    
     @property
     def default(self):
         """
@@ -302,6 +412,61 @@ class Property(object):
         raise TypeError(message)
     
     
+    def _compare_by(self, compare, obj, old_value, new_value):
+        """Checks whether given collections differ using specified strategy."""
+        
+        # compare by identity
+        if compare == PROP_COMPARE_IDENTITY:
+            return old_value is not new_value
+        
+        # increase version
+        if compare == PROP_COMPARE_VERSION:
+            
+            if obj._versions is None:
+                obj._versions = {}
+            
+            obj._versions[self._name] = obj._versions.get(self._name, 0) + 1
+            return True
+        
+        # same object
+        if old_value is new_value:
+            return False
+        
+        # different type
+        if type(old_value) != type(new_value):
+            return True
+        
+        # compare samples
+        if isinstance(old_value, numpy.ndarray) and old_value.ndim:
+            
+            if old_value.shape != new_value.shape or old_value.dtype != new_value.dtype:
+                return True
+            
+            step = max(1, len(old_value) // _SAMPLE_SIZE)
+            if not numpy.array_equal(old_value[::step], new_value[::step]):
+                return True
+            
+            return not numpy.array_equal(old_value[-1], new_value[-1])
+        
+        # compare exactly
+        if isinstance(old_value, numpy.ndarray):
+            return not numpy.array_equal(old_value, new_value)
+        
+        return old_value != new_value
+    
+    
+    def _set_default(self, value):
+        """Sets and pre-parses default value."""
+        
+        # parse value
+        parsed = self.parse(value)
+        
+        # set default
+        self._default = value
+        self._parsed = parsed
+        self._shared = parsed is value or isinstance(parsed, _SHARED_TYPES)
+    
+    
     def clone(self, **kwargs):
         """
         Creates a clone of current property. Note that any custom property,
@@ -332,4 +497,10 @@ class Property(object):
         if 'nullable' not in kwargs:
             kwargs['nullable'] = self.nullable
         
+        if 'vectorized' not in kwargs:
+            kwargs['vectorized'] = self.vectorized
+        
+        if 'compare' not in kwargs:
+            kwargs['compare'] = self.compare
+        
         return self.__class__(**kwargs)
@@ -1,10 +1,15 @@
 #  Created byMartin.cz
 #  Copyright (c) Martin Strohalm. All rights reserved.
 
+import types
 import inspect
-from .. events import EvtHandler
+import collections
+import numpy
+from .. events import EvtHandler, PropertyChangedEvt
 from . undefined import UNDEF
-from . prop import Property
+from . prop import Property, _REVISIONS
+from . columns import make_column
+from . fingerprint import make_fingerprint
 
 # define property names splitter
 PROP_SPLITTER = '_'
@@ -12,6 +17,9 @@ PROP_SPLITTER = '_'
 # init properties cache
 _PROPERTIES_CACHE = {}
 
+# init records cache
+_RECORDS_CACHE = {}
+
 
 class Include(object):
     """
@@ -142,8 +150,16 @@ class PropertySetMeta(type):
                         raise KeyError(message)
                     cls_dict[prop.name] = prop
         
+        # init resolution plans cache
+        cls_dict['_plans'] = {}
+        
         # init new class
-        return type.__new__(cls, cls_name, bases, cls_dict)
+        new_cls = type.__new__(cls, cls_name, bases, cls_dict)
+        
+        # init shared properties table
+        new_cls._properties = types.MappingProxyType({p.name: p for p in new_cls.properties()})
+        
+        return new_cls
 
 
 class PropertySet(EvtHandler, metaclass=PropertySetMeta):
@@ -154,8 +170,31 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
     using the 'fire' method and specific listeners can be attached to it. By
     default only the pero.EVT_PROPERTY_CHANGED is fired every time a
     property is changed.
+    
+    The table of available properties is created once per class and shared by
+    all its instances. Instances store only the values different from the
+    defaults and the sets of locked and held properties are created on first
+    use only.
+    
+    Every change of a property value assigns a new revision number from a
+    global monotonically increasing counter. The revision of the property set
+    (see the 'revision' property) is the highest revision of itself and all its
+    child property sets, so any change deep in the tree is visible at the top.
+    The revision can be stored as a token and later used to check whether the
+    property set has changed since (see the 'is_dirty' method).
     """
     
+    _properties = types.MappingProxyType({})
+    _locked = None
+    _held = None
+    _batch = None
+    _batch_depth = 0
+    _versions = None
+    _revision = 0
+    _fingerprint = None
+    _fingerprinting = False
+    _generated = None
+    
     
     def __init__(self, **overrides):
         """
@@ -168,13 +207,9 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         
         super().__init__()
         
-        # get available properties
-        self._properties = {p.name: p for p in self.properties()}
-        self._locked = set()
-        self._held = set()
-        
         # set given properties
-        self.set_properties(overrides, True)
+        if overrides:
+            self.set_properties(overrides, True)
     
     
     def __call__(self, **overrides):
@@ -190,6 +225,125 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         self.set_properties(overrides, True)
     
     
+    @property
+    def revision(self):
+        """
+        Gets current revision of the property set including all its child
+        property sets.
+        
+        Returns:
+            int
+                Current revision.
+        """
+        
+        return self._get_revision(set())
+    
+    
+    def is_dirty(self, token):
+        """
+        Checks whether the property set or any of its child property sets has
+        changed since given revision token was taken.
+        
+        Args:
+            token: int or None
+                Previously retrieved revision. If set to None, the property set
+                is always considered as dirty.
+        
+        Returns:
+            bool
+                True if anything has changed, False otherwise.
+        """
+        
+        return token is None or self._get_revision(set()) > token
+    
+    
+    def touch(self):
+        """
+        Marks the property set as changed by assigning a new revision. This can
+        be used to signal changes not made through the properties, such as
+        modifications of mutable values or internal structures.
+        """
+        
+        self._revision = next(_REVISIONS)
+    
+    
+    def fingerprint(self, skip=None):
+        """
+        Gets content hash of current property set, which is stable across runs
+        and covers the values of all properties including child property sets
+        and numpy arrays. See pero.make_fingerprint for the hashing rules.
+        
+        Note that dynamic (callable) properties are hashed by identity of the
+        function, so the fingerprint of a property set using such properties
+        is valid within current process only. Automatically generated values
+        (e.g. default tag of pero.Graphics) are skipped, unless they are
+        explicitly replaced by other value.
+        
+        The value is cached and reused until any property of the set or its
+        children is changed (see 'revision'). In-place changes of mutable
+        values must be signaled by calling the 'touch' method.
+        
+        Args:
+            skip: (str,) or None
+                Names of the properties to be excluded from current set as
+                well as from all its child property sets.
+        
+        Returns:
+            str
+                Hexadecimal digest.
+        """
+        
+        skip = tuple(sorted(skip)) if skip else ()
+        revision = self.revision
+        
+        # use cached value
+        cache = self._fingerprint
+        if cache is not None and cache[0] == revision and cache[1] == skip:
+            return cache[2]
+        
+        # break cycle
+        if self._fingerprinting:
+            return "cycle"
+        
+        self._fingerprinting = True
+        
+        try:
+            
+            # hash properties
+            values = [self.__class__.__module__, self.__class__.__qualname__]
+            generated = self._generated
+            for name in sorted(self._properties):
+                
+                if name in skip:
+                    continue
+                
+                value = getattr(self, name)
+                if generated and name in generated and value is generated[name]:
+                    continue
+                
+                if isinstance(value, PropertySet):
+                    value = value.fingerprint(skip)
+                
+                elif isinstance(value, (list, tuple)) and value and isinstance(value[0], PropertySet):
+                    value = [v.fingerprint(skip) if isinstance(v, PropertySet) else v for v in value]
+                
+                values.append((name, value))
+            
+            # hash children
+            values.append([c.fingerprint(skip) for c in self._get_children()])
+            
+            # make hash
+            fingerprint = make_fingerprint(*values)
+        
+        finally:
+            del self._fingerprinting
+        
+        # store value
+        self._fingerprint = (revision, skip, fingerprint)
+        
+        return fingerprint
+    
+    
     def has_property(self, name):
         """
         Checks whether specified property exists.
@@ -257,8 +411,15 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
                 Property value.
         """
         
-        # get property path
-        parent, prop = self.get_property_path(name, True)[-2:]
+        # get resolution plan
+        plan = self._plans.get(name, None)
+        if plan is None:
+            plan = self._make_plan(name)
+        
+        # get property
+        parent, prop = self, plan[0]
+        if prop is None:
+            parent, prop = self.get_property_path(name, True)[-2:]
         
         # get value
         if overrides and name in overrides:
@@ -282,6 +443,177 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         return prop.parse(value)
     
     
+    def get_properties(self, names, source=UNDEF, overrides=None, native=False):
+        """
+        Gets the values of multiple properties at once. This is equivalent to
+        calling the 'get_property' method for each of the names but all the
+        values are resolved within a single loop.
+        
+        The values are returned as a lightweight named tuple, so they can be
+        either unpacked directly or accessed by property names. Note that the
+        record type is created and cached for every unique combination of
+        names, therefore the names should be typically provided as a tuple
+        constant defined by the caller. Any other sequence is converted to
+        tuple first.
+        
+        Args:
+            names: (str,)
+                Names of the properties to be retrieved.
+            
+            source: any
+                Data source to be used for retrieving the final value of
+                callable properties.
+            
+            overrides: dict or None
+                Highest priority properties to be used instead of current value.
+            
+            native: bool
+                If set to True callable properties are returned directly
+                without calling and using the source.
+        
+        Returns:
+            collections.namedtuple
+                Properties values.
+        """
+        
+        # ensure hashable names
+        if not isinstance(names, tuple):
+            names = tuple(names)
+        
+        # get record type
+        record = _RECORDS_CACHE.get(names, None)
+        if record is None:
+            record = collections.namedtuple('Properties', names, rename=True)
+            _RECORDS_CACHE[names] = record
+        
+        # init values
+        values = []
+        plans = self._plans
+        
+        # get values
+        for name in names:
+            
+            # get resolution plan
+            plan = plans.get(name, None)
+            if plan is None:
+                plan = self._make_plan(name)
+            
+            # get property
+            parent, prop = self, plan[0]
+            if prop is None:
+                parent, prop = self.get_property_path(name, True)[-2:]
+            
+            # get value
+            if overrides and name in overrides:
+                value = prop.parse(overrides[name])
+            else:
+                value = getattr(parent, prop.name)
+            
+            # finalize value
+            if not native and not isinstance(value, prop.types):
+                
+                # dynamic property
+                if callable(value):
+                    value = value(source)
+                
+                # parse value
+                value = prop.parse(value)
+            
+            values.append(value)
+        
+        return record._make(values)
+    
+    
+    def get_property_column(self, name, source, overrides=None):
+        """
+        Gets the values of specified property for all items of given columnar
+        source (i.e. numpy record array or dict of numpy arrays).
+        
+        If the property is static, its value is returned directly. If it is
+        dynamic, the values are evaluated for all the items and returned as an
+        array. Vectorized properties or functions (see pero.vectorized) are
+        called just once using the whole source.
+        
+        Args:
+            name: str
+                Name of the property to be retrieved.
+            
+            source: numpy.ndarray or {str: numpy.ndarray}
+                Columnar data source to be used for retrieving the final values
+                of callable properties.
+            
+            overrides: dict or None
+                Highest priority properties to be used instead of current value.
+        
+        Returns:
+            any or numpy.ndarray
+                Static property value or array of values for every item.
+        """
+        
+        # get property
+        parent, prop = self.get_property_path(name, True)[-2:]
+        
+        # get value
+        if overrides and name in overrides:
+            value = prop.parse(overrides[name])
+        else:
+            value = getattr(parent, prop.name)
+        
+        # static property
+        if isinstance(value, prop.types) or not callable(value):
+            return value
+        
+        # dynamic property
+        return make_column(prop, value, source)
+    
+    
+    def get_columns(self, source, overrides=None, skip=None):
+        """
+        Evaluates all dynamic properties of current property set for all items
+        of given columnar source (i.e. numpy record array or dict of numpy
+        arrays). Static properties are not included.
+        
+        Vectorized properties or functions (see pero.vectorized) are called
+        just once using the whole source, others are called for every item.
+        
+        Args:
+            source: numpy.ndarray or {str: numpy.ndarray}
+                Columnar data source to be used for retrieving the final values
+                of callable properties.
+            
+            overrides: dict or None
+                Highest priority properties to be used instead of current value.
+            
+            skip: (str,)
+                Collection of properties to skip.
+        
+        Returns:
+            {str: numpy.ndarray}
+                Values of all dynamic properties for every item.
+        """
+        
+        columns = {}
+        
+        # evaluate properties
+        for name, prop in self._properties.items():
+            
+            # skip property
+            if skip and name in skip:
+                continue
+            
+            # get value
+            if overrides and name in overrides:
+                value = prop.parse(overrides[name])
+            else:
+                value = getattr(self, name)
+            
+            # dynamic property
+            if callable(value) and not isinstance(value, prop.types):
+                columns[name] = make_column(prop, value, source)
+        
+        return columns
+    
+    
     def get_property_path(self, name, raise_error=False):
         """
         Gets the full path of specified property. It includes all the parents
@@ -306,32 +638,23 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
                 Property path or None if not found.
         """
         
-        # init path
-        path = [self]
+        # get resolution plan
+        plan = self._plans.get(name, None)
+        if plan is None:
+            plan = self._make_plan(name)
         
         # get known property
-        if name in self._properties:
-            return path + [self._properties[name]]
-        
-        # get first split
-        idx = name.find(PROP_SPLITTER)
+        prop, children = plan
+        if prop is not None:
+            return [self, prop]
         
         # search child properties
-        while idx > 0:
-            
-            # get parent name
-            parent = name[:idx]
-            
-            # check parent
-            if parent in self._properties:
-                parent_prop = getattr(self, parent)
-                if isinstance(parent_prop, PropertySet):
-                    child_prop = parent_prop.get_property_path(name[idx+1:])
-                    if child_prop:
-                        return path + child_prop
-            
-            # get next split
-            idx = name.find(PROP_SPLITTER, idx+1)
+        for parent, child in children:
+            parent_prop = getattr(self, parent)
+            if isinstance(parent_prop, PropertySet):
+                child_path = parent_prop.get_property_path(child)
+                if child_path:
+                    return [self] + child_path
         
         # raise error for unknown property
         if raise_error:
@@ -487,8 +810,10 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
                 to be set.
         """
         
-        for name, value in sorted(properties.items()):
-            self.set_property(name, value, raise_error)
+        # set properties
+        with self.batch_changes():
+            for name, value in sorted(properties.items()):
+                self.set_property(name, value, raise_error)
     
     
     def set_properties_from(self, prop_set, src_prefix="", dst_prefix="", source=UNDEF, overrides=None, skip=None, native=False):
@@ -546,32 +871,33 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         #     overrides = self.get_child_overrides(src_prefix, overrides, skip)
         
         # process source properties
-        for prop in prop_set.properties():
-            
-            # get source name without prefix
-            name = prop.name
-            if src_prefix and name.startswith(src_prefix):
-                name = name[len(src_prefix):]
-            elif src_prefix:
-                continue
-            
-            # finalize names
-            src_name = prop.name
-            dst_name = dst_prefix + name
-            
-            # skip property
-            if skip and src_name in skip:
-                continue
-            
-            # set shared properties
-            if dst_name in self._properties:
-                value = prop_set.get_property(src_name, source, overrides, native)
-                setattr(self, dst_name, value)
-            
-            # set child properties
-            elif self.has_property(dst_name):
-                value = prop_set.get_property(src_name, source, overrides, native)
-                self.set_property(dst_name, value)
+        with self.batch_changes():
+            for prop in prop_set.properties():
+                
+                # get source name without prefix
+                name = prop.name
+                if src_prefix and name.startswith(src_prefix):
+                    name = name[len(src_prefix):]
+                elif src_prefix:
+                    continue
+                
+                # finalize names
+                src_name = prop.name
+                dst_name = dst_prefix + name
+                
+                # skip property
+                if skip and src_name in skip:
+                    continue
+                
+                # set shared properties
+                if dst_name in self._properties:
+                    value = prop_set.get_property(src_name, source, overrides, native)
+                    setattr(self, dst_name, value)
+                
+                # set child properties
+                elif self.has_property(dst_name):
+                    value = prop_set.get_property(src_name, source, overrides, native)
+                    self.set_property(dst_name, value)
     
     
     def set_properties_to(self, prop_set, src_prefix="", dst_prefix="", source=UNDEF, overrides=None, skip=None, native=False):
@@ -629,32 +955,86 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         #     overrides = self.get_child_overrides(src_prefix, overrides, skip)
         
         # process current properties
-        for prop in self.properties():
-            
-            # get current name without prefix
-            name = prop.name
-            if src_prefix and name.startswith(src_prefix):
-                name = name[len(src_prefix):]
-            elif src_prefix:
-                continue
-            
-            # finalize names
-            src_name = prop.name
-            dst_name = dst_prefix + name
-            
-            # skip property
-            if skip and src_name in skip:
-                continue
-            
-            # set shared properties
-            if dst_name in prop_set._properties:
-                value = self.get_property(src_name, source, overrides, native)
-                setattr(prop_set, dst_name, value)
-            
-            # set child properties
-            elif prop_set.has_property(dst_name):
-                value = self.get_property(src_name, source, overrides, native)
-                prop_set.set_property(dst_name, value)
+        with prop_set.batch_changes():
+            for prop in self.properties():
+                
+                # get current name without prefix
+                name = prop.name
+                if src_prefix and name.startswith(src_prefix):
+                    name = name[len(src_prefix):]
+                elif src_prefix:
+                    continue
+                
+                # finalize names
+                src_name = prop.name
+                dst_name = dst_prefix + name
+                
+                # skip property
+                if skip and src_name in skip:
+                    continue
+                
+                # set shared properties
+                if dst_name in prop_set._properties:
+                    value = self.get_property(src_name, source, overrides, native)
+                    setattr(prop_set, dst_name, value)
+                
+                # set child properties
+                elif prop_set.has_property(dst_name):
+                    value = self.get_property(src_name, source, overrides, native)
+                    prop_set.set_property(dst_name, value)
+    
+    
+    def get_property_version(self, name):
+        """
+        Gets current version of specified property. The version is increased
+        by every assignment of a collection value to a property using the
+        pero.PROP_COMPARE_VERSION change detection strategy. For other
+        properties the version is always 0.
+        
+        If specified property is not found directly, child properties are
+        searched automatically considering the pero.PROP_SPLITTER character as
+        a splitter between parent and child property name.
+        
+        Args:
+            name: str
+                Name of the property.
+        
+        Returns:
+            int
+                Property version.
+        """
+        
+        # get property
+        parent, prop = self.get_property_path(name, True)[-2:]
+        
+        # get version
+        if parent._versions is None:
+            return 0
+        
+        return parent._versions.get(prop.name, 0)
+    
+    
+    def batch_changes(self):
+        """
+        Creates a context to change multiple properties at once. All the
+        changes made within the context are collected and a single
+        pero.EVT_PROPERTY_CHANGED event is fired when the outermost context is
+        closed, so the listeners can update their state just once.
+        
+        If only one property has effectively changed, standard event is fired.
+        If multiple properties have changed, the event 'name', 'old_value' and
+        'new_value' are set to None and all the changes are available in the
+        'changes' attribute. Properties reverted back to their original values
+        are not reported at all, unless they use other than exact comparison
+        strategy (see pero.PROP_COMPARE), in which case the strategy decision
+        made on assignment is kept.
+        
+        Returns:
+            pero.properties.propset.ChangesBatch
+                Context manager to be used within the 'with' statement.
+        """
+        
+        return ChangesBatch(self)
     
     
     def lock_property(self, name, lock=True, raise_error=True):
@@ -683,6 +1063,8 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         
         # lock/unlock known property
         if name in self._properties:
+            if self._locked is None:
+                self._locked = set()
             if lock:
                 self._locked.add(name)
             else:
@@ -724,6 +1106,8 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         
         # hold/release known property
         if name in self._properties:
+            if self._held is None:
+                self._held = set()
             if hold:
                 self._held.add(name)
             else:
@@ -764,7 +1148,7 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         
         # check known property
         if name in self._properties:
-            return name in self._locked
+            return bool(self._locked) and name in self._locked
         
         # get child property path
         path = self.get_property_path(name, raise_error)
@@ -800,7 +1184,7 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
         
         # check known property
         if name in self._properties:
-            return name in self._held
+            return bool(self._held) and name in self._held
         
         # get child property path
         path = self.get_property_path(name, raise_error)
@@ -870,14 +1254,106 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
             setattr(clone, name, value)
         
         # keep locks
-        clone._locked = set(self._locked)
+        if self._locked:
+            clone._locked = set(self._locked)
         
         # keep holds
-        clone._held = set(self._held)
+        if self._held:
+            clone._held = set(self._held)
+        
+        # keep generated values
+        if self._generated:
+            clone._generated = dict(self._generated)
         
         return clone
     
     
+    def _get_revision(self, visited):
+        """Gets the highest revision of current set and its children."""
+        
+        # mark as visited
+        visited.add(id(self))
+        
+        # get own revision
+        revision = self._revision
+        
+        # check child property sets
+        for child in self._get_children():
+            if id(child) not in visited:
+                revision = max(revision, child._get_revision(visited))
+        
+        return revision
+    
+    
+    def _get_children(self):
+        """Gets all child property sets directly used by current set."""
+        
+        children = []
+        properties = self._properties
+        
+        for name, value in self.__dict__.items():
+            
+            # skip non-properties
+            if name not in properties:
+                continue
+            
+            # check property set
+            if isinstance(value, PropertySet):
+                children.append(value)
+            
+            # check collection of property sets
+            elif isinstance(value, (list, tuple)) and value and isinstance(value[0], PropertySet):
+                children.extend(item for item in value if isinstance(item, PropertySet))
+        
+        return children
+    
+    
+    @classmethod
+    def _make_plan(cls, name):
+        """
+        Creates and caches resolution plan for specified property name. The plan
+        is stored as (property, children) tuple, where the property is set for
+        known properties of current class only. Otherwise the children contain
+        all possible (parent, child) name splits, for which the parent is a
+        known property. The splits are resolved against actual values when
+        used, therefore the plan stays valid even if any of the child property
+        sets is replaced.
+        """
+        
+        # get properties
+        properties = cls._properties
+        
+        # known property
+        if name in properties:
+            plan = (properties[name], ())
+        
+        # child properties
+        else:
+            
+            children = []
+            
+            # get first split
+            idx = name.find(PROP_SPLITTER)
+            
+            # get possible splits
+            while idx > 0:
+                
+                # add known parent
+                parent = name[:idx]
+                if parent in properties:
+                    children.append((parent, name[idx+1:]))
+                
+                # get next split
+                idx = name.find(PROP_SPLITTER, idx+1)
+            
+            plan = (None, tuple(children))
+        
+        # update cache
+        cls._plans[name] = plan
+        
+        return plan
+    
+    
     @classmethod
     def properties(cls):
         """
@@ -901,6 +1377,82 @@ class PropertySet(EvtHandler, metaclass=PropertySetMeta):
                 properties.append(item[1])
         
         # update cache
-        _PROPERTIES_CACHE[key] = tuple(properties)
+        properties = tuple(properties)
+        _PROPERTIES_CACHE[key] = properties
         
         return properties
+
+
+class ChangesBatch(object):
+    """
+    Allows using 'with' statement to collect property changes of
+    a pero.PropertySet and fire them as a single event.
+    """
+    
+    
+    def __init__(self, prop_set):
+        """
+        Initializes a new instance of ChangesBatch.
+        
+        Args:
+            prop_set: pero.PropertySet
+                Property set to collect the changes for.
+        """
+        
+        self._prop_set = prop_set
+    
+    
+    def __enter__(self):
+        """Starts collecting changes."""
+        
+        prop_set = self._prop_set
+        
+        # init batch
+        if not prop_set._batch_depth:
+            prop_set._batch = {}
+        
+        prop_set._batch_depth += 1
+        
+        return prop_set
+    
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Fires collected changes."""
+        
+        prop_set = self._prop_set
+        
+        # check nested batch
+        prop_set._batch_depth -= 1
+        if prop_set._batch_depth:
+            return
+        
+        # get changes
+        changes = prop_set._batch
+        del prop_set._batch
+        del prop_set._batch_depth
+        
+        # remove reverted changes of exactly compared properties
+        changes = {k: (o, n) for k, (o, n, exact) in changes.items() if not exact or _is_changed(o, n)}
+        if not changes:
+            return
+        
+        # fire single change
+        if len(changes) == 1:
+            name, (old_value, new_value) = changes.popitem()
+            prop_set.fire(PropertyChangedEvt(name=name, old_value=old_value, new_value=new_value))
+        
+        # fire all changes
+        else:
+            prop_set.fire(PropertyChangedEvt(changes=changes))
+
+
+def _is_changed(old_value, new_value):
+    """Checks whether given values are different."""
+    
+    if type(old_value) != type(new_value):
+        return True
+    
+    if isinstance(old_value, numpy.ndarray):
+        return not numpy.array_equal(old_value, new_value)
+    
+    return old_value != new_value
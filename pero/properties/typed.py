@@ -272,6 +272,10 @@ class IterProperty(Property):
         if not self._intypes:
             return value
         
+        # check float array at once
+        if isinstance(value, numpy.ndarray) and value.dtype == numpy.float64 and float in self._intypes:
+            return value
+        
         # check inner types
         for elm in value:
             if not isinstance(elm, self._intypes):
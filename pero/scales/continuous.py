@@ -247,7 +247,7 @@ class ContinuousScale(Scale):
         """Called after a property has changed."""
         
         # check in_range
-        if evt is None or evt.name in 'in_range':
+        if evt is None or 'in_range' in evt.names:
             self._in_min = 0
             self._in_max = 1
             if self.in_range and self.in_range[0] > self.in_range[1]:
@@ -255,7 +255,7 @@ class ContinuousScale(Scale):
                 self._in_max = 0
         
         # check out_range
-        if evt is None or evt.name == 'out_range':
+        if evt is None or 'out_range' in evt.names:
             self._out_min = 0
             self._out_max = 1
             if self.out_range and self.out_range[0] > self.out_range[1]:
@@ -339,5 +339,5 @@ class PowScale(ContinuousScale):
         """Called after a property has changed."""
         
         # check power
-        if evt is None or evt.name == 'power':
+        if evt is None or 'power' in evt.names:
             self.normalizer.power = self.power
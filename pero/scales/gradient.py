@@ -101,7 +101,7 @@ class GradientScale(Scale):
         """Called after a property has changed."""
         
         # update gradient
-        if evt is None or evt.name == 'out_range':
+        if evt is None or 'out_range' in evt.names:
             self._update_gradient()
 
 
@@ -175,5 +175,5 @@ class GradientPowScale(GradientScale):
         """Called after a property has changed."""
         
         # check power
-        if evt is None or evt.name == 'power':
+        if evt is None or 'power' in evt.names:
             self.normalizer.power = self.power
@@ -116,12 +116,12 @@ class LevelScale(Scale):
         """Called after a property has changed."""
         
         # check in_range
-        if evt is None or evt.name in 'in_range':
+        if evt is None or 'in_range' in evt.names:
             if self.in_range is None or self.in_range is UNDEF:
                 self.in_range = ()
         
         # check out_range
-        if evt is None or evt.name == 'out_range':
+        if evt is None or 'out_range' in evt.names:
             self._levels_idx = None
             if self.out_range is None or self.out_range is UNDEF:
                 self.out_range = ()
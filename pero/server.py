@@ -0,0 +1,633 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import io
+import os
+import stat
+import json
+import time
+import pickle
+import argparse
+import threading
+import collections
+import socketserver
+import http.server
+import urllib.parse
+import concurrent.futures
+import concurrent.futures.process
+from . import version
+from . backends import ExportPool, Image
+
+# define constants
+SERVER_PORT = 8000
+SERVER_MAX_SIZE = 64 * 1024 * 1024
+SERVER_TIMEOUT = 60
+SERVER_METRICS_SIZE = 1000
+
+# define output formats
+_FORMATS = {
+    'png': "image/png",
+    'jpg': "image/jpeg",
+    'jpeg': "image/jpeg",
+    'svg': "image/svg+xml",
+    'pdf': "application/pdf"}
+
+# define input types
+_PAYLOADS = {
+    'application/json': 'json',
+    'application/x-pero-dump': 'dump',
+    'application/zip': 'dump',
+    'application/python-pickle': 'pickle',
+    'application/x-python-pickle': 'pickle'}
+
+# define export options
+_OPTIONS = {
+    'width': float,
+    'height': float,
+    'draw_scale': float,
+    'line_scale': float,
+    'font_scale': float,
+    'dpi': int,
+    'quality': int,
+    'backend': str}
+
+
+class RenderServer(object):
+    """
+    Local HTTP render service converting images into PNG, JPEG, SVG or PDF.
+    The server listens either on TCP address or on Unix socket and renders
+    the requests by a pool of warm worker processes (see pero.ExportPool).
+    
+    The image is posted to '/render' endpoint as pero.Image JSON dump
+    ('application/json'), binary dump created by pero.Image.save method
+    ('application/x-pero-dump') or, if explicitly allowed, as pickled
+    pero.Graphics ('application/x-python-pickle'). The output format and
+    export options are specified by query parameters, e.g.
+    '/render?format=png&width=600&height=400&dpi=144'. Unless specified, the
+    size of the image is used.
+    
+    The number of requests being rendered or waiting for a worker is
+    limited and any request above the limit is rejected immediately by
+    '503 Service Unavailable' response. Basic throughput and latency metrics
+    are available as JSON at '/metrics' endpoint and '/health' endpoint can
+    be used for liveness checks. If any worker process dies unexpectedly,
+    the pool is restarted automatically.
+    
+    Note that unpickling data allows arbitrary code execution, therefore
+    pickled graphics should only be allowed for trusted clients.
+    """
+    
+    
+    def __init__(self, address=('127.0.0.1', SERVER_PORT), workers=None, max_pending=None, max_size=SERVER_MAX_SIZE, timeout=SERVER_TIMEOUT, allow_pickle=False, log=False):
+        """
+        Initializes a new instance of RenderServer.
+        
+        Args:
+            address: (str, int) or str
+                Host and port to listen on or path of the Unix socket.
+            
+            workers: int or None
+                Number of worker processes. If set to None, number of CPUs is
+                used. If set to 0, images are rendered within server threads.
+            
+            max_pending: int or None
+                Maximum number of requests being rendered or waiting for
+                a worker. If set to None, four times the number of workers
+                is used. If set to 0, the number is not limited.
+            
+            max_size: int
+                Maximum size of request data in bytes.
+            
+            timeout: float
+                Maximum time in seconds to wait for rendered image.
+            
+            allow_pickle: bool
+                If set to True, pickled graphics is accepted.
+            
+            log: bool
+                If set to True, requests are logged into stderr.
+        """
+        
+        # init pool
+        self._pool = ExportPool(workers)
+        self._pool_lock = threading.Lock()
+        
+        if max_pending is None:
+            max_pending = 4 * max(1, self._pool.workers)
+        
+        self._slots = threading.BoundedSemaphore(max_pending) if max_pending else None
+        self._max_size = max_size
+        self._timeout = timeout
+        self._allow_pickle = allow_pickle
+        self._log = log
+        
+        self._metrics = _Metrics()
+        self._thread = None
+        
+        # init server
+        if isinstance(address, str):
+            _remove_socket(address)
+            self._server = _UnixServer(address, _RenderHandler)
+        else:
+            self._server = _TCPServer(address, _RenderHandler)
+        
+        self._server.app = self
+    
+    
+    def __enter__(self):
+        """Enters context manager."""
+        
+        return self
+    
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stops the server."""
+        
+        self.close()
+    
+    
+    @property
+    def address(self):
+        """
+        Gets actual server address.
+        
+        Returns:
+            (str, int) or str
+                Host and port or path of the Unix socket.
+        """
+        
+        return self._server.server_address
+    
+    
+    def start(self):
+        """Starts serving requests within background thread."""
+        
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+    
+    
+    def serve_forever(self):
+        """Serves requests until the server is closed."""
+        
+        self._server.serve_forever()
+    
+    
+    def close(self):
+        """Stops the server and shuts down the worker processes."""
+        
+        # stop serving
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        
+        # close socket
+        self._server.server_close()
+        
+        if isinstance(self.address, str):
+            _remove_socket(self.address)
+        
+        # close pool
+        with self._pool_lock:
+            self._pool.close()
+    
+    
+    def get_metrics(self):
+        """
+        Gets current server metrics.
+        
+        Returns:
+            dict
+                Requests counts, throughput in requests per second and
+                latency and rendering time statistics in milliseconds.
+        """
+        
+        return self._metrics.get_stats()
+    
+    
+    def render(self, content_type, data, query):
+        """
+        Renders image from given request data.
+        
+        Args:
+            content_type: str or None
+                Request content type.
+            
+            data: bytes
+                Request data.
+            
+            query: str
+                Request query string.
+        
+        Returns:
+            (int, str, bytes)
+                Response status, content type and data.
+        """
+        
+        # get export options
+        try:
+            fmt, width, height, options = _parse_query(query)
+        except ValueError as exc:
+            return self._fail(400, str(exc))
+        
+        # get payload
+        kind = _get_kind(content_type, data)
+        
+        if kind is None:
+            return self._fail(415, "Unsupported content type! -> %s" % content_type)
+        
+        if kind == 'pickle' and not self._allow_pickle:
+            return self._fail(403, "Pickled graphics is not allowed!")
+        
+        payload = data if kind == 'pickle' else pickle.dumps(_Payload(kind, data), pickle.HIGHEST_PROTOCOL)
+        
+        # check queue
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            return self._fail(503, "Server is busy!", rejected=True)
+        
+        # submit job
+        self._metrics.update(pending=1)
+        
+        pool = self._pool
+        
+        try:
+            try:
+                future = pool.submit(payload, None, width, height, format=fmt, **options)
+            
+            except concurrent.futures.process.BrokenProcessPool:
+                pool = self._restart_pool(pool)
+                future = pool.submit(payload, None, width, height, format=fmt, **options)
+        
+        except Exception as exc:
+            self._done()
+            return self._fail(500, "%s: %s" % (exc.__class__.__name__, exc))
+        
+        future.add_done_callback(self._done)
+        
+        # wait for image
+        try:
+            duration, error, trace, image = future.result(self._timeout)
+        
+        except concurrent.futures.TimeoutError:
+            return self._fail(504, "Rendering timeout!")
+        
+        except concurrent.futures.process.BrokenProcessPool as exc:
+            self._restart_pool(pool)
+            return self._fail(500, "%s: %s" % (exc.__class__.__name__, exc))
+        
+        except Exception as exc:
+            return self._fail(500, "%s: %s" % (exc.__class__.__name__, exc))
+        
+        # check error
+        if error is not None:
+            return self._fail(422, error)
+        
+        self._metrics.update(rendered=1, duration=duration)
+        
+        return 200, _FORMATS[fmt], image
+    
+    
+    def _restart_pool(self, broken):
+        """Replaces broken pool by a new one unless already replaced."""
+        
+        with self._pool_lock:
+            
+            if self._pool is broken:
+                self._pool = ExportPool(broken.workers)
+                broken.close()
+            
+            return self._pool
+    
+    
+    def _done(self, future=None):
+        """Releases finished request slot."""
+        
+        self._metrics.update(pending=-1)
+        
+        if self._slots is not None:
+            self._slots.release()
+    
+    
+    def _fail(self, status, message, rejected=False):
+        """Creates error response."""
+        
+        if rejected:
+            self._metrics.update(rejected=1)
+        else:
+            self._metrics.update(failed=1)
+        
+        return status, "text/plain; charset=utf-8", message.encode('utf-8')
+
+
+class _Payload(object):
+    """Defers decoding of request data into worker process."""
+    
+    
+    def __init__(self, kind, data):
+        """Initializes a new instance of _Payload."""
+        
+        self.kind = kind
+        self.data = data
+    
+    
+    def __reduce__(self):
+        """Unpickles as decoded image."""
+        
+        return _load_image, (self.kind, self.data)
+
+
+class _Metrics(object):
+    """Collects server metrics."""
+    
+    
+    def __init__(self, size=SERVER_METRICS_SIZE):
+        """Initializes a new instance of _Metrics."""
+        
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        
+        self._counts = {'requests': 0, 'rendered': 0, 'failed': 0, 'rejected': 0, 'pending': 0}
+        self._latencies = collections.deque(maxlen=size)
+        self._durations = collections.deque(maxlen=size)
+    
+    
+    def update(self, duration=None, latency=None, **counts):
+        """Updates metrics by given values."""
+        
+        with self._lock:
+            
+            for key, value in counts.items():
+                self._counts[key] += value
+            
+            if duration is not None:
+                self._durations.append(duration)
+            
+            if latency is not None:
+                self._latencies.append(latency)
+    
+    
+    def get_stats(self):
+        """Gets current statistics."""
+        
+        with self._lock:
+            stats = dict(self._counts)
+            latencies = sorted(self._latencies)
+            durations = sorted(self._durations)
+        
+        uptime = time.perf_counter() - self._start
+        
+        stats['uptime'] = uptime
+        stats['throughput'] = stats['rendered'] / uptime if uptime else 0.
+        stats['latency'] = _get_summary(latencies)
+        stats['render_time'] = _get_summary(durations)
+        
+        return stats
+
+
+class _RenderHandler(http.server.BaseHTTPRequestHandler):
+    """Handles render server requests."""
+    
+    protocol_version = "HTTP/1.1"
+    server_version = "pero/%d.%d.%d" % version
+    
+    
+    def do_GET(self):
+        """Handles GET requests."""
+        
+        app = self.server.app
+        path = urllib.parse.urlsplit(self.path).path
+        
+        if path == '/health':
+            self._respond(200, "text/plain; charset=utf-8", b"OK")
+        
+        elif path == '/metrics':
+            data = json.dumps(app.get_metrics()).encode('utf-8')
+            self._respond(200, "application/json", data)
+        
+        else:
+            self._respond(404, "text/plain; charset=utf-8", b"Not found!")
+    
+    
+    def do_POST(self):
+        """Handles POST requests."""
+        
+        start = time.perf_counter()
+        app = self.server.app
+        url = urllib.parse.urlsplit(self.path)
+        
+        app._metrics.update(requests=1)
+        
+        # check path
+        if url.path != '/render':
+            self._respond(*app._fail(404, "Not found!"))
+            return
+        
+        # check size
+        try:
+            size = int(self.headers.get('Content-Length', ""))
+        except ValueError:
+            self._respond(*app._fail(411, "Missing content length!"))
+            return
+        
+        if size < 0:
+            self.close_connection = True
+            self._respond(*app._fail(400, "Invalid content length! -> %d" % size))
+            return
+        
+        if size > app._max_size:
+            self.close_connection = True
+            self._respond(*app._fail(413, "Request data too large! -> %d" % size))
+            return
+        
+        # read data
+        data = self.rfile.read(size)
+        
+        # render image
+        status, content_type, body = app.render(self.headers.get('Content-Type', None), data, url.query)
+        
+        # update metrics
+        if status == 200:
+            app._metrics.update(latency=time.perf_counter() - start)
+        
+        # send image
+        self._respond(status, content_type, body)
+    
+    
+    def address_string(self):
+        """Gets client address for logging."""
+        
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        
+        return "unix"
+    
+    
+    def log_message(self, format, *args):
+        """Logs message if enabled."""
+        
+        if self.server.app._log:
+            super().log_message(format, *args)
+    
+    
+    def _respond(self, status, content_type, body):
+        """Sends response."""
+        
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        
+        if status == 503:
+            self.send_header('Retry-After', "1")
+        
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _TCPServer(http.server.ThreadingHTTPServer):
+    """Threading HTTP server for TCP address."""
+    
+    request_queue_size = 128
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threading HTTP server for Unix socket."""
+    
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def serve(address=('127.0.0.1', SERVER_PORT), **options):
+    """
+    Runs render server until interrupted.
+    
+    Args:
+        address: (str, int) or str
+            Host and port to listen on or path of the Unix socket.
+        
+        options: str:any pairs
+            Additional parameters for pero.server.RenderServer.
+    """
+    
+    with RenderServer(address, **options) as server:
+        
+        try:
+            server.serve_forever()
+        
+        except KeyboardInterrupt:
+            pass
+
+
+def main(args=None):
+    """Runs render server from command line."""
+    
+    # parse arguments
+    parser = argparse.ArgumentParser(prog="python -m pero.server", description="Local pero render service.")
+    parser.add_argument('--host', default='127.0.0.1', help="host to listen on")
+    parser.add_argument('--port', type=int, default=SERVER_PORT, help="port to listen on")
+    parser.add_argument('--unix', default=None, help="path of Unix socket to listen on instead of TCP")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--max-pending', type=int, default=None, help="maximum number of pending requests")
+    parser.add_argument('--timeout', type=float, default=SERVER_TIMEOUT, help="rendering timeout in seconds")
+    parser.add_argument('--allow-pickle', action='store_true', help="accept pickled graphics from trusted clients")
+    parser.add_argument('--log', action='store_true', help="log requests")
+    args = parser.parse_args(args)
+    
+    # run server
+    serve(
+        address = args.unix or (args.host, args.port),
+        workers = args.workers,
+        max_pending = args.max_pending,
+        timeout = args.timeout,
+        allow_pickle = args.allow_pickle,
+        log = args.log)
+
+
+def _parse_query(query):
+    """Gets output format, size and export options from query string."""
+    
+    params = dict(urllib.parse.parse_qsl(query))
+    
+    # get format
+    fmt = params.pop('format', 'png').lower()
+    if fmt not in _FORMATS:
+        raise ValueError("Unsupported image format! -> %s" % fmt)
+    
+    # get options
+    options = {}
+    for name, value in params.items():
+        
+        if name not in _OPTIONS:
+            raise ValueError("Unknown option! -> %s" % name)
+        
+        try:
+            options[name] = _OPTIONS[name](value)
+        except ValueError:
+            raise ValueError("Invalid option value! -> %s=%s" % (name, value))
+    
+    # get size
+    width = options.pop('width', None)
+    height = options.pop('height', None)
+    
+    return fmt, width, height, options
+
+
+def _get_kind(content_type, data):
+    """Gets payload kind from content type or data."""
+    
+    # use content type
+    if content_type:
+        kind = _PAYLOADS.get(content_type.split(";")[0].strip().lower(), None)
+        if kind is not None:
+            return kind
+    
+    # check data
+    if data.startswith(b'PK'):
+        return 'dump'
+    
+    if data.lstrip().startswith(b'{'):
+        return 'json'
+    
+    return None
+
+
+def _load_image(kind, data):
+    """Creates image from request data."""
+    
+    if kind == 'json':
+        return Image.from_json(data.decode('utf-8'))
+    
+    return Image.load(io.BytesIO(data))
+
+
+def _get_summary(values):
+    """Gets summary statistics in milliseconds."""
+    
+    if not values:
+        return {'count': 0, 'mean': None, 'p50': None, 'p95': None, 'p99': None}
+    
+    count = len(values)
+    
+    return {
+        'count': count,
+        'mean': 1e3 * sum(values) / count,
+        'p50': 1e3 * values[int(0.50 * (count - 1))],
+        'p95': 1e3 * values[int(0.95 * (count - 1))],
+        'p99': 1e3 * values[int(0.99 * (count - 1))]}
+
+
+def _remove_socket(path):
+    """Removes stale Unix socket file."""
+    
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    
+    except OSError:
+        pass
+
+
+# run server
+if __name__ == '__main__':
+    
+    main()
@@ -0,0 +1,74 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import io
+import os
+import json
+import tempfile
+import pero
+
+
+class Lines(pero.Graphics):
+    """Testing graphics without text."""
+    
+    def draw(self, canvas, **overrides):
+        canvas.line_color = "red"
+        canvas.draw_line(0, 0, 10, 10)
+
+
+class Failing(pero.Graphics):
+    """Testing graphics raising an error."""
+    
+    def draw(self, canvas, **overrides):
+        raise ValueError("broken")
+
+
+class TestCase(unittest.TestCase):
+    """Test case for batch export."""
+    
+    
+    def test_serial(self):
+        """Tests whether jobs are rendered within current process."""
+        
+        buff = io.BytesIO()
+        graphics = Lines()
+        
+        jobs = [
+            (graphics, buff, 100, 50, {'format': 'json'}),
+            (Failing(), io.BytesIO(), 100, 50, {'format': 'json'}),
+            (graphics, io.BytesIO(), 200, 50, {'format': 'xyz'})]
+        
+        results = pero.export_many(jobs, workers=0)
+        
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual([r.ok for r in results], [True, False, False])
+        self.assertEqual(results[1].error, "ValueError: broken")
+        self.assertIn("broken", results[1].trace)
+        self.assertEqual(buff.getvalue(), pero.export_bytes(graphics, 'json', 100, 50))
+    
+    
+    def test_pool(self):
+        """Tests whether jobs are rendered by workers."""
+        
+        graphics = Lines()
+        finished = []
+        
+        with tempfile.TemporaryDirectory() as temp:
+            paths = [os.path.join(temp, "image%d.json" % i) for i in range(3)]
+            jobs = [(graphics, p, 100, 50) for p in paths]
+            
+            with pero.ExportPool(workers=1) as pool:
+                results = pool.export_many(jobs, callback=finished.append, chunksize=2)
+            
+            self.assertTrue(all(r.ok for r in results))
+            self.assertEqual(len(finished), 3)
+            
+            for path in paths:
+                with open(path, 'rb') as f:
+                    self.assertIn("draw_line", [c[0] for c in json.loads(f.read())['commands']])
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,114 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import io
+import os
+import json
+import tempfile
+import pero
+from pero.backends.export import get_extension, open_file
+
+
+class Lines(pero.Graphics):
+    """Testing graphics without text."""
+    
+    def draw(self, canvas, **overrides):
+        canvas.line_color = "red"
+        canvas.draw_line(0, 0, 10, 10)
+
+
+class Broken(pero.Graphics):
+    """Testing graphics failing while drawing."""
+    
+    def draw(self, canvas, **overrides):
+        canvas.draw_line(0, 0, 10, 10)
+        raise RuntimeError("Drawing failed!")
+
+
+class TestCase(unittest.TestCase):
+    """Test case for in-memory export."""
+    
+    
+    def test_extension(self):
+        """Tests whether format is determined correctly."""
+        
+        self.assertEqual(get_extension("image.PNG"), ".png")
+        self.assertEqual(get_extension("image.png", "svg"), ".svg")
+        self.assertEqual(get_extension(io.BytesIO(), ".JSON"), ".json")
+        self.assertEqual(get_extension(io.BytesIO()), "")
+    
+    
+    def test_open_file(self):
+        """Tests whether file objects are used without closing."""
+        
+        buff = io.BytesIO()
+        
+        with open_file(buff, binary=False) as f:
+            f.write("ä")
+        
+        self.assertFalse(buff.closed)
+        self.assertEqual(buff.getvalue(), "ä".encode('utf-8'))
+    
+    
+    def test_export_bytes(self):
+        """Tests whether bytes are exported."""
+        
+        data = pero.export_bytes(Lines(), 'json', 100, 50)
+        
+        self.assertIsInstance(data, bytes)
+        self.assertIn("draw_line", [c[0] for c in json.loads(data)['commands']])
+        
+        with self.assertRaises(ImportError):
+            pero.export_bytes(Lines(), 'xyz')
+    
+    
+    def test_export_file(self):
+        """Tests whether export into file object equals file export."""
+        
+        buff = io.BytesIO()
+        pero.export(Lines(), buff, 100, 50, format='json')
+        
+        with tempfile.TemporaryDirectory() as temp:
+            path = os.path.join(temp, "image.json")
+            pero.export(Lines(), path, 100, 50)
+            
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), buff.getvalue())
+            
+            with open(path, 'wb') as f:
+                pero.export(Lines(), f, 100, 50)
+            
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), buff.getvalue())
+
+    
+    
+    def test_export_failed(self):
+        """Tests whether failed export keeps previous file intact."""
+        
+        with tempfile.TemporaryDirectory() as temp:
+            
+            path = os.path.join(temp, "image.json")
+            with self.assertRaises(RuntimeError):
+                pero.export(Broken(), path, 100, 50)
+            
+            self.assertEqual(os.listdir(temp), [])
+            
+            pero.export(Lines(), path, 100, 50)
+            
+            with open(path, 'rb') as f:
+                data = f.read()
+            
+            with self.assertRaises(RuntimeError):
+                pero.export(Broken(), path, 100, 50)
+            
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), data)
+            
+            self.assertEqual(os.listdir(temp), ["image.json"])
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
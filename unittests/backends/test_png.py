@@ -0,0 +1,65 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import io
+import zlib
+import numpy
+import PIL.Image
+from pero.backends.png import PNGWriter, compress_rows, _adler32_combine
+
+
+class TestCase(unittest.TestCase):
+    """Test case for progressive PNG writer."""
+    
+    
+    def test_checksum(self):
+        """Tests whether checksums are combined correctly."""
+        
+        data1 = b"pero" * 10000
+        data2 = bytes(range(256)) * 300
+        
+        checksum = _adler32_combine(zlib.adler32(data1), zlib.adler32(data2), len(data2))
+        self.assertEqual(checksum, zlib.adler32(data1 + data2))
+    
+    
+    def test_rows(self):
+        """Tests whether image written by parts is decoded correctly."""
+        
+        rng = numpy.random.default_rng(0)
+        
+        for channels in (3, 4):
+            pixels = (rng.random((101, 37, channels)) * 255).astype(numpy.uint8)
+            
+            buff = io.BytesIO()
+            writer = PNGWriter(buff, 37, 101, alpha=channels == 4, dpi=300)
+            
+            writer.write_rows(pixels[:50])
+            writer.write_compressed(*compress_rows(pixels[50:]), 51)
+            writer.close()
+            
+            buff.seek(0)
+            image = PIL.Image.open(buff)
+            
+            self.assertEqual(image.mode, "RGBA" if channels == 4 else "RGB")
+            self.assertEqual(round(image.info['dpi'][0]), 300)
+            numpy.testing.assert_array_equal(numpy.asarray(image), pixels)
+    
+    
+    def test_size(self):
+        """Tests whether wrong number of rows is detected."""
+        
+        writer = PNGWriter(io.BytesIO(), 10, 10)
+        
+        with self.assertRaises(ValueError):
+            writer.write_rows(numpy.zeros((11, 10, 4), dtype=numpy.uint8))
+        
+        writer.write_rows(numpy.zeros((5, 10, 4), dtype=numpy.uint8))
+        
+        with self.assertRaises(ValueError):
+            writer.close()
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,158 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import numpy
+import pero
+
+try:
+    import cairo
+    from pero.backends.cairo import raster
+except ImportError:
+    cairo = None
+
+# define testing pixels as straight RGBA
+PIXELS = numpy.array([
+    [(255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 255)],
+    [(200, 100, 50, 128), (255, 255, 255, 0), (10, 20, 30, 255)]], dtype=numpy.uint8)
+
+
+class Surface(object):
+    """Testing image surface with padded rows."""
+    
+    
+    def __init__(self, pixels, stride, little):
+        """Initializes a new instance of Surface."""
+        
+        height, width = pixels.shape[:2]
+        
+        # premultiply colors
+        alpha = pixels[:, :, 3:].astype(float)
+        colors = numpy.round(pixels[:, :, :3] * alpha / 255.).astype(numpy.uint8)
+        
+        # order channels as in memory
+        if little:
+            order = numpy.concatenate((colors[:, :, ::-1], pixels[:, :, 3:]), axis=2)
+        else:
+            order = numpy.concatenate((pixels[:, :, 3:], colors), axis=2)
+        
+        # make padded buffer
+        data = numpy.full((height, stride), 0xAB, dtype=numpy.uint8)
+        data[:, :width*4] = order.reshape(height, width*4)
+        
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self.data = bytearray(data.tobytes())
+        self.colors = colors
+    
+    
+    def flush(self):
+        """Finishes drawing."""
+        
+        pass
+    
+    
+    def get_width(self):
+        """Gets width."""
+        
+        return self.width
+    
+    
+    def get_height(self):
+        """Gets height."""
+        
+        return self.height
+    
+    
+    def get_stride(self):
+        """Gets row stride."""
+        
+        return self.stride
+    
+    
+    def get_data(self):
+        """Gets raw data."""
+        
+        return memoryview(self.data)
+
+
+@unittest.skipUnless(cairo, "Cairo not available.")
+class TestCase(unittest.TestCase):
+    """Test case for cairo raster images."""
+    
+    
+    def test_get_image(self):
+        """Tests whether padded surface data are decoded correctly."""
+        
+        little = raster._LITTLE_ENDIAN
+        
+        try:
+            for endian in (True, False):
+                
+                raster._LITTLE_ENDIAN = endian
+                surface = Surface(PIXELS, 20, endian)
+                
+                # check RGBA
+                image = raster.get_image(surface, alpha=True)
+                data = numpy.asarray(image).astype(int)
+                
+                self.assertEqual(image.mode, "RGBA")
+                self.assertEqual(image.size, (3, 2))
+                numpy.testing.assert_array_equal(data[:, :, 3], PIXELS[:, :, 3])
+                
+                visible = PIXELS[:, :, 3] > 0
+                diff = numpy.abs(data[:, :, :3] - PIXELS[:, :, :3])
+                self.assertLessEqual(diff[visible].max(), 1)
+                
+                # check RGB
+                image = raster.get_image(surface, alpha=False)
+                
+                self.assertEqual(image.mode, "RGB")
+                numpy.testing.assert_array_equal(numpy.asarray(image), surface.colors)
+        
+        finally:
+            raster._LITTLE_ENDIAN = little
+    
+    
+    def test_pool(self):
+        """Tests whether released canvas is reset."""
+        
+        pool = raster.RasterPool()
+        canvas = pool.acquire(20, 10)
+        defaults = {p.name: canvas.get_property(p.name) for p in canvas.properties()}
+        
+        # change canvas
+        canvas.line_color = "red"
+        canvas.fill_color = "blue"
+        canvas.line_width = 5
+        canvas.draw_scale = 2
+        
+        canvas.view(2, 2, 5, 5)
+        canvas.clip(pero.Path().rect(0, 0, 2, 2))
+        canvas.fill("green")
+        
+        pool.release(canvas)
+        
+        # check reset
+        reused = pool.acquire(20, 10)
+        self.assertIs(reused, canvas)
+        
+        for name, value in defaults.items():
+            self.assertEqual(reused.get_property(name), value, name)
+        
+        self.assertEqual(reused.viewport.rect, (0, 0, 20, 10))
+        
+        pixels = numpy.asarray(raster.get_image(pool.get_surface(reused)))
+        self.assertFalse(pixels.any())
+        
+        # check clip removed
+        reused.fill("red")
+        
+        pixels = numpy.asarray(raster.get_image(pool.get_surface(reused), alpha=False))
+        self.assertTrue((pixels == (255, 0, 0)).all())
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
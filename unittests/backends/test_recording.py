@@ -0,0 +1,191 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import tempfile
+import os.path
+import json
+import io
+import numpy
+import pero
+
+
+def make_graphics():
+    """Creates testing graphics."""
+    
+    layout = pero.Layout(width=200, height=100)
+    
+    layout.add(pero.Circle(x=50, y=50, size=20, line_color="red", fill_color="blue"), 0, 0)
+    layout.add(pero.Rect(x=20, y=20, width=40, height=30, line_width=3, radius=(1, 2, 3, 4)), 0, 1)
+    layout.add(pero.Profile(x=numpy.arange(10.), y=numpy.arange(10.)**2, show_points=True), 1, 0, col_span=2)
+    
+    return layout
+
+
+def draw(canvas, graphics):
+    """Draws testing scene into given canvas."""
+    
+    graphics.draw(canvas)
+    
+    with canvas.group("bulk", "items"):
+        canvas.line_color = "green"
+        canvas.draw_circles([10, 20], [30, 40], 5, fill_colors=["red", None])
+        canvas.draw_rects([1, 2], [3, 4], 5, 6, radius=2)
+        canvas.draw_segments(0, 0, [10, 20], [30, 40], line_colors=["blue", "red"])
+        canvas.draw_markers(pero.Path().rect(-0.5, -0.5, 1, 1), [1, 2], [3, 4], 10)
+    
+    with canvas.view(10, 10, 50, 50):
+        canvas.draw_arc(10, 10, 5, 0, 1, False)
+        canvas.draw_lines(())
+        canvas.fill("yellow")
+
+
+def normalize(dump):
+    """Parses JSON dump and unifies numbers."""
+    
+    def norm(value):
+        if isinstance(value, (list, tuple)):
+            return [norm(v) for v in value]
+        if isinstance(value, dict):
+            return {k: norm(v) for k, v in value.items()}
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return value
+    
+    return norm(json.loads(dump))
+
+
+class TestCase(unittest.TestCase):
+    """Test case for recording canvas."""
+    
+    
+    def test_replay(self):
+        """Tests whether replay gives the same calls as direct drawing."""
+        
+        graphics = make_graphics()
+        
+        original = pero.json.JsonCanvas(width=200, height=100)
+        draw(original, graphics)
+        
+        recording = pero.recording.RecordingCanvas(width=200, height=100)
+        draw(recording, graphics)
+        
+        replayed = pero.json.JsonCanvas(width=200, height=100)
+        recording.replay(replayed)
+        
+        dump = normalize(original.get_json())
+        self.assertEqual(normalize(recording.get_json()), dump)
+        self.assertEqual(normalize(replayed.get_json()), dump)
+    
+    
+    def test_image(self):
+        """Tests whether image is recorded and restored from JSON."""
+        
+        image = pero.Image(width=200, height=100)
+        draw(image, make_graphics())
+        
+        restored = pero.Image.from_json(image.get_json())
+        self.assertEqual(len(restored), len(image))
+        self.assertEqual(normalize(restored.get_json()), normalize(image.get_json()))
+        
+        canvas = pero.json.JsonCanvas()
+        image.draw(canvas)
+        self.assertEqual(canvas.width, 200)
+    
+    
+    def test_tables(self):
+        """Tests whether values are interned."""
+        
+        canvas = pero.recording.RecordingCanvas()
+        path = pero.Path().rect(0, 0, 1, 1)
+        
+        for i in range(100):
+            canvas.line_color = "red" if i % 2 else "blue"
+            canvas.draw_text("Label", i, i)
+            canvas.draw_path(path)
+        
+        self.assertEqual(len(canvas), 300)
+        self.assertEqual(len(canvas._strings), 2)
+        self.assertEqual(len(canvas._values), 2)
+        self.assertEqual(len(canvas._paths), 1)
+        
+        path.line_to(5, 5)
+        canvas.draw_path(path)
+        self.assertEqual(len(canvas._paths), 2)
+        self.assertNotEqual(canvas._paths[0], canvas._paths[1])
+    
+    
+    def test_groups(self):
+        """Tests whether recording can be sliced by group."""
+        
+        canvas = pero.recording.RecordingCanvas()
+        canvas.line_color = "red"
+        
+        with canvas.clip(pero.Path().rect(0, 0, 10, 10)):
+            canvas.draw_line(0, 0, 1, 1)
+        
+        with canvas.group("outer"):
+            canvas.draw_circle(1, 2, 3)
+            with canvas.group("inner"):
+                canvas.draw_line(1, 2, 3, 4)
+        
+        canvas.draw_rect(1, 2, 3, 4)
+        
+        self.assertEqual(canvas.groups, ("outer", "inner"))
+        self.assertIsNone(canvas.get_group("unknown"))
+        
+        group = canvas.get_group("outer")
+        commands = [c[0] for c in json.loads(group.get_json())['commands']]
+        self.assertEqual(commands, ['set_property', 'group', 'draw_circle', 'group', 'draw_line', 'ungroup', 'ungroup'])
+        
+        group = canvas.get_group("inner")
+        commands = [c[0] for c in json.loads(group.get_json())['commands']]
+        self.assertEqual(commands, ['set_property', 'group', 'draw_line', 'ungroup'])    
+    
+    def test_dump(self):
+        """Tests whether recording is saved and loaded from binary dump."""
+        
+        image = pero.Image(width=200, height=100)
+        draw(image, make_graphics())
+        dump = normalize(image.get_json())
+        
+        with tempfile.TemporaryDirectory() as temp:
+            
+            path = os.path.join(temp, "image.pero")
+            image.save(path)
+            
+            # test mapped
+            loaded = pero.Image.load(path)
+            self.assertIsInstance(loaded, pero.Image)
+            self.assertIsInstance(loaded._floats, numpy.ndarray)
+            self.assertEqual((loaded.width, loaded.height), (200, 100))
+            self.assertEqual(normalize(loaded.get_json()), dump)
+            
+            # test replay
+            canvas = pero.json.JsonCanvas()
+            loaded.draw(canvas)
+            self.assertEqual(normalize(canvas.get_json()), dump)
+            
+            # test drawing into loaded
+            loaded.draw_text("Label", 1, 2)
+            self.assertEqual(len(loaded), len(image) + 1)
+            
+            # test numpy compatibility
+            with numpy.load(path) as data:
+                self.assertEqual(len(data['ops']), len(image))
+            
+            # release mapped file
+            del loaded
+        
+        # test file object and JSON conversion
+        stream = io.BytesIO()
+        pero.Image.from_json(image.get_json()).save(stream)
+        stream.seek(0)
+        
+        loaded = pero.Image.load(stream)
+        self.assertEqual(normalize(loaded.get_json()), dump)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,182 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import io
+import re
+import xml.etree.ElementTree as ET
+import numpy
+import pero
+from pero.backends.svg import SVGCanvas
+
+
+def make_canvas(stream=None, **kwargs):
+    """Creates testing canvas using any installed font."""
+    
+    font_name = sorted(pero.FONTS.families)[0]
+    return SVGCanvas(stream, width=200, height=100, font_name=font_name, **kwargs)
+
+
+def draw(canvas, clip=False, text_bgr=False):
+    """Draws testing scene into given canvas."""
+    
+    canvas.line_color = "red"
+    canvas.fill_color = "blue"
+    
+    canvas.draw_circle(10, 20, 5)
+    canvas.draw_lines(numpy.random.RandomState(0).rand(100, 2) * 100)
+    canvas.draw_polygon(((0, 0), (10.123, 0), (10, 10.005)))
+    canvas.draw_path(pero.Path().move_to(1, 2).line_to(3, 4).curve_to(5, 6, 7, 8, 9, 10).close())
+    canvas.draw_markers(pero.Path().rect(-0.5, -0.5, 1, 1), [1, 2], [3, 4], 10)
+    
+    with canvas.group("items"):
+        
+        if clip:
+            canvas.clip(pero.Path().rect(0, 0, 50, 50))
+        
+        if text_bgr:
+            canvas.text_bgr_color = "yellow"
+        
+        canvas.draw_text("Text", 10, 10)
+        canvas.draw_rects([1, 2], [3, 4], 5, 6)
+        
+        if clip:
+            canvas.unclip()
+
+
+def strip_defs(svg):
+    """Removes all defs from given SVG."""
+    
+    return re.sub(r"\s*<defs>.*?</defs>", "", svg, flags=re.S)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for SVG canvas."""
+    
+    
+    def test_stream(self):
+        """Tests whether streaming gives the same XML as buffering."""
+        
+        buffered = make_canvas()
+        draw(buffered)
+        
+        stream = io.StringIO()
+        streamed = make_canvas(stream)
+        draw(streamed)
+        streamed.finish()
+        
+        self.assertEqual(stream.getvalue(), buffered.get_xml())
+        self.assertRaises(ValueError, streamed.get_svg)
+        self.assertRaises(ValueError, buffered.finish)
+    
+    
+    def test_stream_defs(self):
+        """Tests whether streaming writes defs inline."""
+        
+        buffered = make_canvas()
+        draw(buffered, True, True)
+        
+        stream = io.StringIO()
+        streamed = make_canvas(stream)
+        draw(streamed, True, True)
+        streamed.finish()
+        
+        xml = stream.getvalue()
+        self.assertEqual(strip_defs(xml), strip_defs(buffered.get_xml()))
+        
+        # check defs
+        root = ET.fromstring(xml.split("\n", 3)[-1])
+        ids = [e.get('id') for e in root.iter() if e.tag.endswith("clipPath") or e.tag.endswith("filter")]
+        self.assertEqual(sorted(ids), sorted(list(buffered._clips) + list(buffered._filters)))
+        
+        # check defs precede usage
+        for name in ids:
+            self.assertLess(xml.index('id="%s"' % name), xml.index("url(#%s)" % name))
+    
+    
+    def test_format(self):
+        """Tests bulk coordinates formatting."""
+        
+        canvas = make_canvas()
+        canvas.draw_polygon(((0, 0), (10.123, -0.001), (10, 10.005), (1e6, 0.5)))
+        
+        points = re.search(r'points="([^"]*)"', canvas.get_svg()).group(1)
+        self.assertEqual(points, "0.0,0.0 10.12,-0.0 10.0,10.01 1000000.0,0.5")
+        
+        path = pero.Path().move_to(0.004, 1.006).line_to(3, 4).line_to(5, 6)
+        self.assertEqual(path.svg("  ", 2), "\n  M0.0 1.01 L3.0 4.0 L5.0 6.0")
+        self.assertEqual(path.svg(), "\nM0.004 1.006 L3 4 L5 6")
+    
+    
+    def test_compact(self):
+        """Tests compact output."""
+        
+        canvas = make_canvas(compact=True)
+        draw(canvas, True, True)
+        
+        xml = canvas.get_xml()
+        root = ET.fromstring(xml.split("\n", 3)[-1])
+        
+        # check styles
+        self.assertIn('<style>.p0{stroke:#ff0000;', xml)
+        self.assertEqual(xml.count('stroke="#ff0000"'), 1)
+        self.assertEqual(xml.count('class="p0 f1"'), 7)
+        self.assertNotIn(".t", xml)
+        
+        # check repeated markers
+        symbols = [e for e in root.iter() if e.tag.endswith("symbol")]
+        uses = [e for e in root.iter() if e.tag.endswith("use")]
+        self.assertEqual(len(symbols), 1)
+        self.assertEqual(len(uses), 1)
+        
+        # check relative paths
+        paths = [e.get('d') for e in root.iter() if e.tag.endswith("path")]
+        self.assertIn("M1 2l2 2c2 2 4 4 6 6z", paths)
+        
+        # check streaming
+        stream = io.StringIO()
+        streamed = make_canvas(stream, compact=True)
+        draw(streamed, True, True)
+        streamed.finish()
+        
+        self.assertEqual(strip_defs(stream.getvalue()), strip_defs(xml))
+    
+    
+    def test_compact_size(self):
+        """Tests whether single-use styles are kept inline."""
+        
+        canvas = make_canvas(compact=True)
+        canvas.line_color = "red"
+        canvas.draw_line(0, 0, 10, 10)
+        canvas.draw_text("Text", 10, 10)
+        
+        xml = canvas.get_xml()
+        self.assertNotIn("<style>", xml)
+        self.assertNotIn("xlink", xml)
+        self.assertIn('stroke="#ff0000"', xml)
+        
+        original = make_canvas()
+        original.line_color = "red"
+        original.draw_line(0, 0, 10, 10)
+        original.draw_text("Text", 10, 10)
+        
+        self.assertLess(len(xml), len(original.get_xml()))
+    
+    
+    def test_relative(self):
+        """Tests relative path data."""
+        
+        path = pero.Path().move_to(0.004, 1.006).line_to(3, 4).curve_to(4, 5, 6, 7, 8, 9).close()
+        path.move_to(1, 2).line_to(2, 2)
+        
+        svg = path.svg("", 2, relative=True)
+        self.assertEqual(svg, "\nm0.0 1.01 l3.0 2.99 c1.0 1.0 3.0 3.0 5.0 5.0 z\nm1.0 0.99 l1.0 0.0")
+        
+        # check round trip
+        parsed = pero.Path.from_svg(svg)
+        self.assertEqual(parsed.commands(), pero.Path.from_svg(path.svg("", 2)).commands())
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import json
+import numpy
+import pero
+
+
+def get_commands(canvas):
+    """Gets stored JSON commands."""
+    
+    return json.loads(canvas.get_json())['commands']
+
+
+class TestCase(unittest.TestCase):
+    """Test case for bulk drawing."""
+    
+    
+    def test_json(self):
+        """Tests whether bulk drawing is stored as single command."""
+        
+        canvas = pero.json.JsonCanvas()
+        canvas.draw_circles(numpy.arange(3), 5, [1, 2, 3], line_colors=["red", (0, 0, 255), None])
+        canvas.draw_segments(0, 0, numpy.array([1, 2]), numpy.array([3, 4]))
+        
+        commands = get_commands(canvas)
+        self.assertEqual(len(commands), 2)
+        
+        name, args = commands[0]
+        self.assertEqual(name, 'draw_circles')
+        self.assertEqual(args['xs'], [0, 1, 2])
+        self.assertEqual(args['ys'], [5, 5, 5])
+        self.assertEqual(args['radii'], [1, 2, 3])
+        self.assertEqual(args['line_colors'], ["#ff0000ff", "#0000ffff", None])
+        self.assertIsNone(args['fill_colors'])
+        
+        name, args = commands[1]
+        self.assertEqual(name, 'draw_segments')
+        self.assertEqual(args['x1s'], [0, 0])
+        self.assertEqual(args['y2s'], [3, 4])
+    
+    
+    def test_fallback(self):
+        """Tests whether generic implementation draws items one by one."""
+        
+        canvas = pero.json.JsonCanvas(line_color="green")
+        pero.Canvas.draw_rects(canvas, [1, 2], 3, 4, 5, fill_colors=numpy.array([[255, 0, 0], [0, 255, 0]]))
+        
+        commands = get_commands(canvas)
+        names = [c[0] for c in commands if c[0] != 'set_property']
+        self.assertEqual(names, ['draw_rect', 'draw_rect'])
+        self.assertEqual(commands[-2][1], {'x': 2, 'y': 3, 'width': 4, 'height': 5, 'radius': None})
+        
+        self.assertEqual(canvas.line_color, pero.Color("#008000"))
+        self.assertIsNone(canvas.fill_color)
+    
+    
+    def test_replay(self):
+        """Tests whether stored bulk drawing gives the same output."""
+        
+        xs = numpy.linspace(0, 10, 5)
+        path = pero.Path().circle(0, 0, 0.5)
+        colors = ["red", "blue", None, "#0f08", (0, 0, 0)]
+        
+        canvas = pero.json.JsonCanvas()
+        canvas.draw_markers(path, xs, xs, 2, line_colors=colors)
+        
+        fallback = pero.json.JsonCanvas()
+        pero.Canvas.draw_markers(fallback, path, xs, xs, 2, line_colors=colors)
+        
+        replayed = pero.json.JsonCanvas()
+        pero.Canvas.draw_json(replayed, canvas.get_json())
+        
+        self.assertEqual(get_commands(replayed), get_commands(canvas))
+        self.assertEqual(len([c for c in get_commands(fallback) if c[0] == 'draw_path']), 5)
+    
+    
+    def test_colors(self):
+        """Tests whether item colors are converted correctly."""
+        
+        canvas = pero.json.JsonCanvas(line_alpha=128)
+        
+        colors = canvas._get_bulk_colors(["red", None], 2)
+        self.assertEqual(colors, [pero.Color("#f00"), None])
+        
+        colors = canvas._get_bulk_colors(["red", None], 2, "line_")
+        self.assertEqual(colors, [pero.Color((255, 0, 0, 128)), pero.Color.Transparent])
+        
+        with self.assertRaises(ValueError):
+            canvas.draw_circles([1, 2, 3], 1, 1, fill_colors=["red"])
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
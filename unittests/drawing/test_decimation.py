@@ -0,0 +1,108 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import json
+import numpy
+import pero
+from PIL import Image, ImageDraw
+
+
+def rasterize(points, width=400, height=300):
+    """Draws given points as polyline."""
+    
+    image = Image.new('L', (width, height))
+    ImageDraw.Draw(image).line([tuple(p) for p in points.tolist()], fill=255, width=1)
+    
+    return numpy.asarray(image)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for polyline decimation."""
+    
+    
+    def test_monotonic(self):
+        """Tests whether monotonic lines are decimated losslessly."""
+        
+        rng = numpy.random.default_rng(0)
+        xs = numpy.linspace(0, 400, 100000)
+        ys = 150 + 80*numpy.sin(xs/15) + rng.normal(0, 20, len(xs))
+        points = numpy.column_stack((xs, ys))
+        
+        decimated = pero.drawing.decimate(points, 0.5)
+        self.assertLess(len(decimated), 5000)
+        self.assertEqual(tuple(decimated[0]), tuple(points[0]))
+        self.assertEqual(tuple(decimated[-1]), tuple(points[-1]))
+        self.assertTrue(numpy.array_equal(rasterize(decimated), rasterize(points)))
+        
+        decimated = pero.drawing.decimate(points[::-1, ::-1], 0.5)
+        self.assertLess(len(decimated), 5000)
+    
+    
+    def test_general(self):
+        """Tests whether general lines are simplified within tolerance."""
+        
+        angles = numpy.linspace(0, 20*numpy.pi, 50000)
+        radii = numpy.linspace(10, 140, 50000)
+        points = numpy.column_stack((150 + radii*numpy.cos(angles), 150 + radii*numpy.sin(angles)))
+        
+        decimated = pero.drawing.decimate(points, 0.5)
+        self.assertLess(len(decimated), len(points) / 2)
+        
+        # check deviation from segments
+        samples = points[::50, None, :]
+        starts = decimated[None, :-1, :]
+        diffs = decimated[None, 1:, :] - starts
+        
+        t = numpy.sum((samples - starts) * diffs, axis=2) / numpy.maximum(numpy.sum(diffs**2, axis=2), 1e-12)
+        nearest = starts + numpy.clip(t, 0, 1)[:, :, None] * diffs
+        dists = numpy.hypot(*(samples - nearest).transpose(2, 0, 1))
+        
+        self.assertLess(dists.min(axis=1).max(), 0.5)
+    
+    
+    def test_backtracking(self):
+        """Tests whether lines retracing themselves keep their extent."""
+        
+        values = numpy.tile([0., 100.], 10)
+        values[-1] = 82
+        points = numpy.column_stack((values, values))
+        
+        decimated = pero.drawing.decimate(points, 0.5)
+        self.assertEqual(decimated[:, 0].min(), 0)
+        self.assertEqual(decimated[:, 0].max(), 100)
+        self.assertEqual(tuple(decimated[-1]), (82, 82))
+        self.assertTrue(numpy.array_equal(decimated, points))
+    
+    
+    def test_skip(self):
+        """Tests whether small or undefined data are kept."""
+        
+        points = numpy.array([(0, 0), (1, 1), (2, 2)])
+        self.assertIs(pero.drawing.decimate(points, 0.5), points)
+        
+        points = numpy.column_stack((numpy.arange(100.), numpy.zeros(100)))
+        points[50, 1] = numpy.nan
+        self.assertEqual(len(pero.drawing.decimate(points, 0.5)), 100)
+    
+    
+    def test_canvas(self):
+        """Tests whether canvas decimation can be switched."""
+        
+        xs = numpy.linspace(0, 100, 10000)
+        points = numpy.column_stack((xs, numpy.sin(xs)))
+        
+        canvas = pero.json.JsonCanvas()
+        pero.Canvas.draw_lines(canvas, points)
+        
+        canvas.decimation = 0.5
+        pero.Canvas.draw_lines(canvas, points)
+        
+        commands = [c[1] for c in json.loads(canvas.get_json())['commands'] if c[0] == 'draw_path']
+        self.assertEqual(len(commands[0]['path']['commands']), 10000)
+        self.assertLess(len(commands[1]['path']['commands']), 1000)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,175 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import unittest.mock
+import tempfile
+import shutil
+import os.path
+import pero
+from pero.drawing import fonts
+
+
+class TestCase(unittest.TestCase):
+    """Test case for fonts and text measurement."""
+    
+    
+    def test_text_cache(self):
+        """Tests whether text cache works as LRU."""
+        
+        cache = pero.TextCache(size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        
+        cache.size = 1
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('a'), 1)
+        
+        cache.size = 0
+        cache.put('d', 4)
+        self.assertEqual(len(cache), 0)
+        
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+    
+    
+    @unittest.skipUnless(pero.FONTS.fonts, "No fonts available.")
+    def test_line_size(self):
+        """Tests whether line size is cached."""
+        
+        font = pero.FONTS.fonts[0]
+        canvas = pero.json.JsonCanvas(font_name=font.family)
+        
+        pero.TEXT_CACHE.clear()
+        size = canvas.get_line_size("Testing text")
+        self.assertEqual(pero.TEXT_CACHE.misses, 1)
+        
+        self.assertEqual(canvas.get_line_size("Testing text"), size)
+        self.assertEqual(pero.TEXT_CACHE.hits, 1)
+        
+        canvas = pero.json.JsonCanvas(font_name=font.family)
+        canvas.get_text_bbox("Testing text", angle=1)
+        self.assertEqual(pero.TEXT_CACHE.hits, 2)
+        
+        canvas.font_size = 20
+        self.assertNotEqual(canvas.get_line_size("Testing text"), size)
+        self.assertEqual(pero.TEXT_CACHE.misses, 2)
+    
+    
+    @unittest.skipUnless(pero.FONTS.fonts, "No fonts available.")
+    def test_fast_metrics(self):
+        """Tests whether fast metrics agree with PIL."""
+        
+        font = pero.FONTS.fonts[0]
+        
+        texts = ["", " ", "Testing text", "To AV LT", "1.2345e-10", "a\nb", "\u00e4\u00f6\u00fc \u03a9\u03bc", "\U0001F600 x"]
+        texts += ["%d: %.3f" % (i, i**1.5) for i in range(100)]
+        
+        for size in (8, 11, 17, 24):
+            
+            sizes = font.measure_many(texts, size)
+            self.assertEqual(sizes.shape, (len(texts), 2))
+            
+            for text, (width, height) in zip(texts, sizes):
+                exact = font.get_size(text, size, exact=True) if text else (0, 0)
+                self.assertLessEqual(abs(width - exact[0]), 1)
+                self.assertLessEqual(abs(height - exact[1]), 1)
+                self.assertEqual(font.get_size(text, size), (width, height))
+    
+    
+    @unittest.skipUnless(pero.FONTS.fonts, "No fonts available.")
+    def test_lazy_kerning(self):
+        """Tests whether kerning is measured for used pairs only."""
+        
+        font = pero.FONTS.fonts[0]
+        font.measure_many(["AV", "To", "AV x"], 13)
+        
+        metrics = font._metrics[13]
+        if metrics._exact:
+            self.skipTest("Fast metrics not used.")
+        
+        pairs = {(ord(a), ord(b)) for a, b in ("AV", "To", "V ", " x")}
+        kerned = set(zip(*metrics._kerned.nonzero()))
+        self.assertEqual(kerned, pairs)
+    
+    
+    @unittest.skipUnless(pero.FONTS.fonts, "No fonts available.")
+    def test_index(self):
+        """Tests whether fonts index is used and updated."""
+        
+        font = pero.FONTS.fonts[0]
+        
+        with tempfile.TemporaryDirectory() as temp:
+            
+            # init folders
+            folder = os.path.join(temp, "fonts")
+            cache = os.path.join(temp, "cache", "fonts.json")
+            os.makedirs(folder)
+            shutil.copy(font.path, os.path.join(folder, "test.ttf"))
+            
+            with unittest.mock.patch.object(fonts, '_get_system_paths', return_value=[folder]):
+                with unittest.mock.patch.object(fonts.Font, 'from_ttf', wraps=fonts.Font.from_ttf) as from_ttf:
+                    
+                    # test lazy loading
+                    manager = pero.FontManager(cache=cache)
+                    self.assertFalse(os.path.exists(cache))
+                    self.assertEqual(manager.families, (font.family,))
+                    self.assertTrue(os.path.exists(cache))
+                    self.assertGreater(from_ttf.call_count, 0)
+                    
+                    # test warm loading
+                    from_ttf.reset_mock()
+                    manager = pero.FontManager(cache=cache)
+                    self.assertEqual(manager.get_font(font.family).path, os.path.join(folder, "test.ttf"))
+                    self.assertEqual(from_ttf.call_count, 0)
+                    
+                    # test update
+                    shutil.copy(font.path, os.path.join(folder, "new.ttf"))
+                    manager = pero.FontManager(cache=cache)
+                    self.assertEqual(len(manager.get_fonts(font.family)), 2)
+                    self.assertTrue(all(c.args[0].endswith("new.ttf") for c in from_ttf.call_args_list))
+                    
+                    # test rebuild
+                    from_ttf.reset_mock()
+                    manager.rebuild()
+                    self.assertEqual(len(manager.get_fonts(font.family)), 2)
+                    self.assertTrue(any(c.args[0].endswith("test.ttf") for c in from_ttf.call_args_list))
+                    
+                    # test without index
+                    manager = pero.FontManager(cache=None)
+                    self.assertEqual(manager.families, (font.family,))
+    
+    
+    def test_set_fonts(self):
+        """Tests whether fonts can be exported and set."""
+        
+        definitions = (
+            ("/fonts/a.ttf", 0, "Font A", "Font A", "Regular"),
+            ("/fonts/a-bold.ttf", 0, "Font A", "Font A", "Bold"),
+            ("/fonts/b.ttc", 1, "Font B", "Font B", "Italic"))
+        
+        manager = pero.FontManager(cache=None)
+        manager.set_fonts(definitions)
+        
+        self.assertEqual(manager.families, ("Font A", "Font B"))
+        self.assertEqual(manager.get_font("Font A", weight=pero.FONT_WEIGHT_BOLD).path, "/fonts/a-bold.ttf")
+        self.assertEqual(manager.get_font("Font B").index, 1)
+        self.assertEqual(manager.export_fonts(), definitions)
+        
+        other = pero.FontManager(cache=None)
+        other.set_fonts(manager.export_fonts())
+        self.assertEqual(other.export_fonts(), definitions)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
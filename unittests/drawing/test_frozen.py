@@ -0,0 +1,231 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+from unittest import mock
+import numpy
+import pero
+
+
+class Line(pero.Graphics):
+    """Testing graphics using current canvas pen."""
+    
+    
+    def draw(self, canvas, source=pero.UNDEF, **overrides):
+        """Draws line."""
+        
+        canvas.draw_line(0, 0, 100, 100)
+
+
+class Holder(pero.Graphics):
+    """Testing graphics reading child properties without drawing it."""
+    
+    item = pero.Property(pero.UNDEF, types=(pero.Graphics,))
+    
+    
+    def draw(self, canvas, source=pero.UNDEF, **overrides):
+        """Draws line using item visibility."""
+        
+        if self.item.get_property('visible'):
+            canvas.draw_line(0, 0, 100, 100)
+
+
+class Mover(pero.Graphics):
+    """Testing graphics changing drawn arguments in place."""
+    
+    
+    def draw(self, canvas, source=pero.UNDEF, **overrides):
+        """Draws path and lines twice."""
+        
+        path = pero.Path().rect(0, 0, 10, 10)
+        points = [(0, 0), (10, 10)]
+        
+        canvas.draw_path(path)
+        canvas.draw_lines(points)
+        
+        path.transform(pero.Matrix().translate(50, 0))
+        points.append((20, 0))
+        
+        canvas.draw_path(path)
+        canvas.draw_lines(points)
+
+
+def make_graphics():
+    """Creates testing graphics."""
+    
+    layout = pero.Layout(width=200, height=100)
+    
+    layout.add(pero.Circle(x=50, y=50, size=20, line_color="red", fill_color="blue"), 0, 0)
+    layout.add(pero.Rect(x=20, y=20, width=40, height=30, line_width=3), 0, 1)
+    layout.add(pero.Profile(x=numpy.arange(10.), y=numpy.arange(10.)**2, show_points=True), 1, 0, col_span=2)
+    
+    return layout
+
+
+def draw(graphics):
+    """Draws graphics and returns JSON dump."""
+    
+    canvas = pero.json.JsonCanvas(width=200, height=100)
+    graphics.draw(canvas)
+    
+    return canvas.get_json()
+
+
+class TestCase(unittest.TestCase):
+    """Test case for frozen graphics."""
+    
+    
+    def test_draw(self):
+        """Tests whether frozen graphics gives the same output."""
+        
+        graphics = make_graphics()
+        frozen = graphics.freeze()
+        
+        self.assertIsInstance(frozen, pero.FrozenGraphics)
+        self.assertIs(frozen.graphics, graphics)
+        self.assertFalse(frozen.dynamic)
+        
+        original = draw(graphics)
+        self.assertEqual(draw(frozen), original)
+        self.assertEqual(draw(frozen), original)
+        self.assertEqual(len(frozen._programs), 1)
+    
+    
+    def test_changes(self):
+        """Tests whether changes of the graphics are reflected."""
+        
+        graphics = make_graphics()
+        frozen = graphics.freeze()
+        draw(frozen)
+        
+        graphics.cells[0].graphics.fill_color = "green"
+        self.assertEqual(draw(frozen), draw(graphics))
+        
+        graphics.fill_color = lambda d: "red"
+        self.assertTrue(frozen.dynamic)
+        self.assertEqual(draw(frozen), draw(graphics))
+        self.assertEqual(len(frozen._programs), 0)
+    
+    
+    def test_late_bound(self):
+        """Tests whether dynamic children are drawn late-bound."""
+        
+        graphics = make_graphics()
+        frozen = graphics.freeze()
+        
+        colors = ["red"]
+        graphics.cells[1].graphics.line_color = lambda d: colors[0]
+        self.assertFalse(frozen.dynamic)
+        
+        self.assertEqual(draw(frozen), draw(graphics))
+        self.assertEqual(len(frozen._programs), 1)
+        
+        colors[0] = "green"
+        self.assertEqual(draw(frozen), draw(graphics))
+        self.assertIn("#008000ff", draw(frozen))
+        self.assertEqual(len(frozen._programs), 1)
+    
+    
+    def test_parent_late_bound(self):
+        """Tests whether parents using dynamic children become late-bound."""
+        
+        visible = [True]
+        graphics = Holder(item=Line(visible=lambda d: visible[0]))
+        frozen = graphics.freeze()
+        
+        self.assertFalse(frozen.dynamic)
+        self.assertEqual(draw(frozen), draw(graphics))
+        self.assertTrue(frozen.dynamic)
+        
+        visible[0] = False
+        self.assertEqual(draw(frozen), draw(graphics))
+        self.assertEqual(len(frozen._programs), 0)
+    
+    
+    def test_canvas_state(self):
+        """Tests whether initial canvas state is respected."""
+        
+        graphics = Line()
+        frozen = graphics.freeze()
+        
+        canvas = pero.Image(width=200, height=100)
+        frozen.draw(canvas)
+        
+        canvas = pero.Image(width=200, height=100, line_color="red")
+        frozen.draw(canvas)
+        
+        original = pero.Image(width=200, height=100, line_color="red")
+        graphics.draw(original)
+        
+        self.assertEqual(canvas.get_json(), original.get_json())
+        self.assertEqual(len(frozen._programs), 2)
+    
+    
+    def test_mutable_args(self):
+        """Tests whether in-place changes of drawn arguments are not replayed."""
+        
+        graphics = Mover()
+        frozen = graphics.freeze()
+        
+        original = draw(graphics)
+        self.assertEqual(draw(frozen), original)
+        self.assertEqual(draw(frozen), original)
+    
+    
+    def test_same_canvas(self):
+        """Tests whether repeated drawing into the same canvas reuses the key."""
+        
+        graphics = make_graphics()
+        frozen = graphics.freeze()
+        
+        canvas = pero.json.JsonCanvas(width=200, height=100)
+        frozen.draw(canvas)
+        frozen.draw(canvas)
+        
+        with mock.patch.object(canvas.__class__, 'fingerprint', side_effect=AssertionError):
+            frozen.draw(canvas)
+        
+        original = pero.json.JsonCanvas(width=200, height=100)
+        for i in range(3):
+            graphics.draw(original)
+        
+        self.assertEqual(canvas.get_json(), original.get_json())
+        self.assertEqual(len(frozen._programs), 2)
+    
+    
+    def test_slots(self):
+        """Tests whether late-bound slots are removed after recording."""
+        
+        graphics = make_graphics()
+        child = graphics.cells[1].graphics
+        child.line_color = lambda d: "red"
+        
+        frozen = graphics.freeze()
+        draw(frozen)
+        
+        self.assertNotIn('draw', child.__dict__)
+        self.assertEqual(draw(frozen), draw(graphics))
+    
+    
+    def test_canvas(self):
+        """Tests whether different canvases are compiled separately."""
+        
+        graphics = make_graphics()
+        frozen = graphics.freeze()
+        
+        canvas = pero.json.JsonCanvas(width=300, height=100)
+        frozen.draw(canvas)
+        
+        self.assertEqual(draw(frozen), draw(graphics))
+        self.assertEqual(len(frozen._programs), 2)
+        
+        canvas = pero.json.JsonCanvas(width=300, height=100)
+        with canvas.view(10, 10, 100, 50):
+            frozen.draw(canvas)
+        
+        self.assertEqual(len(frozen._programs), 3)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -87,6 +87,24 @@ class TestCase(unittest.TestCase):
         
         self.assertEqual(layout.cells[0].frame.width, 100)
         self.assertEqual(layout.cols[0].width, 20)
+    
+    
+    def test_revision(self):
+        """Tests whether changes of cells are propagated to layout."""
+        
+        label = pero.TextLabel(text="a")
+        layout = pero.Layout(width=100, height=100)
+        layout.add(label, 0, 0)
+        
+        token = layout.revision
+        self.assertFalse(layout.is_dirty(token))
+        
+        label.text = "b"
+        self.assertTrue(layout.is_dirty(token))
+        
+        token = layout.revision
+        layout.add(pero.Graphics(), 0, 1)
+        self.assertTrue(layout.is_dirty(token))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import gc
+import weakref
+import pero
+
+
+class SampleEvt(pero.Event):
+    """Testing event."""
+    
+    TYPE = "sample"
+
+
+class Listener(object):
+    """Testing listener."""
+    
+    
+    def __init__(self, calls, label):
+        """Initializes a new instance of Listener."""
+        
+        self.calls = calls
+        self.label = label
+    
+    
+    def on_evt(self, evt, **kwargs):
+        """Stores the call."""
+        
+        self.calls.append((self.label, kwargs))
+
+
+class Owner(pero.EvtHandler):
+    """Testing handler listening to itself."""
+    
+    
+    def __init__(self):
+        """Initializes a new instance of Owner."""
+        
+        super().__init__()
+        
+        self.calls = []
+        self.bind(SampleEvt, self.on_evt)
+    
+    
+    def on_evt(self, evt, **kwargs):
+        """Stores the call."""
+        
+        self.calls.append(kwargs)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for EvtHandler class."""
+    
+    
+    def test_fire(self):
+        """Tests whether callbacks are called in reversed order with params."""
+        
+        calls = []
+        handler = pero.EvtHandler()
+        
+        listener1 = Listener(calls, 1)
+        listener2 = Listener(calls, 2)
+        
+        handler.bind(SampleEvt, listener1.on_evt)
+        handler.bind(SampleEvt, listener2.on_evt, a=1, b=2)
+        
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, [(2, {'a': 1, 'b': 2}), (1, {})])
+        
+        calls.clear()
+        handler.fire(SampleEvt(), b=3)
+        self.assertEqual(calls, [(2, {'a': 1, 'b': 3}), (1, {'b': 3})])
+    
+    
+    def test_cancel(self):
+        """Tests whether canceled event stops calling."""
+        
+        calls = []
+        handler = pero.EvtHandler()
+        
+        def on_evt(evt):
+            calls.append('cancel')
+            evt.cancel()
+        
+        listener = Listener(calls, 1)
+        handler.bind(SampleEvt, listener.on_evt)
+        handler.bind(SampleEvt, on_evt)
+        
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, ['cancel'])
+    
+    
+    def test_bind_changes(self):
+        """Tests whether dispatch table follows binding changes."""
+        
+        calls = []
+        handler = pero.EvtHandler()
+        
+        listener1 = Listener(calls, 1)
+        listener2 = Listener(calls, 2)
+        
+        handler.bind(SampleEvt, listener1.on_evt)
+        handler.fire(SampleEvt())
+        
+        handler.bind(SampleEvt, listener2.on_evt)
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, [(1, {}), (2, {}), (1, {})])
+        
+        calls.clear()
+        self.assertTrue(handler.unbind(SampleEvt, listener2.on_evt))
+        self.assertFalse(handler.unbind(SampleEvt, listener2.on_evt))
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, [(1, {})])
+    
+    
+    def test_unbind(self):
+        """Tests whether functions and methods can be unbound."""
+        
+        calls = []
+        handler = pero.EvtHandler()
+        listener = Listener(calls, 1)
+        
+        def on_evt(evt):
+            calls.append('func')
+        
+        def on_other(evt):
+            calls.append('other')
+        
+        handler.bind(SampleEvt, on_evt)
+        handler.bind(SampleEvt, listener.on_evt)
+        
+        self.assertFalse(handler.unbind(SampleEvt, on_other))
+        self.assertFalse(handler.unbind(SampleEvt, Listener(calls, 2).on_evt))
+        
+        self.assertTrue(handler.unbind(SampleEvt, on_evt))
+        self.assertFalse(handler.unbind(SampleEvt, on_evt))
+        
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, [(1, {})])
+        
+        calls.clear()
+        self.assertTrue(handler.unbind(SampleEvt, listener.on_evt))
+        self.assertFalse(handler.unbind(SampleEvt, listener.on_evt))
+        
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, [])
+        self.assertEqual(len(handler._callbacks[SampleEvt.TYPE]), 0)
+    
+    
+    def test_dead_callbacks(self):
+        """Tests whether callbacks of dead objects are removed."""
+        
+        calls = []
+        handler = pero.EvtHandler()
+        
+        listener1 = Listener(calls, 1)
+        listener2 = Listener(calls, 2)
+        
+        handler.bind(SampleEvt, listener1.on_evt)
+        handler.bind(SampleEvt, listener2.on_evt)
+        handler.fire(SampleEvt())
+        
+        calls.clear()
+        del listener2
+        gc.collect()
+        
+        handler.fire(SampleEvt())
+        self.assertEqual(calls, [(1, {})])
+        self.assertEqual(len(handler._callbacks[SampleEvt.TYPE]), 1)
+    
+    
+    def test_own_callbacks(self):
+        """Tests whether own callbacks do not keep the handler alive."""
+        
+        handler = Owner()
+        handler.fire(SampleEvt(), a=1)
+        self.assertEqual(handler.calls, [{'a': 1}])
+        
+        ref = weakref.ref(handler)
+        
+        gc.disable()
+        try:
+            del handler
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,222 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import json
+import numpy
+import pero
+
+
+class Item(pero.PropertySet):
+    """Testing property set."""
+    
+    size = pero.NumProperty(1)
+    width = pero.NumProperty(2, vectorized=True)
+    color = pero.ColorProperty("black")
+
+
+class TestCase(unittest.TestCase):
+    """Test case for columnar properties evaluation."""
+    
+    
+    def test_is_columnar(self):
+        """Tests whether columnar sources are recognized correctly."""
+        
+        records = numpy.array([(1, 2.), (3, 4.)], dtype=[('a', int), ('b', float)])
+        
+        self.assertTrue(pero.is_columnar(records))
+        self.assertTrue(pero.is_columnar({'a': numpy.arange(3), 'b': numpy.ones(3)}))
+        
+        self.assertFalse(pero.is_columnar(numpy.arange(3)))
+        self.assertFalse(pero.is_columnar({'a': numpy.arange(3), 'b': numpy.ones(2)}))
+        self.assertFalse(pero.is_columnar({'a': [1, 2, 3]}))
+        self.assertFalse(pero.is_columnar({}))
+        self.assertFalse(pero.is_columnar([(1, 2), (3, 4)]))
+        
+        self.assertEqual(pero.columnar_size(records), 2)
+        self.assertEqual(pero.columnar_item(records, 1)['a'], 3)
+        self.assertEqual(pero.columnar_item({'a': numpy.arange(3)}, 2), {'a': 2})
+    
+    
+    def test_get_property_column(self):
+        """Tests whether property values are evaluated over columnar source."""
+        
+        source = {'a': numpy.array([1., 2., 3.])}
+        calls = []
+        
+        def size(d):
+            calls.append(d)
+            return d['a'] * 2
+        
+        # static
+        prop_set = Item(size=5)
+        self.assertEqual(prop_set.get_property_column('size', source), 5)
+        
+        # per item
+        prop_set.size = size
+        column = prop_set.get_property_column('size', source)
+        numpy.testing.assert_array_equal(column, [2., 4., 6.])
+        self.assertEqual(len(calls), 3)
+        
+        # vectorized function
+        calls.clear()
+        prop_set.size = pero.vectorized(size)
+        column = prop_set.get_property_column('size', source)
+        numpy.testing.assert_array_equal(column, [2., 4., 6.])
+        self.assertEqual(len(calls), 1)
+        
+        # vectorized property
+        prop_set.width = lambda d: d['a'] + 1
+        column = prop_set.get_property_column('width', source)
+        numpy.testing.assert_array_equal(column, [2., 3., 4.])
+        
+        # broadcast
+        prop_set.width = lambda d: 7
+        column = prop_set.get_property_column('width', source)
+        numpy.testing.assert_array_equal(column, [7, 7, 7])
+        
+        # wrong size
+        prop_set.width = lambda d: d['a'][:2]
+        with self.assertRaises(ValueError):
+            prop_set.get_property_column('width', source)
+    
+    
+    def test_get_columns(self):
+        """Tests whether all dynamic properties are evaluated."""
+        
+        source = numpy.array([(1, "red"), (2, "blue")], dtype=[('a', int), ('c', 'U10')])
+        
+        prop_set = Item(size=lambda d: int(d['a']), color=lambda d: str(d['c']))
+        columns = prop_set.get_columns(source, overrides={'width': lambda d: d['a'] * 3})
+        
+        self.assertEqual(set(columns.keys()), {'size', 'width', 'color'})
+        numpy.testing.assert_array_equal(columns['size'], [1, 2])
+        numpy.testing.assert_array_equal(columns['width'], [3, 6])
+        self.assertEqual(columns['color'].dtype, object)
+        self.assertEqual(columns['color'][1], pero.Color.Blue)
+        
+        columns = prop_set.get_columns(source, skip=('color',))
+        self.assertEqual(set(columns.keys()), {'size'})
+    
+    
+    def test_draw_many(self):
+        """Tests whether columnar drawing gives the same output."""
+        
+        x = numpy.array([10., 20., 30.])
+        size = numpy.array([2., 4., 6.])
+        
+        marker = pero.Circle(
+            x = lambda d: d['x'],
+            size = lambda d: d['size'],
+            line_color = lambda d: "red" if d['size'] > 3 else "blue")
+        
+        rows = pero.json.JsonCanvas()
+        marker.draw_many(rows, [{'x': a, 'size': b} for a, b in zip(x, size)])
+        
+        columns = pero.json.JsonCanvas()
+        marker.draw_many(columns, {'x': x, 'size': size})
+        
+        self.assertEqual(columns.get_json(), rows.get_json())
+    
+    
+    def test_profile_points(self):
+        """Tests whether profile draws columnar data the same way."""
+        
+        x = numpy.array([10., 20., 30., 40.])
+        y = numpy.array([5., 15., 25., 35.])
+        data = numpy.array([(1, 2.), (2, 4.), (3, 6.), (4, 8.)], dtype=[('i', int), ('s', float)])
+        
+        profile = pero.Profile(
+            x = x,
+            y = y,
+            show_line = False,
+            show_points = True,
+            clip = pero.Frame(0, 0, 32, 100),
+            marker = pero.MARKER_CROSS,
+            marker_size = pero.vectorized(lambda d: d['s']),
+            marker_line_color = lambda d: "red" if d['i'] % 2 else "blue")
+        
+        profile.data = data
+        columns = pero.json.JsonCanvas()
+        profile.draw(columns)
+        
+        profile.data = [data[i] for i in range(len(data))]
+        profile.marker_size = lambda d: d['s']
+        rows = pero.json.JsonCanvas()
+        profile.draw(rows)
+        
+        self.assertEqual(columns.get_json(), rows.get_json())
+    
+    
+    def test_profile_markers(self):
+        """Tests whether profile draws columnar symbol markers at once."""
+        
+        x = numpy.array([10., 20., 30., 40.])
+        y = numpy.array([5., 15., 25., 35.])
+        data = numpy.array([(1, 2.), (2, 4.), (3, 6.), (4, 8.)], dtype=[('i', int), ('s', float)])
+        
+        profile = pero.Profile(
+            x = x,
+            y = y,
+            data = data,
+            show_line = False,
+            show_points = True,
+            clip = pero.Frame(0, 0, 32, 100),
+            marker = pero.MARKER_SQUARE,
+            marker_size = pero.vectorized(lambda d: d['s']),
+            marker_fill_color = lambda d: "red" if d['i'] % 2 else "blue")
+        
+        canvas = pero.json.JsonCanvas()
+        profile.draw(canvas)
+        
+        commands = json.loads(canvas.get_json())['commands']
+        commands = [c for c in commands if c[0].startswith('draw_')]
+        self.assertEqual(len(commands), 1)
+        
+        name, params = commands[0]
+        self.assertEqual(name, 'draw_markers')
+        self.assertEqual(params['xs'], [10., 20., 30.])
+        self.assertEqual(params['sizes'], [2., 4., 6.])
+        self.assertEqual(params['fill_colors'], ["#ff0000ff", "#0000ffff", "#ff0000ff"])
+        self.assertIsNone(params['line_colors'])
+    
+    
+    def test_band_markers(self):
+        """Tests whether band draws columnar symbol markers at once."""
+        
+        x = numpy.array([10., 20., 30., 40.])
+        y1 = numpy.array([5., 15., 25., 35.])
+        y2 = numpy.array([50., 150., 60., 70.])
+        data = numpy.array([(1, 2.), (2, 4.), (3, 6.), (4, 8.)], dtype=[('i', int), ('s', float)])
+        
+        band = pero.Band(
+            x = x,
+            y1 = y1,
+            y2 = y2,
+            data = data,
+            show_line = False,
+            show_area = False,
+            show_points = True,
+            clip = pero.Frame(0, 0, 32, 100),
+            marker = pero.MARKER_CIRCLE,
+            marker_size = pero.vectorized(lambda d: d['s']),
+            marker_fill_color = lambda d: "red" if d['i'] % 2 else "blue")
+        
+        canvas = pero.json.JsonCanvas()
+        band.draw(canvas)
+        
+        commands = json.loads(canvas.get_json())['commands']
+        commands = [c for c in commands if c[0].startswith('draw_')]
+        self.assertEqual(len(commands), 1)
+        
+        name, params = commands[0]
+        self.assertEqual(name, 'draw_markers')
+        self.assertEqual(params['xs'], [10., 20., 30., 10., 30.])
+        self.assertEqual(params['ys'], [5., 15., 25., 50., 60.])
+        self.assertEqual(params['sizes'], [2., 4., 6., 2., 6.])
+        self.assertEqual(params['fill_colors'], ["#ff0000ff", "#0000ffff", "#ff0000ff", "#ff0000ff", "#ff0000ff"])
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
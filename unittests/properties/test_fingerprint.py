@@ -0,0 +1,172 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import numpy
+import pero
+
+
+class Child(pero.PropertySet):
+    """Testing child property set."""
+    
+    size = pero.NumProperty(1)
+    color = pero.ColorProperty("black")
+
+
+class Parent(pero.PropertySet):
+    """Testing parent property set."""
+    
+    child = pero.Property(pero.UNDEF, types=(pero.PropertySet,), nullable=True)
+    data = pero.Property(None, nullable=True)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for content fingerprints."""
+    
+    
+    def test_make_fingerprint(self):
+        """Tests whether values are hashed correctly."""
+        
+        make = pero.make_fingerprint
+        
+        self.assertEqual(make(1, "a", None), make(1, "a", None))
+        self.assertEqual(make({'a': 1, 'b': 2}), make({'b': 2, 'a': 1}))
+        self.assertEqual(make({1, "x"}), make({"x", 1}))
+        self.assertEqual(make(numpy.arange(5.)), make(numpy.arange(5.)))
+        self.assertEqual(make(numpy.float64(1.5)), make(1.5))
+        
+        self.assertNotEqual(make(1), make(1.))
+        self.assertNotEqual(make(1), make("1"))
+        self.assertNotEqual(make(True), make(1))
+        self.assertNotEqual(make([1, 2]), make((1, 2)))
+        self.assertNotEqual(make(["ab"]), make(["a", "b"]))
+        self.assertNotEqual(make(numpy.arange(4)), make(numpy.arange(4).reshape(2, 2)))
+        self.assertNotEqual(make(numpy.arange(4)), make(numpy.arange(4.)))
+        
+        # check stable value
+        self.assertEqual(make(1, "a", (2.5, None)), "8150ffd7d5c4f084c6eace1d72727541")
+    
+    
+    def test_chunks(self):
+        """Tests whether big arrays are hashed in chunks."""
+        
+        data = numpy.arange(400000, dtype=float)
+        fingerprint = pero.make_fingerprint(data)
+        
+        self.assertEqual(pero.make_fingerprint(data[::-1][::-1]), fingerprint)
+        
+        data[-1] = 0
+        self.assertNotEqual(pero.make_fingerprint(data), fingerprint)
+    
+    
+    def test_callables(self):
+        """Tests whether callables are hashed by identity."""
+        
+        func1 = lambda d: d
+        func2 = lambda d: d
+        
+        self.assertEqual(pero.make_fingerprint(func1), pero.make_fingerprint(func1))
+        self.assertNotEqual(pero.make_fingerprint(func1), pero.make_fingerprint(func2))
+        self.assertEqual(pero.make_fingerprint(pero.Frame), pero.make_fingerprint(pero.Frame))
+    
+    
+    def test_property_set(self):
+        """Tests whether property set fingerprint follows changes."""
+        
+        child = Child()
+        parent = Parent(child=child, data=numpy.arange(3))
+        fingerprint = parent.fingerprint()
+        
+        self.assertEqual(parent.fingerprint(), fingerprint)
+        self.assertEqual(Parent(child=Child(), data=numpy.arange(3)).fingerprint(), fingerprint)
+        
+        child.size = 2
+        self.assertNotEqual(parent.fingerprint(), fingerprint)
+        
+        child.size = 1
+        self.assertEqual(parent.fingerprint(), fingerprint)
+        
+        parent.data.fill(0)
+        self.assertEqual(parent.fingerprint(), fingerprint)
+        
+        parent.touch()
+        self.assertNotEqual(parent.fingerprint(), fingerprint)
+        
+        parent.child = parent
+        self.assertEqual(len(parent.fingerprint()), 32)
+    
+    
+    def test_skip(self):
+        """Tests whether properties can be skipped."""
+        
+        circle1 = pero.Circle(size=5, tag="circle1")
+        circle2 = pero.Circle(size=5, tag="circle2")
+        
+        self.assertNotEqual(circle1.fingerprint(), circle2.fingerprint())
+        self.assertEqual(circle1.fingerprint(skip=('tag',)), circle2.fingerprint(skip=('tag',)))
+        
+        layout1 = pero.Layout()
+        layout1.add(circle1, 0, 0)
+        layout2 = pero.Layout()
+        layout2.add(circle2, 0, 0)
+        
+        self.assertEqual(layout1.fingerprint(skip=('tag',)), layout2.fingerprint(skip=('tag',)))
+        
+        circle2.size = 6
+        self.assertNotEqual(layout1.fingerprint(skip=('tag',)), layout2.fingerprint(skip=('tag',)))
+    
+    
+    def test_generated_tag(self):
+        """Tests whether automatically generated tags are skipped."""
+        
+        def make_layout(size):
+            layout = pero.Layout()
+            layout.add(pero.Circle(size=size), 0, 0)
+            layout.add(pero.Rect(width=10, height=5), 0, 1)
+            return layout
+        
+        layout1 = make_layout(5)
+        layout2 = make_layout(5)
+        self.assertEqual(layout1.fingerprint(), layout2.fingerprint())
+        
+        circle = pero.Circle(size=5)
+        self.assertEqual(circle.clone().fingerprint(), circle.fingerprint())
+        
+        self.assertNotEqual(make_layout(6).fingerprint(), layout1.fingerprint())
+        
+        layout2.tag = "layout"
+        self.assertNotEqual(layout1.fingerprint(), layout2.fingerprint())
+    
+    
+    def test_objects(self):
+        """Tests fingerprints of colors, gradients, frames and paths."""
+        
+        self.assertEqual(pero.Color("#f00").fingerprint(), pero.Color(255, 0, 0).fingerprint())
+        self.assertNotEqual(pero.Color("#f00").fingerprint(), pero.Color("#f008").fingerprint())
+        
+        gradient = pero.Gradient(("red", "blue"))
+        self.assertEqual(gradient.fingerprint(), pero.Gradient(("#f00", "#00f")).fingerprint())
+        self.assertNotEqual(gradient.fingerprint(), pero.Gradient(("red", "blue"), (0, 2)).fingerprint())
+        
+        frame = pero.Frame(1, 2, 3, 4)
+        fingerprint = frame.fingerprint()
+        self.assertEqual(pero.Frame(1, 2, 3, 4).fingerprint(), fingerprint)
+        
+        frame.offset(1, 1)
+        self.assertNotEqual(frame.fingerprint(), fingerprint)
+        
+        path = pero.Path().rect(0, 0, 10, 10)
+        fingerprint = path.fingerprint()
+        self.assertEqual(pero.Path().rect(0, 0, 10, 10).fingerprint(), fingerprint)
+        
+        path.line_to(5, 5)
+        self.assertNotEqual(path.fingerprint(), fingerprint)
+        
+        fingerprint = path.fingerprint()
+        path.fill_rule = pero.WINDING
+        self.assertNotEqual(path.fingerprint(), fingerprint)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
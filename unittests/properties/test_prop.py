@@ -0,0 +1,129 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import numpy
+import pero
+
+
+class Item(pero.PropertySet):
+    """Testing property set."""
+    
+    exact = pero.SequenceProperty(pero.UNDEF)
+    identity = pero.SequenceProperty(pero.UNDEF, compare=pero.PROP_COMPARE_IDENTITY)
+    version = pero.SequenceProperty(pero.UNDEF, compare=pero.PROP_COMPARE_VERSION)
+    sampled = pero.SequenceProperty(pero.UNDEF, compare=pero.PROP_COMPARE_SAMPLED)
+    size = pero.NumProperty(1, compare=pero.PROP_COMPARE_IDENTITY)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for Property class."""
+    
+    
+    def setUp(self):
+        """Initializes testing property set."""
+        
+        self.changes = []
+        self.prop_set = Item()
+        self.prop_set.bind(pero.EVT_PROPERTY_CHANGED, self.on_changed)
+    
+    
+    def on_changed(self, evt):
+        """Stores changed property name."""
+        
+        self.changes.append(evt.name)
+    
+    
+    def test_exact(self):
+        """Tests whether exact comparison is used by default."""
+        
+        data = numpy.arange(10.)
+        self.prop_set.exact = data
+        self.prop_set.exact = data.copy()
+        
+        self.assertEqual(self.changes, ['exact'])
+        self.assertIs(self.prop_set.exact, data)
+    
+    
+    def test_identity(self):
+        """Tests whether identity comparison works correctly."""
+        
+        data = numpy.arange(10.)
+        self.prop_set.identity = data
+        self.prop_set.identity = data
+        self.prop_set.identity = data.copy()
+        
+        self.assertEqual(self.changes, ['identity', 'identity'])
+        self.assertIsNot(self.prop_set.identity, data)
+        
+        self.prop_set.size = 1
+        self.assertEqual(len(self.changes), 2)
+    
+    
+    def test_version(self):
+        """Tests whether every assignment increases the version."""
+        
+        data = numpy.arange(10.)
+        self.assertEqual(self.prop_set.get_property_version('version'), 0)
+        
+        self.prop_set.version = data
+        self.prop_set.version = data
+        
+        self.assertEqual(self.changes, ['version', 'version'])
+        self.assertEqual(self.prop_set.get_property_version('version'), 2)
+        self.assertEqual(self.prop_set.get_property_version('exact'), 0)
+    
+    
+    def test_sampled(self):
+        """Tests whether sampled comparison works correctly."""
+        
+        data = numpy.arange(100000.)
+        self.prop_set.sampled = data
+        
+        # same values
+        same = data.copy()
+        self.prop_set.sampled = same
+        self.assertEqual(self.changes, ['sampled'])
+        self.assertIs(self.prop_set.sampled, same)
+        
+        # different sampled values
+        self.prop_set.sampled = data * 2
+        self.assertEqual(self.changes, ['sampled', 'sampled'])
+        
+        # different size
+        self.prop_set.sampled = data[:-1]
+        self.assertEqual(self.changes, ['sampled', 'sampled', 'sampled'])
+    
+    
+    def test_batch(self):
+        """Tests whether batched changes respect comparison strategy."""
+        
+        data = numpy.arange(10.)
+        self.prop_set.identity = data
+        self.prop_set.version = data
+        self.prop_set.exact = data
+        self.changes = []
+        
+        self.prop_set.set_properties({'identity': data.copy()})
+        self.assertEqual(self.changes, ['identity'])
+        
+        self.prop_set.set_properties({'version': data})
+        self.assertEqual(self.changes, ['identity', 'version'])
+        
+        self.prop_set.set_properties({'exact': data.copy(), 'identity': self.prop_set.identity})
+        self.assertEqual(self.changes, ['identity', 'version'])
+    
+    
+    def test_clone(self):
+        """Tests whether strategy is kept by cloned properties."""
+        
+        prop = Item.identity.clone(name='other')
+        self.assertEqual(prop.compare, pero.PROP_COMPARE_IDENTITY)
+        
+        with self.assertRaises(ValueError):
+            pero.Property(compare='unknown')
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,242 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import pero
+
+
+class Child(pero.PropertySet):
+    """Testing child property set."""
+    
+    size = pero.NumProperty(1)
+    line = pero.Include(pero.LineProperties)
+
+
+class Parent(pero.PropertySet):
+    """Testing parent property set."""
+    
+    child = pero.Property(pero.UNDEF, types=(pero.PropertySet,), nullable=True)
+    child_size = pero.NumProperty(2)
+    width = pero.NumProperty(3)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for PropertySet class."""
+    
+    
+    def test_get_property(self):
+        """Tests whether known properties are resolved correctly."""
+        
+        prop_set = Parent(width=10)
+        
+        self.assertEqual(prop_set.get_property('width'), 10)
+        self.assertEqual(prop_set.get_property('child_size'), 2)
+        self.assertEqual(prop_set.get_property('width', overrides={'width': 5}), 5)
+        self.assertEqual(prop_set.get_property('width', 4, {'width': lambda d: d*2}), 8)
+    
+    
+    def test_get_child_property(self):
+        """Tests whether child properties are resolved correctly."""
+        
+        prop_set = Parent(child=Child(line_width=5))
+        
+        self.assertEqual(prop_set.get_property('child_line_width'), 5)
+        self.assertEqual(prop_set.get_property('child_size'), 2)
+        self.assertTrue(prop_set.has_property('child_line_color'))
+        self.assertFalse(prop_set.has_property('child_fill_color'))
+        
+        path = prop_set.get_property_path('child_line_width')
+        self.assertIs(path[1], prop_set.child)
+        self.assertEqual(path[-1].name, 'line_width')
+        
+        with self.assertRaises(AttributeError):
+            prop_set.get_property('child_fill_color')
+    
+    
+    def test_replaced_child(self):
+        """Tests whether cached plans follow replaced child property sets."""
+        
+        prop_set = Parent()
+        self.assertFalse(prop_set.has_property('child_line_width'))
+        
+        prop_set.child = Child(line_width=5)
+        self.assertEqual(prop_set.get_property('child_line_width'), 5)
+        
+        prop_set.child = Child(line_width=7)
+        self.assertEqual(prop_set.get_property('child_line_width'), 7)
+        
+        prop_set.set_property('child_line_width', 9)
+        self.assertEqual(prop_set.child.line_width, 9)
+        
+        prop_set.child = None
+        self.assertFalse(prop_set.has_property('child_line_width'))
+    
+    
+    def test_get_properties(self):
+        """Tests whether multiple properties are resolved correctly."""
+        
+        prop_set = Parent(width=lambda d: d*2, child=Child(line_width=5))
+        
+        props = prop_set.get_properties(('width', 'child_size', 'child_line_width'), 3)
+        self.assertEqual(props, (6, 2, 5))
+        self.assertEqual(props.width, 6)
+        self.assertEqual(props.child_line_width, 5)
+        
+        width, size = prop_set.get_properties(('width', 'child_size'), 3, {'width': 1})
+        self.assertEqual((width, size), (1, 2))
+        
+        width, = prop_set.get_properties(('width',), native=True)
+        self.assertTrue(callable(width))
+        
+        props = prop_set.get_properties(['width', 'child_size'], 3)
+        self.assertEqual(props, (6, 2))
+        
+        with self.assertRaises(AttributeError):
+            prop_set.get_properties(('child_size', 'unknown'))
+    
+    
+    def test_shared_defaults(self):
+        """Tests whether defaults are shared and values stored on change only."""
+        
+        prop_set1 = pero.Circle()
+        prop_set2 = pero.Circle(size=8, line_width=3)
+        
+        self.assertIs(prop_set1._properties, prop_set2._properties)
+        self.assertIs(prop_set1.line_color, prop_set2.line_color)
+        self.assertNotIn('size', prop_set2.__dict__)
+        self.assertEqual(prop_set2.__dict__['line_width'], 3)
+        
+        with self.assertRaises(TypeError):
+            prop_set1._properties['size'] = None
+    
+    
+    def test_lock_and_hold(self):
+        """Tests whether locks and holds work correctly."""
+        
+        prop_set = Parent()
+        self.assertFalse(prop_set.is_property_locked('width'))
+        self.assertFalse(prop_set.is_property_held('width'))
+        
+        prop_set.lock_property('width')
+        with self.assertRaises(AttributeError):
+            prop_set.width = 5
+        
+        prop_set.lock_property('width', False)
+        prop_set.width = 5
+        self.assertEqual(prop_set.width, 5)
+        
+        prop_set.hold_property('width')
+        prop_set.width = pero.UNDEF
+        self.assertEqual(prop_set.width, 5)
+        
+        clone = prop_set.clone()
+        self.assertTrue(clone.is_property_held('width'))
+        self.assertFalse(Parent().is_property_held('width'))
+    
+    
+    def test_changed_event(self):
+        """Tests whether property changed event is fired."""
+        
+        changes = []
+        
+        def on_changed(evt):
+            changes.append((evt.name, evt.old_value, evt.new_value))
+        
+        prop_set = Parent()
+        prop_set.bind(pero.EVT_PROPERTY_CHANGED, on_changed)
+        
+        prop_set.width = 3
+        prop_set.width = 4
+        
+        self.assertEqual(changes, [('width', 3, 4)])
+    
+    
+    def test_batch_changes(self):
+        """Tests whether changes made in batch are fired at once."""
+        
+        events = []
+        
+        def on_changed(evt):
+            events.append(evt)
+        
+        prop_set = Parent()
+        prop_set.bind(pero.EVT_PROPERTY_CHANGED, on_changed)
+        
+        # multiple changes
+        with prop_set.batch_changes():
+            prop_set.width = 4
+            prop_set.child_size = 5
+            
+            with prop_set.batch_changes():
+                prop_set.width = 6
+            
+            self.assertEqual(events, [])
+        
+        self.assertEqual(len(events), 1)
+        self.assertIsNone(events[0].name)
+        self.assertEqual(events[0].names, ('width', 'child_size'))
+        self.assertEqual(events[0].changes, {'width': (3, 6), 'child_size': (2, 5)})
+        
+        # single change
+        events.clear()
+        prop_set.set_properties({'width': 7, 'child_size': 5})
+        
+        self.assertEqual(len(events), 1)
+        self.assertEqual((events[0].name, events[0].old_value, events[0].new_value), ('width', 6, 7))
+        self.assertEqual(events[0].names, ('width',))
+        
+        # reverted change
+        events.clear()
+        with prop_set.batch_changes():
+            prop_set.width = 8
+            prop_set.width = 7
+        
+        self.assertEqual(events, [])
+    
+    
+    def test_revision(self):
+        """Tests whether revisions are propagated from children."""
+        
+        child = Child()
+        prop_set = Parent()
+        self.assertTrue(prop_set.is_dirty(None))
+        
+        token = prop_set.revision
+        self.assertFalse(prop_set.is_dirty(token))
+        
+        prop_set.width = 10
+        self.assertTrue(prop_set.is_dirty(token))
+        
+        token = prop_set.revision
+        prop_set.width = 10
+        self.assertFalse(prop_set.is_dirty(token))
+        
+        prop_set.child = child
+        self.assertTrue(prop_set.is_dirty(token))
+        
+        token = prop_set.revision
+        child.line_width = 5
+        self.assertTrue(prop_set.is_dirty(token))
+        self.assertEqual(prop_set.revision, child.revision)
+        
+        token = prop_set.revision
+        child.touch()
+        self.assertTrue(prop_set.is_dirty(token))
+        
+        prop_set.child = prop_set
+        self.assertGreater(prop_set.revision, token)
+    
+    
+    def test_class_plans(self):
+        """Tests whether resolution plans are shared per class."""
+        
+        self.assertIsNot(Parent._plans, Child._plans)
+        
+        Parent().get_property('width')
+        self.assertIn('width', Parent._plans)
+        self.assertNotIn('width', Child._plans)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
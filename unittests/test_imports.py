@@ -0,0 +1,79 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import subprocess
+import sys
+import os.path
+import json
+import pero
+
+# define modules which must not be imported by 'import pero'
+LAZY_MODULES = (
+    'pero.backends',
+    'pero.glyphs.axes',
+    'pero.glyphs.legend',
+    'pero.glyphs.profile',
+    'pero.glyphs.tooltip',
+    'cairo',
+    'fitz',
+    'wx',
+    'PyQt5',
+    'PyQt6',
+    'PySide2',
+    'PySide6')
+
+
+class TestCase(unittest.TestCase):
+    """Test case for lazy imports."""
+    
+    
+    def test_lazy(self):
+        """Tests whether backends and lazy glyphs are not imported."""
+        
+        root = os.path.dirname(os.path.dirname(os.path.abspath(pero.__file__)))
+        script = "import sys, json, pero; print(json.dumps(sorted(sys.modules)))"
+        
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, (root, env.get('PYTHONPATH'))))
+        
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, check=True)
+        modules = set(json.loads(output.stdout))
+        
+        self.assertIn('pero.drawing', modules)
+        self.assertIn('pero.glyphs.shapes', modules)
+        
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, modules)
+    
+    
+    def test_names(self):
+        """Tests whether lazy names are available."""
+        
+        from pero.backends import json as json_backend
+        from pero.backends import view as view_module
+        from pero.glyphs import profile
+        
+        self.assertIs(pero.Image, json_backend.Image)
+        self.assertIs(pero.json, json_backend)
+        self.assertIs(pero.view, view_module)
+        self.assertIs(pero.Profile, profile.Profile)
+        self.assertIs(pero.glyphs.Profile, profile.Profile)
+        self.assertIs(pero.export, pero.backends.export)
+        self.assertIs(pero.svg, pero.backends.svg)
+        
+        self.assertIn('Profile', dir(pero))
+        self.assertIn('Image', dir(pero))
+        self.assertFalse(hasattr(pero, 'UnknownName'))
+        
+        names = {}
+        exec("from pero import *", names)
+        
+        self.assertIs(names['Image'], json_backend.Image)
+        self.assertIs(names['Profile'], profile.Profile)
+        self.assertIs(names['Circle'], pero.Circle)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,215 @@
+#  Created byMartin.cz
+#  Copyright (c) Martin Strohalm. All rights reserved.
+
+import unittest
+import io
+import os
+import json
+import socket
+import signal
+import pickle
+import tempfile
+import time
+import http.client
+import pero
+from pero.server import RenderServer
+
+
+def _has_font():
+    """Checks whether default SVG font is available."""
+    
+    try:
+        pero.backends.svg.SVGCanvas()
+        return True
+    except (AttributeError, ValueError):
+        return False
+
+
+class UnixConnection(http.client.HTTPConnection):
+    """HTTP connection over Unix socket."""
+    
+    def __init__(self, path):
+        super().__init__("localhost")
+        self._path = path
+    
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._path)
+
+
+class TestCase(unittest.TestCase):
+    """Test case for render server."""
+    
+    
+    def setUp(self):
+        """Creates testing image."""
+        
+        self.img = pero.Image(width=100, height=50)
+        self.img.line_color = "red"
+        self.img.draw_line(0, 0, 100, 50)
+        
+        self.line = pero.Line(x1=0, y1=0, x2=100, y2=50, line_color="red")
+    
+    
+    def request(self, server, method, url, body=None, content_type=None, headers=None):
+        """Sends request and gets response."""
+        
+        headers = dict(headers or {})
+        if content_type:
+            headers['Content-Type'] = content_type
+        
+        if isinstance(server.address, str):
+            conn = UnixConnection(server.address)
+        else:
+            conn = http.client.HTTPConnection(*server.address)
+        
+        try:
+            conn.request(method, url, body, headers)
+            response = conn.getresponse()
+            return response.status, response.getheader('Content-Type'), response.read()
+        
+        finally:
+            conn.close()
+    
+    
+    def test_endpoints(self):
+        """Tests whether health and metrics are available."""
+        
+        with RenderServer(('127.0.0.1', 0), workers=0) as server:
+            server.start()
+            
+            status, content_type, data = self.request(server, "GET", "/health")
+            self.assertEqual(status, 200)
+            self.assertEqual(data, b"OK")
+            
+            status, content_type, data = self.request(server, "GET", "/unknown")
+            self.assertEqual(status, 404)
+            
+            status, content_type, data = self.request(server, "GET", "/metrics")
+            self.assertEqual(status, 200)
+            self.assertEqual(content_type, "application/json")
+            
+            metrics = json.loads(data)
+            self.assertEqual(metrics['requests'], 0)
+            self.assertEqual(metrics['latency']['count'], 0)
+    
+    
+    def test_errors(self):
+        """Tests whether invalid requests are refused."""
+        
+        body = self.img.get_json()
+        
+        with RenderServer(('127.0.0.1', 0), workers=0, max_size=1024) as server:
+            server.start()
+            
+            status, content_type, data = self.request(server, "POST", "/render?format=xyz", body, "application/json")
+            self.assertEqual(status, 400)
+            
+            status, content_type, data = self.request(server, "POST", "/render?width=abc", body, "application/json")
+            self.assertEqual(status, 400)
+            
+            status, content_type, data = self.request(server, "POST", "/render", b"data", "text/plain")
+            self.assertEqual(status, 415)
+            
+            status, content_type, data = self.request(server, "POST", "/render", pickle.dumps(self.line), "application/x-python-pickle")
+            self.assertEqual(status, 403)
+            
+            status, content_type, data = self.request(server, "POST", "/render", b"{" + b" " * 2048, "application/json")
+            self.assertEqual(status, 413)
+            
+            status, content_type, data = self.request(server, "POST", "/render", b"{}", "application/json")
+            self.assertEqual(status, 422)
+            
+            status, content_type, data = self.request(server, "POST", "/render", None, "application/json", {'Content-Length': "-1"})
+            self.assertEqual(status, 400)
+            
+            metrics = server.get_metrics()
+            self.assertEqual(metrics['requests'], 7)
+            self.assertEqual(metrics['failed'], 7)
+            self.assertEqual(metrics['pending'], 0)
+    
+    
+    def test_busy(self):
+        """Tests whether requests above limit are rejected."""
+        
+        with RenderServer(('127.0.0.1', 0), workers=0, max_pending=1) as server:
+            server.start()
+            
+            server._slots.acquire()
+            status, content_type, data = self.request(server, "POST", "/render", self.img.get_json(), "application/json")
+            server._slots.release()
+            
+            self.assertEqual(status, 503)
+            self.assertEqual(server.get_metrics()['rejected'], 1)
+    
+    
+    @unittest.skipUnless(_has_font(), "default font not available")
+    def test_render(self):
+        """Tests whether images are rendered from all payloads."""
+        
+        dump = io.BytesIO()
+        self.img.save(dump)
+        
+        with RenderServer(('127.0.0.1', 0), workers=0, allow_pickle=True) as server:
+            server.start()
+            
+            status, content_type, data = self.request(server, "POST", "/render?format=svg", self.img.get_json(), "application/json")
+            self.assertEqual(status, 200)
+            self.assertEqual(content_type, "image/svg+xml")
+            self.assertIn(b'width="100"', data)
+            
+            status, content_type, data = self.request(server, "POST", "/render?format=svg&width=20", dump.getvalue(), "application/x-pero-dump")
+            self.assertEqual(status, 200)
+            self.assertIn(b'width="20', data)
+            
+            status, content_type, data = self.request(server, "POST", "/render?format=svg", pickle.dumps(self.line), "application/x-python-pickle")
+            self.assertEqual(status, 200)
+            
+            metrics = server.get_metrics()
+            self.assertEqual(metrics['rendered'], 3)
+            self.assertEqual(metrics['latency']['count'], 3)
+    
+    
+    @unittest.skipUnless(_has_font(), "default font not available")
+    def test_workers(self):
+        """Tests whether images are rendered by workers over Unix socket."""
+        
+        path = os.path.join(tempfile.mkdtemp(), "pero.sock")
+        
+        with RenderServer(path, workers=1) as server:
+            server.start()
+            
+            status, content_type, data = self.request(server, "POST", "/render?format=svg", self.img.get_json())
+            self.assertEqual(status, 200)
+            self.assertIn(b"<svg", data)
+        
+        self.assertFalse(os.path.exists(path))
+    
+    
+    @unittest.skipUnless(_has_font(), "default font not available")
+    @unittest.skipUnless(hasattr(signal, 'SIGKILL'), "signals not available")
+    def test_dead_worker(self):
+        """Tests whether the pool is restarted if a worker dies."""
+        
+        with RenderServer(('127.0.0.1', 0), workers=1) as server:
+            server.start()
+            
+            # kill worker
+            pool = server._pool
+            for pid in list(pool._executor._processes):
+                os.kill(pid, signal.SIGKILL)
+            
+            # wait for broken pool
+            for i in range(50):
+                if pool._executor._broken:
+                    break
+                time.sleep(0.1)
+            
+            status, content_type, data = self.request(server, "POST", "/render?format=svg", self.img.get_json())
+            self.assertEqual(status, 200)
+            self.assertIsNot(server._pool, pool)
+
+
+# run test case
+if __name__ == "__main__":
+    unittest.main(verbosity=2)